@@ -56,7 +56,8 @@ from .utilities.common import (domain_range_scale, get_domain_range_scale,
 
 from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
                          CHROMATIC_ADAPTATION_TRANSFORMS,
-                         CMCCAT2000_VIEWING_CONDITIONS, chromatic_adaptation)
+                         CMCCAT2000_VIEWING_CONDITIONS, chromatic_adaptation,
+                         get_chromatic_adaptation_function)
 from .algebra import (CubicSplineInterpolator, Extrapolator,
                       KernelInterpolator, NearestNeighbourInterpolator,
                       LinearInterpolator, NullInterpolator, PchipInterpolator,
@@ -85,21 +86,25 @@ from .blindness import (
     CVD_MATRICES_MACHADO2010, anomalous_trichromacy_cmfs_Machado2009,
     anomalous_trichromacy_matrix_Machado2009, cvd_matrix_Machado2009)
 from .appearance import (
-    ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
-    CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
-    LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
-    RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
-    XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
-    XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
+    ATD95_Specification, CAM16_Context, CAM16_Specification,
+    CAM16_VIEWING_CONDITIONS, CAM16_to_XYZ, CIECAM02_Context,
+    CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS, CIECAM02_to_XYZ,
+    HUNT_VIEWING_CONDITIONS, Hunt_Specification, LLAB_Specification,
+    LLAB_VIEWING_CONDITIONS, Nayatani95_Specification, RLAB_D_FACTOR,
+    RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95, XYZ_to_CAM16,
+    XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
+from .difference import (DELTA_E_METHODS, delta_E, delta_E_matrix,
+                         delta_E_nearest, get_delta_E_function)
 from .geometry import (PRIMITIVE_METHODS, primitive,
                        PRIMITIVE_VERTICES_METHODS, primitive_vertices)
 from .io import (LUT1D, LUT3x1D, LUT3D, LUTSequence, READ_IMAGE_METHODS,
-                 SpectralDistribution_IESTM2714, WRITE_IMAGE_METHODS,
-                 read_image, read_LUT, read_sds_from_csv_file,
-                 read_sds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_LUT, write_sds_to_csv_file)
+                 PROCESS_IMAGE_METHODS, SpectralDistribution_IESTM2714,
+                 WRITE_IMAGE_METHODS, read_image, read_LUT,
+                 read_msds_from_csv_file, read_msds_from_IESTM2714_directory,
+                 read_msds_from_xrite_directory, read_msds_from_xrite_file,
+                 read_sds_from_csv_file, read_sds_from_xrite_file,
+                 read_spectral_data_from_csv_file, write_image, write_LUT,
+                 write_msds_to_csv_file, write_sds_to_csv_file, process_image)
 from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
@@ -115,16 +120,20 @@ from .models import (
     MACADAM_1942_ELLIPSES_DATA, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES,
     OSA_UCS_to_XYZ, POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA,
     POINTER_GAMUT_ILLUMINANT, Prismatic_to_RGB, RGB_COLOURSPACES,
-    RGB_Colourspace, RGB_luminance, RGB_luminance_equation, RGB_to_CMY,
-    RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP, RGB_to_Prismatic, RGB_to_RGB,
-    RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YcCbcCrc, RGB_to_YCoCg,
-    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab,
-    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966,
-    XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
+    RGB_Colourspace, RGB_Colourspace_Transform, RGB_luminance,
+    RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP,
+    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_RGB_transform,
+    RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YcCbcCrc, RGB_to_YCoCg, UCS_to_XYZ,
+    UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab,
+    XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab,
+    XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
     XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY,
     YCBCR_WEIGHTS, YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB, cctf_decoding,
     cctf_encoding, chromatically_adapted_primaries, eotf, eotf_inverse,
-    full_to_legal, gamma_function, hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ,
+    full_to_legal, gamma_function, get_cctf_decoding_function,
+    get_cctf_encoding_function, get_eotf_function, get_eotf_inverse_function,
+    get_log_decoding_function, get_log_encoding_function, get_oetf_function,
+    get_oetf_inverse_function, hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ,
     legal_to_full, linear_function, log_decoding, log_encoding,
     normalised_primary_matrix, oetf, oetf_inverse, ootf, ootf_inverse,
     primaries_whitepoint, sRGB_to_XYZ, uv_to_Luv, uv_to_UCS, xyY_to_XYZ,
@@ -143,23 +152,30 @@ from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
                        xyY_to_munsell_colour)
 from .quality import (COLOUR_QUALITY_SCALE_METHODS, colour_quality_scale,
                       colour_rendering_index, spectral_similarity_index)
-from .recovery import XYZ_TO_SD_METHODS, XYZ_to_sd
+from .recovery import XYZ_TO_SD_METHODS, XYZ_to_sd, get_XYZ_to_sd_function
 from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
                           CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
+                          get_CCT_to_uv_function, get_uv_to_CCT_function,
                           uv_to_CCT, xy_to_CCT)
 from .characterisation import (
     CAMERA_RGB_SPECTRAL_SENSITIVITIES, COLOURCHECKERS, COLOURCHECKER_SDS,
     DISPLAY_RGB_PRIMARIES, FILTER_SDS, LENS_SDS, POLYNOMIAL_EXPANSION_METHODS,
-    polynomial_expansion, COLOUR_CORRECTION_MATRIX_METHODS,
-    colour_correction_matrix, COLOUR_CORRECTION_METHODS, colour_correction,
-    idt_matrix, sd_to_aces_relative_exposure_values)
-from .volume import (ILLUMINANT_OPTIMAL_COLOUR_STIMULI, RGB_colourspace_limits,
-                     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-                     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-                     RGB_colourspace_volume_MonteCarlo,
-                     RGB_colourspace_volume_coverage_MonteCarlo,
-                     is_within_macadam_limits, is_within_mesh_volume,
-                     is_within_pointer_gamut, is_within_visible_spectrum)
+    polynomial_expansion, get_polynomial_expansion_function,
+    COLOUR_CORRECTION_MATRIX_METHODS, colour_correction_matrix,
+    COLOUR_CORRECTION_METHODS, colour_correction, idt_matrix,
+    sd_to_aces_relative_exposure_values)
+from .volume import (
+    ILLUMINANT_OPTIMAL_COLOUR_STIMULI, RGB_colourspace_limits,
+    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
+    RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
+    RGB_colourspace_volume_MonteCarlo,
+    RGB_colourspace_volume_MonteCarlo_estimates,
+    RGB_colourspace_volume_MonteCarlo_estimate,
+    RGB_colourspace_volume_coverage_MonteCarlo, RGB_colourspace_volume_Mesh,
+    RGB_colourspace_volume_coverage_Mesh,
+    RGB_colourspace_pointer_gamut_coverage_Mesh,
+    RGB_colourspace_visible_spectrum_coverage_Mesh, is_within_macadam_limits,
+    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
 from .graph import describe_conversion_path, convert
 
 from colour.utilities import is_matplotlib_installed
@@ -180,7 +196,8 @@ __all__ = [
 ]
 __all__ += [
     'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
-    'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
+    'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation',
+    'get_chromatic_adaptation_function'
 ]
 __all__ += [
     'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
@@ -214,26 +231,32 @@ __all__ += [
     'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
 ]
 __all__ += [
-    'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
-    'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
-    'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
-    'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
-    'XYZ_to_RLAB'
+    'ATD95_Specification', 'CAM16_Context', 'CAM16_Specification',
+    'CAM16_VIEWING_CONDITIONS', 'CAM16_to_XYZ', 'CIECAM02_Context',
+    'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS', 'CIECAM02_to_XYZ',
+    'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification', 'LLAB_Specification',
+    'LLAB_VIEWING_CONDITIONS', 'Nayatani95_Specification', 'RLAB_D_FACTOR',
+    'RLAB_Specification', 'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95',
+    'XYZ_to_CAM16', 'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB',
+    'XYZ_to_Nayatani95', 'XYZ_to_RLAB'
+]
+__all__ += [
+    'DELTA_E_METHODS', 'delta_E', 'delta_E_matrix', 'delta_E_nearest',
+    'get_delta_E_function'
 ]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
 __all__ += [
     'PRIMITIVE_METHODS', 'primitive', 'PRIMITIVE_VERTICES_METHODS',
     'primitive_vertices'
 ]
 __all__ += [
     'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence', 'READ_IMAGE_METHODS',
-    'SpectralDistribution_IESTM2714', 'WRITE_IMAGE_METHODS', 'read_image',
-    'read_LUT', 'read_sds_from_csv_file', 'read_sds_from_xrite_file',
-    'read_spectral_data_from_csv_file', 'write_image', 'write_LUT',
-    'write_sds_to_csv_file'
+    'PROCESS_IMAGE_METHODS', 'SpectralDistribution_IESTM2714',
+    'WRITE_IMAGE_METHODS', 'read_image', 'read_LUT', 'read_msds_from_csv_file',
+    'read_msds_from_IESTM2714_directory', 'read_msds_from_xrite_directory',
+    'read_msds_from_xrite_file', 'read_sds_from_csv_file',
+    'read_sds_from_xrite_file', 'read_spectral_data_from_csv_file',
+    'write_image', 'write_LUT', 'write_msds_to_csv_file',
+    'write_sds_to_csv_file', 'process_image', 'process_image_sequence'
 ]
 __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
@@ -252,21 +275,25 @@ __all__ += [
     'MACADAM_1942_ELLIPSES_DATA', 'OOTF_INVERSES', 'OSA_UCS_to_XYZ',
     'POINTER_GAMUT_BOUNDARIES', 'POINTER_GAMUT_DATA',
     'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
-    'RGB_Colourspace', 'RGB_luminance', 'RGB_luminance_equation', 'RGB_to_CMY',
-    'RGB_to_HSL', 'RGB_to_HSV', 'RGB_to_ICTCP', 'RGB_to_Prismatic',
-    'RGB_to_RGB', 'RGB_to_RGB_matrix', 'RGB_to_XYZ', 'RGB_to_YCbCr',
-    'RGB_to_YcCbcCrc', 'RGB_to_YCoCg', 'UCS_to_XYZ', 'UCS_to_uv',
-    'UCS_uv_to_xy', 'UVW_to_XYZ', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab',
-    'XYZ_to_IPT', 'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
-    'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
-    'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
-    'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
-    'YCoCg_to_RGB', 'cctf_decoding', 'cctf_encoding',
-    'chromatically_adapted_primaries', 'eotf', 'eotf_inverse', 'full_to_legal',
-    'gamma_function', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
-    'linear_function', 'log_decoding', 'log_encoding',
-    'normalised_primary_matrix', 'oetf', 'oetf_inverse', 'ootf',
-    'ootf_inverse', 'primaries_whitepoint', 'sRGB_to_XYZ', 'uv_to_Luv',
+    'RGB_Colourspace', 'RGB_Colourspace_Transform', 'RGB_luminance',
+    'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
+    'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
+    'RGB_to_RGB_transform', 'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc',
+    'RGB_to_YCoCg', 'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
+    'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_JzAzBz',
+    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_OSA_UCS',
+    'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab',
+    'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY',
+    'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB', 'YCoCg_to_RGB',
+    'cctf_decoding', 'cctf_encoding', 'chromatically_adapted_primaries',
+    'eotf', 'eotf_inverse', 'full_to_legal', 'gamma_function',
+    'get_cctf_decoding_function', 'get_cctf_encoding_function',
+    'get_eotf_function', 'get_eotf_inverse_function',
+    'get_log_decoding_function', 'get_log_encoding_function',
+    'get_oetf_function', 'get_oetf_inverse_function', 'hdr_CIELab_to_XYZ',
+    'hdr_IPT_to_XYZ', 'legal_to_full', 'linear_function', 'log_decoding',
+    'log_encoding', 'normalised_primary_matrix', 'oetf', 'oetf_inverse',
+    'ootf', 'ootf_inverse', 'primaries_whitepoint', 'sRGB_to_XYZ', 'uv_to_Luv',
     'uv_to_UCS', 'xyY_to_XYZ', 'xyY_to_xy', 'xy_to_Luv_uv', 'xy_to_UCS_uv',
     'xy_to_XYZ', 'xy_to_xyY'
 ]
@@ -288,27 +315,33 @@ __all__ += [
     'COLOUR_QUALITY_SCALE_METHODS', 'colour_quality_scale',
     'colour_rendering_index', 'spectral_similarity_index'
 ]
-__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd']
+__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd', 'get_XYZ_to_sd_function']
 __all__ += [
     'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
-    'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
+    'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'get_CCT_to_uv_function',
+    'get_uv_to_CCT_function', 'uv_to_CCT', 'xy_to_CCT'
 ]
 __all__ += [
     'CAMERA_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS', 'COLOURCHECKER_SDS',
     'DISPLAY_RGB_PRIMARIES', 'FILTER_SDS', 'LENS_SDS',
     'POLYNOMIAL_EXPANSION_METHODS', 'polynomial_expansion',
-    'COLOUR_CORRECTION_MATRIX_METHODS', 'colour_correction_matrix',
-    'COLOUR_CORRECTION_METHODS', 'colour_correction', 'idt_matrix',
-    'sd_to_aces_relative_exposure_values'
+    'get_polynomial_expansion_function', 'COLOUR_CORRECTION_MATRIX_METHODS',
+    'colour_correction_matrix', 'COLOUR_CORRECTION_METHODS',
+    'colour_correction', 'idt_matrix', 'sd_to_aces_relative_exposure_values'
 ]
 __all__ += [
     'ILLUMINANT_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
     'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
+    'RGB_colourspace_volume_MonteCarlo_estimates',
+    'RGB_colourspace_volume_MonteCarlo_estimate',
+    'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_coverage_Mesh',
+    'RGB_colourspace_pointer_gamut_coverage_Mesh',
+    'RGB_colourspace_visible_spectrum_coverage_Mesh',
+    'is_within_macadam_limits', 'is_within_mesh_volume',
+    'is_within_pointer_gamut', 'is_within_visible_spectrum'
 ]
 __all__ += ['describe_conversion_path', 'convert']
 
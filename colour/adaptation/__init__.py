@@ -25,6 +25,7 @@ References
 from __future__ import absolute_import
 
 import sys
+from functools import partial
 
 from colour.utilities.deprecation import ModuleAPI, build_API_changes
 from colour.utilities.documentation import is_documentation_building
@@ -76,6 +77,65 @@ CHROMATIC_ADAPTATION_METHODS : CaseInsensitiveMapping
 """
 
 
+def _chromatic_adaptation(function, XYZ, XYZ_w, XYZ_wr, **kwargs):
+    """
+    Adapts given stimulus from test viewing conditions to reference viewing
+    conditions using given chromatic adaptation definition.
+
+    Parameters
+    ----------
+    function : callable
+        Chromatic adaptation definition from the
+        :attr:`colour.CHROMATIC_ADAPTATION_METHODS` attribute.
+    XYZ : array_like
+        *CIE XYZ* tristimulus values of stimulus to adapt.
+    XYZ_w : array_like
+        Test viewing condition *CIE XYZ* tristimulus values of the whitepoint.
+    XYZ_wr : array_like
+        Reference viewing condition *CIE XYZ* tristimulus values of the
+        whitepoint.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the chromatic adaptation definition.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ_c* tristimulus values of the stimulus corresponding colour.
+    """
+
+    domain_range_reference = get_domain_range_scale() == 'reference'
+    domain_100 = (chromatic_adaptation_CIE1994,
+                  chromatic_adaptation_CMCCAT2000,
+                  chromatic_adaptation_Fairchild1990)
+
+    if function in domain_100 and domain_range_reference:
+        XYZ = as_float_array(XYZ) * 100
+        XYZ_w = as_float_array(XYZ_w) * 100
+        XYZ_wr = as_float_array(XYZ_wr) * 100
+        if kwargs.get('Y_o'):
+            kwargs['Y_o'] = kwargs['Y_o'] * 100
+
+    kwargs.update({'XYZ_w': XYZ_w, 'XYZ_wr': XYZ_wr})
+
+    if function is chromatic_adaptation_CIE1994:
+        from colour import XYZ_to_xy
+
+        kwargs.update({'xy_o1': XYZ_to_xy(XYZ_w), 'xy_o2': XYZ_to_xy(XYZ_wr)})
+
+    elif function is chromatic_adaptation_Fairchild1990:
+        kwargs.update({'XYZ_n': XYZ_w, 'XYZ_r': XYZ_wr})
+
+    XYZ_c = function(XYZ, **filter_kwargs(function, **kwargs))
+
+    if function in domain_100 and domain_range_reference:
+        XYZ_c /= 100
+
+    return XYZ_c
+
+
 def chromatic_adaptation(XYZ, XYZ_w, XYZ_wr, method='Von Kries', **kwargs):
     """
     Adapts given stimulus from test viewing conditions to reference viewing
@@ -212,39 +272,53 @@ def chromatic_adaptation(XYZ, XYZ_w, XYZ_wr, method='Von Kries', **kwargs):
     array([ 0.2332526...,  0.2332455...,  0.7611593...])
     """
 
-    function = CHROMATIC_ADAPTATION_METHODS[method]
+    return _chromatic_adaptation(CHROMATIC_ADAPTATION_METHODS[method], XYZ,
+                                 XYZ_w, XYZ_wr, **kwargs)
 
-    domain_range_reference = get_domain_range_scale() == 'reference'
-    domain_100 = (chromatic_adaptation_CIE1994,
-                  chromatic_adaptation_CMCCAT2000,
-                  chromatic_adaptation_Fairchild1990)
 
-    if function in domain_100 and domain_range_reference:
-        XYZ = as_float_array(XYZ) * 100
-        XYZ_w = as_float_array(XYZ_w) * 100
-        XYZ_wr = as_float_array(XYZ_wr) * 100
-        if kwargs.get('Y_o'):
-            kwargs['Y_o'] = kwargs['Y_o'] * 100
-
-    kwargs.update({'XYZ_w': XYZ_w, 'XYZ_wr': XYZ_wr})
-
-    if function is chromatic_adaptation_CIE1994:
-        from colour import XYZ_to_xy
+def get_chromatic_adaptation_function(method='Von Kries', **kwargs):
+    """
+    Returns the chromatic adaptation definition for given method, with the
+    keyword arguments bound, for repeated evaluations without resolving the
+    method on each call.
 
-        kwargs.update({'xy_o1': XYZ_to_xy(XYZ_w), 'xy_o2': XYZ_to_xy(XYZ_wr)})
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Von Kries', 'CIE 1994', 'CMCCAT2000', 'Fairchild 1990'}**,
+        Computation method.
 
-    elif function is chromatic_adaptation_Fairchild1990:
-        kwargs.update({'XYZ_n': XYZ_w, 'XYZ_r': XYZ_wr})
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the chromatic adaptation definition, see
+        :func:`colour.chromatic_adaptation` definition.
 
-    XYZ_c = function(XYZ, **filter_kwargs(function, **kwargs))
+    Returns
+    -------
+    callable
+        Chromatic adaptation definition taking the *CIE XYZ* tristimulus
+        values of the stimulus, the test and reference viewing conditions
+        whitepoints as positional arguments.
 
-    if function in domain_100 and domain_range_reference:
-        XYZ_c /= 100
+    Examples
+    --------
+    >>> import numpy as np
+    >>> XYZ = np.array([0.2248, 0.2274, 0.0854])
+    >>> XYZ_w = np.array([1.1115, 1.0000, 0.3520])
+    >>> XYZ_wr = np.array([0.9481, 1.0000, 1.0730])
+    >>> chromatic_adaptation_ = get_chromatic_adaptation_function(
+    ...     'CMCCAT2000', L_A1=200, L_A2=200)
+    >>> chromatic_adaptation_(XYZ, XYZ_w, XYZ_wr)  # doctest: +ELLIPSIS
+    array([ 0.1952698...,  0.2306834...,  0.2497175...])
+    """
 
-    return XYZ_c
+    return partial(_chromatic_adaptation, CHROMATIC_ADAPTATION_METHODS[method],
+                   **kwargs)
 
 
 __all__ += ['CHROMATIC_ADAPTATION_METHODS', 'chromatic_adaptation']
+__all__ += ['get_chromatic_adaptation_function']
 
 
 # ----------------------------------------------------------------------------#
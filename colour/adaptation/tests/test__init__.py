@@ -10,7 +10,8 @@ import numpy as np
 import unittest
 from six.moves import zip
 
-from colour.adaptation import chromatic_adaptation
+from colour.adaptation import (chromatic_adaptation,
+                               get_chromatic_adaptation_function)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -20,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestChromaticAdaptation']
+__all__ = ['TestChromaticAdaptation', 'TestGetChromaticAdaptationFunction']
 
 
 class TestChromaticAdaptation(unittest.TestCase):
@@ -119,5 +120,48 @@ class TestChromaticAdaptation(unittest.TestCase):
                         decimal=7)
 
 
+class TestGetChromaticAdaptationFunction(unittest.TestCase):
+    """
+    Defines :func:`colour.adaptation.get_chromatic_adaptation_function`
+    definition unit tests methods.
+    """
+
+    def test_get_chromatic_adaptation_function(self):
+        """
+        Tests :func:`colour.adaptation.get_chromatic_adaptation_function`
+        definition.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        XYZ_w = np.array([0.95045593, 1.00000000, 1.08905775])
+        XYZ_wr = np.array([0.96429568, 1.00000000, 0.82510460])
+        kwargs = {
+            'Y_o': 0.2,
+            'E_o1': 1000,
+            'E_o2': 1000,
+            'L_A1': 200,
+            'L_A2': 200,
+            'Y_n': 200
+        }
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for method in ('Von Kries', 'CIE 1994', 'CMCCAT2000',
+                       'Fairchild 1990'):
+            for scale, factor in d_r:
+                with domain_range_scale(scale):
+                    kwargs_s = dict(kwargs, Y_o=kwargs['Y_o'] * factor)
+                    function = get_chromatic_adaptation_function(
+                        method, **kwargs_s)
+                    np.testing.assert_equal(
+                        function(XYZ * factor, XYZ_w * factor,
+                                 XYZ_wr * factor),
+                        chromatic_adaptation(
+                            XYZ * factor,
+                            XYZ_w * factor,
+                            XYZ_wr * factor,
+                            method=method,
+                            **kwargs_s))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -107,6 +107,33 @@ chromatic_adaptation_matrix_VonKries` definition.
             ]),
             decimal=7)
 
+    def test_cache_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition cache.
+        """
+
+        XYZ_w = np.array([0.95045593, 1.00000000, 1.08905775])
+        XYZ_wr = np.array([0.96429568, 1.00000000, 0.82510460])
+
+        M_CAT = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Sharp')
+        M_CAT[...] = 0
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Sharp'),
+            np.array([
+                [1.07010560, -0.00612957, -0.04284710],
+                [0.04206095, 0.97690850, -0.01550476],
+                [-0.00795167, 0.00708757, 0.75806333],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_wr, XYZ_w, 'Sharp'),
+            np.linalg.inv(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Sharp')),
+            decimal=7)
+
     def test_raise_exception_chromatic_adaptation_matrix_VonKries(self):
         """
         Tests :func:`colour.adaptation.vonkries.\
@@ -20,7 +20,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.utilities import (dot_matrix, dot_vector, from_range_1,
+from colour.utilities import (LRUCache, dot_matrix, dot_vector, from_range_1,
                               row_as_diagonal, to_domain_1)
 
 __author__ = 'Colour Developers'
@@ -34,6 +34,14 @@ __all__ = [
     'chromatic_adaptation_matrix_VonKries', 'chromatic_adaptation_VonKries'
 ]
 
+_CHROMATIC_ADAPTATION_MATRICES_CACHE = LRUCache(128)
+"""
+Cache of the *chromatic adaptation* matrices, keyed by the whitepoints and
+chromatic adaptation transform matrix content.
+
+_CHROMATIC_ADAPTATION_MATRICES_CACHE : LRUCache
+"""
+
 
 def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     """
@@ -73,6 +81,11 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     | ``XYZ_wr`` | [0, 1]                | [0, 1]        |
     +------------+-----------------------+---------------+
 
+    -   The *chromatic adaptation* matrices of single whitepoints pairs are
+        cached, keyed by the whitepoints and chromatic adaptation transform
+        matrix content, thus subsequent calls with the same arguments do not
+        derive the matrix again.
+
     References
     ----------
     :cite:`Fairchild2013t`
@@ -110,6 +123,14 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
             'methods: "{1}".'.format(transform,
                                      CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
 
+    # Only the matrices of single whitepoints pairs are cached.
+    key = None
+    if XYZ_w.shape == XYZ_wr.shape == (3, ):
+        key = (XYZ_w.tobytes(), XYZ_wr.tobytes(), np.asarray(M).tobytes())
+        M_CAT = _CHROMATIC_ADAPTATION_MATRICES_CACHE.get(key)
+        if M_CAT is not None:
+            return np.copy(M_CAT)
+
     rgb_w = np.einsum('...i,...ij->...j', XYZ_w, np.transpose(M))
     rgb_wr = np.einsum('...i,...ij->...j', XYZ_wr, np.transpose(M))
 
@@ -120,6 +141,11 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     M_CAT = dot_matrix(np.linalg.inv(M), D)
     M_CAT = dot_matrix(M_CAT, M)
 
+    if key is not None:
+        M_CAT_c = np.copy(M_CAT)
+        M_CAT_c.setflags(write=False)
+        _CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = M_CAT_c
+
     return M_CAT
 
 
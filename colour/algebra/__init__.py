@@ -16,7 +16,8 @@ from .interpolation import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, NearestNeighbourInterpolator,
     LinearInterpolator, SpragueInterpolator, CubicSplineInterpolator,
-    PchipInterpolator, NullInterpolator, lagrange_coefficients,
+    PchipInterpolator, NullInterpolator, LINEAR_INTERPOLATORS,
+    resampling_matrix, resample, lagrange_coefficients,
     table_interpolation_trilinear, table_interpolation_tetrahedral,
     TABLE_INTERPOLATION_METHODS, table_interpolation)
 from .matrix import is_identity
@@ -39,9 +40,10 @@ __all__ += [
     'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
     'NearestNeighbourInterpolator', 'LinearInterpolator',
     'SpragueInterpolator', 'CubicSplineInterpolator', 'PchipInterpolator',
-    'NullInterpolator', 'lagrange_coefficients',
-    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
-    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
+    'NullInterpolator', 'LINEAR_INTERPOLATORS', 'resampling_matrix',
+    'resample', 'lagrange_coefficients', 'table_interpolation_trilinear',
+    'table_interpolation_tetrahedral', 'TABLE_INTERPOLATION_METHODS',
+    'table_interpolation'
 ]
 __all__ += ['is_identity']
 __all__ += ['random_triplet_generator']
@@ -21,8 +21,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import as_float, is_numeric, is_string
+from colour.utilities import (as_float, is_numeric, is_string,
+                              get_float_precision)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -121,7 +121,7 @@ class Extrapolator(object):
                  right=None,
                  dtype=None):
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         self._interpolator = None
         self.interpolator = interpolator
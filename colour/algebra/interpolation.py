@@ -17,6 +17,12 @@ Defines classes and definitions for interpolating variables.
 -   :class:`colour.PchipInterpolator`: 1-D function piecewise cube Hermite
     interpolation.
 -   :class:`colour.NullInterpolator`: 1-D function null interpolation.
+-   :attr:`colour.algebra.LINEAR_INTERPOLATORS`: Interpolators linear in the
+    dependent variable values.
+-   :func:`colour.algebra.resampling_matrix`: Computation of the matrix
+    resampling a dependent variable with a linear interpolator.
+-   :func:`colour.algebra.resample`: Resampling of dependent variables with
+    a linear interpolator.
 -   :func:`colour.lagrange_coefficients`: Computation of
     *Lagrange Coefficients*.
 -   :func:`colour.algebra.table_interpolation_trilinear`: Trilinear
@@ -62,7 +68,10 @@ from __future__ import division, unicode_literals
 
 import itertools
 import numpy as np
+from fractions import Fraction
 import scipy.interpolate
+import scipy.sparse
+import six
 from six.moves import reduce
 from collections import OrderedDict
 try:  # pragma: no cover
@@ -70,10 +79,11 @@ try:  # pragma: no cover
 except ImportError:  # pragma: no cover
     from collections.abc import Mapping
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
-                              closest_indexes, interval, is_integer,
-                              is_numeric, runtime_warning, tsplit)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, LRUCache, as_float_array,
+                              as_float, closest_indexes, interval, is_integer,
+                              is_numeric, runtime_warning, tsplit,
+                              get_float_precision)
 from colour.utilities.deprecation import ObjectRenamed
 
 __author__ = 'Colour Developers'
@@ -88,10 +98,10 @@ __all__ = [
     'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
     'NearestNeighbourInterpolator', 'LinearInterpolator',
     'SpragueInterpolator', 'CubicSplineInterpolator', 'PchipInterpolator',
-    'NullInterpolator', 'lagrange_coefficients',
-    'vertices_and_relative_coordinates', 'table_interpolation_trilinear',
-    'table_interpolation_tetrahedral', 'TABLE_INTERPOLATION_METHODS',
-    'table_interpolation'
+    'NullInterpolator', 'LINEAR_INTERPOLATORS', 'resampling_matrix',
+    'resample', 'lagrange_coefficients', 'vertices_and_relative_coordinates',
+    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
 ]
 
 
@@ -270,6 +280,24 @@ def kernel_cardinal_spline(x, a=0.5, b=0.0):
     return 1 / 6 * y
 
 
+_KERNEL_INTERPOLATOR_CHUNK_SIZE = 2 ** 18
+"""
+Maximum element count of the windows indexes and kernel weights arrays
+computed at once by the :class:`colour.KernelInterpolator` class.
+
+_KERNEL_INTERPOLATOR_CHUNK_SIZE : int
+"""
+
+_KERNEL_INTERPOLATOR_MAXIMUM_PERIOD = 64
+"""
+Maximum period, in points, of the kernel weights of a uniformly spaced
+:math:`x` variable for the :class:`colour.KernelInterpolator` class to
+compute them once per phase.
+
+_KERNEL_INTERPOLATOR_MAXIMUM_PERIOD : int
+"""
+
+
 class KernelInterpolator(object):
     """
     Kernel based interpolation of a 1-D function.
@@ -362,10 +390,11 @@ class KernelInterpolator(object):
                  padding_kwargs=None,
                  dtype=None):
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         self._x_p = None
         self._y_p = None
+        self._x_interval = None
 
         self._x = None
         self._y = None
@@ -425,6 +454,7 @@ class KernelInterpolator(object):
                                  'unpredictable results may occur!'))
 
             self._x = value
+            self._x_interval = value_interval[0]
 
             if self._window is not None:
                 self._x_p = np.pad(
@@ -633,6 +663,14 @@ class KernelInterpolator(object):
         """
         Performs the interpolator evaluation at given points.
 
+        The points are evaluated by chunks so that the windows indexes and
+        kernel weights arrays never exceed
+        :attr:`colour.algebra.interpolation._KERNEL_INTERPOLATOR_CHUNK_SIZE`
+        elements. When the points are uniformly spaced with a step that is a
+        rational multiple of the :math:`x` variable interval, the kernel
+        weights are periodic: they are computed once per phase and applied
+        with strided slices of the padded :math:`y` variable.
+
         Parameters
         ----------
         x : ndarray
@@ -647,21 +685,110 @@ class KernelInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        x_interval = interval(self._x)[0]
+        shape = x.shape
+        x = np.ravel(x)
+
+        xi = self._evaluate_uniform(x)
+        if xi is None:
+            xi = np.empty(x.shape, dtype=self._dtype)
+
+            chunk_size = max(
+                _KERNEL_INTERPOLATOR_CHUNK_SIZE // (2 * self._window), 1)
+            for i in range(0, x.size, chunk_size):
+                windows, weights = self._windows_and_weights(
+                    x[i:i + chunk_size])
+                xi[i:i + chunk_size] = np.sum(
+                    self._y_p[windows] * weights, axis=-1)
+
+        return np.reshape(xi, shape)
+
+    def _evaluate_uniform(self, x):
+        """
+        Performs the interpolator evaluation at given uniformly spaced points
+        using the periodicity of the kernel weights.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the interpolant at.
+
+        Returns
+        -------
+        ndarray or None
+            Interpolated points values or *None* if the points are not
+            uniformly spaced with a step that is a rational multiple of the
+            :math:`x` variable interval.
+        """
+
+        if x.size < 4:
+            return None
+
+        x_interval = self._x_interval
+        x_s = (x[-1] - x[0]) / (x.size - 1)
+        if x_s <= 0:
+            return None
+
+        ratio = Fraction(
+            x_s /
+            x_interval).limit_denominator(_KERNEL_INTERPOLATOR_MAXIMUM_PERIOD)
+        p, q = ratio.numerator, ratio.denominator
+        if p == 0 or q * 4 > x.size:
+            return None
+
+        tolerance = np.finfo(np.float64).eps * 2 ** 10 * max(
+            abs(x[0]), abs(x[-1]), x_interval)
+        x_u = x[0] + np.arange(x.size) * (p / q * x_interval)
+        if np.max(np.abs(x - x_u)) > tolerance:
+            return None
+
+        windows, weights = self._windows_and_weights(x[:q])
+
+        counts = (x.size - 1 - np.arange(q)) // q + 1
+        if (np.any(np.diff(windows, axis=-1) != 1) or
+                np.max(windows[:, -1] + (counts - 1) * p) >= len(self._y_p)):
+            return None
+
+        xi = np.zeros(x.shape, dtype=self._dtype)
+        for r in range(q):
+            for k in range(2 * self._window):
+                i = windows[r, k]
+                xi[r::
+                   q] += weights[r, k] * self._y_p[i:i +
+                                                   (counts[r] - 1) * p + 1:p]
+
+        return xi
+
+    def _windows_and_weights(self, x):
+        """
+        Returns the windows indexes in the padded :math:`y` variable and the
+        kernel weights for given points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the interpolant at.
+
+        Returns
+        -------
+        tuple
+            Windows indexes and kernel weights.
+        """
+
+        x_interval = self._x_interval
         x_f = np.floor(x / x_interval)
 
         windows = (x_f[:, np.newaxis] + np.arange(-self._window + 1,
                                                   self._window + 1))
-        clip_l = min(self._x_p) / x_interval
-        clip_h = max(self._x_p) / x_interval
+        clip_l = np.min(self._x_p) / x_interval
+        clip_h = np.max(self._x_p) / x_interval
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(DEFAULT_INT_DTYPE)
 
-        return np.sum(
-            self._y_p[windows] * self._kernel(
-                x[:, np.newaxis] / x_interval - windows -
-                min(self._x_p) / x_interval, **self._kernel_kwargs),
-            axis=-1)
+        weights = self._kernel(
+            x[:, np.newaxis] / x_interval - windows - clip_l,
+            **self._kernel_kwargs)
+
+        return windows, weights
 
     def _validate_dimensions(self):
         """
@@ -809,7 +936,7 @@ class LinearInterpolator(object):
 
     def __init__(self, x, y, dtype=None):
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         self._x = None
         self._y = None
@@ -1027,10 +1154,11 @@ class SpragueInterpolator(object):
 
     def __init__(self, x, y, dtype=None):
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         self._xp = None
         self._yp = None
+        self._coefficients = None
 
         self._x = None
         self._y = None
@@ -1078,7 +1206,8 @@ class SpragueInterpolator(object):
             xp3 = value[-1] + value_interval
             xp4 = value[-1] + value_interval * 2
 
-            self._xp = np.concatenate(((xp1, xp2), value, (xp3, xp4)))
+            self._xp = np.concatenate(((xp1, xp2), value,
+                                       (xp3, xp4))).astype(self._dtype)
 
         self._x = value
 
@@ -1131,7 +1260,11 @@ class SpragueInterpolator(object):
                 (np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
                         np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
 
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            self._yp = np.concatenate(((yp1, yp2), value,
+                                       (yp3, yp4))).astype(self._dtype)
+
+            # The polynomial coefficients are computed on first evaluation.
+            self._coefficients = None
 
         self._y = value
 
@@ -1152,6 +1285,45 @@ class SpragueInterpolator(object):
 
         return self._evaluate(x)
 
+    @staticmethod
+    def _polynomial_coefficients(r):
+        """
+        Computes the fifth-order polynomial coefficients of each interval from
+        given dependent variable values with boundaries extra points.
+
+        Parameters
+        ----------
+        r : ndarray, (n, ...)
+            Dependent variable values with boundaries extra points, the first
+            axis is the interpolated axis.
+
+        Returns
+        -------
+        ndarray, (6, n, ...)
+            Polynomial coefficients :math:`a_0, ..., a_5`, indexed by the
+            interval lower bound index.
+        """
+
+        # The dependent variable values are rolled so that the coefficients of
+        # the boundaries intervals match those of the direct indexing.
+        r_m2, r_m1, r_p1, r_p2, r_p3 = [
+            np.roll(r, -i, axis=0) for i in (-2, -1, 1, 2, 3)
+        ]
+
+        a0p = r
+        a1p = ((2 * r_m2 - 16 * r_m1 + 16 * r_p1 - 2 * r_p2) / 24)
+        a2p = ((-r_m2 + 16 * r_m1 - 30 * r + 16 * r_p1 - r_p2) / 24)
+        a3p = (
+            (-9 * r_m2 + 39 * r_m1 - 70 * r + 66 * r_p1 - 33 * r_p2 + 7 * r_p3)
+            / 24)
+        a4p = ((13 * r_m2 - 64 * r_m1 + 126 * r - 124 * r_p1 + 61 * r_p2 -
+                12 * r_p3) / 24)
+        a5p = (
+            (-5 * r_m2 + 25 * r_m1 - 50 * r + 50 * r_p1 - 25 * r_p2 + 5 * r_p3)
+            / 24)
+
+        return np.array([a0p, a1p, a2p, a3p, a4p, a5p])
+
     def _evaluate(self, x):
         """
         Performs the interpolating polynomial evaluation at given point.
@@ -1175,22 +1347,12 @@ class SpragueInterpolator(object):
         i = np.searchsorted(self._xp, x) - 1
         X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
 
-        r = self._yp
+        if self._coefficients is None:
+            self._coefficients = self._polynomial_coefficients(self._yp)
 
-        a0p = r[i]
-        a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
-                2 * r[i + 2]) / 24)  # yapf: disable
-        a2p = ((-r[i - 2] + 16 * r[i - 1] - 30 * r[i] + 16 * r[i + 1] -
-                r[i + 2]) / 24)  # yapf: disable
-        a3p = ((-9 * r[i - 2] + 39 * r[i - 1] - 70 * r[i] + 66 * r[i + 1] -
-                33 * r[i + 2] + 7 * r[i + 3]) / 24)
-        a4p = ((13 * r[i - 2] - 64 * r[i - 1] + 126 * r[i] - 124 * r[i + 1] +
-                61 * r[i + 2] - 12 * r[i + 3]) / 24)
-        a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] + 50 * r[i + 1] -
-                25 * r[i + 2] + 5 * r[i + 3]) / 24)
+        a0p, a1p, a2p, a3p, a4p, a5p = self._coefficients[:, i]
 
-        y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
-             a5p * X ** 5)
+        y = a0p + X * (a1p + X * (a2p + X * (a3p + X * (a4p + X * a5p))))
 
         return y
 
@@ -1333,7 +1495,7 @@ class NullInterpolator(object):
                  default=np.nan,
                  dtype=None):
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         self._x = None
         self._y = None
@@ -1583,6 +1745,300 @@ class NullInterpolator(object):
             raise ValueError('"{0}" is above interpolation range.'.format(x))
 
 
+_RESAMPLING_MATRICES_CACHE = LRUCache(64)
+"""
+Cache of the resampling matrices, keyed by the independent variables content
+and the interpolator settings.
+
+_RESAMPLING_MATRICES_CACHE : LRUCache
+"""
+
+LINEAR_INTERPOLATORS = (KernelInterpolator, LinearInterpolator,
+                        SpragueInterpolator, CubicSplineInterpolator)
+"""
+Interpolators whose interpolated values are a linear combination of the
+dependent variable values, thus supported by the
+:func:`colour.algebra.resampling_matrix` definition.
+
+LINEAR_INTERPOLATORS : tuple
+"""
+
+
+def _band_matrix(weights, columns, size):
+    """
+    Returns the sparse matrix whose rows hold given weights at given columns.
+
+    Parameters
+    ----------
+    weights : array_like, (m, k)
+        Weights of each row.
+    columns : array_like, (m, k)
+        Column indexes of the weights.
+    size : int
+        Columns count.
+
+    Returns
+    -------
+    csr_matrix, (m, size)
+        Sparse matrix.
+    """
+
+    weights = np.atleast_2d(weights)
+    rows, count = weights.shape
+
+    M = scipy.sparse.csr_matrix(
+        (np.ravel(weights), np.ravel(columns),
+         np.arange(0, rows * count + 1, count)),
+        shape=(rows, size))
+    M.sum_duplicates()
+
+    return M
+
+
+def _resampling_matrix_Kernel(interpolator, x_r):
+    """
+    Returns the resampling matrix of given kernel interpolator, built from
+    the kernel weights of the padded dependent variable values windows.
+    """
+
+    windows, weights = interpolator._windows_and_weights(x_r)
+
+    # The padding is applied to the canonical basis vectors to map the padded
+    # dependent variable values onto the dependent variable values.
+    padding_kwargs = dict(interpolator.padding_kwargs)
+    pad_width = np.broadcast_to(padding_kwargs['pad_width'], (1, 2))
+    padding_kwargs['pad_width'] = (tuple(pad_width[0]), (0, 0))
+    P = scipy.sparse.csr_matrix(
+        np.pad(np.identity(len(interpolator.x)), **padding_kwargs))
+
+    return _band_matrix(weights, windows, P.shape[0]).dot(P)
+
+
+def _resampling_matrix_Linear(interpolator, x_r):
+    """
+    Returns the resampling matrix of given linear interpolator, built from
+    the weights of the bounding samples.
+    """
+
+    x = as_float_array(interpolator.x)
+    i = np.clip(np.searchsorted(x, x_r, 'right') - 1, 0, len(x) - 2)
+    t = (x_r - x[i]) / (x[i + 1] - x[i])
+
+    return _band_matrix(
+        np.transpose([1 - t, t]), i[:, np.newaxis] + np.arange(2), len(x))
+
+
+def _resampling_matrix_Sprague(interpolator, x_r):
+    """
+    Returns the resampling matrix of given *Sprague (1880)* interpolator,
+    built from the fifth-order polynomial coefficients of the canonical basis
+    vectors, i.e. the weights of the 6 samples surrounding each interval.
+    """
+
+    xp = interpolator._xp
+    i = np.searchsorted(xp, x_r) - 1
+    X = (x_r - xp[i]) / (xp[i + 1] - xp[i])
+
+    stencil = interpolator._polynomial_coefficients(np.identity(6))[:, 2]
+    weights = np.dot(X[:, np.newaxis] ** np.arange(6), stencil)
+
+    # The boundaries extra points are linear combinations of the first and
+    # last 6 dependent variable values.
+    n = len(interpolator.x)
+    boundaries = interpolator.SPRAGUE_C_COEFFICIENTS / 209
+    zeros = scipy.sparse.csr_matrix((2, n - 6))
+    P = scipy.sparse.vstack(
+        [
+            scipy.sparse.hstack([boundaries[:2], zeros]),
+            scipy.sparse.identity(n),
+            scipy.sparse.hstack([zeros, boundaries[2:]]),
+        ],
+        format='csr')
+
+    return _band_matrix(
+        weights, (i[:, np.newaxis] + np.arange(-2, 4)) % (n + 4), n + 4).dot(P)
+
+
+def _resampling_matrix_CubicSpline(interpolator, x_r):
+    """
+    Returns the resampling matrix of given cubic spline interpolator, built
+    by interpolating the canonical basis vectors at once. The matrix is dense
+    as each interpolated value depends on all the samples.
+    """
+
+    interpolator = CubicSplineInterpolator(
+        interpolator.x, np.identity(len(interpolator.x)), axis=0)
+
+    return as_float_array(interpolator(x_r))
+
+
+def resampling_matrix(x,
+                      x_r,
+                      interpolator=SpragueInterpolator,
+                      interpolator_kwargs=None):
+    """
+    Returns the matrix :math:`M` resampling a dependent variable from given
+    independent variable :math:`x` to given independent variable :math:`x_r`
+    using given linear interpolator.
+
+    The interpolators from :attr:`colour.algebra.LINEAR_INTERPOLATORS`
+    attribute are linear in the dependent variable values, the resampling of
+    any dependent variable :math:`y` is thus the matrix product
+    :math:`M \\cdot y`. The matrix is built at once from the interpolator
+    weights: the *Kernel*, *Linear* and *Sprague (1880)* interpolators
+    weights span a few samples around each interval and yield a banded sparse
+    matrix while the *Cubic Spline* interpolator yields a dense matrix, whose
+    product is faster without the sparse representation.
+
+    The matrices are cached, keyed by the independent variables content and
+    the interpolator settings, thus subsequent calls with the same arguments
+    do not build the matrix again.
+
+    Parameters
+    ----------
+    x : array_like
+        Independent :math:`x` variable values of the dependent variables to
+        resample.
+    x_r : array_like
+        Independent :math:`x_r` variable values to resample the dependent
+        variables at.
+    interpolator : object, optional
+        Interpolator class type from the
+        :attr:`colour.algebra.LINEAR_INTERPOLATORS` attribute or a sub-class.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolator class.
+
+    Returns
+    -------
+    csr_matrix or ndarray, (len(x_r), len(x))
+        Resampling matrix :math:`M`, its data is read-only as it is shared by
+        the subsequent calls.
+
+    Raises
+    ------
+    ValueError
+        If the interpolator is not linear in the dependent variable values or
+        if :math:`x_r` is outside the interpolation range.
+
+    Examples
+    --------
+    >>> x = np.arange(7)
+    >>> M = resampling_matrix(x, np.array([0.25, 0.5, 0.75]))
+    >>> M.shape
+    (3, 7)
+    >>> y = np.array([5.9200, 9.3700, 10.8135, 4.5100,
+    ...               69.5900, 27.8007, 86.0500])
+    >>> M.dot(y)  # doctest: +ELLIPSIS
+    array([ 6.7295161...,  7.2185025...,  7.8140625...])
+    """
+
+    for linear, builder in (
+        (KernelInterpolator, _resampling_matrix_Kernel),
+        (LinearInterpolator, _resampling_matrix_Linear),
+        (SpragueInterpolator, _resampling_matrix_Sprague),
+        (CubicSplineInterpolator, _resampling_matrix_CubicSpline),
+    ):
+        if issubclass(interpolator, linear):
+            break
+    else:
+        raise ValueError(
+            '"{0}" interpolator is not linear in the dependent variable '
+            'values, supported interpolators: "{1}".'.format(
+                interpolator.__name__,
+                [linear.__name__ for linear in LINEAR_INTERPOLATORS]))
+
+    if interpolator_kwargs is None:
+        interpolator_kwargs = {}
+
+    x = as_float_array(x)
+    x_r = np.ravel(as_float_array(x_r))
+
+    key = (x.tobytes(), x_r.tobytes(), interpolator,
+           six.text_type(sorted(interpolator_kwargs.items())))
+    M = _RESAMPLING_MATRICES_CACHE.get(key)
+    if M is None:
+        interpolator = interpolator(x, np.zeros(x.shape),
+                                    **interpolator_kwargs)
+        if hasattr(interpolator, '_validate_interpolation_range'):
+            interpolator._validate_interpolation_range(x_r)
+
+        M = builder(interpolator, x_r)
+        if scipy.sparse.issparse(M):
+            M.eliminate_zeros()
+            arrays = (M.data, M.indices, M.indptr)
+        else:
+            arrays = (M, )
+
+        for array in arrays:
+            array.setflags(write=False)
+
+        _RESAMPLING_MATRICES_CACHE[key] = M
+
+    return M
+
+
+def resample(y,
+             x,
+             x_r,
+             interpolator=SpragueInterpolator,
+             interpolator_kwargs=None):
+    """
+    Resamples given dependent variable :math:`y` from given independent
+    variable :math:`x` to given independent variable :math:`x_r` using given
+    linear interpolator.
+
+    The resampling is performed with a single sparse matrix product with the
+    cached :func:`colour.algebra.resampling_matrix` definition matrix, thus an
+    array of many dependent variables, e.g. measured spectra, is resampled at
+    once.
+
+    Parameters
+    ----------
+    y : array_like, (..., len(x))
+        Dependent :math:`y` variable values to resample, the last axis is the
+        resampled axis.
+    x : array_like
+        Independent :math:`x` variable values of the dependent variables to
+        resample.
+    x_r : array_like
+        Independent :math:`x_r` variable values to resample the dependent
+        variables at.
+    interpolator : object, optional
+        Interpolator class type from the
+        :attr:`colour.algebra.LINEAR_INTERPOLATORS` attribute or a sub-class.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolator class.
+
+    Returns
+    -------
+    ndarray, (..., len(x_r))
+        Resampled dependent variable values.
+
+    Notes
+    -----
+    -   A non-finite value, e.g. *nan*, spreads to the whole resampled
+        dependent variable it belongs to.
+
+    Examples
+    --------
+    >>> y = np.array([[5.9200, 9.3700, 10.8135, 4.5100,
+    ...                69.5900, 27.8007, 86.0500],
+    ...               [1.0000, 2.0000, 3.0000, 4.0000,
+    ...                5.0000, 6.0000, 7.0000]])
+    >>> resample(y, np.arange(7), np.array([0.5, 1.5]))  # doctest: +ELLIPSIS
+    array([[  7.2185025...,  12.2356883...],
+           [  1.5       ,   2.5       ]])
+    """
+
+    M = resampling_matrix(x, x_r, interpolator, interpolator_kwargs)
+
+    y = as_float_array(y)
+
+    return np.reshape(
+        np.transpose(M.dot(np.transpose(np.reshape(y, (-1, y.shape[-1]))))),
+        y.shape[:-1] + (M.shape[0], ))
+
+
 def lagrange_coefficients(r, n=4):
     """
     Computes the *Lagrange Coefficients* at given point :math:`r` for degree
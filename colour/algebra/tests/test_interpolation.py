@@ -16,13 +16,15 @@ import os
 import unittest
 from itertools import permutations
 
+from colour.algebra import interpolation
 from colour.algebra.interpolation import vertices_and_relative_coordinates
 from colour.algebra import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, NearestNeighbourInterpolator,
     LinearInterpolator, SpragueInterpolator, CubicSplineInterpolator,
-    PchipInterpolator, NullInterpolator, lagrange_coefficients,
-    table_interpolation_trilinear, table_interpolation_tetrahedral)
+    PchipInterpolator, NullInterpolator, resampling_matrix, resample,
+    lagrange_coefficients, table_interpolation_trilinear,
+    table_interpolation_tetrahedral)
 from colour.algebra import random_triplet_generator
 from colour.io import read_LUT
 from colour.utilities import ignore_numpy_errors
@@ -43,9 +45,9 @@ __all__ = [
     'TestKernelLanczos', 'TestKernelCardinalSpline', 'TestKernelInterpolator',
     'TestLinearInterpolator', 'TestSpragueInterpolator',
     'TestCubicSplineInterpolator', 'TestPchipInterpolator',
-    'TestNullInterpolator', 'TestLagrangeCoefficients',
-    'TestVerticesAndRelativeCoordinates', 'TestTableInterpolationTrilinear',
-    'TestTableInterpolationTetrahedral'
+    'TestNullInterpolator', 'TestResamplingMatrix', 'TestResample',
+    'TestLagrangeCoefficients', 'TestVerticesAndRelativeCoordinates',
+    'TestTableInterpolationTrilinear', 'TestTableInterpolationTetrahedral'
 ]
 
 POINTS_DATA_A = (9.3700, 12.3200, 12.4600, 9.5100, 5.9200, 4.3300, 4.2900,
@@ -510,6 +512,36 @@ padding_kwargs` property.
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+    def test_chunks__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
+        method evaluation by chunks and with periodic kernel weights.
+        """
+
+        x = np.arange(11, 61, 1)
+        y = np.sin(x / len(x) * np.pi * 6) / (x / len(x)) + np.pi
+        kernel_interpolator = KernelInterpolator(x, y, kernel=kernel_sinc)
+
+        for x_i in (np.linspace(11, 60, 491), np.arange(11, 60, 2.5),
+                    np.linspace(11.25, 59.75, 98)):
+            y_i = np.array([kernel_interpolator(i) for i in x_i])
+
+            np.testing.assert_almost_equal(
+                kernel_interpolator(x_i), y_i, decimal=7)
+
+            chunk_size = interpolation._KERNEL_INTERPOLATOR_CHUNK_SIZE
+            try:
+                interpolation._KERNEL_INTERPOLATOR_CHUNK_SIZE = 16
+                np.testing.assert_almost_equal(
+                    kernel_interpolator(x_i[::-1]), y_i[::-1], decimal=7)
+            finally:
+                interpolation._KERNEL_INTERPOLATOR_CHUNK_SIZE = chunk_size
+
+            np.testing.assert_almost_equal(
+                kernel_interpolator(np.reshape(x_i[:12], (2, 3, 2))),
+                np.reshape(y_i[:12], (2, 3, 2)),
+                decimal=7)
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
@@ -947,6 +979,102 @@ default` property.
                 pass
 
 
+class TestResamplingMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.resampling_matrix` definition
+    unit tests methods.
+    """
+
+    def test_resampling_matrix(self):
+        """
+        Tests :func:`colour.algebra.interpolation.resampling_matrix`
+        definition.
+        """
+
+        x = np.arange(len(POINTS_DATA_A))
+        x_r = np.linspace(0, len(POINTS_DATA_A) - 1, 151)
+
+        for interpolator in (KernelInterpolator, NearestNeighbourInterpolator,
+                             LinearInterpolator, SpragueInterpolator,
+                             CubicSplineInterpolator):
+            M = resampling_matrix(x, x_r, interpolator)
+            self.assertTupleEqual(M.shape, (len(x_r), len(x)))
+
+            np.testing.assert_almost_equal(
+                M.dot(POINTS_DATA_A),
+                interpolator(x, POINTS_DATA_A)(x_r),
+                decimal=7)
+
+        M = resampling_matrix(
+            x, x_r, KernelInterpolator,
+            {'padding_kwargs': {
+                'pad_width': 3,
+                'mode': 'edge'
+            }})
+        np.testing.assert_almost_equal(
+            M.dot(POINTS_DATA_A),
+            KernelInterpolator(
+                x,
+                POINTS_DATA_A,
+                padding_kwargs={
+                    'pad_width': 3,
+                    'mode': 'edge'
+                })(x_r),
+            decimal=7)
+
+        M = resampling_matrix(x, x_r)
+        self.assertIs(M, resampling_matrix(x, x_r))
+        self.assertFalse(M.data.flags.writeable)
+
+        # The "Sprague (1880)" interpolator weights span the 6 samples
+        # surrounding each interval away from the boundaries.
+        x = np.arange(100)
+        M = resampling_matrix(x, np.linspace(0, 99, 991))
+        self.assertLessEqual(np.max(np.diff(M.indptr)[30:-30]), 6)
+
+        self.assertIsNot(M, resampling_matrix(x, x_r, LinearInterpolator))
+
+    def test_raise_exception_resampling_matrix(self):
+        """
+        Tests :func:`colour.algebra.interpolation.resampling_matrix`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, resampling_matrix, np.arange(10),
+                          np.linspace(0, 9, 19), PchipInterpolator)
+
+        self.assertRaises(ValueError, resampling_matrix, np.arange(10),
+                          np.linspace(0, 10, 21))
+
+
+class TestResample(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.resample` definition unit
+    tests methods.
+    """
+
+    def test_resample(self):
+        """
+        Tests :func:`colour.algebra.interpolation.resample` definition.
+        """
+
+        x = np.arange(len(POINTS_DATA_A))
+        x_r = np.linspace(0, len(POINTS_DATA_A) - 1, 151)
+
+        np.testing.assert_almost_equal(
+            resample(POINTS_DATA_A, x, x_r),
+            SpragueInterpolator(x, POINTS_DATA_A)(x_r),
+            decimal=7)
+
+        y = np.reshape(np.tile(POINTS_DATA_A, 6), (2, 3, len(x)))
+        np.testing.assert_almost_equal(
+            resample(y, x, x_r, LinearInterpolator),
+            np.reshape(
+                np.tile(LinearInterpolator(x, POINTS_DATA_A)(x_r), 6),
+                (2, 3, len(x_r))),
+            decimal=7)
+
+
 class TestLagrangeCoefficients(unittest.TestCase):
     """
     Defines :func:`colour.algebra.interpolation.lagrange_coefficients`
@@ -10,6 +10,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.CAM16_Specification`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
+-   :class:`colour.CAM16_Context`
 
 References
 ----------
@@ -26,20 +27,20 @@ from collections import namedtuple
 
 from colour.algebra import spow
 from colour.appearance.ciecam02 import (
-    CIECAM02_VIEWING_CONDITIONS, P, achromatic_response_forward,
-    achromatic_response_inverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
-    hue_angle, hue_quadrature, lightness_correlate,
-    opponent_colour_dimensions_forward, opponent_colour_dimensions_inverse,
+    _range_correlates, _required_correlates, CIECAM02_VIEWING_CONDITIONS, P,
+    achromatic_response_forward, achromatic_response_inverse,
+    brightness_correlate, chroma_correlate, colourfulness_correlate,
+    degree_of_adaptation, eccentricity_factor, hue_angle, hue_quadrature,
+    lightness_correlate, opponent_colour_dimensions_forward,
+    opponent_colour_dimensions_inverse,
     post_adaptation_non_linear_response_compression_forward,
     post_adaptation_non_linear_response_compression_inverse,
     post_adaptation_non_linear_response_compression_matrix,
     saturation_correlate, temporary_magnitude_quantity_inverse,
     viewing_condition_dependent_parameters)
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              as_namedtuple, dot_vector, from_range_100,
-                              from_range_degrees, ones, to_domain_100,
-                              to_domain_degrees, tsplit)
+                              as_namedtuple, dot_vector, from_range_100, ones,
+                              to_domain_100, to_domain_degrees, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -51,7 +52,7 @@ __status__ = 'Production'
 __all__ = [
     'M_16', 'M_16_INVERSE', 'CAM16_InductionFactors',
     'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_to_XYZ', 'CAM16_Context'
 ]
 
 M_16 = np.array([
@@ -159,7 +160,8 @@ def XYZ_to_CAM16(XYZ,
                  L_A,
                  Y_b,
                  surround=CAM16_VIEWING_CONDITIONS['Average'],
-                 discount_illuminant=False):
+                 discount_illuminant=False,
+                 correlates=None):
     """
     Computes the *CAM16* colour appearance model correlates from given
     *CIE XYZ* tristimulus values.
@@ -181,12 +183,22 @@ def XYZ_to_CAM16(XYZ,
         Surround viewing conditions induction factors.
     discount_illuminant : bool, optional
         Truth value indicating if the illuminant should be discounted.
+    correlates : array_like or unicode, optional
+        **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+        Correlates to compute, e.g. ``('J', 'M', 'h')`` or ``'JMh'``, only the
+        intermediate quantities they depend on are computed and the other
+        correlates are set to *None*. Default to all the correlates.
 
     Returns
     -------
     CAM16_Specification
         *CAM16* colour appearance model specification.
 
+    Raises
+    ------
+    ValueError
+        If an unsupported correlate is given in the ``correlates`` argument.
+
     Notes
     -----
 
@@ -230,8 +242,14 @@ def XYZ_to_CAM16(XYZ,
     >>> XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround)  # doctest: +ELLIPSIS
     CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
 s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
+    >>> XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround, correlates='JMh')
+    ... # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7312079..., C=None, h=217.0679597..., s=None, \
+Q=None, M=0.1074367..., H=None, HC=None)
     """
 
+    required = _required_correlates(correlates)
+
     XYZ = to_domain_100(XYZ)
     XYZ_w = to_domain_100(XYZ_w)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -271,47 +289,54 @@ s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
     # Applying forward post-adaptation non linear response compression.
     RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_c, F_L)
 
-    # Step 4
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+    J = C = h = s = Q = M = H = None
 
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
+    if 'h' in required:
+        # Step 4
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
 
-    # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
 
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
+    if 'H' in required:
+        # Step 5
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
 
-    # Step 6
-    # Computing achromatic responses for the stimulus.
-    A = achromatic_response_forward(RGB_a, N_bb)
+    if 'J' in required:
+        # Step 6
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, N_bb)
 
-    # Step 7
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
+        # Step 7
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, A_w, surround.c, z)
 
-    # Step 8
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
+    if 'Q' in required:
+        # Step 8
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, A_w, F_L)
 
-    # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+    if 'C' in required:
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
 
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
+        # Step 9
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
 
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
+    if 'M' in required:
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+    if 's' in required:
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
 
     return CAM16_Specification(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H), None)
+        *_range_correlates(correlates, J, C, h, s, Q, M, H))
 
 
 def CAM16_to_XYZ(CAM16_specification,
@@ -475,3 +500,306 @@ def CAM16_to_XYZ(CAM16_specification,
     XYZ = dot_vector(M_16_INVERSE, RGB)
 
     return from_range_100(XYZ)
+
+
+class CAM16_Context(object):
+    """
+    Defines a *CAM16* colour appearance model context precomputing the
+    terms depending only on the reference white and viewing conditions so
+    that its forward and inverse transforms only perform the per-stimulus
+    computations.
+
+    The :math:`M_{16}` adaptation matrix and full chromatic adaptation steps
+    are fused into a single matrix.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    inverse
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   The reference white is converted according to the domain-range scale
+        in effect when the context is instantiated.
+
+    References
+    ----------
+    :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> context = CAM16_Context(XYZ_w, 318.31, 20.0)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> context.forward(XYZ)  # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
+s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
+    >>> context.inverse(context.forward(XYZ))  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CAM16_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = to_domain_100(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        RGB_w = dot_vector(M_16, self._XYZ_w)
+
+        D = (np.clip(degree_of_adaptation(surround.F, self._L_A), 0, 1)
+             if not discount_illuminant else ones(self._L_A.shape))
+
+        self._n, self._F_L, self._N_bb, self._N_cb, self._z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            D_RGB * RGB_w, self._F_L)
+        self._A_w = achromatic_response_forward(RGB_aw, self._N_bb)
+
+        self._XYZ_to_RGB_c_matrix = D_RGB[..., np.newaxis] * M_16
+        self._RGB_c_to_XYZ_matrix = M_16_INVERSE / D_RGB[..., np.newaxis, :]
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        CAM16_InductionFactors
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    def forward(self, XYZ, correlates=None):
+        """
+        Computes the *CAM16* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+        correlates : array_like or unicode, optional
+            **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+            Correlates to compute, e.g. ``('J', 'M', 'h')`` or ``'JMh'``, the
+            other correlates are set to *None*. Default to all the
+            correlates.
+
+        Returns
+        -------
+        CAM16_Specification
+            *CAM16* colour appearance model specification.
+
+        Raises
+        ------
+        ValueError
+            If an unsupported correlate is given in the ``correlates``
+            argument.
+
+        Notes
+        -----
+        -   Refer to the :func:`colour.XYZ_to_CAM16` definition for the
+            domain and range of the *CIE XYZ* tristimulus values and
+            correlates.
+        """
+
+        required = _required_correlates(correlates)
+
+        XYZ = to_domain_100(XYZ)
+
+        # Converting *CIE XYZ* tristimulus values to adapted sharpened *RGB*
+        # values.
+        RGB_c = dot_vector(self._XYZ_to_RGB_c_matrix, XYZ)
+
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_c, self._F_L)
+
+        J = C = h = s = Q = M = H = None
+
+        if 'h' in required:
+            a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+            h = hue_angle(a, b)
+
+        if 'H' in required:
+            H = hue_quadrature(h)
+
+        if 'J' in required:
+            A = achromatic_response_forward(RGB_a, self._N_bb)
+            J = lightness_correlate(A, self._A_w, self._surround.c, self._z)
+
+        if 'Q' in required:
+            Q = brightness_correlate(self._surround.c, J, self._A_w, self._F_L)
+
+        if 'C' in required:
+            e_t = eccentricity_factor(h)
+            C = chroma_correlate(J, self._n, self._surround.N_c, self._N_cb,
+                                 e_t, a, b, RGB_a)
+
+        if 'M' in required:
+            M = colourfulness_correlate(C, self._F_L)
+
+        if 's' in required:
+            s = saturation_correlate(M, Q)
+
+        return CAM16_Specification(
+            *_range_correlates(correlates, J, C, h, s, Q, M, H))
+
+    def inverse(self, CAM16_specification):
+        """
+        Converts from *CAM16* specification to *CIE XYZ* tristimulus
+        values.
+
+        Parameters
+        ----------
+        CAM16_specification : CAM16_Specification
+            *CAM16* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CAM16_specification`` argument.
+
+        Notes
+        -----
+        -   Refer to the :func:`colour.CAM16_to_XYZ` definition for the
+            domain and range of the correlates and *CIE XYZ* tristimulus
+            values.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
+                                                    CAM16_Specification)
+        J = to_domain_100(J)
+        C = to_domain_100(C) if C is not None else C
+        h = to_domain_degrees(h)
+        M = to_domain_100(M) if M is not None else M
+
+        if C is None and M is not None:
+            C = M / spow(self._F_L, 0.25)
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CAM16_specification" argument!')
+
+        t = temporary_magnitude_quantity_inverse(C, J, self._n)
+        e_t = eccentricity_factor(h)
+        A = achromatic_response_inverse(self._A_w, J, self._surround.c,
+                                        self._z)
+
+        P_n = P(self._surround.N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
+
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+        RGB_c = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, self._F_L)
+
+        # Converting from adapted sharpened *RGB* values to *CIE XYZ*
+        # tristimulus values.
+        XYZ = dot_vector(self._RGB_c_to_XYZ_matrix, RGB_c)
+
+        return from_range_100(XYZ)
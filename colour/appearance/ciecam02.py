@@ -10,6 +10,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CIECAM02_Specification`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.CIECAM02_Context`
 
 References
 ----------
@@ -52,10 +53,10 @@ __all__ = [
     'CAT02_INVERSE_CAT', 'CIECAM02_InductionFactors',
     'CIECAM02_VIEWING_CONDITIONS', 'HUE_DATA_FOR_HUE_QUADRATURE',
     'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
-    'chromatic_induction_factors', 'base_exponential_non_linearity',
-    'viewing_condition_dependent_parameters', 'degree_of_adaptation',
-    'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_inverse',
-    'RGB_to_rgb', 'rgb_to_RGB',
+    'CIECAM02_Context', 'chromatic_induction_factors',
+    'base_exponential_non_linearity', 'viewing_condition_dependent_parameters',
+    'degree_of_adaptation', 'full_chromatic_adaptation_forward',
+    'full_chromatic_adaptation_inverse', 'RGB_to_rgb', 'rgb_to_RGB',
     'post_adaptation_non_linear_response_compression_forward',
     'post_adaptation_non_linear_response_compression_inverse',
     'opponent_colour_dimensions_forward', 'opponent_colour_dimensions_inverse',
@@ -170,12 +171,122 @@ class CIECAM02_Specification(
             cls, J, C, h, s, Q, M, H, HC)
 
 
+_CORRELATES_DEPENDENCIES = {
+    'J': (),
+    'C': ('J', 'h'),
+    'h': (),
+    's': ('M', 'Q'),
+    'Q': ('J', ),
+    'M': ('C', ),
+    'H': ('h', ),
+}
+"""
+Correlates computation dependencies of the *CIECAM02* and *CAM16* colour
+appearance models.
+
+_CORRELATES_DEPENDENCIES : dict
+"""
+
+
+def _required_correlates(correlates=None):
+    """
+    Returns the correlates that must be computed to yield given correlates,
+    i.e. given correlates and the correlates they depend on.
+
+    Parameters
+    ----------
+    correlates : array_like or unicode, optional
+        **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+        Correlates to compute, default to all the correlates.
+
+    Returns
+    -------
+    set
+        Correlates that must be computed.
+
+    Raises
+    ------
+    ValueError
+        If an unsupported correlate is given.
+
+    Examples
+    --------
+    >>> sorted(_required_correlates('JMh'))
+    ['C', 'J', 'M', 'h']
+    """
+
+    if correlates is None:
+        return set(_CORRELATES_DEPENDENCIES.keys())
+
+    required = set()
+    pending = list(correlates)
+    while pending:
+        correlate = pending.pop()
+
+        if correlate not in _CORRELATES_DEPENDENCIES:
+            raise ValueError(
+                '"{0}" correlate is not supported, it must be one of {1}!'.
+                format(correlate, sorted(_CORRELATES_DEPENDENCIES.keys())))
+
+        if correlate not in required:
+            required.add(correlate)
+            pending.extend(_CORRELATES_DEPENDENCIES[correlate])
+
+    return required
+
+
+def _range_correlates(correlates, J, C, h, s, Q, M, H):
+    """
+    Converts given correlates to the current range-scale, the correlates not
+    being part of the requested correlates are set to *None*.
+
+    Parameters
+    ----------
+    correlates : array_like or unicode
+        **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+        Requested correlates, *None* meaning all the correlates.
+    J : ndarray
+        Correlate of *Lightness* :math:`J`.
+    C : ndarray
+        Correlate of *chroma* :math:`C`.
+    h : ndarray
+        *Hue* angle :math:`h` in degrees.
+    s : ndarray
+        Correlate of *saturation* :math:`s`.
+    Q : ndarray
+        Correlate of *brightness* :math:`Q`.
+    M : ndarray
+        Correlate of *colourfulness* :math:`M`.
+    H : ndarray
+        *Hue* :math:`h` quadrature :math:`H`.
+
+    Returns
+    -------
+    tuple
+        Converted correlates and *Hue* :math:`h` composition :math:`H^C` set
+        to *None*.
+    """
+
+    from_ranges = (from_range_100, from_range_100, from_range_degrees,
+                   from_range_100, from_range_100, from_range_100,
+                   from_range_degrees)
+
+    values = (J, C, h, s, Q, M, H)
+
+    return tuple(
+        from_range(value)
+        if correlates is None or correlate in correlates else None
+        for correlate, value, from_range in zip('JChsQMH', values,
+                                                from_ranges)) + (None, )
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
                     Y_b,
                     surround=CIECAM02_VIEWING_CONDITIONS['Average'],
-                    discount_illuminant=False):
+                    discount_illuminant=False,
+                    correlates=None):
     """
     Computes the *CIECAM02* colour appearance model correlates from given
     *CIE XYZ* tristimulus values.
@@ -197,12 +308,22 @@ def XYZ_to_CIECAM02(XYZ,
         Surround viewing conditions induction factors.
     discount_illuminant : bool, optional
         Truth value indicating if the illuminant should be discounted.
+    correlates : array_like or unicode, optional
+        **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+        Correlates to compute, e.g. ``('J', 'M', 'h')`` or ``'JMh'``, only the
+        intermediate quantities they depend on are computed and the other
+        correlates are set to *None*. Default to all the correlates.
 
     Returns
     -------
     CIECAM02_Specification
         *CIECAM02* colour appearance model specification.
 
+    Raises
+    ------
+    ValueError
+        If an unsupported correlate is given in the ``correlates`` argument.
+
     Notes
     -----
 
@@ -247,8 +368,14 @@ def XYZ_to_CIECAM02(XYZ,
     >>> XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, surround)  # doctest: +ELLIPSIS
     CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
 s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+    >>> XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, surround, correlates='JMh')
+    ... # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=None, h=219.0484326..., s=None, \
+Q=None, M=0.1088421..., H=None, HC=None)
     """
 
+    required = _required_correlates(correlates)
+
     XYZ = to_domain_100(XYZ)
     XYZ_w = to_domain_100(XYZ_w)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -280,42 +407,49 @@ s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
     RGB_aw = post_adaptation_non_linear_response_compression_forward(
         RGB_pw, F_L)
 
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+    J = C = h = s = Q = M = H = None
 
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
+    if 'h' in required:
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
 
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
 
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
+    if 'H' in required:
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
 
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
+    if 'J' in required:
+        # Computing achromatic responses for the stimulus and the whitepoint.
+        A = achromatic_response_forward(RGB_a, N_bb)
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
 
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, A_w, surround.c, z)
 
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
+    if 'Q' in required:
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, A_w, F_L)
 
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+    if 'C' in required:
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
 
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
 
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
+    if 'M' in required:
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+    if 's' in required:
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
 
     return CIECAM02_Specification(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H), None)
+        *_range_correlates(correlates, J, C, h, s, Q, M, H))
 
 
 def CIECAM02_to_XYZ(CIECAM02_specification,
@@ -487,6 +621,315 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     return from_range_100(XYZ)
 
 
+class CIECAM02_Context(object):
+    """
+    Defines a *CIECAM02* colour appearance model context precomputing the
+    terms depending only on the reference white and viewing conditions so
+    that its forward and inverse transforms only perform the per-stimulus
+    computations.
+
+    The *CAT02* chromatic adaptation, full chromatic adaptation and
+    *Hunt-Pointer-Estevez* steps are fused into a single matrix.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    inverse
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   The reference white is converted according to the domain-range scale
+        in effect when the context is instantiated.
+
+    References
+    ----------
+    :cite:`Fairchild2004c`, :cite:`Luo2013`, :cite:`Moroneya`,
+    :cite:`Wikipedia2007a`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> context = CIECAM02_Context(XYZ_w, 318.31, 20.0)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> context.forward(XYZ)  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+    >>> context.inverse(context.forward(XYZ))  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CIECAM02_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = to_domain_100(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        self._n, self._F_L, self._N_bb, self._N_cb, self._z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        RGB_w = dot_vector(CAT02_CAT, self._XYZ_w)
+
+        D = (degree_of_adaptation(surround.F, self._L_A)
+             if not discount_illuminant else ones(self._L_A.shape))
+
+        RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            RGB_to_rgb(RGB_wc), self._F_L)
+        self._A_w = achromatic_response_forward(RGB_aw, self._N_bb)
+
+        D_RGB = (Y_w[..., np.newaxis] * D[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+
+        self._XYZ_to_RGB_p_matrix = dot_matrix(
+            dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT),
+            D_RGB[..., np.newaxis] * CAT02_CAT)
+        self._RGB_p_to_XYZ_matrix = dot_matrix(
+            CAT02_INVERSE_CAT / D_RGB[..., np.newaxis, :],
+            dot_matrix(CAT02_CAT, HPE_TO_XYZ_MATRIX))
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        CIECAM02_InductionFactors
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    def forward(self, XYZ, correlates=None):
+        """
+        Computes the *CIECAM02* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+        correlates : array_like or unicode, optional
+            **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+            Correlates to compute, e.g. ``('J', 'M', 'h')`` or ``'JMh'``, the
+            other correlates are set to *None*. Default to all the
+            correlates.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            *CIECAM02* colour appearance model specification.
+
+        Raises
+        ------
+        ValueError
+            If an unsupported correlate is given in the ``correlates``
+            argument.
+
+        Notes
+        -----
+        -   Refer to the :func:`colour.XYZ_to_CIECAM02` definition for the
+            domain and range of the *CIE XYZ* tristimulus values and
+            correlates.
+        """
+
+        required = _required_correlates(correlates)
+
+        XYZ = to_domain_100(XYZ)
+
+        # Converting *CIE XYZ* tristimulus values to adapted
+        # *Hunt-Pointer-Estevez* colourspace.
+        RGB_p = dot_vector(self._XYZ_to_RGB_p_matrix, XYZ)
+
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, self._F_L)
+
+        J = C = h = s = Q = M = H = None
+
+        if 'h' in required:
+            a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+            h = hue_angle(a, b)
+
+        if 'H' in required:
+            H = hue_quadrature(h)
+
+        if 'J' in required:
+            A = achromatic_response_forward(RGB_a, self._N_bb)
+            J = lightness_correlate(A, self._A_w, self._surround.c, self._z)
+
+        if 'Q' in required:
+            Q = brightness_correlate(self._surround.c, J, self._A_w, self._F_L)
+
+        if 'C' in required:
+            e_t = eccentricity_factor(h)
+            C = chroma_correlate(J, self._n, self._surround.N_c, self._N_cb,
+                                 e_t, a, b, RGB_a)
+
+        if 'M' in required:
+            M = colourfulness_correlate(C, self._F_L)
+
+        if 's' in required:
+            s = saturation_correlate(M, Q)
+
+        return CIECAM02_Specification(
+            *_range_correlates(correlates, J, C, h, s, Q, M, H))
+
+    def inverse(self, CIECAM02_specification):
+        """
+        Converts from *CIECAM02* specification to *CIE XYZ* tristimulus
+        values.
+
+        Parameters
+        ----------
+        CIECAM02_specification : CIECAM02_Specification
+            *CIECAM02* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CIECAM02_specification`` argument.
+
+        Notes
+        -----
+        -   Refer to the :func:`colour.CIECAM02_to_XYZ` definition for the
+            domain and range of the correlates and *CIE XYZ* tristimulus
+            values.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
+                                                    CIECAM02_Specification)
+        J = to_domain_100(J)
+        C = to_domain_100(C) if C is not None else C
+        h = to_domain_degrees(h)
+        M = to_domain_100(M) if M is not None else M
+
+        if C is None and M is not None:
+            C = M / spow(self._F_L, 0.25)
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CIECAM02_specification" argument!')
+
+        t = temporary_magnitude_quantity_inverse(C, J, self._n)
+        e_t = eccentricity_factor(h)
+        A = achromatic_response_inverse(self._A_w, J, self._surround.c,
+                                        self._z)
+
+        P_n = P(self._surround.N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
+
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+        RGB_p = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, self._F_L)
+
+        # Converting from adapted *Hunt-Pointer-Estevez* colourspace to
+        # *CIE XYZ* tristimulus values.
+        XYZ = dot_vector(self._RGB_p_to_XYZ_matrix, RGB_p)
+
+        return from_range_100(XYZ)
+
+
 def chromatic_induction_factors(n):
     """
     Returns the chromatic induction factors :math:`N_{bb}` and :math:`N_{cb}`.
@@ -963,7 +1406,7 @@ def hue_angle(a, b):
 
     h = np.degrees(np.arctan2(b, a)) % 360
 
-    return h
+    return as_float(h)
 
 
 def hue_quadrature(h):
@@ -7,14 +7,16 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (CAM16_VIEWING_CONDITIONS,
                                CAM16_InductionFactors, CAM16_Specification,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+                               XYZ_to_CAM16, CAM16_to_XYZ, CAM16_Context)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
-                              ignore_numpy_errors, tsplit, tstack)
+                              ignore_numpy_errors, set_float_precision, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -25,7 +27,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelInverse'
+    'TestCAM16ColourAppearanceModelInverse', 'TestCAM16_Context'
 ]
 
 
@@ -106,6 +108,73 @@ class TestCAM16ColourAppearanceModelForward(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_correlates_XYZ_to_CAM16(self):
+        """
+        Tests :func:`colour.appearance.cam16.XYZ_to_CAM16` definition
+        correlates selection.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        surround = CAM16_VIEWING_CONDITIONS['Average']
+        specification = XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround)
+
+        for correlates in ('J', 'JMh', ('Q', 'C', 'h'), 's', 'H', 'JCsQMHh'):
+            specification_c = XYZ_to_CAM16(
+                XYZ, XYZ_w, L_A, Y_b, surround, correlates=correlates)
+            for correlate in 'JChsQMH':
+                if correlate in correlates:
+                    np.testing.assert_almost_equal(
+                        getattr(specification_c, correlate),
+                        getattr(specification, correlate),
+                        decimal=7)
+                else:
+                    assert getattr(specification_c, correlate) is None
+
+    def test_float32_XYZ_to_CAM16(self):
+        """
+        Tests :func:`colour.appearance.cam16.XYZ_to_CAM16` definition
+        *float32* precision support.
+        """
+
+        XYZ = np.array([57.06, 43.06, 31.96])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        surround = CAM16_VIEWING_CONDITIONS['Average']
+        specification = XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround)
+
+        try:
+            set_float_precision(np.float32)
+            specification_f = XYZ_to_CAM16(
+                XYZ, XYZ_w, L_A, Y_b, surround, correlates='JMh')
+            for correlate in 'JMh':
+                assert getattr(specification_f, correlate).dtype == np.float32
+                np.testing.assert_allclose(
+                    getattr(specification_f, correlate),
+                    getattr(specification, correlate),
+                    rtol=0.0001)
+        finally:
+            set_float_precision(np.float64)
+
+    def test_raise_exception_XYZ_to_CAM16(self):
+        """
+        Tests :func:`colour.appearance.cam16.XYZ_to_CAM16` definition raised
+        exception.
+        """
+
+        try:
+            XYZ_to_CAM16(
+                np.array([19.01, 20.00, 21.78]),
+                np.array([95.05, 100.00, 108.88]),
+                318.31,
+                20.0,
+                correlates='JMx')
+        except ValueError:
+            pass
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_CAM16(self):
         """
@@ -299,3 +368,149 @@ class TestCAM16ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = CAM16_InductionFactors(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM16_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCAM16_Context(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.CAM16_Context` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+            [19.01, 20.00, 21.78],
+        ])
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CAM16_Context))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'inverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CAM16_Context))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_Context.forward` method.
+        """
+
+        for L_A, Y_b, surround, discount_illuminant in (
+            (318.31, 20.0, CAM16_VIEWING_CONDITIONS['Average'], False),
+            (31.83, 20.0, CAM16_VIEWING_CONDITIONS['Dim'], False),
+            (318.31, 10.0, CAM16_VIEWING_CONDITIONS['Dark'], True),
+        ):
+            context = CAM16_Context(self._XYZ_w, L_A, Y_b, surround,
+                                    discount_illuminant)
+
+            np.testing.assert_almost_equal(
+                context.forward(self._XYZ)[:-1],
+                XYZ_to_CAM16(self._XYZ, self._XYZ_w, L_A, Y_b, surround,
+                             discount_illuminant)[:-1],
+                decimal=7)
+
+        XYZ = np.reshape(self._XYZ, (2, 2, 3))
+        np.testing.assert_almost_equal(
+            CAM16_Context(self._XYZ_w, 318.31, 20.0).forward(XYZ)[:-1],
+            XYZ_to_CAM16(XYZ, self._XYZ_w, 318.31, 20.0)[:-1],
+            decimal=7)
+
+    def test_forward_correlates(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_Context.forward` method
+        correlates selection.
+        """
+
+        context = CAM16_Context(self._XYZ_w, 318.31, 20.0)
+        specification = context.forward(self._XYZ)
+        specification_c = context.forward(self._XYZ, correlates='JMh')
+
+        for correlate in 'JChsQMH':
+            if correlate in 'JMh':
+                np.testing.assert_almost_equal(
+                    getattr(specification_c, correlate),
+                    getattr(specification, correlate),
+                    decimal=7)
+            else:
+                self.assertIsNone(getattr(specification_c, correlate))
+
+        self.assertRaises(ValueError, context.forward, self._XYZ, 'JMx')
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_Context.inverse` method.
+        """
+
+        context = CAM16_Context(self._XYZ_w, 318.31, 20.0)
+        specification = context.forward(self._XYZ)
+
+        np.testing.assert_almost_equal(
+            context.inverse(specification), self._XYZ, decimal=7)
+
+        np.testing.assert_almost_equal(
+            context.inverse(
+                CAM16_Specification(
+                    J=specification.J, h=specification.h, M=specification.M)),
+            CAM16_to_XYZ(specification, self._XYZ_w, 318.31, 20.0),
+            decimal=7)
+
+    def test_domain_range_scale_CAM16_Context(self):
+        """
+        Tests :class:`colour.appearance.cam16.CAM16_Context` class domain and
+        range scale support.
+        """
+
+        XYZ = self._XYZ[0]
+        specification = CAM16_Context(self._XYZ_w, 318.31,
+                                      20.0).forward(XYZ)[:-1]
+
+        d_r = (
+            ('reference', 1, 1),
+            (1, 0.01,
+             np.array([
+                 1 / 100, 1 / 100, 1 / 360, 1 / 100, 1 / 100, 1 / 100, 1 / 360
+             ])),
+            (100, 1, np.array([1, 1, 100 / 360, 1, 1, 1, 100 / 360])),
+        )
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                context = CAM16_Context(self._XYZ_w * factor_a, 318.31, 20.0)
+                np.testing.assert_almost_equal(
+                    context.forward(XYZ * factor_a)[:-1],
+                    specification * factor_b,
+                    decimal=7)
+                np.testing.assert_almost_equal(
+                    context.inverse(specification * factor_b),
+                    XYZ * factor_a,
+                    decimal=7)
+
+    def test_raise_exception_CAM16_Context(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_Context.inverse` method
+        raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            CAM16_Context(self._XYZ_w, 318.31, 20.0).inverse,
+            CAM16_Specification(41.731207905126638, None, 219.04843265831178))
@@ -15,7 +15,8 @@ from .aces_it import (
 from .correction import (
     augmented_matrix_Cheung2004, polynomial_expansion_Finlayson2015,
     polynomial_expansion_Vandermonde, POLYNOMIAL_EXPANSION_METHODS,
-    polynomial_expansion, colour_correction_matrix_Cheung2004,
+    polynomial_expansion, get_polynomial_expansion_function,
+    colour_correction_matrix_Cheung2004,
     colour_correction_matrix_Finlayson2015,
     colour_correction_matrix_Vandermonde, COLOUR_CORRECTION_MATRIX_METHODS,
     colour_correction_matrix, colour_correction_Cheung2004,
@@ -35,7 +36,8 @@ __all__ += [
 __all__ += [
     'augmented_matrix_Cheung2004', 'polynomial_expansion_Finlayson2015',
     'polynomial_expansion_Vandermonde', 'POLYNOMIAL_EXPANSION_METHODS',
-    'polynomial_expansion', 'colour_correction_matrix_Cheung2004',
+    'polynomial_expansion', 'get_polynomial_expansion_function',
+    'colour_correction_matrix_Cheung2004',
     'colour_correction_matrix_Finlayson2015',
     'colour_correction_matrix_Vandermonde', 'COLOUR_CORRECTION_MATRIX_METHODS',
     'colour_correction_matrix', 'colour_correction_Cheung2004',
@@ -16,6 +16,8 @@ Defines various objects for colour correction, like colour matching two images:
     methods.
 -   :func:`colour.polynomial_expansion`: Polynomial expansion of given
     :math:`a` array.
+-   :func:`colour.get_polynomial_expansion_function`: Polynomial expansion
+    definition for given method with bound keyword arguments.
 -   :func:`colour.characterisation.colour_correction_matrix_Cheung2004` :
     Colour correction matrix computation using *Cheung et al. (2004)* method.
 -   :func:`colour.characterisation.colour_correction_matrix_Finlayson2015` :
@@ -60,6 +62,7 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+from functools import partial
 
 from colour.algebra import least_square_mapping_MoorePenrose
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_int,
@@ -75,7 +78,8 @@ __status__ = 'Production'
 __all__ = [
     'augmented_matrix_Cheung2004', 'polynomial_expansion_Finlayson2015',
     'polynomial_expansion_Vandermonde', 'POLYNOMIAL_EXPANSION_METHODS',
-    'polynomial_expansion', 'colour_correction_matrix_Cheung2004',
+    'polynomial_expansion', 'get_polynomial_expansion_function',
+    'colour_correction_matrix_Cheung2004',
     'colour_correction_matrix_Finlayson2015',
     'colour_correction_matrix_Vandermonde', 'COLOUR_CORRECTION_MATRIX_METHODS',
     'colour_correction_matrix', 'colour_correction_Cheung2004',
@@ -381,6 +385,44 @@ def polynomial_expansion(a, method='Cheung 2004', **kwargs):
     return function(a, **filter_kwargs(function, **kwargs))
 
 
+def get_polynomial_expansion_function(method='Cheung 2004', **kwargs):
+    """
+    Returns the polynomial expansion definition for given method, with its
+    supported keyword arguments bound, for repeated evaluations without
+    resolving the method and filtering the keyword arguments on each call.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015', 'Vandermonde'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the polynomial expansion definition, see
+        :func:`colour.polynomial_expansion` definition.
+
+    Returns
+    -------
+    callable
+        Polynomial expansion definition taking the :math:`a` array as
+        positional argument.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> polynomial_expansion_ = get_polynomial_expansion_function(
+    ...     'Cheung 2004', terms=5)
+    >>> polynomial_expansion_(RGB)  # doctest: +ELLIPSIS
+    array([ 0.1722481...,  0.0917066...,  0.0641693...,  0.0010136...,  1...])
+    """
+
+    function = POLYNOMIAL_EXPANSION_METHODS[method]
+
+    return partial(function, **filter_kwargs(function, **kwargs))
+
+
 def colour_correction_matrix_Cheung2004(M_T, M_R, terms=3):
     """
     Computes a colour correction from given :math:`M_T` colour array to
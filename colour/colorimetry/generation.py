@@ -37,10 +37,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.colorimetry import (
     DEFAULT_SPECTRAL_SHAPE, MultiSpectralDistributions, SpectralDistribution)
-from colour.utilities import CaseInsensitiveMapping, as_float_array, full, ones
+from colour.utilities import (CaseInsensitiveMapping, as_float_array, full,
+                              ones, get_float_precision)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -92,7 +92,7 @@ def sd_constant(k, shape=DEFAULT_SPECTRAL_SHAPE, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     wavelengths = shape.range(dtype)
     values = full(len(wavelengths), k, dtype)
@@ -202,7 +202,7 @@ def msds_constant(k, labels, shape=DEFAULT_SPECTRAL_SHAPE, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     wavelengths = shape.range(dtype)
     values = full([len(wavelengths), len(labels)], k, dtype)
@@ -27,15 +27,18 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+import six
 from six.moves import zip
 
 from colour.algebra import (Extrapolator, CubicSplineInterpolator,
-                            SpragueInterpolator)
+                            LINEAR_INTERPOLATORS, SpragueInterpolator,
+                            resampling_matrix)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignals
 from colour.utilities import (as_float, as_int, first_item, is_iterable,
                               is_numeric, is_string, is_uniform, interval,
-                              runtime_warning, tstack, usage_warning)
+                              runtime_warning, tstack, usage_warning,
+                              get_float_precision)
 from colour.utilities.deprecation import (ObjectRemoved, ObjectRenamed,
                                           handle_arguments_deprecation)
 
@@ -459,7 +462,7 @@ class SpectralShape(object):
         """
 
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         if None in (self._start, self._end, self._interval):
             raise RuntimeError(('One of the spectral shape "start", "end" or '
@@ -1083,6 +1086,40 @@ dict_like, optional
             'ArgumentRenamed': [['interpolator_args', 'interpolator_kwargs']],
         }, **kwargs).get('interpolator_kwargs', interpolator_kwargs)
 
+        shape, interpolator, interpolator_kwargs = (
+            self._interpolation_settings(shape, interpolator,
+                                         interpolator_kwargs))
+
+        interpolator = interpolator(self.wavelengths, self.values,
+                                    **interpolator_kwargs)
+
+        self.domain = shape.range()
+        self.range = interpolator(self.domain)
+
+        return self
+
+    def _interpolation_settings(self, shape, interpolator,
+                                interpolator_kwargs):
+        """
+        Returns the interpolation spectral shape, interpolator class and
+        arguments used by the
+        :meth:`colour.SpectralDistribution.interpolate` method.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for interpolation.
+        interpolator : object
+            Interpolator class type to use as interpolating function.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        tuple
+            Interpolation spectral shape, interpolator class and arguments.
+        """
+
         self_shape = self.shape
         s_e_i = zip((shape.start, shape.end, shape.interval),
                     (self_shape.start, self_shape.end, self_shape.interval))
@@ -1118,13 +1155,7 @@ dict_like, optional
             else:
                 interpolator_kwargs = {}
 
-        interpolator = interpolator(self.wavelengths, self.values,
-                                    **interpolator_kwargs)
-
-        self.domain = shape.range()
-        self.range = interpolator(self.domain)
-
-        return self
+        return shape, interpolator, interpolator_kwargs
 
     def extrapolate(self,
                     shape,
@@ -2165,11 +2196,69 @@ MultiSpectralDistributions or array_like or dict_like, optional
             'ArgumentRenamed': [['interpolator_args', 'interpolator_kwargs']],
         }, **kwargs).get('interpolator_kwargs', interpolator_kwargs)
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_kwargs)
+        if self._is_resamplable(shape, interpolator, interpolator_kwargs):
+            shape, interpolator, interpolator_kwargs = (first_item(
+                self.signals.values())._interpolation_settings(
+                    shape, interpolator, interpolator_kwargs))
+
+            M = resampling_matrix(self.wavelengths, shape.range(),
+                                  interpolator, interpolator_kwargs)
+            values = self.values
+
+            self.domain = shape.range()
+            self.range = M.dot(values)
+        else:
+            for signal in self.signals.values():
+                signal.interpolate(shape, interpolator, interpolator_kwargs)
 
         return self
 
+    def _is_resamplable(self, shape, interpolator, interpolator_kwargs):
+        """
+        Returns whether the multi-spectral distributions can be interpolated
+        at once with the :func:`colour.algebra.resampling_matrix` definition
+        matrix, i.e. whether all the spectral distributions share the same
+        linear interpolator settings and have finite values.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for interpolation.
+        interpolator : object
+            Interpolator class type to use as interpolating function.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        bool
+            Whether the multi-spectral distributions can be interpolated at
+            once.
+        """
+
+        if not self.signals:
+            return False
+
+        # The signals share the same domain, thus the interpolation settings
+        # only differ by the signals interpolator and its arguments.
+        signals = list(self.signals.values())
+        signal_interpolator = signals[0].interpolator
+        signal_interpolator_kwargs = six.text_type(
+            sorted(signals[0].interpolator_kwargs.items()))
+        for signal in signals[1:]:
+            if (signal.interpolator is not signal_interpolator or
+                    six.text_type(sorted(signal.interpolator_kwargs.items()))
+                    != signal_interpolator_kwargs):
+                return False
+
+        _shape, interpolator, _interpolator_kwargs = (
+            signals[0]._interpolation_settings(shape, interpolator,
+                                               interpolator_kwargs))
+        if not issubclass(interpolator, LINEAR_INTERPOLATORS):
+            return False
+
+        return bool(np.all(np.isfinite(self.values)))
+
     def extrapolate(self,
                     shape,
                     extrapolator=None,
@@ -1679,6 +1679,16 @@ MultiSpectralDistributions.interpolate` method.
                 rtol=0.0000001,
                 atol=0.0000001)
 
+        msds = self._sample_msds.copy()
+        values = msds.values
+        values[0, 0] = np.nan
+        msds.range = values
+        msds.interpolate(SpectralShape(interval=1))
+        np.testing.assert_almost_equal(
+            msds.values[:, 1:],
+            tstack([INTERPOLATED_SAMPLE_SD_DATA] * 2),
+            decimal=7)
+
     def test_extrapolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
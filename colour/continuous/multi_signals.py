@@ -26,10 +26,10 @@ try:  # pragma: no cover
 except ImportError:  # pragma: no cover
     from collections.abc import Iterator, Mapping, Sequence
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import AbstractContinuousFunction, Signal
 from colour.utilities import (as_float_array, first_item, is_pandas_installed,
-                              usage_warning, tsplit, tstack)
+                              usage_warning, tsplit, tstack,
+                              get_float_precision)
 from colour.utilities.deprecation import ObjectRenamed
 
 __author__ = 'Colour Developers'
@@ -1316,7 +1316,7 @@ dict_like, optional
         """
 
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         domain_u, range_u, signals = None, None, None
         signals = OrderedDict()
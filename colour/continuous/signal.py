@@ -28,10 +28,10 @@ except ImportError:  # pragma: no cover
     from collections.abc import Iterator, Mapping, Sequence
 
 from colour.algebra import Extrapolator, KernelInterpolator
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import AbstractContinuousFunction
 from colour.utilities import (as_array, fill_nan, full, is_pandas_installed,
-                              runtime_warning, tsplit, tstack, usage_warning)
+                              runtime_warning, tsplit, tstack, usage_warning,
+                              get_float_precision)
 from colour.utilities.deprecation import ObjectRenamed
 
 __author__ = 'Colour Developers'
@@ -216,7 +216,7 @@ class Signal(AbstractContinuousFunction):
 
         self.domain, self.range = self.signal_unpack_data(data, domain)
 
-        self.dtype = kwargs.get('dtype', DEFAULT_FLOAT_DTYPE)
+        self.dtype = kwargs.get('dtype', get_float_precision())
 
         self.interpolator = kwargs.get('interpolator')
         self.interpolator_kwargs = kwargs.get('interpolator_kwargs')
@@ -501,8 +501,13 @@ class Signal(AbstractContinuousFunction):
         Notes
         -----
         -   This property is read only.
+        -   The callable is created on first access after the continuous
+            signal definition has changed.
         """
 
+        if self._function is None:
+            self._function = self._build_function()
+
         return self._function
 
     def __str__(self):
@@ -643,7 +648,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -854,11 +859,29 @@ class Signal(AbstractContinuousFunction):
 
     def _create_function(self):
         """
-        Creates the continuous signal underlying function.
+        Invalidates the continuous signal underlying function so that it is
+        created again on next access to the
+        :attr:`colour.continuous.Signal.function` property.
+
+        Creating the function lazily avoids instantiating the interpolator
+        and extrapolator for each of the properties set, e.g. at
+        instantiation time.
+        """
+
+        self._function = None
+
+    def _build_function(self):
+        """
+        Builds the continuous signal underlying function.
+
+        Returns
+        -------
+        callable
+            Continuous signal underlying function.
         """
 
         if self._domain is not None and self._range is not None:
-            self._function = self._extrapolator(
+            return self._extrapolator(
                 self._interpolator(self.domain, self.range,
                                    **self._interpolator_kwargs),
                 **self._extrapolator_kwargs)
@@ -885,7 +908,7 @@ class Signal(AbstractContinuousFunction):
                     'please ensure you defined both '
                     '"domain" and "range" variables!')
 
-            self._function = _undefined_function
+            return _undefined_function
 
     def _fill_domain_nan(self, method='Interpolation', default=0):
         """
@@ -1110,7 +1133,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         if dtype is None:
-            dtype = DEFAULT_FLOAT_DTYPE
+            dtype = get_float_precision()
 
         domain_u, range_u = None, None
         if isinstance(data, Signal):
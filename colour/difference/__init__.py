@@ -33,7 +33,16 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 
 from __future__ import absolute_import
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+import numpy as np
+from functools import partial
+from scipy.spatial import cKDTree
+
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.models import Lab_to_DIN99
+from colour.models.cam02_ucs import COEFFICIENTS_UCS_LUO2006
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              filter_kwargs, get_domain_range_scale,
+                              to_domain_100)
 
 from .cam02_ucs import delta_E_CAM02LCD, delta_E_CAM02SCD, delta_E_CAM02UCS
 from .cam16_ucs import delta_E_CAM16LCD, delta_E_CAM16SCD, delta_E_CAM16UCS
@@ -160,4 +169,323 @@ def delta_E(a, b, method='CIE 2000', **kwargs):
     return function(a, b, **filter_kwargs(function, **kwargs))
 
 
-__all__ += ['DELTA_E_METHODS', 'delta_E']
+def get_delta_E_function(method='CIE 2000', **kwargs):
+    """
+    Returns the colour difference definition for given method, with its
+    supported keyword arguments bound, for repeated evaluations without
+    resolving the method and filtering the keyword arguments on each call.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the colour difference definition, see
+        :func:`colour.delta_E` definition.
+
+    Returns
+    -------
+    callable
+        Colour difference definition taking the :math:`a` and :math:`b`
+        arrays as positional arguments.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> a = np.array([100.00000000, 21.57210357, 272.22819350])
+    >>> b = np.array([100.00000000, 426.67945353, 72.39590835])
+    >>> delta_E_ = get_delta_E_function('CIE 1994', textiles=False)
+    >>> delta_E_(a, b)  # doctest: +ELLIPSIS
+    83.7792255...
+    """
+
+    function = DELTA_E_METHODS[method]
+
+    return partial(function, **filter_kwargs(function, **kwargs))
+
+
+__all__ += ['DELTA_E_METHODS', 'delta_E', 'get_delta_E_function']
+
+_DELTA_E_LUO2006_METHODS = {
+    delta_E_CAM02LCD: 'CAM02-LCD',
+    delta_E_CAM02SCD: 'CAM02-SCD',
+    delta_E_CAM02UCS: 'CAM02-UCS',
+    delta_E_CAM16LCD: 'CAM02-LCD',
+    delta_E_CAM16SCD: 'CAM02-SCD',
+    delta_E_CAM16UCS: 'CAM02-UCS',
+}
+"""
+*Luo et al. (2006)* and *Li et al. (2017)* colour difference definitions
+mapped to their :attr:`colour.models.COEFFICIENTS_UCS_LUO2006` attribute
+coefficients.
+
+_DELTA_E_LUO2006_METHODS : dict
+"""
+
+
+def _delta_E_euclidean_embedding(a, function, **kwargs):
+    """
+    Embeds given *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array in
+    the space where given colour difference definition is the euclidean
+    distance.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`.
+    function : callable
+        Colour difference definition, e.g.
+        :func:`colour.difference.delta_E_CIE1976`.
+
+    Other Parameters
+    ----------------
+    textiles : bool, optional
+        {:func:`colour.difference.delta_E_DIN99`},
+        Textiles application specific parametric factors.
+
+    Returns
+    -------
+    ndarray or None
+        Embedded colourspace array or *None* if the colour difference
+        definition is not an euclidean distance.
+
+    Examples
+    --------
+    >>> a = np.array([54.90433134, -0.08450395, -0.06854831])
+    >>> _delta_E_euclidean_embedding(a, delta_E_CAM02LCD)
+    ... # doctest: +ELLIPSIS
+    array([  7.1304326...e+01,  -8.4503950...e-02,  -6.8548310...e-02])
+    >>> print(_delta_E_euclidean_embedding(a, delta_E_CIE2000))
+    None
+    """
+
+    if function is delta_E_CIE1976:
+        return to_domain_100(a)
+    elif function is delta_E_DIN99:
+        textiles = kwargs.get('textiles', False)
+        factor = 100 if get_domain_range_scale() == '1' else 1
+
+        return Lab_to_DIN99(a, 2 if textiles else 1, 0.5
+                            if textiles else 1) * factor
+    elif function in _DELTA_E_LUO2006_METHODS:
+        K_L = COEFFICIENTS_UCS_LUO2006[_DELTA_E_LUO2006_METHODS[function]][0]
+
+        return as_float_array(a) / np.array([K_L, 1, 1])
+    else:
+        return None
+
+
+def delta_E_matrix(a, b, method='CIE 2000', tile_size=2 ** 20, **kwargs):
+    """
+    Returns the pairwise difference :math:`\\Delta E_{ab}` matrix between
+    the two given *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace arrays
+    using given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    tile_size : int, optional
+        Maximum count of colour differences computed at once, the
+        differences are computed in tiles of rows of the matrix to bound the
+        memory usage.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        Colour difference :math:`\\Delta E_{ab}` matrix of shape
+        *a.shape[:-1] + b.shape[:-1]*.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> b = np.array([
+    ...     [100.00000000, 426.67945353, 72.39590835],
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [60.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_matrix(a, b)  # doctest: +ELLIPSIS
+    array([[ 94.0356490...,   0.        ,  47.1934770...],
+           [ 54.3890726...,  52.8648618...,   9.4705785...]])
+    >>> delta_E_matrix(a, b, method='CIE 1976')  # doctest: +ELLIPSIS
+    array([[ 451.7133019...,    0.        ,  275.9955524...],
+           [ 435.6564284...,  277.6212257...,   10.        ]])
+    """
+
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    shape = a.shape[:-1] + b.shape[:-1]
+
+    a = np.reshape(a, (-1, 3))
+    b = np.reshape(b, (-1, 3))
+
+    rows = max(DEFAULT_INT_DTYPE(tile_size) // max(b.shape[0], 1), 1)
+
+    d_E = np.empty((a.shape[0], b.shape[0]), dtype=a.dtype)
+    for i in range(0, a.shape[0], rows):
+        d_E[i:i + rows] = delta_E(a[i:i + rows, np.newaxis, :],
+                                  b[np.newaxis, ...], method, **kwargs)
+
+    return np.reshape(d_E, shape)
+
+
+def delta_E_nearest(a,
+                    b,
+                    k=1,
+                    method='CIE 2000',
+                    candidates=None,
+                    tile_size=2 ** 20,
+                    **kwargs):
+    """
+    Returns the :math:`k` nearest neighbours in given *CIE L\\*a\\*b\\** or
+    :math:`J'a'b'` colourspace array :math:`b` of given *CIE L\\*a\\*b\\**
+    or :math:`J'a'b'` colourspace array :math:`a` according to the colour
+    difference :math:`\\Delta E_{ab}` computed using given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`,
+        i.e. the samples.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        i.e. the references.
+    k : int, optional
+        Nearest neighbours count.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    candidates : int, optional
+        {'CIE 2000', 'CIE 1994', 'CMC'},
+        Candidates count retrieved for each sample in
+        *CIE L\\*a\\*b\\** colourspace and ranked with given method, default to
+        the greatest of :math:`4k` and 32.
+    tile_size : int, optional
+        Maximum count of colour differences computed at once, the samples are
+        processed in tiles to bound the memory usage.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    tuple
+        Colour differences :math:`\\Delta E_{ab}` to the nearest neighbours
+        and their indices in the flattened colourspace array :math:`b`, sorted
+        by increasing colour difference, the last axis of length :math:`k` is
+        squeezed if :math:`k` is equal to 1.
+
+    Notes
+    -----
+    -   The *CIE 1976*, *DIN99*, *CAM02-LCD*, *CAM02-SCD*, *CAM02-UCS*,
+        *CAM16-LCD*, *CAM16-SCD* and *CAM16-UCS* colour differences are
+        euclidean distances in a transformed colourspace: the nearest
+        neighbours are exactly retrieved with a *KD-Tree* built in that
+        colourspace.
+    -   The *CIE 2000*, *CIE 1994* and *CMC* colour differences are not
+        euclidean distances: the candidates nearest to the samples in
+        *CIE L\\*a\\*b\\** colourspace are retrieved with a *KD-Tree* and
+        ranked with the given method. The search is exact only if the
+        candidates count is equal to the references count.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> b = np.array([
+    ...     [100.00000000, 426.67945353, 72.39590835],
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [60.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_nearest(a, b)  # doctest: +ELLIPSIS
+    (array([ 0.        ,  9.4705785...]), array([1, 2]))
+    >>> delta_E_nearest(a, b, k=2, method='CIE 1976')
+    ... # doctest: +ELLIPSIS
+    (array([[   0.        ,  275.9955524...],
+           [  10.        ,  277.6212257...]]), array([[1, 2],
+           [2, 1]]))
+    """
+
+    function = DELTA_E_METHODS[method]
+
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    shape = a.shape[:-1]
+
+    a = np.reshape(a, (-1, 3))
+    b = np.reshape(b, (-1, 3))
+
+    k = DEFAULT_INT_DTYPE(k)
+    assert 0 < k <= b.shape[0], ('"k" must be in domain [1, {0}]!'.format(
+        b.shape[0]))
+
+    b_e = _delta_E_euclidean_embedding(b, function, **kwargs)
+    if b_e is not None:
+        count = k
+        tree = cKDTree(b_e)
+    else:
+        count = min(
+            DEFAULT_INT_DTYPE(candidates)
+            if candidates is not None else max(4 * k, 32), b.shape[0])
+        tree = cKDTree(to_domain_100(b))
+
+    rows = max(DEFAULT_INT_DTYPE(tile_size) // count, 1)
+
+    d_E = np.empty((a.shape[0], k), dtype=a.dtype)
+    indices = np.empty((a.shape[0], k), dtype=DEFAULT_INT_DTYPE)
+    for i in range(0, a.shape[0], rows):
+        a_t = a[i:i + rows]
+
+        if b_e is not None:
+            d_E_t, indices_t = tree.query(
+                _delta_E_euclidean_embedding(a_t, function, **kwargs), count)
+        else:
+            _d_E_t, indices_t = tree.query(to_domain_100(a_t), count)
+            indices_t = np.reshape(indices_t, (-1, count))
+            d_E_t = delta_E(a_t[:, np.newaxis, :], b[indices_t], method,
+                            **kwargs)
+
+            ranks = np.argsort(d_E_t, axis=-1)[:, :k]
+            samples = np.arange(a_t.shape[0])[:, np.newaxis]
+            d_E_t = d_E_t[samples, ranks]
+            indices_t = indices_t[samples, ranks]
+
+        d_E[i:i + rows] = np.reshape(d_E_t, (-1, k))
+        indices[i:i + rows] = np.reshape(indices_t, (-1, k))
+
+    if k == 1:
+        return np.reshape(d_E, shape), np.reshape(indices, shape)
+    else:
+        return (np.reshape(d_E, shape + (k, )),
+                np.reshape(indices, shape + (k, )))
+
+
+__all__ += ['delta_E_matrix', 'delta_E_nearest']
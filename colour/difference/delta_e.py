@@ -32,10 +32,12 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 
 from __future__ import division, unicode_literals
 
+import math
 import numpy as np
 
 from colour.algebra import euclidean_distance
-from colour.utilities import to_domain_100, tsplit
+from colour.utilities import (Structure, as_float, as_float_scalars,
+                              get_domain_range_scale, to_domain_100, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -49,6 +51,66 @@ __all__ = [
 ]
 
 
+def _Lab_scalars(Lab_1, Lab_2):
+    """
+    Returns given single colour *CIE L\\*a\\*b\\** colourspace arrays as
+    *float* scalars in the reference domain scale.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+
+    Returns
+    -------
+    tuple or None
+        *CIE L\\*a\\*b\\** colourspace *float* scalars or *None* if any of
+        the given arrays is not a single colour.
+    """
+
+    Lab_1 = as_float_scalars(Lab_1)
+    Lab_2 = as_float_scalars(Lab_2)
+
+    if Lab_1 is None or Lab_2 is None:
+        return None
+
+    if get_domain_range_scale() == '1':
+        Lab_1 = tuple(C * 100 for C in Lab_1)
+        Lab_2 = tuple(C * 100 for C in Lab_2)
+
+    return Lab_1, Lab_2
+
+
+def _delta_E_CIE1976_scalar(Lab_1, Lab_2):
+    """
+    Returns the difference :math:`\\Delta E_{76}` between two given single
+    colour *CIE L\\*a\\*b\\** colourspace arrays using *float* scalars
+    arithmetic.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+
+    Returns
+    -------
+    numeric or None
+        Colour difference :math:`\\Delta E_{76}` or *None* if any of the
+        given arrays is not a single colour.
+    """
+
+    Lab = _Lab_scalars(Lab_1, Lab_2)
+
+    if Lab is None:
+        return None
+
+    return as_float(math.sqrt(sum((C_1 - C_2) ** 2 for C_1, C_2 in zip(*Lab))))
+
+
 def delta_E_CIE1976(Lab_1, Lab_2):
     """
     Returns the difference :math:`\\Delta E_{76}` between two given
@@ -97,6 +159,10 @@ def delta_E_CIE1976(Lab_1, Lab_2):
     451.7133019...
     """
 
+    d_E = _delta_E_CIE1976_scalar(Lab_1, Lab_2)
+    if d_E is not None:
+        return d_E
+
     d_E = euclidean_distance(to_domain_100(Lab_1), to_domain_100(Lab_2))
 
     return d_E
@@ -193,6 +259,161 @@ def delta_E_CIE1994(Lab_1, Lab_2, textiles=False):
     return d_E
 
 
+_SCALAR_MATH = Structure(
+    hypot=math.hypot,
+    sqrt=math.sqrt,
+    arctan2=math.atan2,
+    degrees=math.degrees,
+    deg2rad=math.radians,
+    cos=math.cos,
+    sin=math.sin,
+    exp=math.exp,
+    where=lambda condition, x, y: x if condition else y)
+"""
+:mod:`math` module functions named as their :mod:`numpy` module counterparts,
+allowing the colour difference formulas to be evaluated with *float* scalars
+arithmetic.
+
+_SCALAR_MATH : Structure
+"""
+
+
+def _delta_E_CIE2000(L_1, a_1, b_1, L_2, a_2, b_2, textiles, xp):
+    """
+    Returns the difference :math:`\\Delta E_{00}` between two given
+    *CIE L\\*a\\*b\\** colourspace components sets with given math
+    functions namespace.
+
+    Parameters
+    ----------
+    L_1 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`L^*` component.
+    a_1 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`a^*` component.
+    b_1 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`b^*` component.
+    L_2 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`L^*` component.
+    a_2 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`a^*` component.
+    b_2 : numeric or ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`b^*` component.
+    textiles : bool
+        Textiles application specific parametric factors.
+    xp : object
+        Math functions namespace, either :mod:`numpy` module or
+        :attr:`colour.difference.delta_e._SCALAR_MATH` attribute.
+
+    Returns
+    -------
+    numeric or ndarray
+        Colour difference :math:`\\Delta E_{00}`.
+    """
+
+    k_L = 2 if textiles else 1
+    k_C = 1
+    k_H = 1
+
+    l_bar_prime = 0.5 * (L_1 + L_2)
+
+    c_1 = xp.hypot(a_1, b_1)
+    c_2 = xp.hypot(a_2, b_2)
+
+    c_bar = 0.5 * (c_1 + c_2)
+    c_bar7 = c_bar ** 7
+
+    g = 0.5 * (1 - xp.sqrt(c_bar7 / (c_bar7 + 25.0 ** 7)))
+
+    a_1_prime = a_1 * (1 + g)
+    a_2_prime = a_2 * (1 + g)
+    c_1_prime = xp.hypot(a_1_prime, b_1)
+    c_2_prime = xp.hypot(a_2_prime, b_2)
+    c_bar_prime = 0.5 * (c_1_prime + c_2_prime)
+
+    h_1_prime = xp.degrees(xp.arctan2(b_1, a_1_prime)) % 360
+    h_2_prime = xp.degrees(xp.arctan2(b_2, a_2_prime)) % 360
+
+    h_bar_prime = xp.where(
+        abs(h_1_prime - h_2_prime) <= 180,
+        0.5 * (h_1_prime + h_2_prime),
+        (0.5 * (h_1_prime + h_2_prime + 360)),
+    )
+
+    t = (1 - 0.17 * xp.cos(xp.deg2rad(h_bar_prime - 30)) +
+         0.24 * xp.cos(xp.deg2rad(2 * h_bar_prime)) +
+         0.32 * xp.cos(xp.deg2rad(3 * h_bar_prime + 6)) -
+         0.20 * xp.cos(xp.deg2rad(4 * h_bar_prime - 63)))
+
+    h = h_2_prime - h_1_prime
+    delta_h_prime = xp.where(h_2_prime <= h_1_prime, h - 360, h + 360)
+    delta_h_prime = xp.where(abs(h) <= 180, h, delta_h_prime)
+
+    delta_L_prime = L_2 - L_1
+    delta_C_prime = c_2_prime - c_1_prime
+    delta_H_prime = (2 * xp.sqrt(c_1_prime * c_2_prime) * xp.sin(
+        xp.deg2rad(0.5 * delta_h_prime)))
+
+    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
+               xp.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
+    s_C = 1 + 0.045 * c_bar_prime
+    s_H = 1 + 0.015 * c_bar_prime * t
+
+    delta_theta = (
+        30 * xp.exp(-((h_bar_prime - 275) / 25) * ((h_bar_prime - 275) / 25)))
+
+    c_bar_prime7 = c_bar_prime ** 7
+
+    r_C = xp.sqrt(c_bar_prime7 / (c_bar_prime7 + 25.0 ** 7))
+    r_T = -2 * r_C * xp.sin(xp.deg2rad(2 * delta_theta))
+
+    d_E = xp.sqrt((delta_L_prime / (k_L * s_L)) ** 2 +
+                  (delta_C_prime / (k_C * s_C)) ** 2 +
+                  (delta_H_prime / (k_H * s_H)) ** 2 +
+                  (delta_C_prime / (k_C * s_C)) * (delta_H_prime /
+                                                   (k_H * s_H)) * r_T)
+
+    return d_E
+
+
+def _delta_E_CIE2000_scalar(Lab_1, Lab_2, textiles=False):
+    """
+    Returns the difference :math:`\\Delta E_{00}` between two given single
+    colour *CIE L\\*a\\*b\\** colourspace arrays using *float* scalars
+    arithmetic.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    textiles : bool, optional
+        Textiles application specific parametric factors.
+
+    Returns
+    -------
+    numeric or None
+        Colour difference :math:`\\Delta E_{00}` or *None* if any of the
+        given arrays is not a single colour or the given values require the
+        *ndarray* arithmetic, e.g. *nan* values.
+    """
+
+    Lab = _Lab_scalars(Lab_1, Lab_2)
+
+    if Lab is None:
+        return None
+
+    (L_1, a_1, b_1), (L_2, a_2, b_2) = Lab
+
+    try:
+        d_E = _delta_E_CIE2000(L_1, a_1, b_1, L_2, a_2, b_2, textiles,
+                               _SCALAR_MATH)
+    except (ArithmeticError, ValueError):
+        return None
+
+    return as_float(d_E)
+
+
 def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     """
     Returns the difference :math:`\\Delta E_{00}` between two given
@@ -268,72 +489,14 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     95.7920535...
     """
 
+    d_E = _delta_E_CIE2000_scalar(Lab_1, Lab_2, textiles)
+    if d_E is not None:
+        return d_E
+
     L_1, a_1, b_1 = tsplit(to_domain_100(Lab_1))
     L_2, a_2, b_2 = tsplit(to_domain_100(Lab_2))
 
-    k_L = 2 if textiles else 1
-    k_C = 1
-    k_H = 1
-
-    l_bar_prime = 0.5 * (L_1 + L_2)
-
-    c_1 = np.hypot(a_1, b_1)
-    c_2 = np.hypot(a_2, b_2)
-
-    c_bar = 0.5 * (c_1 + c_2)
-    c_bar7 = c_bar ** 7
-
-    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
-
-    a_1_prime = a_1 * (1 + g)
-    a_2_prime = a_2 * (1 + g)
-    c_1_prime = np.hypot(a_1_prime, b_1)
-    c_2_prime = np.hypot(a_2_prime, b_2)
-    c_bar_prime = 0.5 * (c_1_prime + c_2_prime)
-
-    h_1_prime = np.degrees(np.arctan2(b_1, a_1_prime)) % 360
-    h_2_prime = np.degrees(np.arctan2(b_2, a_2_prime)) % 360
-
-    h_bar_prime = np.where(
-        np.fabs(h_1_prime - h_2_prime) <= 180,
-        0.5 * (h_1_prime + h_2_prime),
-        (0.5 * (h_1_prime + h_2_prime + 360)),
-    )
-
-    t = (1 - 0.17 * np.cos(np.deg2rad(h_bar_prime - 30)) +
-         0.24 * np.cos(np.deg2rad(2 * h_bar_prime)) +
-         0.32 * np.cos(np.deg2rad(3 * h_bar_prime + 6)) -
-         0.20 * np.cos(np.deg2rad(4 * h_bar_prime - 63)))
-
-    h = h_2_prime - h_1_prime
-    delta_h_prime = np.where(h_2_prime <= h_1_prime, h - 360, h + 360)
-    delta_h_prime = np.where(np.fabs(h) <= 180, h, delta_h_prime)
-
-    delta_L_prime = L_2 - L_1
-    delta_C_prime = c_2_prime - c_1_prime
-    delta_H_prime = (2 * np.sqrt(c_1_prime * c_2_prime) * np.sin(
-        np.deg2rad(0.5 * delta_h_prime)))
-
-    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
-               np.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
-    s_C = 1 + 0.045 * c_bar_prime
-    s_H = 1 + 0.015 * c_bar_prime * t
-
-    delta_theta = (
-        30 * np.exp(-((h_bar_prime - 275) / 25) * ((h_bar_prime - 275) / 25)))
-
-    c_bar_prime7 = c_bar_prime ** 7
-
-    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25 ** 7))
-    r_T = -2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
-
-    d_E = np.sqrt((delta_L_prime / (k_L * s_L)) ** 2 +
-                  (delta_C_prime / (k_C * s_C)) ** 2 +
-                  (delta_H_prime / (k_H * s_H)) ** 2 +
-                  (delta_C_prime / (k_C * s_C)) * (delta_H_prime /
-                                                   (k_H * s_H)) * r_T)
-
-    return d_E
+    return _delta_E_CIE2000(L_1, a_1, b_1, L_2, a_2, b_2, textiles, np)
 
 
 def delta_E_CMC(Lab_1, Lab_2, l=2, c=1):  # noqa
@@ -8,9 +8,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.difference import delta_E
+from colour.difference import (DELTA_E_METHODS, delta_E, delta_E_matrix,
+                               delta_E_nearest, get_delta_E_function)
 
-from colour.utilities import domain_range_scale
+from colour.utilities import domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -19,7 +20,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDelta_E']
+__all__ = [
+    'TestDelta_E', 'TestGetDelta_E_Function', 'TestDelta_E_matrix',
+    'TestDelta_E_nearest'
+]
 
 
 class TestDelta_E(unittest.TestCase):
@@ -49,5 +53,188 @@ class TestDelta_E(unittest.TestCase):
                         decimal=7)
 
 
+class TestGetDelta_E_Function(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.get_delta_E_function` definition unit
+    tests methods.
+    """
+
+    def test_get_delta_E_function(self):
+        """
+        Tests :func:`colour.difference.get_delta_E_function` definition.
+        """
+
+        Lab_1 = np.array([100.00000000, 21.57210357, 272.22819350])
+        Lab_2 = np.array([100.00000000, 426.67945353, 72.39590835])
+
+        for method in DELTA_E_METHODS:
+            function = get_delta_E_function(method, textiles=True, l=2)
+            np.testing.assert_equal(
+                function(Lab_1, Lab_2),
+                delta_E(Lab_1, Lab_2, method, textiles=True, l=2))
+
+
+class TestDelta_E_matrix(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_matrix` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self._a = (random_state.random_sample(
+            (8, 3)) * [100, 200, 200] - [0, 100, 100])
+        self._b = (random_state.random_sample(
+            (12, 3)) * [100, 200, 200] - [0, 100, 100])
+
+    @ignore_numpy_errors
+    def test_delta_E_matrix(self):
+        """
+        Tests :func:`colour.difference.delta_E_matrix` definition.
+        """
+
+        for method in DELTA_E_METHODS:
+            d_E = np.array(
+                [[delta_E(a, b, method) for b in self._b] for a in self._a])
+
+            np.testing.assert_almost_equal(
+                delta_E_matrix(self._a, self._b, method), d_E, decimal=7)
+
+            np.testing.assert_almost_equal(
+                delta_E_matrix(self._a, self._b, method, tile_size=20),
+                d_E,
+                decimal=7)
+
+    def test_n_dimensional_delta_E_matrix(self):
+        """
+        Tests :func:`colour.difference.delta_E_matrix` definition
+        n-dimensional arrays support.
+        """
+
+        d_E = delta_E_matrix(self._a, self._b)
+
+        np.testing.assert_almost_equal(
+            delta_E_matrix(
+                np.reshape(self._a, (2, 4, 3)), np.reshape(self._b,
+                                                           (3, 4, 3))),
+            np.reshape(d_E, (2, 4, 3, 4)),
+            decimal=7)
+
+    def test_domain_range_scale_delta_E_matrix(self):
+        """
+        Tests :func:`colour.difference.delta_E_matrix` definition domain and
+        range scale support.
+        """
+
+        d_E = delta_E_matrix(self._a, self._b)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    delta_E_matrix(self._a * factor, self._b * factor),
+                    d_E,
+                    decimal=7)
+
+
+class TestDelta_E_nearest(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_nearest` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self._a = (random_state.random_sample(
+            (64, 3)) * [100, 200, 200] - [0, 100, 100])
+        self._b = (random_state.random_sample(
+            (128, 3)) * [100, 200, 200] - [0, 100, 100])
+
+    def test_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition.
+        """
+
+        for method in ('CIE 1976', 'CAM02-LCD', 'CAM16-SCD', 'CAM02-UCS',
+                       'DIN99'):
+            d_E = delta_E_matrix(self._a, self._b, method)
+            indices = np.argsort(d_E, axis=-1)[:, :3]
+
+            d_E_n, indices_n = delta_E_nearest(
+                self._a, self._b, 3, method, tile_size=20)
+            np.testing.assert_equal(indices_n, indices)
+            np.testing.assert_almost_equal(
+                d_E_n,
+                d_E[np.arange(d_E.shape[0])[:, np.newaxis], indices],
+                decimal=7)
+
+            d_E_n, indices_n = delta_E_nearest(self._a, self._b, 1, method)
+            np.testing.assert_equal(indices_n, indices[:, 0])
+
+    def test_candidates_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition candidates
+        re-ranking.
+        """
+
+        for method in ('CIE 2000', 'CIE 1994', 'CMC'):
+            d_E = delta_E_matrix(self._a, self._b, method)
+            indices = np.argsort(d_E, axis=-1)[:, :2]
+
+            d_E_n, indices_n = delta_E_nearest(
+                self._a, self._b, 2, method, candidates=128, tile_size=500)
+            np.testing.assert_equal(indices_n, indices)
+            np.testing.assert_almost_equal(
+                d_E_n,
+                d_E[np.arange(d_E.shape[0])[:, np.newaxis], indices],
+                decimal=7)
+
+            d_E_n, indices_n = delta_E_nearest(
+                self._a, self._b, method=method, candidates=4)
+            np.testing.assert_array_less(d_E.min(axis=-1) - 1e-7, d_E_n)
+            np.testing.assert_almost_equal(
+                d_E_n, d_E[np.arange(d_E.shape[0]), indices_n], decimal=7)
+
+    def test_n_dimensional_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition
+        n-dimensional arrays support.
+        """
+
+        d_E, indices = delta_E_nearest(self._a, self._b, 2)
+
+        d_E_n, indices_n = delta_E_nearest(
+            np.reshape(self._a, (4, 16, 3)), np.reshape(self._b, (2, 64, 3)),
+            2)
+        np.testing.assert_almost_equal(
+            d_E_n, np.reshape(d_E, (4, 16, 2)), decimal=7)
+        np.testing.assert_equal(indices_n, np.reshape(indices, (4, 16, 2)))
+
+    def test_domain_range_scale_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.delta_E_nearest` definition domain and
+        range scale support.
+        """
+
+        for method in ('CIE 1976', 'CIE 2000', 'DIN99'):
+            d_E, indices = delta_E_nearest(self._a, self._b, method=method)
+
+            d_r = (('reference', 1), (1, 0.01), (100, 1))
+            for scale, factor in d_r:
+                with domain_range_scale(scale):
+                    d_E_n, indices_n = delta_E_nearest(
+                        self._a * factor, self._b * factor, method=method)
+                    np.testing.assert_almost_equal(d_E_n, d_E, decimal=7)
+                    np.testing.assert_equal(indices_n, indices)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -20,6 +20,7 @@ from colour.difference import (delta_E_CIE1976, delta_E_CIE1994,
                                delta_E_CIE2000, delta_E_CMC)
 
 from colour.algebra import euclidean_distance
+from colour.difference.delta_e import _delta_E_CIE2000_scalar
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -318,6 +319,39 @@ class TestDelta_E_CIE2000(unittest.TestCase):
             Lab_2 = np.array(case)
             delta_E_CIE2000(Lab_1, Lab_2)
 
+    def test_scalar_delta_E_CIE2000(self):
+        """
+        Tests :func:`colour.difference.delta_e.delta_E_CIE2000` definition
+        single colour *float* scalars arithmetic against the *ndarray*
+        arithmetic.
+        """
+
+        random_state = np.random.RandomState(4)
+        Lab_1 = random_state.uniform([0, -128, -128], [100, 128, 128],
+                                     (1000, 3))
+        Lab_2 = random_state.uniform([0, -128, -128], [100, 128, 128],
+                                     (1000, 3))
+
+        # Hue angles on both sides of the hue wrap.
+        h = np.radians(random_state.uniform(-30, 30, (2, 250)))
+        Lab_1[:250, 1:] = np.transpose([np.cos(h[0]), np.sin(h[0])]) * 50
+        Lab_2[:250, 1:] = np.transpose([np.cos(h[1]), np.sin(h[1])]) * 50
+        Lab_1[250:500, 1:] = np.transpose([-np.cos(h[0]), np.sin(h[0])]) * 50
+        Lab_2[250:500, 1:] = np.transpose([-np.cos(h[1]), -np.sin(h[1])]) * 50
+
+        # Zero chroma.
+        Lab_1[500:550, 1:] = 0
+        Lab_2[525:575, 1:] = 0
+
+        for textiles in (False, True):
+            delta_E = delta_E_CIE2000(Lab_1, Lab_2, textiles)
+            for i in range(Lab_1.shape[0]):
+                np.testing.assert_allclose(
+                    _delta_E_CIE2000_scalar(Lab_1[i], Lab_2[i], textiles),
+                    delta_E[i],
+                    rtol=1e-12,
+                    atol=1e-12)
+
     def test_delta_E_CIE2000_Sharma2004(self):
         """
         Tests :func:`colour.difference.delta_e.delta_E_CIE2000` definition
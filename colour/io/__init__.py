@@ -2,7 +2,8 @@
 
 from __future__ import absolute_import
 
-from .ies_tm2714 import SpectralDistribution_IESTM2714
+from .ies_tm2714 import (SpectralDistribution_IESTM2714,
+                         read_msds_from_IESTM2714_directory)
 from .luts import *  # noqa
 from . import luts
 from .image import ImageAttribute_Specification, convert_bit_depth
@@ -10,19 +11,33 @@ from .image import read_image_OpenImageIO, write_image_OpenImageIO
 from .image import read_image_Imageio, write_image_Imageio
 from .image import READ_IMAGE_METHODS, WRITE_IMAGE_METHODS
 from .image import read_image, write_image
+from .image import process_image_OpenImageIO, process_image_Imageio
+from .image import PROCESS_IMAGE_METHODS, process_image
+from .image import process_image_sequence
 from .tabular import (read_spectral_data_from_csv_file, read_sds_from_csv_file,
-                      write_sds_to_csv_file)
-from .xrite import read_sds_from_xrite_file
+                      write_sds_to_csv_file, read_msds_from_csv_file,
+                      write_msds_to_csv_file)
+from .xrite import (read_sds_from_xrite_file, read_msds_from_xrite_file,
+                    read_msds_from_xrite_directory)
 
-__all__ = ['SpectralDistribution_IESTM2714']
+__all__ = [
+    'SpectralDistribution_IESTM2714', 'read_msds_from_IESTM2714_directory'
+]
 __all__ += luts.__all__
 __all__ += ['ImageAttribute_Specification', 'convert_bit_depth']
 __all__ += ['read_image_OpenImageIO', 'write_image_OpenImageIO']
 __all__ += ['read_image_Imageio', 'write_image_Imageio']
 __all__ += ['READ_IMAGE_METHODS', 'WRITE_IMAGE_METHODS']
 __all__ += ['read_image', 'write_image']
+__all__ += ['process_image_OpenImageIO', 'process_image_Imageio']
+__all__ += ['PROCESS_IMAGE_METHODS', 'process_image']
+__all__ += ['process_image_sequence']
 __all__ += [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'write_sds_to_csv_file', 'read_msds_from_csv_file',
+    'write_msds_to_csv_file'
+]
+__all__ += [
+    'read_sds_from_xrite_file', 'read_msds_from_xrite_file',
+    'read_msds_from_xrite_directory'
 ]
-__all__ += ['read_sds_from_xrite_file']
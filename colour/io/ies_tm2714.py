@@ -4,7 +4,9 @@ IES TM-27-14 Data Input / Output
 ================================
 
 Defines the :class:`colour.SpectralDistribution_IESTM2714` class handling *IES
-TM-27-14* spectral data XML files.
+TM-27-14* spectral data XML files and the
+:func:`colour.read_msds_from_IESTM2714_directory` definition reading a
+directory of *IES TM-27-14* spectral data XML files at once.
 
 References
 ----------
@@ -16,15 +18,18 @@ References
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
 import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from functools import partial
 from xml.etree import ElementTree  # nosec
 from xml.dom import minidom  # nosec
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import MultiSpectralDistributions, SpectralDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import Structure, is_numeric, is_string, tstack
+from colour.utilities import (Structure, is_numeric, is_string,
+                              multiprocessing_pool, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -36,7 +41,7 @@ __status__ = 'Production'
 __all__ = [
     'IES_TM2714_VERSION', 'IES_TM2714_NAMESPACE',
     'IES_TM2714_ElementSpecification', 'IES_TM2714_Header',
-    'SpectralDistribution_IESTM2714'
+    'SpectralDistribution_IESTM2714', 'read_msds_from_IESTM2714_directory'
 ]
 
 IES_TM2714_VERSION = '1.0'
@@ -956,39 +961,55 @@ class SpectralDistribution_IESTM2714(SpectralDistribution):
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)  # nosec
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
-
-        self.name = os.path.splitext(os.path.basename(self._path))[0]
-
-        iterator = root.iter
-
+        specifications = {}
         for header_element in (self.header, self):
             mapping = header_element.mapping
             for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
-                    setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
+                specifications[(mapping.element,
+                                specification.element)] = (header_element,
+                                                           specification)
+
+        self.name = os.path.splitext(os.path.basename(self._path))[0]
 
-        # Reading spectral data.
+        # The file is parsed incrementally and the spectral data elements are
+        # removed from the tree once read so that large files are not held
+        # in memory.
+        namespace = None
+        elements = []
+        read = set()
         wavelengths = []
         values = []
-        for spectral_data in iterator('{{{0}}}{1}'.format(
-                namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(
-                    spectral_data.attrib[self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+        for event, element in ElementTree.iterparse(  # nosec
+                self._path, events=('start', 'end')):
+            if event == 'start':
+                if namespace is None:
+                    namespace = '{{{0}}}'.format(
+                        re.match('{(.*)}', element.tag).group(1))
+
+                elements.append(element)
+                continue
+
+            elements.pop()
+
+            tag = element.tag[len(namespace):]
+            if element.tag != namespace + tag:
+                continue
+
+            if tag == self.mapping.data.element:
+                wavelengths.append(element.attrib[self.mapping.data.attribute])
+                values.append(element.text)
+
+                elements[-1].remove(element)
+            elif len(elements) == 2:
+                key = (elements[1].tag[len(namespace):], tag)
+                if key in specifications and key not in read:
+                    header_element, specification = specifications[key]
+                    setattr(header_element, specification.attribute,
+                            specification.read_conversion(element.text))
+                    read.add(key)
 
-        self.wavelengths = wavelengths
-        self.values = values
+        self.wavelengths = np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE)
+        self.values = np.array(values, dtype=DEFAULT_FLOAT_DTYPE)
 
         return self
 
@@ -1052,3 +1073,125 @@ class SpectralDistribution_IESTM2714(SpectralDistribution):
             file.write(xml)
 
         return True
+
+
+def _read_IESTM2714_file(path, shape=None):
+    """
+    Reads given *IES TM-27-14* spectral data XML file and returns its
+    wavelengths, values and header.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral data XML file path.
+    shape : SpectralShape, optional
+        Spectral shape to align the spectral distribution to.
+
+    Returns
+    -------
+    tuple
+        Wavelengths, values and header of the spectral data XML file, the
+        header is an *OrderedDict* of the file name and the
+        :class:`colour.io.ies_tm2714.IES_TM2714_Header` and
+        :class:`colour.SpectralDistribution_IESTM2714` classes attributes.
+    """
+
+    sd = SpectralDistribution_IESTM2714(path).read()
+
+    if shape is not None:
+        sd.align(shape)
+
+    header = OrderedDict([('name', sd.name)])
+    for header_element in (sd.header, sd):
+        for specification in header_element.mapping.elements:
+            header[specification.attribute] = getattr(header_element,
+                                                      specification.attribute)
+
+    return sd.wavelengths, sd.values, header
+
+
+def read_msds_from_IESTM2714_directory(directory,
+                                       shape=None,
+                                       extension='.spdx',
+                                       processes=None,
+                                       chunksize=16):
+    """
+    Reads the *IES TM-27-14* spectral data XML files of given directory
+    across a pool of worker processes and returns their spectral data stacked
+    into a :class:`colour.MultiSpectralDistributions` class instance and
+    their headers as a table.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the spectral data XML files.
+    shape : SpectralShape, optional
+        Spectral shape to align the spectral distributions to, required if
+        the spectral distributions have different wavelengths.
+    extension : unicode, optional
+        Extension of the spectral data XML files, matched case-insensitively.
+    processes : int, optional
+        Worker processes count, default to the CPU count.
+    chunksize : int, optional
+        Spectral data XML files count sent at once to each worker process.
+
+    Returns
+    -------
+    tuple
+        Multi-spectral distributions labelled with the spectral data XML
+        files names and headers table as an *OrderedDict* of lists, i.e.
+        columns, of the files names and the
+        :class:`colour.io.ies_tm2714.IES_TM2714_Header` and
+        :class:`colour.SpectralDistribution_IESTM2714` classes attributes.
+
+    Raises
+    ------
+    RuntimeError
+        If the spectral distributions have different wavelengths and no
+        spectral shape is given.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> from colour import SpectralShape
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> msds, headers = read_msds_from_IESTM2714_directory(
+    ...     directory, SpectralShape(400, 700, 10))  # doctest: +SKIP
+    >>> msds.labels  # doctest: +SKIP
+    ['Fluorescent']
+    >>> headers['description']  # doctest: +SKIP
+    ['Rare earth fluorescent lamp']
+    """
+
+    paths = [
+        os.path.join(directory, path)
+        for path in sorted(os.listdir(directory))
+        if path.lower().endswith(extension.lower())
+    ]
+
+    with multiprocessing_pool(processes) as pool:
+        results = pool.map(
+            partial(_read_IESTM2714_file, shape=shape),
+            paths,
+            chunksize=chunksize)
+
+    headers = OrderedDict()
+    for _wavelengths, _values, header in results:
+        for attribute, value in header.items():
+            headers.setdefault(attribute, []).append(value)
+
+    if not results:
+        return MultiSpectralDistributions(), headers
+
+    wavelengths = results[0][0]
+    for result in results[1:]:
+        if not np.array_equal(result[0], wavelengths):
+            raise RuntimeError(
+                ('Cannot stack "IES TM-27-14" spectral distributions with '
+                 'different wavelengths, please provide a spectral shape to '
+                 'align them to!'))
+
+    return MultiSpectralDistributions(
+        tstack([result[1] for result in results]),
+        wavelengths,
+        labels=headers['name']), headers
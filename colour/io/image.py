@@ -8,14 +8,17 @@ Defines image related input / output utilities objects.
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 import platform
-from collections import namedtuple
+from collections import deque, namedtuple
+from multiprocessing.pool import ThreadPool
 from six import string_types
 
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
                               is_openimageio_installed, filter_kwargs,
-                              usage_warning)
+                              multiprocessing_pool, usage_warning)
+from colour.utilities.data_structures import copy_context
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -28,7 +31,9 @@ __all__ = [
     'BitDepth_Specification', 'ImageAttribute_Specification',
     'convert_bit_depth', 'read_image_OpenImageIO', 'read_image_Imageio',
     'READ_IMAGE_METHODS', 'read_image', 'write_image_OpenImageIO',
-    'write_image_Imageio', 'WRITE_IMAGE_METHODS', 'write_image'
+    'write_image_Imageio', 'WRITE_IMAGE_METHODS', 'write_image',
+    'process_image_OpenImageIO', 'process_image_Imageio',
+    'PROCESS_IMAGE_METHODS', 'process_image', 'process_image_sequence'
 ]
 
 BitDepth_Specification = namedtuple(
@@ -150,15 +155,19 @@ def convert_bit_depth(a, bit_depth='float32'):
         if bit_depth == 'uint8':
             return a
         elif bit_depth == 'uint16':
-            return (a * 257).astype(target_dtype)
-        elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
+            return np.multiply(a, 257, dtype=target_dtype)
+        elif bit_depth in ('float32', 'float64'):
+            return np.divide(a, 255, dtype=target_dtype)
+        elif bit_depth in ('float16', 'float128'):
             return (a / 255).astype(target_dtype)
     elif source_dtype == 'uint16':
         if bit_depth == 'uint8':
-            return (a / 257).astype(target_dtype)
+            return np.floor_divide(a, 257).astype(target_dtype)
         elif bit_depth == 'uint16':
             return a
-        elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
+        elif bit_depth in ('float32', 'float64'):
+            return np.divide(a, 65535, dtype=target_dtype)
+        elif bit_depth in ('float16', 'float128'):
             return (a / 65535).astype(target_dtype)
     elif source_dtype in ('float16', 'float32', 'float64', 'float128'):
         if bit_depth == 'uint8':
@@ -360,6 +369,31 @@ def read_image(path, bit_depth='float32', method='OpenImageIO', **kwargs):
     return function(path, bit_depth, **kwargs)
 
 
+def _set_specification_attributes(specification, attributes):
+    """
+    Sets given attributes on given *OpenImageIO* image specification.
+
+    Parameters
+    ----------
+    specification : ImageSpec
+        *OpenImageIO* :class:`ImageSpec` class instance.
+    attributes : array_like
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances.
+    """
+
+    for attribute in attributes:
+        name = str(attribute.name)
+        value = (str(attribute.value)
+                 if isinstance(attribute.value, string_types) else
+                 attribute.value)
+        type_ = attribute.type_
+        if attribute.type_ is None:
+            specification.attribute(name, value)
+        else:
+            specification.attribute(name, type_, value)
+
+
 def write_image_OpenImageIO(image, path, bit_depth='float32', attributes=None):
     """
     Writes given image at given path using *OpenImageIO*.
@@ -428,15 +462,7 @@ def write_image_OpenImageIO(image, path, bit_depth='float32', attributes=None):
             height, width, channels = image.shape
 
         specification = ImageSpec(width, height, channels, bit_depth)
-        for attribute in attributes:
-            name = str(attribute.name)
-            value = (str(attribute.value) if isinstance(
-                attribute.value, string_types) else attribute.value)
-            type_ = attribute.type_
-            if attribute.type_ is None:
-                specification.attribute(name, value)
-            else:
-                specification.attribute(name, type_, value)
+        _set_specification_attributes(specification, attributes)
 
         image_output = ImageOutput.create(path)
 
@@ -589,3 +615,631 @@ def write_image(image,
         kwargs = filter_kwargs(function, **kwargs)
 
     return function(image, path, bit_depth, **kwargs)
+
+
+_PROCESS_IMAGE_TILE_SIZE = 256
+"""
+Default scanlines count of the image regions read, processed and written at
+once by the :func:`colour.io.process_image` definition.
+
+_PROCESS_IMAGE_TILE_SIZE : int
+"""
+
+
+def _image_regions(height, tile_size=None, alignment=1):
+    """
+    Returns the image regions, as *(y_begin, y_end)* scanlines ranges spanning
+    the image width, that an image with given height is split into.
+
+    Parameters
+    ----------
+    height : int
+        Image height.
+    tile_size : int, optional
+        Scanlines count of the image regions.
+    alignment : int, optional
+        Scanlines count the image regions height is rounded up to a multiple
+        of, e.g. the tiles height of a tiled image.
+
+    Returns
+    -------
+    list
+        Image regions.
+
+    Examples
+    --------
+    >>> _image_regions(10, 4)
+    [(0, 4), (4, 8), (8, 10)]
+    >>> _image_regions(10, 4, 3)
+    [(0, 6), (6, 10)]
+    """
+
+    if tile_size is None:
+        tile_size = _PROCESS_IMAGE_TILE_SIZE
+
+    tile_size = max(int(np.ceil(tile_size / alignment)) * alignment, 1)
+
+    return [(y, min(y + tile_size, height))
+            for y in range(0, height, tile_size)]
+
+
+def _process_image_regions(read_region,
+                           write_region,
+                           regions,
+                           function,
+                           threads=None):
+    """
+    Reads, processes and writes given image regions in order.
+
+    At most ``threads`` image regions are held in memory at once, the
+    processing is performed by a pool of worker threads when ``threads`` is
+    greater than 1, each image region being processed in a copy of the
+    calling thread context so that, e.g. the domain-range scale and float
+    precision, apply in the worker threads.
+
+    Parameters
+    ----------
+    read_region : callable
+        Callable reading an image region and returning its data for given
+        *(y_begin, y_end)* scanlines range.
+    write_region : callable
+        Callable writing given processed image region data for given
+        *(y_begin, y_end)* scanlines range.
+    regions : array_like
+        Image regions as *(y_begin, y_end)* scanlines ranges.
+    function : callable
+        Callable processing the image regions data.
+    threads : int, optional
+        Worker threads count.
+    """
+
+    def _process_region(region):
+        """
+        Reads and processes given image region.
+        """
+
+        return function(read_region(*region))
+
+    def _process_region_in_context(arguments):
+        """
+        Reads and processes given image region in given context.
+        """
+
+        context, region = arguments
+
+        return context.run(_process_region, region)
+
+    threads = 1 if threads is None else max(int(threads), 1)
+
+    pool = ThreadPool(threads) if threads > 1 else None
+    try:
+        for i in range(0, len(regions), threads):
+            batch = regions[i:i + threads]
+            if pool is None:
+                tiles = [_process_region(region) for region in batch]
+            else:
+                tiles = pool.map(_process_region_in_context,
+                                 [(copy_context(), region)
+                                  for region in batch])
+
+            for region, tile in zip(batch, tiles):
+                write_region(region, tile)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def process_image_OpenImageIO(input_path,
+                              output_path,
+                              function,
+                              bit_depth='float32',
+                              tile_size=None,
+                              threads=None,
+                              attributes=None):
+    """
+    Processes the image at given input path with given function and writes
+    it at given output path using *OpenImageIO*, the image is streamed by
+    regions of scanlines so that it is never entirely held in memory.
+
+    Parameters
+    ----------
+    input_path : unicode
+        Input image path.
+    output_path : unicode
+        Output image path.
+    function : callable
+        Callable processing the image regions, e.g. a colour conversion
+        definition or the :meth:`colour.LUT3D.apply` method. It is given
+        *float32* arrays of shape *(scanlines, width, channels)* and must
+        return arrays of the same shape.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth to write the image at, the bit depth conversion behaviour is
+        ruled directly by *OpenImageIO*.
+    tile_size : int, optional
+        Scanlines count of the image regions processed at once, rounded up to
+        a multiple of the tiles height for tiled images.
+    threads : int, optional
+        Worker threads count processing the image regions concurrently, the
+        image regions are processed serially by default.
+    attributes : array_like, optional
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances used to set attributes of the image.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The peak memory usage is bounded by ``threads`` image regions of
+        ``tile_size`` scanlines spanning the image width.
+    -   The subimages, e.g. the parts of a multi-part *OpenEXR* file, are all
+        processed if the output image format supports them, only the first
+        subimage is processed otherwise.
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> input_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                           'resources', 'CMS_Test_Pattern.exr')
+    >>> output_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                            'resources', 'CMSTestPattern.tif')
+    >>> process_image_OpenImageIO(
+    ...     input_path, output_path, colour.models.eotf_inverse_sRGB,
+    ...     'uint16', threads=4)  # doctest: +SKIP
+    True
+    """
+
+    if is_openimageio_installed(raise_exception=True):  # pragma: no cover
+        from OpenImageIO import FLOAT, ImageInput, ImageOutput
+
+        input_path = str(input_path)
+        output_path = str(output_path)
+
+        if attributes is None:
+            attributes = []
+
+        bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
+
+        image_input = ImageInput.open(input_path)
+
+        specifications = []
+        while image_input.seek_subimage(len(specifications), 0):
+            specification = image_input.spec()
+            specification.set_format(bit_depth)
+            _set_specification_attributes(specification, attributes)
+            specifications.append(specification)
+
+        image_output = ImageOutput.create(output_path)
+        if not image_output.supports('multiimage'):
+            specifications = specifications[:1]
+
+        for subimage, specification in enumerate(specifications):
+            if subimage == 0:
+                image_output.open(
+                    output_path, specifications
+                    if len(specifications) > 1 else specification)
+            else:
+                image_output.open(output_path, specification, 'AppendSubimage')
+
+            x, y, z = specification.x, specification.y, specification.z
+            width = specification.width
+            channels = specification.nchannels
+
+            def read_region(y_begin, y_end):
+                """
+                Reads given image region as *float32* data.
+                """
+
+                return image_input.read_scanlines(
+                    subimage, 0, y + y_begin, y + y_end, z, 0, channels, FLOAT)
+
+            if specification.tile_width:
+                alignment = specification.tile_height
+
+                def write_region(region, tile):
+                    """
+                    Writes given image region data as tiles.
+                    """
+
+                    image_output.write_tiles(
+                        x, x + width, y + region[0], y + region[1], z, z + 1,
+                        np.ascontiguousarray(tile, dtype=np.float32))
+            else:
+                alignment = 1
+
+                def write_region(region, tile):
+                    """
+                    Writes given image region data as scanlines.
+                    """
+
+                    image_output.write_scanlines(
+                        y + region[0], y + region[1], z,
+                        np.ascontiguousarray(tile, dtype=np.float32))
+
+            _process_image_regions(
+                read_region, write_region,
+                _image_regions(specification.height, tile_size, alignment),
+                function, threads)
+
+        image_output.close()
+        image_input.close()
+
+        return True
+
+
+def process_image_Imageio(input_path,
+                          output_path,
+                          function,
+                          bit_depth='float32',
+                          tile_size=None,
+                          threads=None,
+                          **kwargs):
+    """
+    Processes the image at given input path with given function and writes
+    it at given output path using *Imageio*, the image is processed by regions
+    of scanlines.
+
+    Parameters
+    ----------
+    input_path : unicode
+        Input image path.
+    output_path : unicode
+        Output image path.
+    function : callable
+        Callable processing the image regions, e.g. a colour conversion
+        definition or the :meth:`colour.LUT3D.apply` method. It is given
+        *float32* arrays of shape *(scanlines, width, channels)*, or
+        *(scanlines, width)* for single channel images, and must return
+        arrays of the same shape.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth to write the image at, the image regions data is converted
+        with :func:`colour.io.convert_bit_depth` definition.
+    tile_size : int, optional
+        Scanlines count of the image regions processed at once.
+    threads : int, optional
+        Worker threads count processing the image regions concurrently, the
+        image regions are processed serially by default.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the :func:`imageio.imwrite` definition.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   *Imageio* does not support partial image reading and writing, the
+        input and output images are thus entirely held in memory at their
+        bit depth, only the *float32* intermediate data is bounded by
+        ``threads`` image regions of ``tile_size`` scanlines.
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> input_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                           'resources', 'Colour_Logo.png')
+    >>> output_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                            'resources', 'ColourLogo.png')
+    >>> process_image_Imageio(
+    ...     input_path, output_path, colour.models.eotf_inverse_sRGB,
+    ...     'uint8', threads=4)  # doctest: +SKIP
+    True
+    """
+
+    from imageio import imread, imwrite
+
+    image = imread(input_path)
+    output = []
+
+    def read_region(y_begin, y_end):
+        """
+        Reads given image region as *float32* data.
+        """
+
+        return convert_bit_depth(image[y_begin:y_end], 'float32')
+
+    def write_region(region, tile):
+        """
+        Writes given image region data into the output image.
+        """
+
+        tile = convert_bit_depth(tile, bit_depth)
+        if not output:
+            output.append(
+                np.empty((image.shape[0], ) + tile.shape[1:], tile.dtype))
+
+        output[0][region[0]:region[1]] = tile
+
+    _process_image_regions(read_region, write_region,
+                           _image_regions(image.shape[0], tile_size), function,
+                           threads)
+
+    imwrite(output_path, output[0], **kwargs)
+
+    return True
+
+
+PROCESS_IMAGE_METHODS = CaseInsensitiveMapping({
+    'Imageio': process_image_Imageio,
+    'OpenImageIO': process_image_OpenImageIO,
+})
+PROCESS_IMAGE_METHODS.__doc__ = """
+Supported process image methods.
+
+PROCESS_IMAGE_METHODS : CaseInsensitiveMapping
+    **{'Imageio', 'OpenImageIO'}**
+"""
+
+
+def process_image(input_path,
+                  output_path,
+                  function,
+                  bit_depth='float32',
+                  method='OpenImageIO',
+                  **kwargs):
+    """
+    Processes the image at given input path with given function and writes
+    it at given output path using given method, the image is processed by
+    regions of scanlines.
+
+    Parameters
+    ----------
+    input_path : unicode
+        Input image path.
+    output_path : unicode
+        Output image path.
+    function : callable
+        Callable processing the image regions, e.g. a colour conversion
+        definition or the :meth:`colour.LUT3D.apply` method. It is given
+        *float32* arrays of shape *(scanlines, width, channels)* and must
+        return arrays of the same shape.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth to write the image at.
+    method : unicode, optional
+        **{'OpenImageIO', 'Imageio'}**,
+        Process method, i.e. the image library used for reading and writing
+        images.
+
+    Other Parameters
+    ----------------
+    tile_size : int, optional
+        {:func:`colour.io.process_image_OpenImageIO`,
+        :func:`colour.io.process_image_Imageio`},
+        Scanlines count of the image regions processed at once.
+    threads : int, optional
+        {:func:`colour.io.process_image_OpenImageIO`,
+        :func:`colour.io.process_image_Imageio`},
+        Worker threads count processing the image regions concurrently.
+    attributes : array_like, optional
+        {:func:`colour.io.process_image_OpenImageIO`},
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances used to set attributes of the image.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   If the given method is *OpenImageIO* but the library is not available
+        processing will be performed by *Imageio*.
+    -   With the *OpenImageIO* method, the image is streamed and the peak
+        memory usage is bounded by ``threads`` image regions of ``tile_size``
+        scanlines spanning the image width.
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> input_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                           'resources', 'CMS_Test_Pattern.exr')
+    >>> output_path = os.path.join(colour.__path__[0], 'io', 'tests',
+    ...                            'resources', 'CMSTestPattern.exr')
+    >>> LUT = colour.LUT3D(colour.LUT3D.linear_table(33) ** 0.5)
+    >>> process_image(input_path, output_path, LUT.apply, threads=4)
+    ... # doctest: +SKIP
+    True
+    """
+
+    if method.lower() == 'openimageio':  # pragma: no cover
+        if not is_openimageio_installed():
+            usage_warning(
+                '"OpenImageIO" related API features are not available, '
+                'switching to "Imageio"!')
+            method = 'Imageio'
+
+    function_ = PROCESS_IMAGE_METHODS[method]
+
+    if method.lower() == 'openimageio':  # pragma: no cover
+        kwargs = filter_kwargs(function_, **kwargs)
+
+    return function_(input_path, output_path, function, bit_depth, **kwargs)
+
+
+def _process_frame(input_path, output_path, function, bit_depth, read_image_,
+                   write_image_, pool, kwargs):
+    """
+    Reads, processes and writes given frame, the processing is performed by
+    given pool while the reading and writing are performed in the calling
+    thread.
+
+    Parameters
+    ----------
+    input_path : unicode
+        Input image path.
+    output_path : unicode
+        Output image path.
+    function : callable
+        Callable processing the frame.
+    bit_depth : unicode
+        Bit depth to write the frame at.
+    read_image_ : callable
+        Definition reading the frame, e.g.
+        :func:`colour.io.read_image_Imageio`.
+    write_image_ : callable
+        Definition writing the frame, e.g.
+        :func:`colour.io.write_image_Imageio`.
+    pool : Pool
+        Pool processing the frame.
+    kwargs : dict
+        Keywords arguments passed to the write definition.
+
+    Returns
+    -------
+    Exception
+        Exception raised while handling the frame, *None* on success.
+    """
+
+    try:
+        image = read_image_(input_path, 'float32')
+        image = pool.apply(function, (image, ))
+        write_image_(image, output_path, bit_depth, **kwargs)
+    except Exception as error:
+        return error
+
+
+def process_image_sequence(input_paths,
+                           output_paths,
+                           function,
+                           bit_depth='float32',
+                           method='OpenImageIO',
+                           processes=None,
+                           threads=None,
+                           **kwargs):
+    """
+    Processes the image sequence at given input paths with given function
+    and writes it at given output paths using given method, the frames reading
+    and writing are performed by a pool of worker threads overlapping with the
+    frames processing performed by a pool of worker processes.
+
+    The frames are yielded, in the image sequence order, as soon as they are
+    written, allowing to report the progress of the image sequence
+    processing.
+
+    Parameters
+    ----------
+    input_paths : array_like
+        Input images paths.
+    output_paths : array_like
+        Output images paths.
+    function : callable
+        Picklable callable processing the frames, e.g. a colour conversion
+        definition or the :meth:`colour.LUT3D.apply` method. It is given the
+        frames as *float32* arrays.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Bit depth to write the frames at.
+    method : unicode, optional
+        **{'OpenImageIO', 'Imageio'}**,
+        Read and write method, i.e. the image library used for reading and
+        writing images.
+    processes : int, optional
+        Worker processes count processing the frames, default to the CPU
+        count.
+    threads : int, optional
+        Worker threads count reading and writing the frames, default to the
+        CPU count.
+
+    Other Parameters
+    ----------------
+    attributes : array_like, optional
+        {:func:`colour.io.write_image_OpenImageIO`},
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances used to set attributes of the frames.
+
+    Yields
+    ------
+    tuple
+        Input image path, output image path and exception raised while
+        handling the frame, *None* on success.
+
+    Notes
+    -----
+    -   An exception raised while handling a frame does not interrupt the
+        image sequence processing, it is yielded with the frame.
+    -   At most twice ``threads`` frames are in flight at once, the frames
+        are only submitted as the previous ones are consumed from the
+        generator.
+    -   When multiprocessing is disabled with
+        :class:`colour.utilities.disable_multiprocessing`, the frames are
+        processed by the worker threads.
+    -   The frames are handled in a copy of the calling thread context and
+        the worker processes inherit from its domain-range scale and float
+        precision.
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> input_paths = ['Frame.{0:04d}.exr'.format(i) for i in range(100)]
+    >>> output_paths = ['Frame.{0:04d}.tif'.format(i) for i in range(100)]
+    >>> for input_path, output_path, error in process_image_sequence(
+    ...         input_paths, output_paths, colour.models.eotf_inverse_sRGB,
+    ...         'uint16'):
+    ...     print(output_path, error)  # doctest: +SKIP
+    Frame.0000.tif None
+    ...
+    """
+
+    input_paths = list(input_paths)
+    output_paths = list(output_paths)
+
+    assert len(input_paths) == len(output_paths), (
+        'Input and output paths must have the same length!')
+
+    if method.lower() == 'openimageio':  # pragma: no cover
+        if not is_openimageio_installed():
+            usage_warning(
+                '"OpenImageIO" related API features are not available, '
+                'switching to "Imageio"!')
+            method = 'Imageio'
+
+    read_image_ = READ_IMAGE_METHODS[method]
+    write_image_ = WRITE_IMAGE_METHODS[method]
+
+    if method.lower() == 'openimageio':  # pragma: no cover
+        kwargs = filter_kwargs(write_image_, **kwargs)
+
+    if threads is None:
+        threads = multiprocessing.cpu_count()
+
+    threads = max(int(threads), 1)
+
+    with multiprocessing_pool(processes) as pool:
+        thread_pool = ThreadPool(threads)
+        try:
+            frames = iter(zip(input_paths, output_paths))
+            results = deque()
+            while True:
+                for input_path, output_path in frames:
+                    results.append(
+                        (input_path, output_path,
+                         thread_pool.apply_async(
+                             copy_context().run,
+                             (_process_frame, input_path, output_path,
+                              function, bit_depth, read_image_, write_image_,
+                              pool, kwargs))))
+                    if len(results) >= threads * 2:
+                        break
+
+                if not results:
+                    break
+
+                input_path, output_path, result = results.popleft()
+                yield input_path, output_path, result.get()
+        finally:
+            thread_pool.close()
+            thread_pool.join()
@@ -8,14 +8,19 @@ Defines various input / output objects for *CSV* tabular data files:
 -   :func:`colour.read_spectral_data_from_csv_file`
 -   :func:`colour.read_sds_from_csv_file`
 -   :func:`colour.write_sds_to_csv_file`
+-   :func:`colour.read_msds_from_csv_file`
+-   :func:`colour.write_msds_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+import warnings
 from collections import OrderedDict
+from itertools import islice
 import csv
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import MultiSpectralDistributions, SpectralDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
@@ -27,7 +32,8 @@ __status__ = 'Production'
 
 __all__ = [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'write_sds_to_csv_file', 'read_msds_from_csv_file',
+    'write_msds_to_csv_file'
 ]
 
 
@@ -318,3 +324,191 @@ def write_sds_to_csv_file(sds, path, delimiter=',', fields=None):
             writer.writerow(row)
 
     return True
+
+
+def _parse_csv_lines(lines, delimiter, columns, default):
+    """
+    Parses given *CSV* file lines numeric block into a 2D array.
+
+    The lines are parsed at once with :func:`np.fromstring` definition when
+    every line defines a value for each column, otherwise they are parsed
+    with :func:`np.genfromtxt` definition, filling the missing and invalid
+    values with given default value.
+
+    Parameters
+    ----------
+    lines : array_like
+        *CSV* file lines.
+    delimiter : unicode
+        *CSV* file content delimiter.
+    columns : int
+        *CSV* file columns count.
+    default : numeric
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    ndarray
+        *CSV* file lines numeric block.
+    """
+
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return np.zeros((0, columns), dtype=DEFAULT_FLOAT_DTYPE)
+
+    if all(line.count(delimiter) == columns - 1 for line in lines):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                block = np.fromstring(
+                    ''.join(lines).replace(delimiter, ' '),
+                    dtype=DEFAULT_FLOAT_DTYPE,
+                    sep=' ')
+
+            if block.size == len(lines) * columns:
+                return np.reshape(block, (len(lines), columns))
+        except (DeprecationWarning, ValueError):
+            pass
+
+    # Short lines are padded with empty fields so that their missing values
+    # are filled with the default value.
+    lines = [
+        line.rstrip('\r\n') + delimiter * (columns - 1 - line.count(delimiter))
+        for line in lines
+    ]
+
+    return np.reshape(
+        np.genfromtxt(
+            lines,
+            dtype=DEFAULT_FLOAT_DTYPE,
+            delimiter=delimiter,
+            filling_values=default), (len(lines), columns))
+
+
+def read_msds_from_csv_file(path,
+                            delimiter=',',
+                            fields=None,
+                            default=0,
+                            chunk_size=None):
+    """
+    Reads the spectral data from given *CSV* file and return its content as
+    :class:`colour.MultiSpectralDistributions` class instance.
+
+    Contrary to the :func:`colour.read_sds_from_csv_file` definition, the
+    numeric block of the file is parsed directly into a 2D array without
+    creating intermediate objects for each value.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+    chunk_size : int, optional
+        Count of lines parsed at once, bounding the memory used by the file
+        content text for large files. If no value is provided the whole file
+        is parsed at once.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Multi-spectral distributions of given *CSV* file.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> msds = read_msds_from_csv_file(csv_file)
+    >>> print(msds.labels[:4])
+    ['1', '2', '3', '4']
+    >>> msds[555][:8]
+    array([ 0.082,  0.298,  0.188,  0.147,  0.207,  0.458,  0.26 ,  0.094])
+    """
+
+    with open(path, 'rU') as csv_file:
+        if fields is None:
+            fields = next(csv.reader([next(csv_file)], delimiter=delimiter))
+
+        fields = list(fields)
+        if len(fields) == 1:
+            raise RuntimeError(('A "CSV" spectral data file should define '
+                                'the following fields: '
+                                '("wavelength", "field 1", ..., "field n")!'))
+
+        if chunk_size is None:
+            data = _parse_csv_lines(csv_file, delimiter, len(fields), default)
+        else:
+            blocks = []
+            while True:
+                lines = list(islice(csv_file, chunk_size))
+                if not lines:
+                    break
+
+                blocks.append(
+                    _parse_csv_lines(lines, delimiter, len(fields), default))
+
+            data = np.concatenate(blocks) if blocks else _parse_csv_lines(
+                [], delimiter, len(fields), default)
+
+    return MultiSpectralDistributions(
+        data[:, 1:], data[:, 0], labels=fields[1:])
+
+
+def write_msds_to_csv_file(msds, path, delimiter=',', fields=None):
+    """
+    Writes the given multi-spectral distributions to given *CSV* file.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions
+        Multi-spectral distributions to write.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names, i.e. labels of the
+        multi-spectral distributions to write. If no value is provided the
+        multi-spectral distributions labels are used.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> msds = read_msds_from_csv_file(csv_file)
+    >>> csv_file = os.path.join(tempfile.gettempdir(), 'colorchecker.csv')
+    >>> write_msds_to_csv_file(msds, csv_file, fields=['1', '2'])
+    True
+    """
+
+    labels = msds.labels
+    fields = list(fields) if fields is not None else labels
+    indexes = [labels.index(field) for field in fields]
+
+    data = np.column_stack([msds.wavelengths, msds.values[:, indexes]])
+    with open(path, 'w') as csv_file:
+        writer = csv.writer(
+            csv_file, delimiter=str(delimiter), lineterminator='\n')
+
+        writer.writerow(['wavelength'] + fields)
+        writer.writerows(row.tolist() for row in data)
+
+    return True
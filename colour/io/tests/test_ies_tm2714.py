@@ -11,9 +11,11 @@ import shutil
 import unittest
 import tempfile
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import SpectralDistribution, SpectralShape
 from colour.io.ies_tm2714 import (IES_TM2714_Header,
-                                  SpectralDistribution_IESTM2714)
+                                  SpectralDistribution_IESTM2714,
+                                  read_msds_from_IESTM2714_directory)
+from colour.utilities import disable_multiprocessing
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -25,7 +27,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'FLUORESCENT_FILE_HEADER',
     'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION', 'FLUORESCENT_FILE_SPECTRAL_DATA',
-    'TestIES_TM2714_Header', 'TestIES_TM2714_Sd'
+    'TestIES_TM2714_Header', 'TestIES_TM2714_Sd',
+    'TestReadMsdsFromIESTM2714Directory'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -247,5 +250,75 @@ _temporary_directory_temporary_directory
         self.assertEquals(sd_r, sd_t)
 
 
+class TestReadMsdsFromIESTM2714Directory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.ies_tm2714.read_msds_from_IESTM2714_directory`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        for name in ('Fluorescent_1.spdx', 'Fluorescent_2.SPDX'):
+            shutil.copyfile(
+                os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+                os.path.join(self._temporary_directory, name))
+
+        sd = SpectralDistribution_IESTM2714(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx')).read()
+        sd.interpolate(SpectralShape(400, 700, 5))
+        sd.header.description = 'Interpolated fluorescent lamp'
+        sd.path = os.path.join(self._temporary_directory, 'Fluorescent_3.spdx')
+        sd.write()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_msds_from_IESTM2714_directory(self):
+        """
+        Tests :func:`colour.io.ies_tm2714.\
+read_msds_from_IESTM2714_directory` definition.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        msds, headers = read_msds_from_IESTM2714_directory(
+            self._temporary_directory, shape, processes=2)
+
+        self.assertEqual(msds.shape, shape)
+        self.assertListEqual(
+            msds.labels, ['Fluorescent_1', 'Fluorescent_2', 'Fluorescent_3'])
+        self.assertListEqual(headers['name'], msds.labels)
+        self.assertListEqual(headers['description'], [
+            'Rare earth fluorescent lamp', 'Rare earth fluorescent lamp',
+            'Interpolated fluorescent lamp'
+        ])
+        self.assertListEqual(headers['spectral_quantity'], ['relative'] * 3)
+
+        sd = SpectralDistribution_IESTM2714(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx')).read()
+        np.testing.assert_almost_equal(
+            msds.values[:, 0], sd.align(shape).values, decimal=7)
+        np.testing.assert_almost_equal(
+            msds.values[:, 0], msds.values[:, 1], decimal=7)
+
+    @disable_multiprocessing()
+    def test_raise_exception_read_msds_from_IESTM2714_directory(self):
+        """
+        Tests :func:`colour.io.ies_tm2714.\
+read_msds_from_IESTM2714_directory` definition raised exception.
+        """
+
+        self.assertRaises(RuntimeError, read_msds_from_IESTM2714_directory,
+                          self._temporary_directory)
+
+
 if __name__ == '__main__':
     unittest.main()
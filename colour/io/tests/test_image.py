@@ -16,8 +16,12 @@ from colour.io import convert_bit_depth
 from colour.io import read_image_OpenImageIO, write_image_OpenImageIO
 from colour.io import read_image_Imageio, write_image_Imageio
 from colour.io import read_image, write_image
+from colour.io import process_image_Imageio, process_image
+from colour.io import process_image_sequence
 from colour.io import ImageAttribute_Specification
-from colour.utilities import is_openimageio_installed
+from colour.utilities import (disable_multiprocessing, domain_range_scale,
+                              float_precision, get_domain_range_scale,
+                              get_float_precision, is_openimageio_installed)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -29,7 +33,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'TestReadImageOpenImageIO',
     'TestWriteImageOpenImageIO', 'TestReadImageImageio',
-    'TestWriteImageImageio', 'TestReadImage', 'TestWriteImage'
+    'TestWriteImageImageio', 'TestReadImage', 'TestWriteImage',
+    'TestProcessImageImageio', 'TestProcessImage', 'TestProcessImageSequence'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -416,5 +421,309 @@ class TestWriteImage(unittest.TestCase):
         self.assertIs(image.dtype, np.dtype('float32'))
 
 
+class TestProcessImageImageio(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.process_image_Imageio` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_process_image_Imageio(self):
+        """
+        Tests :func:`colour.io.image.process_image_Imageio` definition.
+        """
+
+        source_image_path = os.path.join(RESOURCES_DIRECTORY,
+                                         'Colour_Logo.png')
+        target_image_path = os.path.join(self._temporary_directory,
+                                         'Colour_Logo.tif')
+
+        image = read_image_Imageio(source_image_path)
+        reference = convert_bit_depth(1 - image, 'uint16')
+
+        for tile_size, threads in ((None, None), (7, None), (7, 3), (1000, 2)):
+            self.assertTrue(
+                process_image_Imageio(
+                    source_image_path,
+                    target_image_path,
+                    lambda a: 1 - a,
+                    'uint16',
+                    tile_size=tile_size,
+                    threads=threads))
+            np.testing.assert_equal(
+                read_image_Imageio(target_image_path, 'uint16'), reference)
+
+    def test_process_image_Imageio_regions(self):
+        """
+        Tests :func:`colour.io.image.process_image_Imageio` definition
+        processed image regions.
+        """
+
+        source_image_path = os.path.join(RESOURCES_DIRECTORY,
+                                         'Colour_Logo.png')
+        target_image_path = os.path.join(self._temporary_directory,
+                                         'Colour_Logo.png')
+
+        shapes = []
+
+        def _function(a):
+            """
+            Records the processed image regions shape.
+            """
+
+            shapes.append(a.shape)
+
+            return a
+
+        process_image_Imageio(
+            source_image_path,
+            target_image_path,
+            _function,
+            'uint8',
+            tile_size=50)
+        self.assertListEqual(shapes, [(50, 256, 4), (50, 256, 4),
+                                      (28, 256, 4)])
+        np.testing.assert_equal(
+            read_image_Imageio(target_image_path, 'uint8'),
+            read_image_Imageio(source_image_path, 'uint8'))
+
+    def test_domain_range_scale_process_image_Imageio(self):
+        """
+        Tests :func:`colour.io.image.process_image_Imageio` definition
+        domain and range scale support.
+        """
+
+        source_image_path = os.path.join(RESOURCES_DIRECTORY,
+                                         'Colour_Logo.png')
+        target_image_path = os.path.join(self._temporary_directory,
+                                         'Colour_Logo.tif')
+
+        def _function(a):
+            """
+            Halves the image regions in the *'1'* domain-range scale.
+            """
+
+            return a / 2 if get_domain_range_scale() == '1' else a
+
+        image = read_image_Imageio(source_image_path)
+        reference = convert_bit_depth(image / 2, 'uint16')
+
+        with domain_range_scale('1'):
+            for threads in (None, 4):
+                process_image_Imageio(
+                    source_image_path,
+                    target_image_path,
+                    _function,
+                    'uint16',
+                    tile_size=7,
+                    threads=threads)
+                np.testing.assert_equal(
+                    read_image_Imageio(target_image_path, 'uint16'), reference)
+
+
+class TestProcessImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.process_image` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_process_image(self):
+        """
+        Tests :func:`colour.io.image.process_image` definition.
+        """
+
+        source_image_path = os.path.join(RESOURCES_DIRECTORY,
+                                         'Colour_Logo.png')
+        target_image_path = os.path.join(self._temporary_directory,
+                                         'Colour_Logo.png')
+
+        process_image(
+            source_image_path,
+            target_image_path,
+            lambda a: a ** 2,
+            'uint8',
+            method='Imageio',
+            tile_size=16,
+            threads=2)
+        image = read_image(target_image_path, 'uint8', method='Imageio')
+        self.assertTupleEqual(image.shape, (128, 256, 4))
+        np.testing.assert_equal(
+            image,
+            convert_bit_depth(
+                read_image(source_image_path, method='Imageio') ** 2, 'uint8'))
+
+
+def _halve_in_context(a):
+    """
+    Halves given frame in the *'1'* domain-range scale and *float32* float
+    precision.
+    """
+
+    if (get_domain_range_scale() == '1' and
+            get_float_precision() == np.float32):
+        return a / 2
+    else:
+        return a
+
+
+class TestProcessImageSequence(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.process_image_sequence` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._input_paths = []
+        self._output_paths = []
+        for i in range(7):
+            input_path = os.path.join(self._temporary_directory,
+                                      'Input.{0:04d}.png'.format(i))
+            shutil.copyfile(
+                os.path.join(RESOURCES_DIRECTORY, 'Colour_Logo.png'),
+                input_path)
+            self._input_paths.append(input_path)
+            self._output_paths.append(
+                os.path.join(self._temporary_directory,
+                             'Output.{0:04d}.png'.format(i)))
+
+        self._reference = convert_bit_depth(
+            np.sqrt(
+                read_image(
+                    os.path.join(RESOURCES_DIRECTORY, 'Colour_Logo.png'),
+                    method='Imageio')), 'uint8')
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_process_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.process_image_sequence` definition.
+        """
+
+        results = list(
+            process_image_sequence(
+                self._input_paths,
+                self._output_paths,
+                np.sqrt,
+                'uint8',
+                method='Imageio',
+                processes=2,
+                threads=2))
+        self.assertListEqual(
+            results,
+            list(zip(self._input_paths, self._output_paths, [None] * 7)))
+        for output_path in self._output_paths:
+            np.testing.assert_equal(
+                read_image(output_path, 'uint8', method='Imageio'),
+                self._reference)
+
+    def test_context_process_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.process_image_sequence` definition
+        domain-range scale and float precision support.
+        """
+
+        reference = convert_bit_depth(
+            read_image(
+                os.path.join(RESOURCES_DIRECTORY, 'Colour_Logo.png'),
+                method='Imageio') / 2, 'uint8')
+
+        def _process_image_sequence():
+            """
+            Processes the image sequence in the *'1'* domain-range scale and
+            *float32* float precision.
+            """
+
+            with domain_range_scale('1'), float_precision(np.float32):
+                results = list(
+                    process_image_sequence(
+                        self._input_paths,
+                        self._output_paths,
+                        _halve_in_context,
+                        'uint8',
+                        method='Imageio',
+                        processes=2,
+                        threads=2))
+            self.assertListEqual([result[2] for result in results], [None] * 7)
+            for output_path in self._output_paths:
+                np.testing.assert_equal(
+                    read_image(output_path, 'uint8', method='Imageio'),
+                    reference)
+
+        _process_image_sequence()
+        with disable_multiprocessing():
+            _process_image_sequence()
+
+    @disable_multiprocessing()
+    def test_process_image_sequence_errors(self):
+        """
+        Tests :func:`colour.io.image.process_image_sequence` definition
+        errors isolation.
+        """
+
+        os.remove(self._input_paths[3])
+
+        results = list(
+            process_image_sequence(
+                self._input_paths,
+                self._output_paths,
+                np.sqrt,
+                'uint8',
+                method='Imageio',
+                threads=1))
+        self.assertListEqual([result[0] for result in results],
+                             self._input_paths)
+        for i, (_input_path, output_path, error) in enumerate(results):
+            if i == 3:
+                self.assertIsInstance(error, Exception)
+                self.assertFalse(os.path.exists(output_path))
+            else:
+                self.assertIsNone(error)
+                np.testing.assert_equal(
+                    read_image(output_path, 'uint8', method='Imageio'),
+                    self._reference)
+
+        self.assertRaises(
+            AssertionError, lambda: list(
+                process_image_sequence(self._input_paths, [], np.sqrt)))
+
+
 if __name__ == '__main__':
     unittest.main()
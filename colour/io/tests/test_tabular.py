@@ -12,9 +12,11 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralDistribution, SpectralShape
+from colour.colorimetry import (MultiSpectralDistributions,
+                                SpectralDistribution, SpectralShape)
 from colour.io import (read_spectral_data_from_csv_file,
-                       read_sds_from_csv_file, write_sds_to_csv_file)
+                       read_sds_from_csv_file, write_sds_to_csv_file,
+                       read_msds_from_csv_file, write_msds_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -26,7 +28,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
     'TestReadSpectralDataFromCsvFile', 'TestReadSdsFromCsvFile',
-    'TestWriteSdsToCsvFile'
+    'TestWriteSdsToCsvFile', 'TestReadMsdsFromCsvFile',
+    'TestWriteMsdsToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -241,5 +244,107 @@ class TestWriteSdsToCsvFile(unittest.TestCase):
         self.assertRaises(RuntimeError, write_sds_to_csv_file, sds, '')
 
 
+class TestReadMsdsFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_msds_from_csv_file` definition units
+    tests methods.
+    """
+
+    def test_read_msds_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_msds_from_csv_file` definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        msds = read_msds_from_csv_file(colour_checker_n_ohta)
+        self.assertIsInstance(msds, MultiSpectralDistributions)
+        self.assertListEqual(msds.labels, [text_type(x) for x in range(1, 25)])
+
+        sds = read_sds_from_csv_file(colour_checker_n_ohta)
+        for label, sd in sds.items():
+            np.testing.assert_equal(msds.signals[label].values, sd.values)
+
+        np.testing.assert_equal(
+            read_msds_from_csv_file(colour_checker_n_ohta,
+                                    chunk_size=7).values, msds.values)
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        for chunk_size in (None, 7):
+            msds = read_msds_from_csv_file(
+                linss2_10e_5,
+                fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+                chunk_size=chunk_size)
+            self.assertListEqual(msds.labels, ['l_bar', 'm_bar', 's_bar'])
+            np.testing.assert_almost_equal(
+                msds[760], [7.79912e-05, 5.69093e-06, 0], decimal=7)
+
+        msds = read_msds_from_csv_file(
+            linss2_10e_5,
+            fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+            default=-1)
+        self.assertEqual(msds.signals['s_bar'][760], -1)
+
+        short_rows = os.path.join(RESOURCES_DIRECTORY, 'Short_Rows.csv')
+        msds = read_msds_from_csv_file(short_rows, default=-1)
+        np.testing.assert_equal(msds.values,
+                                [[0.1, 0.2], [0.3, -1], [0.5, 0.6]])
+        np.testing.assert_equal(
+            read_msds_from_csv_file(short_rows, chunk_size=2).values,
+            [[0.1, 0.2], [0.3, 0], [0.5, 0.6]])
+
+    def test_raise_exception_read_msds_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_msds_from_csv_file` definition
+        raised exception.
+        """
+
+        self.assertRaises(RuntimeError, read_msds_from_csv_file,
+                          os.path.join(RESOURCES_DIRECTORY, 'Invalid.csv'))
+
+
+class TestWriteMsdsToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_msds_to_csv_file` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_msds_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_msds_to_csv_file` definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        msds = read_msds_from_csv_file(colour_checker_n_ohta)
+        colour_checker_n_ohta_test = os.path.join(self._temporary_directory,
+                                                  'colorchecker_n_ohta.csv')
+        write_msds_to_csv_file(msds, colour_checker_n_ohta_test)
+        msds_test = read_msds_from_csv_file(colour_checker_n_ohta_test)
+        self.assertListEqual(msds_test.labels, msds.labels)
+        np.testing.assert_almost_equal(msds_test.values, msds.values)
+
+        write_msds_to_csv_file(
+            msds, colour_checker_n_ohta_test, fields=['2', '1'])
+        msds_test = read_msds_from_csv_file(colour_checker_n_ohta_test)
+        self.assertListEqual(msds_test.labels, ['2', '1'])
+        np.testing.assert_almost_equal(msds_test.values,
+                                       msds.values[:, [1, 0]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,16 @@ Defines unit tests for :mod:`colour.io.xrite` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
+import shutil
+import tempfile
 import unittest
 
-from colour.colorimetry import SpectralDistribution
-from colour.io import read_sds_from_xrite_file
+from colour.colorimetry import (MultiSpectralDistributions,
+                                SpectralDistribution, SpectralShape)
+from colour.io import (read_sds_from_xrite_file, read_msds_from_xrite_file,
+                       read_msds_from_xrite_directory)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -19,7 +24,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSdsFromXRiteFile'
+    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSdsFromXRiteFile',
+    'TestReadMsdsFromXRiteFile', 'TestReadMsdsFromXRiteDirectory'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -85,5 +91,89 @@ class TestReadSdsFromXRiteFile(unittest.TestCase):
             sds['X1'], SpectralDistribution(COLOURCHECKER_XRITE_1, name='X1'))
 
 
+class TestReadMsdsFromXRiteFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.read_msds_from_xrite_file` definition units
+    tests methods.
+    """
+
+    def test_read_msds_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_msds_from_xrite_file` definition.
+        """
+
+        colour_checker_xrite = os.path.join(
+            RESOURCES_DIRECTORY, 'X-Rite_Digital_Colour_Checker.txt')
+        msds = read_msds_from_xrite_file(colour_checker_xrite)
+        self.assertIsInstance(msds, MultiSpectralDistributions)
+        self.assertListEqual(msds.labels,
+                             ['X{0}'.format(i) for i in range(1, 11)])
+        self.assertEqual(msds.shape, SpectralShape(380, 730, 10))
+
+        sds = read_sds_from_xrite_file(colour_checker_xrite)
+        for label, sd in sds.items():
+            np.testing.assert_equal(msds.signals[label].values, sd.values)
+
+        np.testing.assert_equal(
+            msds.signals['X1'].values,
+            SpectralDistribution(COLOURCHECKER_XRITE_1).values)
+
+        quoted_names_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                          'X-Rite_Quoted_Names.txt')
+        msds = read_msds_from_xrite_file(quoted_names_xrite)
+        self.assertListEqual(msds.labels,
+                             ['Dark Skin', 'Light Skin', 'Blue_Sky'])
+        self.assertEqual(msds.shape, SpectralShape(400, 430, 10))
+        np.testing.assert_equal(msds.signals['Dark Skin'].values,
+                                np.array([0.0480, 0.0510, 0.0550, 0.0600]))
+
+        sds = read_sds_from_xrite_file(quoted_names_xrite)
+        self.assertListEqual(
+            list(sds.keys()), ['Dark Skin', 'Light Skin', 'Blue_Sky'])
+        np.testing.assert_equal(sds['Light Skin'].values,
+                                np.array([0.1030, 0.1200, 0.1410, 0.1620]))
+
+
+class TestReadMsdsFromXRiteDirectory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.read_msds_from_xrite_directory` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_msds_from_xrite_directory(self):
+        """
+        Tests :func:`colour.io.xrite.read_msds_from_xrite_directory`
+        definition.
+        """
+
+        for name in ('Chart_1.txt', 'Chart_2.TXT', 'Chart_3.cxf'):
+            shutil.copyfile(
+                os.path.join(RESOURCES_DIRECTORY,
+                             'X-Rite_Digital_Colour_Checker.txt'),
+                os.path.join(self._temporary_directory, name))
+
+        results = list(
+            read_msds_from_xrite_directory(self._temporary_directory))
+        self.assertListEqual(
+            [os.path.basename(path) for path, _msds in results],
+            ['Chart_1.txt', 'Chart_2.TXT'])
+        for _path, msds in results:
+            self.assertEqual(len(msds.labels), 10)
+
+
 if __name__ == '__main__':
     unittest.main()
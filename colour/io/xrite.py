@@ -3,19 +3,23 @@
 X-Rite Data Input
 =================
 
-Defines input object for *X-Rite* spectral data files:
+Defines input objects for *X-Rite* spectral data files:
 
 -   :func:`colour.read_sds_from_xrite_file`
+-   :func:`colour.read_msds_from_xrite_file`
+-   :func:`colour.read_msds_from_xrite_directory`
 """
 
 from __future__ import division, unicode_literals
 
 import codecs
+import numpy as np
+import os
 import re
 from collections import OrderedDict
 
-from colour.colorimetry import SpectralDistribution
-from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.colorimetry import MultiSpectralDistributions, SpectralDistribution
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -24,11 +28,85 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['XRITE_FILE_ENCODING', 'read_sds_from_xrite_file']
+__all__ = [
+    'XRITE_FILE_ENCODING', 'read_sds_from_xrite_file',
+    'read_msds_from_xrite_file', 'read_msds_from_xrite_directory'
+]
 
 XRITE_FILE_ENCODING = 'utf-8'
 
 
+def _parse_xrite_file(path):
+    """
+    Parses given *X-Rite* file and returns its patches names, wavelengths and
+    spectral data.
+
+    The *DATA* block is split into a 2D array of tokens at once, quoted tokens,
+    e.g. *"Dark Skin"*, being kept whole, the spectral data columns, i.e. the
+    *DATA_FORMAT* block fields named *nm* followed by the wavelength, are then
+    converted together. Rows whose tokens count does not match the
+    *DATA_FORMAT* block fields count have their spectral data columns taken
+    from the end.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* file path.
+
+    Returns
+    -------
+    tuple
+        Patches names, wavelengths and spectral data array of shape
+        (patches count, wavelengths count).
+    """
+
+    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
+        content = xrite_file.read()
+
+    data_format = re.search(
+        '^\\s*BEGIN_DATA_FORMAT\\s*$(.*?)^\\s*END_DATA_FORMAT\\s*$', content,
+        re.MULTILINE | re.DOTALL)
+    data = re.search('^\\s*BEGIN_DATA\\s*$(.*?)^\\s*END_DATA\\s*$', content,
+                     re.MULTILINE | re.DOTALL)
+
+    if data_format is None or data is None:
+        return [], np.zeros(0), np.zeros((0, 0))
+
+    fields = data_format.group(1).split()
+    name_index = (fields.index('SAMPLE_NAME')
+                  if 'SAMPLE_NAME' in fields else 1)
+
+    indexes, wavelengths = [], []
+    for i, field in enumerate(fields):
+        match = re.match('^nm(\\d+)$', field)
+        if match:
+            indexes.append(i)
+            wavelengths.append(DEFAULT_FLOAT_DTYPE(match.group(1)))
+
+    rows = [[token.strip('"') for token in re.findall('"[^"]*"|\\S+', line)]
+            for line in data.group(1).splitlines()]
+    rows = [row for row in rows if row]
+    if not rows:
+        return [], np.array(wavelengths), np.zeros((0, len(wavelengths)))
+
+    order = np.argsort(wavelengths)
+    wavelengths = np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE)[order]
+    indexes = np.array(indexes, dtype=DEFAULT_INT_DTYPE)[order]
+
+    if all(len(row) == len(fields) for row in rows):
+        tokens = np.array(rows)
+        names = tokens[:, name_index].tolist()
+        values = tokens[:, indexes].astype(DEFAULT_FLOAT_DTYPE)
+    else:
+        indexes -= len(fields)
+        names = [row[min(name_index, len(row) - 1)] for row in rows]
+        values = np.array(
+            [[row[i] for i in indexes] for row in rows],
+            dtype=DEFAULT_FLOAT_DTYPE)
+
+    return names, wavelengths, values
+
+
 def read_sds_from_xrite_file(path):
     """
     Reads the spectral data from given *X-Rite* file and returns it as an
@@ -61,37 +139,91 @@ def read_sds_from_xrite_file(path):
     ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
     """
 
-    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
-        lines = xrite_file.read().strip().split('\n')
+    names, wavelengths, values = _parse_xrite_file(path)
 
-        xrite_sds = OrderedDict()
-        is_spectral_data_format, is_spectral_data = False, False
-        for line in lines:
-            line = line.strip()
+    return OrderedDict((name,
+                        SpectralDistribution(value, wavelengths, name=name))
+                       for name, value in zip(names, values))
 
-            if line == 'END_DATA_FORMAT':
-                is_spectral_data_format = False
 
-            if line == 'END_DATA':
-                is_spectral_data = False
+def read_msds_from_xrite_file(path):
+    """
+    Reads the spectral data from given *X-Rite* file and returns it as a
+    :class:`colour.MultiSpectralDistributions` class instance labelled with
+    the patches names.
 
-            if is_spectral_data_format:
-                wavelengths = [
-                    DEFAULT_FLOAT_DTYPE(x)
-                    for x in re.findall('nm(\\d+)', line)
-                ]
-                index = len(wavelengths)
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* file path.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Multi-spectral distributions of given *X-Rite* file.
 
-            if is_spectral_data:
-                tokens = line.split()
-                values = [DEFAULT_FLOAT_DTYPE(x) for x in tokens[-index:]]
-                xrite_sds[tokens[1]] = (SpectralDistribution(
-                    dict(zip(wavelengths, values)), name=tokens[1]))
+    Notes
+    -----
+    -   This parser is minimalistic and absolutely not bullet proof.
+
+    Examples
+    --------
+    >>> import os
+    >>> xrite_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'X-Rite_Digital_Colour_Checker.txt')
+    >>> msds = read_msds_from_xrite_file(xrite_file)
+    >>> msds.labels  # doctest: +SKIP
+    ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
+    >>> msds.shape
+    SpectralShape(380.0, 730.0, 10.0)
+    """
+
+    names, wavelengths, values = _parse_xrite_file(path)
+
+    if not names:
+        return MultiSpectralDistributions()
+
+    return MultiSpectralDistributions(
+        np.transpose(values),
+        wavelengths,
+        labels=names,
+        name=os.path.splitext(os.path.basename(path))[0])
+
+
+def read_msds_from_xrite_directory(directory, extension='.txt'):
+    """
+    Reads the spectral data of the *X-Rite* files of given directory one file
+    at a time and yields them as :class:`colour.MultiSpectralDistributions`
+    class instances.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the *X-Rite* files.
+    extension : unicode, optional
+        Extension of the *X-Rite* files, matched case-insensitively.
+
+    Yields
+    ------
+    tuple
+        *X-Rite* file path and multi-spectral distributions.
+
+    Examples
+    --------
+    >>> import os
+    >>> directory = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                          'resources')
+    >>> for path, msds in read_msds_from_xrite_directory(directory):
+    ...     print(os.path.basename(path))
+    X-Rite_Digital_Colour_Checker.txt
+    X-Rite_Quoted_Names.txt
+    """
 
-            if line == 'BEGIN_DATA_FORMAT':
-                is_spectral_data_format = True
+    for path in sorted(os.listdir(directory)):
+        if not path.lower().endswith(extension.lower()):
+            continue
 
-            if line == 'BEGIN_DATA':
-                is_spectral_data = True
+        path = os.path.join(directory, path)
 
-        return xrite_sds
+        yield path, read_msds_from_xrite_file(path)
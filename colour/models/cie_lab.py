@@ -19,11 +19,14 @@ References
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+
 from colour.colorimetry import (ILLUMINANTS,
                                 intermediate_lightness_function_CIE1976,
                                 intermediate_luminance_function_CIE1976)
 from colour.models import xy_to_xyY, xyY_to_XYZ, Jab_to_JCh, JCh_to_Jab
-from colour.utilities import (from_range_1, from_range_100, to_domain_1,
+from colour.utilities import (as_float_scalars, from_range_1, from_range_100,
+                              get_domain_range_scale, to_domain_1,
                               to_domain_100, tsplit, tstack)
 
 __author__ = 'Colour Developers'
@@ -36,9 +39,61 @@ __status__ = 'Production'
 __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 
+def _XYZ_to_Lab_scalar(XYZ, illuminant):
+    """
+    Converts from single colour *CIE XYZ* tristimulus values to
+    *CIE L\\*a\\*b\\** colourspace using *float* scalars arithmetic.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+    illuminant : array_like
+        Reference *illuminant* *CIE xy* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray or None
+        *CIE L\\*a\\*b\\** colourspace array or *None* if the given values
+        are not a single colour or require the *ndarray* arithmetic, e.g. a
+        division by zero.
+    """
+
+    XYZ = as_float_scalars(XYZ)
+    xy = as_float_scalars(illuminant, 2)
+
+    if XYZ is None or xy is None:
+        return None
+
+    scale = get_domain_range_scale()
+    if scale == '100':
+        XYZ = [C / 100 for C in XYZ]
+
+    try:
+        x, y = xy
+        XYZ_n = (x / y, 1, (1 - x - y) / y)
+
+        f_X_X_n, f_Y_Y_n, f_Z_Z_n = [
+            C_C_n ** (1 / 3)
+            if C_C_n > (24 / 116) ** 3 else (841 / 108) * C_C_n + 16 / 116
+            for C_C_n in (C / C_n for C, C_n in zip(XYZ, XYZ_n))
+        ]
+    except ArithmeticError:
+        return None
+
+    Lab = np.array([
+        116 * f_Y_Y_n - 16,
+        500 * (f_X_X_n - f_Y_Y_n),
+        200 * (f_Y_Y_n - f_Z_Z_n),
+    ])
+
+    return Lab / 100 if scale == '1' else Lab
+
+
 def XYZ_to_Lab(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\\*a\\*b\\**
     colourspace.
@@ -50,6 +105,8 @@ def XYZ_to_Lab(
     illuminant : array_like, optional
         Reference *illuminant* *CIE xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array the *CIE L\\*a\\*b\\** colourspace array is written into.
 
     Returns
     -------
@@ -89,26 +146,30 @@ def XYZ_to_Lab(
     array([ 41.5278752...,  52.6385830...,  26.9231792...])
     """
 
-    X, Y, Z = tsplit(to_domain_1(XYZ))
+    if out is None:
+        Lab = _XYZ_to_Lab_scalar(XYZ, illuminant)
+        if Lab is not None:
+            return Lab
 
-    X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    XYZ_n = xyY_to_XYZ(xy_to_xyY(illuminant))
 
-    f_X_X_n = intermediate_lightness_function_CIE1976(X, X_n)
-    f_Y_Y_n = intermediate_lightness_function_CIE1976(Y, Y_n)
-    f_Z_Z_n = intermediate_lightness_function_CIE1976(Z, Z_n)
+    f_X_X_n, f_Y_Y_n, f_Z_Z_n = tsplit(
+        intermediate_lightness_function_CIE1976(to_domain_1(XYZ), XYZ_n),
+        copy=False)
 
     L = 116 * f_Y_Y_n - 16
     a = 500 * (f_X_X_n - f_Y_Y_n)
     b = 200 * (f_Y_Y_n - f_Z_Z_n)
 
-    Lab = tstack([L, a, b])
+    Lab = tstack([L, a, b], out=out)
 
     return from_range_100(Lab)
 
 
 def Lab_to_XYZ(
         Lab,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE L\\*a\\*b\\** colourspace to *CIE XYZ* tristimulus
     values.
@@ -120,6 +181,8 @@ def Lab_to_XYZ(
     illuminant : array_like, optional
         Reference *illuminant* *CIE xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written into.
 
     Returns
     -------
@@ -159,7 +222,7 @@ def Lab_to_XYZ(
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    L, a, b = tsplit(to_domain_100(Lab))
+    L, a, b = tsplit(to_domain_100(Lab), copy=False)
 
     X_n, Y_n, Z_n = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
 
@@ -171,7 +234,7 @@ def Lab_to_XYZ(
     Y = intermediate_luminance_function_CIE1976(f_Y_Y_n, Y_n)
     Z = intermediate_luminance_function_CIE1976(f_Z_Z_n, Z_n)
 
-    XYZ = tstack([X, Y, Z])
+    XYZ = tstack([X, Y, Z], out=out)
 
     return from_range_1(XYZ)
 
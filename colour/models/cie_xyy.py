@@ -27,8 +27,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
-from colour.utilities import (as_float_array, from_range_1, full, to_domain_1,
-                              tsplit, tstack, zeros)
+from colour.utilities import (as_float_array, as_float_scalars, from_range_1,
+                              full, to_domain_1, tsplit, tstack, zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -45,7 +45,8 @@ __all__ = [
 
 def XYZ_to_xyY(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE xyY* colourspace and
     reference *illuminant*.
@@ -56,6 +57,8 @@ def XYZ_to_xyY(
         *CIE XYZ* tristimulus values.
     illuminant : array_like, optional
         Reference *illuminant* chromaticity coordinates.
+    out : ndarray, optional
+        Array the *CIE xyY* colourspace array is written into.
 
     Returns
     -------
@@ -92,20 +95,19 @@ def XYZ_to_xyY(
     X, Y, Z = tsplit(XYZ)
     xy_w = as_float_array(illuminant)
 
-    XYZ_n = zeros(XYZ.shape)
-    XYZ_n[..., 0:2] = xy_w
+    xyY_n = zeros(xy_w.shape[:-1] + (3, ))
+    xyY_n[..., 0:2] = xy_w
+
+    X_Y_Z = X + Y + Z
+    X /= X_Y_Z
+    xyY = tstack([X, Y / X_Y_Z, from_range_1(Y)], out=out)
 
-    xyY = np.where(
-        np.all(XYZ == 0, axis=-1)[..., np.newaxis],
-        XYZ_n,
-        tstack([X / (X + Y + Z), Y / (X + Y + Z),
-                from_range_1(Y)]),
-    )
+    np.copyto(xyY, xyY_n, where=np.all(XYZ == 0, axis=-1)[..., np.newaxis])
 
     return xyY
 
 
-def xyY_to_XYZ(xyY):
+def xyY_to_XYZ(xyY, out=None):
     """
     Converts from *CIE xyY* colourspace to *CIE XYZ* tristimulus values.
 
@@ -113,6 +115,8 @@ def xyY_to_XYZ(xyY):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written into.
 
     Returns
     -------
@@ -148,11 +152,10 @@ def xyY_to_XYZ(xyY):
     x, y, Y = tsplit(xyY)
     Y = to_domain_1(Y)
 
-    XYZ = np.where(
-        (y == 0)[..., np.newaxis],
-        tstack([y, y, y]),
-        tstack([x * Y / y, Y, (1 - x - y) * Y / y]),
-    )
+    Y_y = Y / y
+    XYZ = tstack([x * Y_y, Y, (1 - x - y) * Y_y], out=out)
+
+    np.copyto(XYZ, 0, where=(y == 0)[..., np.newaxis])
 
     return from_range_1(XYZ)
 
@@ -286,6 +289,44 @@ def xy_to_xyY(xy, Y=1):
     return xyY
 
 
+def _XYZ_to_xy_scalar(XYZ):
+    """
+    Returns the *CIE xy* chromaticity coordinates from given single colour
+    *CIE XYZ* tristimulus values using *float* scalars arithmetic.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    ndarray or None
+        *CIE xy* chromaticity coordinates or *None* if the given values are
+        not a single colour or require the *ndarray* arithmetic, e.g. a
+        division by zero.
+    """
+
+    XYZ = as_float_scalars(XYZ)
+
+    if XYZ is None:
+        return None
+
+    X, Y, Z = XYZ
+
+    # The black case uses the reference illuminant and is handled by the
+    # *ndarray* code path.
+    if X == Y == Z == 0:
+        return None
+
+    try:
+        X_Y_Z = X + Y + Z
+
+        return np.array([X / X_Y_Z, Y / X_Y_Z])
+    except ZeroDivisionError:
+        return None
+
+
 def XYZ_to_xy(
         XYZ,
         illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']):
@@ -325,6 +366,10 @@ def XYZ_to_xy(
     array([ 0.5436955...,  0.3210794...])
     """
 
+    xy = _XYZ_to_xy_scalar(XYZ)
+    if xy is not None:
+        return xy
+
     return xyY_to_xy(XYZ_to_xyY(XYZ, illuminant))
 
 
@@ -17,10 +17,12 @@ References
 
 from __future__ import division, unicode_literals
 
+import math
 import numpy as np
 
 from colour.algebra import cartesian_to_polar, polar_to_cartesian
-from colour.utilities import (domain_range_scale, from_range_degrees,
+from colour.utilities import (as_float_scalars, domain_range_scale,
+                              from_range_degrees, get_domain_range_scale,
                               to_domain_degrees, tsplit, tstack)
 
 __author__ = 'Colour Developers'
@@ -36,6 +38,41 @@ __all__ = [
 ]
 
 
+def _Jab_to_JCh_scalar(Jab):
+    """
+    Converts from single colour *Jab** colour representation to *JCh* colour
+    representation using *float* scalars arithmetic.
+
+    Parameters
+    ----------
+    Jab : array_like
+        *Jab** colour representation array.
+
+    Returns
+    -------
+    ndarray or None
+        *JCh* colour representation array or *None* if the given values are
+        not a single colour.
+    """
+
+    Jab = as_float_scalars(Jab)
+
+    if Jab is None:
+        return None
+
+    J, a, b = Jab
+
+    h = math.degrees(math.atan2(b, a)) % 360
+
+    scale = get_domain_range_scale()
+    if scale == '1':
+        h /= 360
+    elif scale == '100':
+        h /= 360 / 100
+
+    return np.array([J, math.hypot(a, b), h])
+
+
 def Jab_to_JCh(Jab):
     """
     Converts from *Jab** colour representation to *JCh* colour representation.
@@ -91,6 +128,10 @@ def Jab_to_JCh(Jab):
     array([ 41.5278752...,  59.1242590...,  27.0884878...])
     """
 
+    JCh = _Jab_to_JCh_scalar(Jab)
+    if JCh is not None:
+        return JCh
+
     L, a, b = tsplit(Jab)
 
     C, H = tsplit(cartesian_to_polar(tstack([a, b])))
@@ -7,7 +7,8 @@ from .derivation import (normalised_primary_matrix,
                          RGB_luminance_equation, RGB_luminance)
 from .rgb_colourspace import RGB_Colourspace
 from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB
+from .rgb_colourspace import (RGB_to_RGB_matrix, RGB_Colourspace_Transform,
+                              RGB_to_RGB_transform, RGB_to_RGB)
 from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .datasets import *  # noqa
@@ -27,7 +28,10 @@ __all__ = [
 ]
 __all__ += ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
-__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
+__all__ += [
+    'RGB_to_RGB_matrix', 'RGB_Colourspace_Transform', 'RGB_to_RGB_transform',
+    'RGB_to_RGB'
+]
 __all__ += transfer_functions.__all__
 __all__ += datasets.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
@@ -35,10 +35,12 @@ References
 
 from __future__ import division, unicode_literals
 
+import math
 import numpy as np
 
-from colour.utilities import (as_float_array, from_range_1, to_domain_1,
-                              tsplit, tstack)
+from colour.utilities import (as_float_array, as_float_scalars, from_range_1,
+                              get_domain_range_scale, to_domain_1, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -50,6 +52,65 @@ __status__ = 'Production'
 __all__ = ['RGB_to_HSV', 'HSV_to_RGB', 'RGB_to_HSL', 'HSL_to_RGB']
 
 
+def _RGB_to_HSV_scalar(RGB):
+    """
+    Converts from single colour *RGB* colourspace to *HSV* colourspace using
+    *float* scalars arithmetic.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray or None
+        *HSV* array or *None* if the given values are not a finite single
+        colour or require the *ndarray* arithmetic, e.g. a division by zero.
+    """
+
+    RGB = as_float_scalars(RGB)
+
+    if RGB is None or any(math.isnan(C) or math.isinf(C) for C in RGB):
+        return None
+
+    scale = get_domain_range_scale()
+    if scale == '100':
+        RGB = [C / 100 for C in RGB]
+
+    R, G, B = RGB
+
+    maximum = max(RGB)
+    delta = maximum - min(RGB)
+
+    if delta == 0:
+        H = S = 0
+    else:
+        try:
+            S = delta / maximum
+        except ZeroDivisionError:
+            return None
+
+        delta_R = (((maximum - R) / 6) + (delta / 2)) / delta
+        delta_G = (((maximum - G) / 6) + (delta / 2)) / delta
+        delta_B = (((maximum - B) / 6) + (delta / 2)) / delta
+
+        H = delta_B - delta_G
+        if G == maximum:
+            H = (1 / 3) + delta_R - delta_B
+        if B == maximum:
+            H = (2 / 3) + delta_G - delta_R
+
+        if H < 0:
+            H += 1
+        if H > 1:
+            H -= 1
+
+    HSV = np.array([H, S, maximum])
+
+    return HSV * 100 if scale == '100' else HSV
+
+
 def RGB_to_HSV(RGB):
     """
     Converts from *RGB* colourspace to *HSV* colourspace.
@@ -90,6 +151,10 @@ def RGB_to_HSV(RGB):
     array([ 0.9960394...,  0.9324630...,  0.4562051...])
     """
 
+    HSV = _RGB_to_HSV_scalar(RGB)
+    if HSV is not None:
+        return HSV
+
     RGB = to_domain_1(RGB)
 
     maximum = np.amax(RGB, -1)
@@ -30,7 +30,7 @@ import numpy as np
 
 from colour.adaptation import chromatic_adaptation_VonKries
 from colour.models import XYZ_to_xy, XYZ_to_xyY, xy_to_XYZ
-from colour.utilities import as_numeric, ones, tsplit
+from colour.utilities import LRUCache, as_float_array, as_numeric, ones, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -44,6 +44,14 @@ __all__ = [
     'primaries_whitepoint', 'RGB_luminance_equation', 'RGB_luminance'
 ]
 
+_NORMALISED_PRIMARY_MATRICES_CACHE = LRUCache(64)
+"""
+Cache of the *normalised primary matrices*, keyed by the primaries and
+whitepoint content.
+
+_NORMALISED_PRIMARY_MATRICES_CACHE : LRUCache
+"""
+
 
 def xy_to_z(xy):
     """
@@ -89,6 +97,12 @@ def normalised_primary_matrix(primaries, whitepoint):
     ndarray, (3, 3)
         *Normalised primary matrix*.
 
+    Notes
+    -----
+    -   The *normalised primary matrices* are cached, keyed by the primaries
+        and whitepoint content, thus subsequent calls with the same arguments
+        do not derive the matrix again.
+
     References
     ----------
     :cite:`SocietyofMotionPictureandTelevisionEngineers1993a`
@@ -103,7 +117,13 @@ def normalised_primary_matrix(primaries, whitepoint):
            [  0.0000000...e+00,   0.0000000...e+00,   1.0088251...e+00]])
     """
 
-    primaries = np.reshape(primaries, (3, 2))
+    primaries = np.reshape(as_float_array(primaries), (3, 2))
+    whitepoint = as_float_array(whitepoint)
+
+    key = (primaries.tobytes(), whitepoint.tobytes(), whitepoint.shape)
+    npm = _NORMALISED_PRIMARY_MATRICES_CACHE.get(key)
+    if npm is not None:
+        return np.copy(npm)
 
     z = xy_to_z(primaries)[..., np.newaxis]
     primaries = np.transpose(np.hstack([primaries, z]))
@@ -115,6 +135,8 @@ def normalised_primary_matrix(primaries, whitepoint):
 
     npm = np.dot(primaries, coefficients)
 
+    _NORMALISED_PRIMARY_MATRICES_CACHE[key] = np.copy(npm)
+
     return npm
 
 
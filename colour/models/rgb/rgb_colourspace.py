@@ -10,6 +10,8 @@ datasets from :mod:`colour.models.datasets.aces_rgb`, etc... and the following
 -   :func:`colour.XYZ_to_RGB`
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
+-   :class:`colour.RGB_Colourspace_Transform`
+-   :func:`colour.RGB_to_RGB_transform`
 -   :func:`colour.RGB_to_RGB`
 
 References
@@ -32,10 +34,11 @@ from copy import deepcopy
 from colour.models import xy_to_XYZ, xy_to_xyY, xyY_to_XYZ
 from colour.models.rgb import (chromatically_adapted_primaries,
                                normalised_primary_matrix)
+from colour.models.rgb.transfer_functions import _evaluate_cctf
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import (as_float_array, domain_range_scale, dot_matrix,
-                              dot_vector, filter_kwargs, from_range_1,
-                              to_domain_1, is_string, usage_warning)
+from colour.utilities import (
+    LRUCache, as_float_array, domain_range_scale, dot_matrix, dot_vector,
+    filter_kwargs, from_range_1, to_domain_1, is_string, usage_warning)
 from colour.utilities.deprecation import (ObjectRenamed,
                                           handle_arguments_deprecation)
 
@@ -48,9 +51,17 @@ __status__ = 'Production'
 
 __all__ = [
     'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'RGB_Colourspace_Transform', 'RGB_to_RGB_transform', 'RGB_to_RGB'
 ]
 
+_DERIVED_MATRICES_CACHE = LRUCache(64)
+"""
+Cache of the derived *normalised primary matrices* and their inverse, keyed by
+the primaries and whitepoint content.
+
+_DERIVED_MATRICES_CACHE : LRUCache
+"""
+
 
 class RGB_Colourspace(object):
     """
@@ -740,11 +751,17 @@ class RGB_Colourspace(object):
 
         if hasattr(self, '_primaries') and hasattr(self, '_whitepoint'):
             if self._primaries is not None and self._whitepoint is not None:
-                npm = normalised_primary_matrix(self._primaries,
-                                                self._whitepoint)
-
-                self._derived_RGB_to_XYZ_matrix = npm
-                self._derived_XYZ_to_RGB_matrix = np.linalg.inv(npm)
+                key = (self._primaries.tobytes(), self._primaries.shape,
+                       self._whitepoint.tobytes(), self._whitepoint.shape)
+                matrices = _DERIVED_MATRICES_CACHE.get(key)
+                if matrices is None:
+                    npm = normalised_primary_matrix(self._primaries,
+                                                    self._whitepoint)
+                    matrices = (npm, np.linalg.inv(npm))
+                    _DERIVED_MATRICES_CACHE[key] = matrices
+
+                self._derived_RGB_to_XYZ_matrix = np.copy(matrices[0])
+                self._derived_XYZ_to_RGB_matrix = np.copy(matrices[1])
 
     def use_derived_transformation_matrices(self, usage=True):
         """
@@ -899,12 +916,43 @@ class RGB_Colourspace(object):
         return self.cctf_encoding
 
 
+def _apply_cctf(cctf, a, out=None):
+    """
+    Applies given colour component transfer function to given array, the
+    array is updated in-place if the function supports an ``out`` argument.
+
+    Parameters
+    ----------
+    cctf : object
+        Colour component transfer function.
+    a : ndarray
+        Array to apply the colour component transfer function onto.
+    out : ndarray, optional
+        Array the transformed array is written into.
+
+    Returns
+    -------
+    ndarray
+        Transformed array.
+    """
+
+    if out is None:
+        return cctf(a, **filter_kwargs(cctf, out=a))
+
+    b = cctf(a, **filter_kwargs(cctf, out=out))
+    if b is not out:
+        out[...] = b
+
+    return out
+
+
 def XYZ_to_RGB(XYZ,
                illuminant_XYZ,
                illuminant_RGB,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
                cctf_encoding=None,
+               out=None,
                **kwargs):
     """
     Converts from *CIE XYZ* tristimulus values to *RGB* colourspace array.
@@ -930,6 +978,10 @@ def XYZ_to_RGB(XYZ,
     cctf_encoding : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Array the *RGB* colourspace array is written into. It is also passed
+        to the encoding colour component transfer function if it supports an
+        ``out`` argument.
 
     Other Parameters
     ----------------
@@ -982,19 +1034,20 @@ def XYZ_to_RGB(XYZ,
 
     XYZ = to_domain_1(XYZ)
 
+    M = XYZ_to_RGB_matrix
     if chromatic_adaptation_transform is not None:
         M_CAT = chromatic_adaptation_matrix_VonKries(
             xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
             xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
             transform=chromatic_adaptation_transform)
 
-        XYZ = dot_vector(M_CAT, XYZ)
+        M = dot_matrix(M, M_CAT)
 
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ)
+    RGB = dot_vector(M, XYZ, out=out)
 
     if cctf_encoding is not None:
         with domain_range_scale('ignore'):
-            RGB = cctf_encoding(RGB)
+            RGB = _apply_cctf(cctf_encoding, RGB, out)
 
     return from_range_1(RGB)
 
@@ -1005,6 +1058,7 @@ def RGB_to_XYZ(RGB,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
                cctf_decoding=None,
+               out=None,
                **kwargs):
     """
     Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values.
@@ -1030,6 +1084,8 @@ def RGB_to_XYZ(RGB,
     cctf_decoding : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written into.
 
     Other Parameters
     ----------------
@@ -1084,17 +1140,18 @@ def RGB_to_XYZ(RGB,
 
     if cctf_decoding is not None:
         with domain_range_scale('ignore'):
-            RGB = cctf_decoding(RGB)
-
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
+            RGB = _apply_cctf(cctf_decoding, RGB)
 
+    M = RGB_to_XYZ_matrix
     if chromatic_adaptation_transform is not None:
         M_CAT = chromatic_adaptation_matrix_VonKries(
             xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
             xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
             transform=chromatic_adaptation_transform)
 
-        XYZ = dot_vector(M_CAT, XYZ)
+        M = dot_matrix(M_CAT, M)
+
+    XYZ = dot_vector(M, RGB, out=out)
 
     return from_range_1(XYZ)
 
@@ -1150,6 +1207,307 @@ def RGB_to_RGB_matrix(input_colourspace,
     return M
 
 
+class RGB_Colourspace_Transform(object):
+    """
+    Implements a precomputed conversion from an input *RGB* colourspace to an
+    output *RGB* colourspace.
+
+    The transform stores the fused conversion matrix :math:`M` and,
+    optionally, the input colourspace decoding colour component transfer
+    function and output colourspace encoding colour component transfer
+    function, optionally evaluated with the 1D tables they are baked into.
+    Repeated conversions then neither derive the chromatic adaptation matrix
+    nor evaluate the colour component transfer functions analytically.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC', None}**,
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+    apply_cctf_decoding : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_cctf_encoding : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+    baked : bool, optional
+        Whether to evaluate the colour component transfer functions with the
+        1D tables they are baked into rather than analytically.
+
+    Attributes
+    ----------
+    matrix
+    cctf_decoding
+    cctf_encoding
+    baked
+
+    Methods
+    -------
+    apply
+
+    Notes
+    -----
+    -   The colour component transfer functions are baked as with the
+        transfer functions dispatchers, e.g.
+        :func:`colour.cctf_decoding` definition, ``baked=True`` argument: the
+        1D tables are sampled within a maximum error and cached per keywords
+        arguments given to :meth:`colour.RGB_Colourspace_Transform.apply`
+        method, the values they do not cover being evaluated analytically with
+        the same keywords arguments.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> RGB = np.array([0.45595571, 0.03039702, 0.04087245])
+    >>> transform = RGB_Colourspace_Transform(
+    ...     sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+    >>> transform.apply(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2568891...,  0.0721446...,  0.0465553...])
+    >>> transform = RGB_Colourspace_Transform(
+    ...     sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE,
+    ...     apply_cctf_decoding=True, apply_cctf_encoding=True, baked=True)
+    >>> transform.apply(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2689123...,  0.1114372...,  0.0577435...])
+    """
+
+    def __init__(self,
+                 input_colourspace,
+                 output_colourspace,
+                 chromatic_adaptation_transform='CAT02',
+                 apply_cctf_decoding=False,
+                 apply_cctf_encoding=False,
+                 baked=False):
+        self._matrix = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                                         chromatic_adaptation_transform)
+
+        self._cctf_decoding = (input_colourspace.cctf_decoding
+                               if apply_cctf_decoding else None)
+        self._cctf_encoding = (output_colourspace.cctf_encoding
+                               if apply_cctf_encoding else None)
+        self._baked = baked
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the fused conversion matrix :math:`M`.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix :math:`M`.
+        """
+
+        return self._matrix
+
+    @property
+    def cctf_decoding(self):
+        """
+        Getter property for the input colourspace decoding colour component
+        transfer function.
+
+        Returns
+        -------
+        object
+            Decoding colour component transfer function or *None* if it is
+            not applied.
+        """
+
+        return self._cctf_decoding
+
+    @property
+    def cctf_encoding(self):
+        """
+        Getter property for the output colourspace encoding colour component
+        transfer function.
+
+        Returns
+        -------
+        object
+            Encoding colour component transfer function or *None* if it is
+            not applied.
+        """
+
+        return self._cctf_encoding
+
+    @property
+    def baked(self):
+        """
+        Getter property for whether the colour component transfer functions
+        are evaluated with the 1D tables they are baked into.
+
+        Returns
+        -------
+        bool
+            Whether the colour component transfer functions are baked.
+        """
+
+        return self._baked
+
+    def apply(self, RGB, out=None, **kwargs):
+        """
+        Converts given *RGB* colourspace array from the input *RGB*
+        colourspace to the output *RGB* colourspace.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        out : ndarray, optional
+            Array the output *RGB* colourspace array is written into.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for the colour component transfer functions,
+            they are filtered with :func:`colour.utilities.filter_kwargs`
+            definition.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace array.
+
+        Notes
+        -----
+
+        +------------+-----------------------+---------------+
+        | **Domain** | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        +------------+-----------------------+---------------+
+        | **Range**  | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        Examples
+        --------
+        >>> from colour.models import (sRGB_COLOURSPACE,
+        ...                            PROPHOTO_RGB_COLOURSPACE)
+        >>> RGB = np.array([0.45595571, 0.03039702, 0.04087245])
+        >>> transform = RGB_Colourspace_Transform(
+        ...     sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+        >>> transform.apply(RGB)  # doctest: +ELLIPSIS
+        array([ 0.2568891...,  0.0721446...,  0.0465553...])
+        """
+
+        RGB = to_domain_1(RGB)
+
+        if self._cctf_decoding is not None:
+            with domain_range_scale('ignore'):
+                RGB = _evaluate_cctf(self._cctf_decoding, RGB, self._baked,
+                                     **kwargs)
+
+        if self._cctf_encoding is None:
+            RGB = dot_vector(self._matrix, RGB, out=out)
+        else:
+            with domain_range_scale('ignore'):
+                RGB = _evaluate_cctf(self._cctf_encoding,
+                                     dot_vector(self._matrix, RGB),
+                                     self._baked, **kwargs)
+
+            if out is not None:
+                out[...] = RGB
+                RGB = out
+
+        return from_range_1(RGB)
+
+
+_RGB_COLOURSPACE_TRANSFORMS_CACHE = LRUCache(32)
+"""
+Cache of the :class:`colour.RGB_Colourspace_Transform` class instances, keyed
+by the input and output *RGB* colourspaces content and the transform
+settings.
+
+_RGB_COLOURSPACE_TRANSFORMS_CACHE : LRUCache
+"""
+
+
+def RGB_to_RGB_transform(input_colourspace,
+                         output_colourspace,
+                         chromatic_adaptation_transform='CAT02',
+                         apply_cctf_decoding=False,
+                         apply_cctf_encoding=False,
+                         baked=False):
+    """
+    Returns the :class:`colour.RGB_Colourspace_Transform` class instance
+    converting from given input *RGB* colourspace to output *RGB* colourspace
+    using given *chromatic adaptation* method.
+
+    The transforms are cached, their key is built from the colourspaces
+    matrices, whitepoints and colour component transfer functions, thus
+    subsequent calls with the same colourspaces return the same transform
+    while modified colourspaces yield a new one.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC', None}**,
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+    apply_cctf_decoding : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_cctf_encoding : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+    baked : bool, optional
+        Whether to evaluate the colour component transfer functions with the
+        1D tables they are baked into rather than analytically.
+
+    Returns
+    -------
+    RGB_Colourspace_Transform
+        *RGB* colourspace transform.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> transform = RGB_to_RGB_transform(sRGB_COLOURSPACE,
+    ...                                  PROPHOTO_RGB_COLOURSPACE)
+    >>> transform is RGB_to_RGB_transform(sRGB_COLOURSPACE,
+    ...                                   PROPHOTO_RGB_COLOURSPACE)
+    True
+    >>> transform.matrix  # doctest: +ELLIPSIS
+    array([[ 0.5288241...,  0.3340609...,  0.1373616...],
+           [ 0.0975294...,  0.8790074...,  0.0233981...],
+           [ 0.0163599...,  0.1066124...,  0.8772485...]])
+    """
+
+    key = (as_float_array(input_colourspace.RGB_to_XYZ_matrix).tobytes(),
+           as_float_array(input_colourspace.whitepoint).tobytes(),
+           as_float_array(output_colourspace.XYZ_to_RGB_matrix).tobytes(),
+           as_float_array(output_colourspace.whitepoint).tobytes(),
+           chromatic_adaptation_transform, input_colourspace.cctf_decoding
+           if apply_cctf_decoding else None, output_colourspace.cctf_encoding
+           if apply_cctf_encoding else None, baked)
+
+    transform = _RGB_COLOURSPACE_TRANSFORMS_CACHE.get(key)
+    if transform is None:
+        transform = RGB_Colourspace_Transform(
+            input_colourspace, output_colourspace,
+            chromatic_adaptation_transform, apply_cctf_decoding,
+            apply_cctf_encoding, baked)
+        _RGB_COLOURSPACE_TRANSFORMS_CACHE[key] = transform
+
+    return transform
+
+
 def RGB_to_RGB(RGB,
                input_colourspace,
                output_colourspace,
@@ -1224,23 +1582,8 @@ def RGB_to_RGB(RGB,
         'ArgumentRenamed': [['apply_encoding_cctf', 'apply_cctf_encoding']],
     }, **kwargs).get('apply_cctf_encoding', apply_cctf_encoding)
 
-    RGB = to_domain_1(RGB)
-
-    if apply_cctf_decoding:
-        with domain_range_scale('ignore'):
-            RGB = input_colourspace.cctf_decoding(
-                RGB, **filter_kwargs(input_colourspace.cctf_decoding,
-                                     **kwargs))
-
-    M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
-                          chromatic_adaptation_transform)
-
-    RGB = dot_vector(M, RGB)
+    transform = RGB_to_RGB_transform(input_colourspace, output_colourspace,
+                                     chromatic_adaptation_transform,
+                                     apply_cctf_decoding, apply_cctf_encoding)
 
-    if apply_cctf_encoding:
-        with domain_range_scale('ignore'):
-            RGB = output_colourspace.cctf_encoding(
-                RGB, **filter_kwargs(output_colourspace.cctf_encoding,
-                                     **kwargs))
-
-    return from_range_1(RGB)
+    return transform.apply(RGB, **kwargs)
@@ -119,6 +119,36 @@ class TestNormalisedPrimaryMatrix(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_cache_normalised_primary_matrix(self):
+        """
+        Tests :func:`colour.models.rgb.derivation.normalised_primary_matrix`
+        definition cache.
+        """
+
+        p = np.array([0.640, 0.330, 0.300, 0.600, 0.150, 0.060])
+        w = np.array([0.3127, 0.3290])
+
+        npm = normalised_primary_matrix(p, w)
+        npm[...] = 0
+
+        np.testing.assert_almost_equal(
+            normalised_primary_matrix(p, w),
+            np.array([
+                [0.41239080, 0.35758434, 0.18048079],
+                [0.21263901, 0.71516868, 0.07219232],
+                [0.01933082, 0.11919478, 0.95053215],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            normalised_primary_matrix(p, np.array([0.32168, 0.33767])),
+            np.array([
+                [0.43181565, 0.35563305, 0.16519737],
+                [0.22265495, 0.71126611, 0.06607895],
+                [0.02024136, 0.11854435, 0.87003947],
+            ]),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_normalised_primary_matrix(self):
         """
@@ -16,8 +16,9 @@ from itertools import permutations
 
 from colour.models import (
     RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
-    RGB_to_RGB_matrix, RGB_to_RGB, chromatically_adapted_primaries,
-    normalised_primary_matrix, eotf_inverse_sRGB, eotf_sRGB)
+    RGB_to_RGB_matrix, RGB_Colourspace_Transform, RGB_to_RGB_transform,
+    RGB_to_RGB, chromatically_adapted_primaries, normalised_primary_matrix,
+    eotf_inverse_sRGB, eotf_sRGB)
 from colour.utilities import as_int, domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -29,7 +30,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_Colourspace_Transform',
+    'TestRGB_to_RGB_transform', 'TestRGB_to_RGB'
 ]
 
 
@@ -500,6 +502,31 @@ class TestXYZ_to_RGB(unittest.TestCase):
                     RGB * factor,
                     decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        *out* argument support.
+        """
+
+        XYZ = np.tile(np.array([0.21638819, 0.12570000, 0.03847493]), (6, 1))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+        for cctf_encoding in (None, eotf_inverse_sRGB,
+                              lambda x: eotf_inverse_sRGB(x)):
+            out = np.zeros(XYZ.shape)
+            RGB = XYZ_to_RGB(
+                XYZ, W_R, W_T, M, 'Bradford', cctf_encoding, out=out)
+            self.assertIs(RGB, out)
+            np.testing.assert_almost_equal(
+                RGB,
+                XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', cctf_encoding),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RGB(self):
         """
@@ -640,6 +667,30 @@ class TestRGB_to_XYZ(unittest.TestCase):
                     XYZ * factor,
                     decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        *out* argument support.
+        """
+
+        RGB = np.tile(np.array([0.45595571, 0.03039702, 0.04087245]), (6, 1))
+        W_R = np.array([0.31270, 0.32900])
+        W_T = np.array([0.34570, 0.35850])
+        M = np.array([
+            [0.41240000, 0.35760000, 0.18050000],
+            [0.21260000, 0.71520000, 0.07220000],
+            [0.01930000, 0.11920000, 0.95050000],
+        ])
+        for cctf_decoding in (None, eotf_sRGB):
+            out = np.zeros(RGB.shape)
+            XYZ = RGB_to_XYZ(
+                RGB, W_R, W_T, M, 'Bradford', cctf_decoding, out=out)
+            self.assertIs(XYZ, out)
+            np.testing.assert_almost_equal(
+                XYZ,
+                RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', cctf_decoding),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_XYZ(self):
         """
@@ -721,6 +772,194 @@ class TestRGB_to_RGB_matrix(unittest.TestCase):
             decimal=7)
 
 
+class TestRGB_Colourspace_Transform(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.\
+RGB_Colourspace_Transform` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('matrix', 'cctf_decoding', 'cctf_encoding',
+                               'baked')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_Colourspace_Transform))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'apply')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_Colourspace_Transform))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.rgb_colourspace.\
+RGB_Colourspace_Transform.apply` method.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        transform = RGB_Colourspace_Transform(aces_2065_1_colourspace,
+                                              sRGB_colourspace)
+        np.testing.assert_almost_equal(
+            transform.matrix,
+            RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace),
+            decimal=7)
+        self.assertIsNone(transform.cctf_encoding)
+        self.assertFalse(transform.baked)
+
+        RGB = np.array([0.21931722, 0.06950287, 0.04694832])
+        np.testing.assert_almost_equal(
+            transform.apply(RGB),
+            RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace),
+            decimal=7)
+
+        RGB = np.reshape(np.linspace(-0.1, 1.1, 36), (4, 3, 3))
+        transform = RGB_Colourspace_Transform(
+            sRGB_colourspace,
+            aces_2065_1_colourspace,
+            apply_cctf_decoding=True,
+            baked=True)
+        self.assertTrue(transform.baked)
+        np.testing.assert_almost_equal(
+            transform.apply(RGB),
+            RGB_to_RGB(
+                RGB,
+                sRGB_colourspace,
+                aces_2065_1_colourspace,
+                apply_cctf_decoding=True),
+            decimal=5)
+
+        transform = RGB_Colourspace_Transform(
+            aces_2065_1_colourspace,
+            sRGB_colourspace,
+            apply_cctf_encoding=True,
+            baked=True)
+        RGB_o = np.zeros(RGB.shape)
+        self.assertIs(transform.apply(RGB, out=RGB_o), RGB_o)
+        np.testing.assert_almost_equal(
+            RGB_o,
+            RGB_to_RGB(
+                RGB,
+                aces_2065_1_colourspace,
+                sRGB_colourspace,
+                apply_cctf_encoding=True),
+            decimal=4)
+
+        alexa_colourspace = RGB_COLOURSPACES['ALEXA Wide Gamut']
+        transform = RGB_Colourspace_Transform(
+            alexa_colourspace,
+            aces_2065_1_colourspace,
+            apply_cctf_decoding=True,
+            baked=True)
+        RGB = np.linspace(0, 1, 36).reshape([12, 3])
+        np.testing.assert_almost_equal(
+            transform.apply(RGB, EI=1600),
+            RGB_to_RGB(
+                RGB,
+                alexa_colourspace,
+                aces_2065_1_colourspace,
+                apply_cctf_decoding=True,
+                EI=1600),
+            decimal=6)
+        self.assertFalse(
+            np.allclose(transform.apply(RGB, EI=1600), transform.apply(RGB)))
+
+        RGB = np.array([-0.1, 0.5, 300])
+        np.testing.assert_almost_equal(
+            transform.apply(RGB, EI=1600),
+            RGB_to_RGB(
+                RGB,
+                alexa_colourspace,
+                aces_2065_1_colourspace,
+                apply_cctf_decoding=True,
+                EI=1600),
+            decimal=6)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :meth:`colour.models.rgb.rgb_colourspace.\
+RGB_Colourspace_Transform.apply` method nan support.
+        """
+
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+        ProPhoto_colourspace = RGB_COLOURSPACES['ProPhoto RGB']
+
+        transform = RGB_Colourspace_Transform(
+            sRGB_colourspace,
+            ProPhoto_colourspace,
+            apply_cctf_decoding=True,
+            apply_cctf_encoding=True,
+            baked=True)
+
+        RGB = np.array([
+            [0.5, 0.5, 0.5],
+            [np.nan, np.nan, np.nan],
+            [0.5, np.nan, 0.5],
+            [np.inf, 0.5, -np.inf],
+        ])
+        np.testing.assert_almost_equal(
+            transform.apply(RGB),
+            RGB_to_RGB(
+                RGB,
+                sRGB_colourspace,
+                ProPhoto_colourspace,
+                apply_cctf_decoding=True,
+                apply_cctf_encoding=True),
+            decimal=4)
+
+
+class TestRGB_to_RGB_transform(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_transform`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_RGB_transform(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_transform`
+        definition.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        transform = RGB_to_RGB_transform(aces_2065_1_colourspace,
+                                         sRGB_colourspace)
+        self.assertIsInstance(transform, RGB_Colourspace_Transform)
+        self.assertIs(
+            RGB_to_RGB_transform(aces_2065_1_colourspace, sRGB_colourspace),
+            transform)
+        self.assertIsNot(
+            RGB_to_RGB_transform(aces_2065_1_colourspace, sRGB_colourspace,
+                                 'Bradford'), transform)
+        self.assertIsNot(
+            RGB_to_RGB_transform(
+                aces_2065_1_colourspace,
+                sRGB_colourspace,
+                apply_cctf_encoding=True), transform)
+
+        colourspace = deepcopy(sRGB_colourspace)
+        self.assertIs(
+            RGB_to_RGB_transform(aces_2065_1_colourspace, colourspace),
+            transform)
+
+        colourspace.whitepoint = np.array([0.32168, 0.33767])
+        self.assertIsNot(
+            RGB_to_RGB_transform(aces_2065_1_colourspace, colourspace),
+            transform)
+
+
 class TestRGB_to_RGB(unittest.TestCase):
     """
     Defines :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
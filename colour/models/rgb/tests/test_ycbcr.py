@@ -9,6 +9,7 @@ import numpy as np
 import unittest
 from itertools import permutations
 
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
                                      RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
                                      YCBCR_WEIGHTS)
@@ -112,6 +113,72 @@ class TestRGB_to_YCbCr(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     RGB_to_YCbCr(RGB * factor), YCbCr * factor, decimal=7)
 
+    def test_out_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition
+        *out* argument support.
+        """
+
+        RGB = np.tile(np.array([0.75, 0.75, 0.0]), (6, 1))
+        out = np.zeros(RGB.shape)
+        YCbCr = RGB_to_YCbCr(RGB, out=out)
+        self.assertIs(YCbCr, out)
+        np.testing.assert_almost_equal(YCbCr, RGB_to_YCbCr(RGB), decimal=7)
+
+        out = np.zeros(RGB.shape, DEFAULT_INT_DTYPE)
+        YCbCr = RGB_to_YCbCr(RGB, out_int=True, out=out)
+        self.assertIs(YCbCr, out)
+        np.testing.assert_equal(YCbCr, RGB_to_YCbCr(RGB, out_int=True))
+
+    def test_integer_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition integer
+        fast path.
+        """
+
+        RGB = np.reshape(np.arange(0, 1024, 7), (-1, 3))
+        RGB = np.vstack([RGB, RGB[::-1], np.roll(RGB, 1, axis=-1)])
+        for bits, dtype in ((8, np.uint8), (10, np.uint16), (16, np.uint16)):
+            RGB_i = (RGB * (2 ** bits - 1) // 1023).astype(dtype)
+            for K in YCBCR_WEIGHTS.values():
+                for out_bits, out_legal in ((8, True), (10, True), (12,
+                                                                    False)):
+                    kwargs = {
+                        'K': K,
+                        'in_bits': bits,
+                        'in_int': True,
+                        'out_bits': out_bits,
+                        'out_legal': out_legal,
+                    }
+                    np.testing.assert_almost_equal(
+                        RGB_to_YCbCr(RGB_i, **kwargs),
+                        RGB_to_YCbCr(
+                            RGB_i.astype(DEFAULT_INT_DTYPE), **kwargs),
+                        decimal=7)
+
+                    kwargs['out_int'] = True
+                    YCbCr = RGB_to_YCbCr(RGB_i, **kwargs)
+                    self.assertEqual(YCbCr.dtype, DEFAULT_INT_DTYPE)
+                    np.testing.assert_allclose(
+                        YCbCr,
+                        RGB_to_YCbCr(
+                            RGB_i.astype(DEFAULT_INT_DTYPE), **kwargs),
+                        atol=1)
+
+        RGB = np.array([[102, 0, 51], [255, 255, 255]], dtype=np.uint8)
+        out = np.zeros(RGB.shape, np.int16)
+        YCbCr = RGB_to_YCbCr(
+            RGB,
+            K=YCBCR_WEIGHTS['ITU-R BT.601'],
+            in_bits=8,
+            in_int=True,
+            out_legal=False,
+            out_int=True,
+            out=out)
+        self.assertIs(YCbCr, out)
+        np.testing.assert_equal(YCbCr,
+                                np.array([[36, 136, 175], [255, 128, 128]]))
+
     @ignore_numpy_errors
     def test_nan_RGB_to_YCbCr(self):
         """
@@ -205,6 +272,66 @@ class TestYCbCr_to_RGB(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     YCbCr_to_RGB(YCbCr * factor), RGB * factor, decimal=7)
 
+    def test_out_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition
+        *out* argument support.
+        """
+
+        YCbCr = np.tile(np.array([0.49215686, 0.09411765, 0.46745098]), (6, 1))
+        out = np.zeros(YCbCr.shape)
+        RGB = YCbCr_to_RGB(YCbCr, out=out)
+        self.assertIs(RGB, out)
+        np.testing.assert_almost_equal(RGB, YCbCr_to_RGB(YCbCr), decimal=7)
+
+        out = np.zeros(YCbCr.shape, DEFAULT_INT_DTYPE)
+        RGB = YCbCr_to_RGB(YCbCr, out_int=True, out=out)
+        self.assertIs(RGB, out)
+        np.testing.assert_equal(RGB, YCbCr_to_RGB(YCbCr, out_int=True))
+
+    def test_integer_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition integer
+        fast path.
+        """
+
+        YCbCr = np.reshape(np.arange(64, 946, 6), (-1, 3))
+        YCbCr = np.vstack([YCbCr, YCbCr[::-1], np.roll(YCbCr, 1, axis=-1)])
+        for bits, dtype in ((8, np.uint8), (10, np.uint16), (16, np.uint16)):
+            YCbCr_i = (YCbCr * (2 ** bits - 1) // 1023).astype(dtype)
+            for K in YCBCR_WEIGHTS.values():
+                for out_bits, out_legal in ((8, False), (10, False), (12,
+                                                                      True)):
+                    kwargs = {
+                        'K': K,
+                        'in_bits': bits,
+                        'in_int': True,
+                        'out_bits': out_bits,
+                        'out_legal': out_legal,
+                    }
+                    np.testing.assert_almost_equal(
+                        YCbCr_to_RGB(YCbCr_i, **kwargs),
+                        YCbCr_to_RGB(
+                            YCbCr_i.astype(DEFAULT_INT_DTYPE), **kwargs),
+                        decimal=7)
+
+                    kwargs['out_int'] = True
+                    RGB = YCbCr_to_RGB(YCbCr_i, **kwargs)
+                    self.assertEqual(RGB.dtype, DEFAULT_INT_DTYPE)
+                    np.testing.assert_allclose(
+                        RGB,
+                        YCbCr_to_RGB(
+                            YCbCr_i.astype(DEFAULT_INT_DTYPE), **kwargs),
+                        atol=1)
+
+        YCbCr = np.array([[502, 512, 512], [940, 512, 512]], dtype=np.uint16)
+        out = np.zeros(YCbCr.shape, np.uint16)
+        RGB = YCbCr_to_RGB(
+            YCbCr, in_bits=10, in_int=True, out_int=True, out=out)
+        self.assertIs(RGB, out)
+        np.testing.assert_equal(
+            RGB, np.array([[512, 512, 512], [1023, 1023, 1023]]))
+
     @ignore_numpy_errors
     def test_nan_YCbCr_to_RGB(self):
         """
@@ -2,10 +2,13 @@
 
 from __future__ import absolute_import
 
+import numpy as np
+from collections import namedtuple
 from functools import partial
 
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
-                              usage_warning)
+from colour.utilities import (
+    CaseInsensitiveMapping, LRUCache, domain_range_scale, filter_kwargs,
+    get_domain_range_scale, get_float_precision, usage_warning)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 from .common import CV_range, legal_to_full, full_to_legal
@@ -121,6 +124,372 @@ __all__ += [
 __all__ += ['eotf_inverse_sRGB', 'eotf_sRGB']
 __all__ += ['log_encoding_ViperLog', 'log_decoding_ViperLog']
 
+_CCTF_BAKING_EXPONENTS = (-64, 8)
+"""
+Base-2 exponents bounding the shaper domain the functions evaluated by the
+dispatchers with ``baked=True`` are baked on. The shaper domain is made of the
+octaves from :math:`2^{-64}` to :math:`2^8`, offset by :math:`2^{-64}` so that
+it starts at 0, each octave being uniformly sampled.
+
+_CCTF_BAKING_EXPONENTS : tuple
+"""
+
+_CCTF_BAKING_MAXIMUM_SIZE = 65536
+"""
+Maximum samples count of an octave of the shaper domain, the samples count of
+each octave is successively doubled, starting from 1, until meeting the
+:attr:`colour.models.rgb.transfer_functions._CCTF_BAKING_TOLERANCE`
+attribute maximum error.
+
+_CCTF_BAKING_MAXIMUM_SIZE : int
+"""
+
+_CCTF_BAKING_TOLERANCE = 1e-7
+"""
+Maximum error, relative to the function value magnitude when greater than 1,
+of the linear interpolation of the 1D tables the functions are baked into. It
+is measured halfway between the table samples, thus, the discontinuities of
+the functions smaller than twice the maximum error might not be detected, e.g.
+the :math:`2.5 \\times 10^{-7}` jump of the *ALEXA Log C* log encoding at its
+cut is interpolated with a maximum error of :math:`2.5 \\times 10^{-7}`.
+
+_CCTF_BAKING_TOLERANCE : numeric
+"""
+
+_BAKED_CCTFS_CACHE = LRUCache(64)
+"""
+Cache of the 1D tables the functions evaluated by the dispatchers with
+``baked=True`` are baked into, keyed by the function, the input bit depth
+and the function keywords arguments.
+
+_BAKED_CCTFS_CACHE : LRUCache
+"""
+
+
+class _BakedCCTF(
+        namedtuple('_BakedCCTF',
+                   ('table', 'slopes', 'sizes', 'offsets', 'partial'))):
+    """
+    Defines a function baked into a 1D table sampled on the shaper domain.
+
+    Parameters
+    ----------
+    table : ndarray
+        1D table, i.e. the function value at the start of each segment, *nan*
+        for the segments not meeting the maximum error.
+    slopes : ndarray
+        1D table segments slopes, *nan* for the segments not meeting the
+        maximum error.
+    sizes : ndarray
+        Segments count of each octave of the shaper domain.
+    offsets : ndarray
+        Index of the first segment of each octave of the shaper domain.
+    partial : bool
+        Whether some segments do not meet the maximum error, the function
+        being evaluated analytically for the values in these segments.
+    """
+
+
+def _bake_cctf(function, **kwargs):
+    """
+    Bakes given function into a 1D table sampled on the shaper domain.
+
+    Each octave of the shaper domain is uniformly sampled with the smallest
+    power of 2 segments count meeting the maximum error. The segments of the
+    octaves not meeting it with the maximum segments count, e.g. at the
+    discontinuities of the function, or whose values are not finite are
+    marked with *nan* values.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the function.
+
+    Returns
+    -------
+    _BakedCCTF
+        Baked function or *None* if no octave meets the maximum error.
+    """
+
+    e_min, e_max = _CCTF_BAKING_EXPONENTS
+
+    octaves = np.arange(e_max - e_min)
+    sizes = np.zeros(octaves.shape, dtype=np.intp)
+    tables, slopes = [None] * octaves.size, [None] * octaves.size
+
+    size = 1
+    while octaves.size:
+        # Octaves samples with the samples halfway between them.
+        x = (np.ldexp(1 + np.arange(size * 2 + 1) / (size * 2),
+                      (e_min + octaves)[:, np.newaxis]) - np.ldexp(1, e_min))
+
+        with domain_range_scale('ignore'), np.errstate(all='ignore'):
+            values = np.reshape(
+                np.asarray(function(np.ravel(x), **kwargs), dtype=np.float64),
+                x.shape)
+
+            table, half = values[:, ::2], values[:, 1::2]
+            error = np.abs(half - (table[:, :-1] + table[:, 1:]) / 2)
+            valid = error <= _CCTF_BAKING_TOLERANCE * np.maximum(
+                np.abs(half), 1)
+
+        met = np.all(valid, axis=-1)
+        if size == _CCTF_BAKING_MAXIMUM_SIZE:
+            # The octaves mostly not meeting the maximum error are reduced to
+            # a single invalid segment.
+            met = np.logical_or(met, True)
+            mostly_invalid = np.mean(valid, axis=-1) < 0.5
+            table[mostly_invalid], valid[mostly_invalid] = np.nan, False
+
+        for i in np.flatnonzero(met):
+            octave_table = np.where(valid[i], table[i, :-1], np.nan)
+            if np.all(np.isnan(octave_table)):
+                octave_table = octave_table[:1]
+            tables[octaves[i]] = octave_table
+            slopes[octaves[i]] = (
+                np.diff(table[i])[:octave_table.size] + octave_table * 0)
+            sizes[octaves[i]] = octave_table.size
+
+        octaves = octaves[~met]
+        size *= 2
+
+    table = np.hstack(tables)
+    if np.all(np.isnan(table)):
+        return None
+
+    slopes = np.hstack(slopes)
+    offsets = np.hstack([0, np.cumsum(sizes)[:-1]])
+    for array in (table, slopes, sizes, offsets):
+        array.setflags(write=False)
+
+    return _BakedCCTF(table, slopes, sizes.astype(np.float64), offsets,
+                      bool(np.any(np.isnan(table))))
+
+
+def _baked_cctf_table(function, bits=None, **kwargs):
+    """
+    Returns the 1D table given function is baked into.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake.
+    bits : int, optional
+        Bit depth of the integer code values the table is indexed with, if
+        *None*, the table samples the shaper domain for linear interpolation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the function.
+
+    Returns
+    -------
+    ndarray or _BakedCCTF
+        1D table indexed with the integer code values, or baked function, or
+        *None* if the linear interpolation maximum error cannot be met.
+
+    Warnings
+    --------
+    A usage warning is issued when the function cannot be baked, it is then
+    evaluated analytically.
+
+    Examples
+    --------
+    >>> _baked_cctf_table(eotf_sRGB, 8)[128]  # doctest: +ELLIPSIS
+    0.2158605...
+    >>> _baked_cctf_table(eotf_sRGB).table.size
+    20475
+    """
+
+    key = (function, bits,
+           tuple(
+               sorted((name, repr(value)) for name, value in kwargs.items())))
+    if key in _BAKED_CCTFS_CACHE:
+        return _BAKED_CCTFS_CACHE[key]
+
+    if bits is not None:
+        with domain_range_scale('ignore'):
+            table = np.asarray(
+                function(np.arange(2 ** bits) / (2 ** bits - 1), **kwargs),
+                dtype=np.float64)
+        table.setflags(write=False)
+    else:
+        table = _bake_cctf(function, **kwargs)
+        if table is None:
+            usage_warning(
+                '"{0}" cannot be baked within the maximum error, it will be '
+                'evaluated analytically!'.format(
+                    getattr(function, '__name__', function)))
+
+    _BAKED_CCTFS_CACHE[key] = table
+
+    return table
+
+
+def _evaluate_cctf(function, value, baked=False, in_bits=None, **kwargs):
+    """
+    Evaluates given function, analytically or with the 1D table it is baked
+    into.
+
+    Parameters
+    ----------
+    function : callable
+        Function to evaluate.
+    value : numeric or array_like
+        Value.
+    baked : bool, optional
+        Whether to evaluate the function with the 1D table it is baked into.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values ``value``
+        when ``baked`` is *True*, default to the integer type bit depth.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, they are filtered with
+        :func:`colour.utilities.filter_kwargs` definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        Function value.
+
+    Notes
+    -----
+    -   With ``baked`` set to *True*, *uint8* or *uint16* integer code values
+        are normalised to domain [0, 1] and looked up in an exact table
+        holding the function value of every code value. Floating point
+        values are linearly interpolated in a cached table sampled uniformly
+        within each octave of the shaper domain, from 0 to :math:`2^8`, and
+        whose maximum error is measured against the function. The function
+        is evaluated analytically for the values outside the table domain,
+        including non-finite values, with the integer switches, array
+        keywords arguments or a domain-range scale other than
+        **'Reference'**, and, with a usage warning, when the maximum error
+        cannot be met.
+
+    Examples
+    --------
+    >>> _evaluate_cctf(eotf_sRGB, 0.5)  # doctest: +ELLIPSIS
+    0.2140411...
+    >>> _evaluate_cctf(eotf_sRGB, np.array([0.5]), True)
+    ... # doctest: +ELLIPSIS
+    array([ 0.2140411...])
+    >>> _evaluate_cctf(  # doctest: +ELLIPSIS
+    ...     eotf_sRGB, np.array([512], dtype=np.uint16), True, 10)
+    array([ 0.2144938...])
+    """
+
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if (not baked or get_domain_range_scale() not in ('reference', 'ignore') or
+            kwargs.get('in_int') or kwargs.get('out_int') or
+            any(np.ndim(argument) != 0 for argument in kwargs.values())):
+        return function(value, **kwargs)
+
+    value = np.asarray(value)
+    dtype = get_float_precision()
+    if value.dtype in (np.uint8, np.uint16):
+        bits = value.dtype.itemsize * 8 if in_bits is None else in_bits
+
+        return np.take(
+            _baked_cctf_table(function, bits, **kwargs), value,
+            mode='clip').astype(
+                dtype, copy=False)
+
+    baked_cctf = (_baked_cctf_table(function, **kwargs)
+                  if value.dtype.kind == 'f' else None)
+    if baked_cctf is None:
+        return function(value, **kwargs)
+
+    ndim, value = value.ndim, np.atleast_1d(value)
+    e_min, e_max = _CCTF_BAKING_EXPONENTS
+    offset = np.ldexp(1, e_min)
+
+    # NOTE: The values outside the shaper domain and the non-finite values,
+    # which would otherwise be cast to invalid indexes, are looked up at the
+    # shaper domain start and evaluated analytically afterwards.
+    x = np.add(
+        value,
+        offset,
+        dtype=np.float64 if value.dtype == np.float64 else np.float32)
+    invalid = None
+    if not 0 <= np.min(value) <= np.max(value) < np.ldexp(1, e_max) - offset:
+        invalid = ~np.logical_and(value >= 0,
+                                  value < np.ldexp(1, e_max) - offset)
+        x[invalid] = offset
+
+    # The octave, the segment and the interpolation weight are computed
+    # exactly from the offset value mantissa and exponent.
+    mantissa, exponent = np.frexp(x)
+    exponent -= e_min + 1
+    mantissa *= 2
+    mantissa -= 1
+    mantissa *= baked_cctf.sizes[exponent]
+    indexes = mantissa.astype(np.intp)
+    mantissa -= indexes
+    indexes += baked_cctf.offsets[exponent]
+
+    value_t = np.multiply(
+        baked_cctf.slopes[indexes],
+        mantissa,
+        out=np.empty(value.shape, get_float_precision()))
+    value_t += baked_cctf.table[indexes]
+
+    if baked_cctf.partial:
+        nan = np.isnan(value_t)
+        invalid = nan if invalid is None else np.logical_or(invalid, nan)
+
+    if invalid is not None:
+        value_t[invalid] = function(value[invalid], **kwargs)
+
+    return value_t if ndim else value_t[0]
+
+
+def _cctf_function(function, baked=False, in_bits=None, **kwargs):
+    """
+    Returns given function with its supported keyword arguments bound.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bind the keyword arguments to.
+    baked : bool, optional
+        Whether to evaluate the function with the 1D table it is baked into.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, they are filtered with
+        :func:`colour.utilities.filter_kwargs` definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> _cctf_function(eotf_sRGB, L_p=1000)(0.5)  # doctest: +ELLIPSIS
+    0.2140411...
+    """
+
+    if baked:
+        return partial(
+            _evaluate_cctf, function, baked=baked, in_bits=in_bits, **kwargs)
+
+    return partial(function, **filter_kwargs(function, **kwargs))
+
+
 LOG_ENCODINGS = CaseInsensitiveMapping({
     'ACEScc': log_encoding_ACEScc,
     'ACEScct': log_encoding_ACEScct,
@@ -238,6 +607,15 @@ def log_encoding(value, function='Cineon', **kwargs):
         {:func:`colour.models.log_encoding_ALEXALogC`},
         **{'Linear Scene Exposure Factor', 'Normalised Sensor Signal'}**,
         Conversion method.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -263,7 +641,50 @@ def log_encoding(value, function='Cineon', **kwargs):
 
     function = LOG_ENCODINGS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_log_encoding_function(function='Cineon', **kwargs):
+    """
+    Returns the *log* encoding function for given method, with its supported
+    keyword arguments bound, for repeated evaluations without resolving the
+    method and filtering the keyword arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ACEScc', 'ACEScct', 'ACESproxy', 'ALEXA Log C', 'Canon Log 2',
+        'Canon Log 3', 'Canon Log', 'Cineon', 'D-Log', 'ERIMM RGB', 'F-Log',
+        'Filmic Pro 6', 'Log2', 'Log3G10', 'Log3G12', 'Panalog', 'PLog',
+        'Protune', 'REDLog', 'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3',
+        'T-Log', 'V-Log', 'ViperLog'}**,
+        Computation function.
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.log_encoding` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.log_encoding`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> log_encoding_ = get_log_encoding_function('Cineon')
+    >>> log_encoding_(0.18)  # doctest: +ELLIPSIS
+    0.4573196...
+    """
+
+    return _cctf_function(LOG_ENCODINGS[function], **kwargs)
 
 
 LOG_DECODINGS = CaseInsensitiveMapping({
@@ -383,6 +804,15 @@ def log_decoding(value, function='Cineon', **kwargs):
         {:func:`colour.models.log_decoding_ALEXALogC`},
         **{'Linear Scene Exposure Factor', 'Normalised Sensor Signal'}**,
         Conversion method.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -410,11 +840,55 @@ def log_decoding(value, function='Cineon', **kwargs):
 
     function = LOG_DECODINGS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_log_decoding_function(function='Cineon', **kwargs):
+    """
+    Returns the *log* decoding function for given method, with its supported
+    keyword arguments bound, for repeated evaluations without resolving the
+    method and filtering the keyword arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ACEScc', 'ACEScct', 'ACESproxy', 'ALEXA Log C', 'Canon Log 2',
+        'Canon Log 3', 'Canon Log', 'Cineon', 'D-Log', 'ERIMM RGB', 'F-Log',
+        'Filmic Pro 6', 'Log2', 'Log3G10', 'Log3G12', 'Panalog', 'PLog',
+        'Protune', 'REDLog', 'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3',
+        'T-Log', 'V-Log', 'ViperLog'}**,
+        Computation function.
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.log_decoding` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.log_decoding`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> log_decoding_ = get_log_decoding_function('Cineon')
+    >>> log_decoding_(0.457319613085418)  # doctest: +ELLIPSIS
+    0.1...
+    """
+
+    return _cctf_function(LOG_DECODINGS[function], **kwargs)
 
 
 __all__ += ['LOG_ENCODINGS', 'LOG_DECODINGS']
 __all__ += ['log_encoding', 'log_decoding']
+__all__ += ['get_log_encoding_function', 'get_log_decoding_function']
 
 OETFS = CaseInsensitiveMapping({
     'ARIB STD-B67': oetf_ARIBSTDB67,
@@ -461,6 +935,15 @@ def oetf(value, function='ITU-R BT.709', **kwargs):
     r : numeric, optional
         {:func:`colour.models.oetf_ARIBSTDB67`},
         Video level corresponding to reference white level.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -477,7 +960,48 @@ def oetf(value, function='ITU-R BT.709', **kwargs):
 
     function = OETFS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_oetf_function(function='ITU-R BT.709', **kwargs):
+    """
+    Returns the opto-electronic transfer function (OETF / OECF) for given
+    method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ITU-R BT.709', 'ARIB STD-B67', 'ITU-R BT.2100 HLG',
+        'ITU-R BT.2100 PQ', 'ITU-R BT.601', 'SMPTE 240M', 'ST 2084'}**,
+        Opto-electronic transfer function (OETF / OECF).
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.oetf` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.oetf`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> oetf_ = get_oetf_function('ITU-R BT.709')
+    >>> oetf_(0.5)  # doctest: +ELLIPSIS
+    0.7055150...
+    """
+
+    return _cctf_function(OETFS[function], **kwargs)
 
 
 OETF_INVERSES = CaseInsensitiveMapping({
@@ -516,6 +1040,15 @@ def oetf_inverse(value, function='ITU-R BT.709', **kwargs):
     r : numeric, optional
         {:func:`colour.models.oetf_ARIBSTDB67`},
         Video level corresponding to reference white level.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -533,7 +1066,48 @@ def oetf_inverse(value, function='ITU-R BT.709', **kwargs):
 
     function = OETF_INVERSES[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_oetf_inverse_function(function='ITU-R BT.709', **kwargs):
+    """
+    Returns the inverse opto-electronic transfer function (OETF / OECF) for
+    given method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ITU-R BT.709', 'ARIB STD-B67', 'ITU-R BT.2100 HLG',
+        'ITU-R BT.2100 PQ', 'ITU-R BT.601', }**,
+        Inverse opto-electronic transfer function (OETF / OECF).
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.oetf_inverse` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.oetf_inverse`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> oetf_inverse_ = get_oetf_inverse_function('ITU-R BT.709')
+    >>> oetf_inverse_(0.409007728864150)  # doctest: +ELLIPSIS
+    0.1...
+    """
+
+    return _cctf_function(OETF_INVERSES[function], **kwargs)
 
 
 EOTFS = CaseInsensitiveMapping({
@@ -608,6 +1182,15 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
         :func:`colour.models.eotf_DICOMGSDF`},
         Whether to return value as integer code value or float equivalent of a
         code value at a given bit depth.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -628,7 +1211,49 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
 
     function = EOTFS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_eotf_function(function='ITU-R BT.1886', **kwargs):
+    """
+    Returns the electro-optical transfer function (EOTF / EOCF) for given
+    method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ITU-R BT.1886', 'DCDM', 'DICOM GSDF', 'ITU-R BT.2020',
+        'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'SMPTE 240M', 'ST 2084',
+        'sRGB'}**,
+        Electro-optical transfer function (EOTF / EOCF).
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.eotf` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.eotf`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> eotf_ = get_eotf_function('ST 2084')
+    >>> eotf_(0.5)  # doctest: +ELLIPSIS
+    92.2457089...
+    """
+
+    return _cctf_function(EOTFS[function], **kwargs)
 
 
 EOTF_INVERSES = CaseInsensitiveMapping({
@@ -695,6 +1320,15 @@ def eotf_inverse(value, function='ITU-R BT.1886', **kwargs):
         :func:`colour.models.eotf_inverse_DICOMGSDF`},
         Whether to return value as integer code value or float equivalent of a
         code value at a given bit depth.
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
 
     Returns
     -------
@@ -712,11 +1346,56 @@ def eotf_inverse(value, function='ITU-R BT.1886', **kwargs):
 
     function = EOTF_INVERSES[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_eotf_inverse_function(function='ITU-R BT.1886', **kwargs):
+    """
+    Returns the inverse electro-optical transfer function (EOTF / EOCF) for
+    given method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        **{'ITU-R BT.1886', 'DCDM', 'DICOM GSDF', 'ITU-R BT.2020',
+        'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'ST 2084', 'sRGB'}**,
+        Inverse electro-optical transfer function (EOTF / EOCF).
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.eotf_inverse` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.eotf_inverse`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> eotf_inverse_ = get_eotf_inverse_function('ST 2084')
+    >>> eotf_inverse_(1.738580491084806)  # doctest: +ELLIPSIS
+    0.1...
+    """
+
+    return _cctf_function(EOTF_INVERSES[function], **kwargs)
 
 
 __all__ += ['OETFS', 'OETF_INVERSES', 'EOTFS', 'EOTF_INVERSES']
 __all__ += ['oetf', 'oetf_inverse', 'eotf', 'eotf_inverse']
+__all__ += [
+    'get_oetf_function', 'get_oetf_inverse_function', 'get_eotf_function',
+    'get_eotf_inverse_function'
+]
 
 CCTF_ENCODINGS = CaseInsensitiveMapping({
     'Gamma 2.2': partial(gamma_function, exponent=1 / 2.2),
@@ -766,6 +1445,15 @@ def cctf_encoding(value, function='sRGB', **kwargs):
 
     Other Parameters
     ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
     \\**kwargs : dict, optional
         Keywords arguments for the relevant encoding CCTF of the
         :attr:`colour.CCTF_ENCODINGS` attribute collection.
@@ -804,7 +1492,54 @@ def cctf_encoding(value, function='sRGB', **kwargs):
 
     function = CCTF_ENCODINGS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_cctf_encoding_function(function='sRGB', **kwargs):
+    """
+    Returns the encoding colour component transfer function (Encoding CCTF) for
+    given method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        {:attr:`colour.CCTF_ENCODINGS`},
+        Computation function.
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.cctf_encoding` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.cctf_encoding`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> cctf_encoding_ = get_cctf_encoding_function('sRGB')
+    >>> cctf_encoding_(0.18)  # doctest: +ELLIPSIS
+    0.4613561...
+    """
+
+    if 'itu-r bt.2100' in function.lower():
+        usage_warning(
+            'With the "ITU-R BT.2100" method, only the inverse '
+            'electro-optical transfer functions (EOTFs / EOCFs) are exposed '
+            'by this definition, please refer to the "colour.oetf" definition '
+            'for the opto-electronic transfer functions (OETF / OECF).')
+
+    return _cctf_function(CCTF_ENCODINGS[function], **kwargs)
 
 
 CCTF_DECODINGS = CaseInsensitiveMapping({
@@ -860,6 +1595,15 @@ def cctf_decoding(value, function='sRGB', **kwargs):
 
     Other Parameters
     ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into: *uint8* or *uint16* integer code values are looked up in an
+        exact table while floating point values in domain [0, 1] are linearly
+        interpolated with a maximum error relative to the function range of
+        1e-7.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
     \\**kwargs : dict, optional
         Keywords arguments for the relevant decoding CCTF of the
         :attr:`colour.CCTF_DECODINGS` attribute collection.
@@ -899,11 +1643,60 @@ def cctf_decoding(value, function='sRGB', **kwargs):
 
     function = CCTF_DECODINGS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate_cctf(function, value, **kwargs)
+
+
+def get_cctf_decoding_function(function='sRGB', **kwargs):
+    """
+    Returns the decoding colour component transfer function (Decoding CCTF) for
+    given method, with its supported keyword arguments bound, for repeated
+    evaluations without resolving the method and filtering the keyword
+    arguments on each call.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        {:attr:`colour.CCTF_DECODINGS`},
+        Computation function.
+
+    Other Parameters
+    ----------------
+    baked : bool, optional
+        Whether to evaluate the function with a cached 1D table it is baked
+        into, see :func:`colour.cctf_decoding` definition.
+    in_bits : int, optional
+        Bit depth of the *uint8* or *uint16* integer code values when
+        ``baked`` is *True*, default to the integer type bit depth.
+    \\**kwargs : dict, optional
+        Keywords arguments for the function, see :func:`colour.cctf_decoding`
+        definition.
+
+    Returns
+    -------
+    callable
+        Function taking the value as single positional argument.
+
+    Examples
+    --------
+    >>> cctf_decoding_ = get_cctf_decoding_function('sRGB')
+    >>> cctf_decoding_(0.461356129500442)  # doctest: +ELLIPSIS
+    0.1...
+    """
+
+    if 'itu-r bt.2100' in function.lower():
+        usage_warning(
+            'With the "ITU-R BT.2100" method, only the electro-optical '
+            'transfer functions (EOTFs / EOCFs) are exposed by this '
+            'definition, please refer to the "colour.oetf_inverse" definition '
+            'for the inverse opto-electronic transfer functions (OETF / OECF).'
+        )
+
+    return _cctf_function(CCTF_DECODINGS[function], **kwargs)
 
 
 __all__ += ['CCTF_ENCODINGS', 'CCTF_DECODINGS']
 __all__ += ['cctf_encoding', 'cctf_decoding']
+__all__ += ['get_cctf_encoding_function', 'get_cctf_decoding_function']
 
 OOTFS = CaseInsensitiveMapping({
     'ITU-R BT.2100 HLG': ootf_HLG_BT2100,
@@ -10,8 +10,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import as_float_array
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.utilities import as_float_array, get_float_precision
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -59,7 +59,7 @@ def CV_range(bit_depth=10, is_legal=False, is_int=False):
         ranges = np.array([0, 2 ** bit_depth - 1])
 
     if not is_int:
-        ranges = ranges.astype(DEFAULT_FLOAT_DTYPE) / (2 ** bit_depth - 1)
+        ranges = ranges.astype(get_float_precision()) / (2 ** bit_depth - 1)
 
     return ranges
 
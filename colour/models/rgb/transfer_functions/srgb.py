@@ -28,7 +28,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.algebra import spow
+from colour.algebra import is_spow_enabled
 from colour.utilities import (as_float, domain_range_scale, from_range_1,
                               to_domain_1)
 
@@ -42,7 +42,7 @@ __status__ = 'Production'
 __all__ = ['eotf_inverse_sRGB', 'eotf_sRGB']
 
 
-def eotf_inverse_sRGB(L):
+def eotf_inverse_sRGB(L, out=None):
     """
     Defines the *IEC 61966-2-1:1999* *sRGB* inverse electro-optical transfer
     function (EOTF / EOCF).
@@ -51,6 +51,8 @@ def eotf_inverse_sRGB(L):
     ----------
     L : numeric or array_like
         *Luminance* :math:`L` of the image.
+    out : ndarray, optional
+        Array the electrical signal :math:`V` is written into.
 
     Returns
     -------
@@ -85,12 +87,25 @@ def eotf_inverse_sRGB(L):
 
     L = to_domain_1(L)
 
-    V = np.where(L <= 0.0031308, L * 12.92, 1.055 * spow(L, 1 / 2.4) - 0.055)
+    V = np.empty_like(L) if out is None else out
 
-    return as_float(from_range_1(V))
+    # The power segment is evaluated in-place on the absolute values, the
+    # negative values are in the linear segment anyway. NaNs are zeroed as
+    # with :func:`colour.algebra.spow` definition.
+    np.abs(L, out=V)
+    np.power(V, 1 / 2.4, out=V)
+    if is_spow_enabled():
+        np.copyto(V, 0, where=np.isnan(V))
+    V *= 1.055
+    V -= 0.055
+    np.multiply(L, 12.92, out=V, where=L <= 0.0031308)
 
+    V = from_range_1(V)
 
-def eotf_sRGB(V):
+    return as_float(V) if out is None else V
+
+
+def eotf_sRGB(V, out=None):
     """
     Defines the *IEC 61966-2-1:1999* *sRGB* electro-optical transfer function
     (EOTF / EOCF).
@@ -99,6 +114,8 @@ def eotf_sRGB(V):
     ----------
     V : numeric or array_like
         Electrical signal :math:`V`.
+    out : ndarray, optional
+        Array the *luminance* :math:`L` is written into.
 
     Returns
     -------
@@ -133,11 +150,17 @@ def eotf_sRGB(V):
 
     V = to_domain_1(V)
 
+    L = np.empty_like(V) if out is None else out
+
     with domain_range_scale('ignore'):
-        L = np.where(
-            V <= eotf_inverse_sRGB(0.0031308),
-            V / 12.92,
-            spow((V + 0.055) / 1.055, 2.4),
-        )
+        np.add(V, 0.055, out=L)
+        L /= 1.055
+        np.abs(L, out=L)
+        np.power(L, 2.4, out=L)
+        if is_spow_enabled():
+            np.copyto(L, 0, where=np.isnan(L))
+        np.divide(V, 12.92, out=L, where=V <= eotf_inverse_sRGB(0.0031308))
+
+    L = from_range_1(L)
 
-    return as_float(from_range_1(L))
+    return as_float(L) if out is None else L
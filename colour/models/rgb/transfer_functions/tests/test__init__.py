@@ -8,12 +8,19 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import unittest
+import warnings
 
 from colour.models.rgb.transfer_functions import (
     CCTF_DECODINGS, CCTF_ENCODINGS, EOTFS, EOTF_INVERSES, LOG_DECODINGS,
     LOG_ENCODINGS, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES, cctf_encoding,
-    cctf_decoding)
-from colour.utilities import as_int
+    cctf_decoding, eotf, get_cctf_decoding_function,
+    get_cctf_encoding_function, get_eotf_function, get_eotf_inverse_function,
+    get_log_decoding_function, get_log_encoding_function, get_oetf_function,
+    get_oetf_inverse_function, eotf_inverse, log_decoding, log_encoding, oetf,
+    oetf_inverse)
+from colour.models.rgb.transfer_functions import _evaluate_cctf
+from colour.utilities import (ColourUsageWarning, as_int, domain_range_scale,
+                              float_precision)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -22,7 +29,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Development'
 
-__all__ = ['TestCctfEncoding', 'TestCctfDecoding', 'TestTransferFunctions']
+__all__ = [
+    'TestCctfEncoding', 'TestCctfDecoding', 'TestBakedTransferFunctions',
+    'TestGetTransferFunctions', 'TestTransferFunctions'
+]
 
 
 class TestCctfEncoding(unittest.TestCase):
@@ -59,6 +69,184 @@ log_encoding_ACESproxy` definition raised exception.
         cctf_decoding(0.18, 'ITU-R BT.2100 PQ')
 
 
+class TestBakedTransferFunctions(unittest.TestCase):
+    """
+    Defines transfer functions dispatchers baked evaluation unit tests
+    methods.
+    """
+
+    def test_baked_float(self):
+        """
+        Tests transfer functions dispatchers baked evaluation of floating point
+        values.
+        """
+
+        samples = np.hstack(
+            [np.linspace(-0.1, 1.1, 10001),
+             np.linspace(1, 300, 10001)])
+        for dispatcher, name in (
+            (cctf_decoding, 'sRGB'),
+            (cctf_encoding, 'sRGB'),
+            (eotf, 'ST 2084'),
+            (eotf_inverse, 'ST 2084'),
+            (eotf_inverse, 'ITU-R BT.1886'),
+            (oetf, 'ITU-R BT.2100 HLG'),
+            (log_decoding, 'S-Log3'),
+            (log_decoding, 'ALEXA Log C'),
+            (log_encoding, 'Log3G10'),
+        ):
+            analytic = dispatcher(samples, name)
+            baked = dispatcher(samples, name, baked=True)
+
+            np.testing.assert_allclose(baked, analytic, rtol=1e-7, atol=1e-7)
+
+            outside = np.logical_or(samples < 0, samples >= 256)
+            np.testing.assert_equal(baked[outside], analytic[outside])
+
+        # The "ALEXA Log C" log encoding jumps by 2.5e-7 at its cut.
+        np.testing.assert_allclose(
+            log_encoding(samples, 'ALEXA Log C', baked=True),
+            log_encoding(samples, 'ALEXA Log C'),
+            atol=3e-7)
+
+        np.testing.assert_allclose(
+            eotf(0.5, 'ST 2084', baked=True), eotf(0.5, 'ST 2084'), atol=1e-3)
+
+    def test_float_precision_baked(self):
+        """
+        Tests transfer functions dispatchers baked evaluation floating point
+        precision support.
+        """
+
+        samples = np.linspace(0, 1, 11)
+        with float_precision(np.float32):
+            baked = cctf_decoding(samples, 'sRGB', baked=True)
+
+        self.assertEqual(baked.dtype, np.float32)
+        np.testing.assert_allclose(
+            baked, cctf_decoding(samples, 'sRGB'), atol=1e-6)
+
+    def test_partial_baked(self):
+        """
+        Tests transfer functions baked evaluation of functions partially or
+        not meeting the maximum error.
+        """
+
+        def step(x):
+            """
+            Step function, discontinuous at 0.5.
+            """
+
+            return np.where(np.asarray(x) < 0.5, 0.0, 1.0)
+
+        samples = np.linspace(0, 1, 10001)
+        np.testing.assert_equal(
+            _evaluate_cctf(step, samples, True), step(samples))
+
+        def undefined(x):
+            """
+            Function whose value is not defined.
+            """
+
+            return np.full(np.shape(x), np.nan)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ColourUsageWarning)
+            np.testing.assert_equal(
+                _evaluate_cctf(undefined, samples, True), undefined(samples))
+
+        self.assertTrue(
+            any(
+                issubclass(warning.category, ColourUsageWarning)
+                for warning in caught))
+
+    def test_nan_baked(self):
+        """
+        Tests transfer functions dispatchers baked evaluation nan support.
+        """
+
+        samples = np.array([0.5, np.nan, np.inf, -np.inf, 1.5, -0.5])
+        for dispatcher, name in ((cctf_decoding, 'sRGB'), (eotf, 'ST 2084'),
+                                 (log_decoding, 'S-Log3')):
+            baked = dispatcher(samples, name, baked=True)
+            analytic = dispatcher(samples, name)
+
+            np.testing.assert_allclose(
+                baked[[0, 4]], analytic[[0, 4]], rtol=1e-7, atol=1e-7)
+            np.testing.assert_equal(baked[[1, 2, 3, 5]], analytic[[1, 2, 3,
+                                                                   5]])
+
+            np.testing.assert_equal(
+                dispatcher(np.nan, name, baked=True), dispatcher(np.nan, name))
+
+    def test_baked_integer(self):
+        """
+        Tests transfer functions dispatchers baked evaluation of integer code
+        values.
+        """
+
+        code_values = np.arange(1024, dtype=np.uint16)
+        np.testing.assert_equal(
+            cctf_decoding(code_values, 'sRGB', baked=True, in_bits=10),
+            cctf_decoding(code_values / 1023, 'sRGB'))
+
+        code_values = np.arange(256, dtype=np.uint8)
+        np.testing.assert_equal(
+            log_decoding(code_values, 'S-Log3', baked=True),
+            log_decoding(code_values / 255, 'S-Log3'))
+
+    def test_domain_range_scale_baked(self):
+        """
+        Tests transfer functions dispatchers baked evaluation domain-range
+        scale support.
+        """
+
+        samples = np.linspace(0, 1, 11)
+        for scale, factor in (('Reference', 1), (1, 1), (100, 100)):
+            with domain_range_scale(scale):
+                np.testing.assert_allclose(
+                    cctf_decoding(samples * factor, 'sRGB', baked=True),
+                    cctf_decoding(samples * factor, 'sRGB'),
+                    atol=1e-7 * factor)
+
+
+class TestGetTransferFunctions(unittest.TestCase):
+    """
+    Defines transfer functions accessors unit tests methods.
+    """
+
+    def test_get_transfer_functions(self):
+        """
+        Tests transfer functions accessors.
+        """
+
+        samples = np.linspace(0, 1, 11)
+        for mapping, dispatcher, accessor in (
+            (LOG_ENCODINGS, log_encoding, get_log_encoding_function),
+            (LOG_DECODINGS, log_decoding, get_log_decoding_function),
+            (OETFS, oetf, get_oetf_function),
+            (OETF_INVERSES, oetf_inverse, get_oetf_inverse_function),
+            (EOTFS, eotf, get_eotf_function),
+            (EOTF_INVERSES, eotf_inverse, get_eotf_inverse_function),
+            (CCTF_ENCODINGS, cctf_encoding, get_cctf_encoding_function),
+            (CCTF_DECODINGS, cctf_decoding, get_cctf_decoding_function),
+        ):
+            for name in mapping:
+                np.testing.assert_equal(
+                    accessor(name, L_p=1000, out_int=False)(samples),
+                    dispatcher(samples, name, L_p=1000, out_int=False))
+
+        np.testing.assert_equal(
+            get_eotf_function('ST 2084', baked=True)(samples),
+            eotf(samples, 'ST 2084', baked=True))
+
+        code_values = np.arange(1024, dtype=np.uint16)
+        np.testing.assert_equal(
+            get_cctf_decoding_function('sRGB', baked=True,
+                                       in_bits=10)(code_values),
+            cctf_decoding(code_values / 1023, 'sRGB'))
+
+
 class TestTransferFunctions(unittest.TestCase):
     """
     Defines transfer functions unit tests methods.
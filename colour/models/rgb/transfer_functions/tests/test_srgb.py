@@ -9,6 +9,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
+from colour.algebra import spow_enable
 from colour.models.rgb.transfer_functions import eotf_inverse_sRGB, eotf_sRGB
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
@@ -77,6 +78,23 @@ eotf_inverse_sRGB` definition domain and range scale support.
                 np.testing.assert_almost_equal(
                     eotf_inverse_sRGB(L * factor), V * factor, decimal=7)
 
+    def test_out_eotf_inverse_sRGB(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.srgb.\
+eotf_inverse_sRGB` definition *out* argument support.
+        """
+
+        L = np.array([-0.1, 0.0, 0.0015, 0.18, 1.0])
+        out = np.zeros(L.shape)
+        V = eotf_inverse_sRGB(L, out=out)
+        self.assertIs(V, out)
+        np.testing.assert_almost_equal(
+            V, [eotf_inverse_sRGB(x) for x in L], decimal=7)
+
+        out = np.zeros(L.shape, np.float32)
+        np.testing.assert_almost_equal(
+            eotf_inverse_sRGB(L, out=out), V, decimal=6)
+
     @ignore_numpy_errors
     def test_nan_eotf_inverse_sRGB(self):
         """
@@ -84,7 +102,17 @@ eotf_inverse_sRGB` definition domain and range scale support.
 eotf_inverse_sRGB` definition nan support.
         """
 
-        eotf_inverse_sRGB(np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]))
+        L = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        V = np.array([-12.92, 0.0, 1.0, -np.inf, np.inf, -0.055])
+        np.testing.assert_almost_equal(eotf_inverse_sRGB(L), V, decimal=7)
+        np.testing.assert_almost_equal(
+            eotf_inverse_sRGB(L, out=np.empty(6)), V, decimal=7)
+        np.testing.assert_almost_equal(
+            eotf_inverse_sRGB(np.nan), -0.055, decimal=7)
+
+        with spow_enable(False):
+            V[-1] = np.nan
+            np.testing.assert_almost_equal(eotf_inverse_sRGB(L), V, decimal=7)
 
 
 class TestEotf_sRGB(unittest.TestCase):
@@ -141,6 +169,18 @@ eotf_sRGB` definition domain and range scale support.
                 np.testing.assert_almost_equal(
                     eotf_sRGB(V * factor), L * factor, decimal=7)
 
+    def test_out_eotf_sRGB(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.srgb.\
+eotf_sRGB` definition *out* argument support.
+        """
+
+        V = np.array([-0.1, 0.0, 0.0015, 0.461356129500442, 1.0])
+        out = np.zeros(V.shape)
+        L = eotf_sRGB(V, out=out)
+        self.assertIs(L, out)
+        np.testing.assert_almost_equal(L, [eotf_sRGB(x) for x in V], decimal=7)
+
     @ignore_numpy_errors
     def test_nan_eotf_sRGB(self):
         """
@@ -148,7 +188,15 @@ eotf_sRGB` definition domain and range scale support.
 eotf_sRGB` definition nan support.
         """
 
-        eotf_sRGB(np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]))
+        V = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        L = np.array([-1.0 / 12.92, 0.0, 1.0, -np.inf, np.inf, 0.0])
+        np.testing.assert_equal(eotf_sRGB(V), L)
+        np.testing.assert_equal(eotf_sRGB(V, out=np.empty(6)), L)
+        np.testing.assert_equal(eotf_sRGB(np.nan), 0.0)
+
+        with spow_enable(False):
+            L[-1] = np.nan
+            np.testing.assert_equal(eotf_sRGB(V), L)
 
 
 if __name__ == '__main__':
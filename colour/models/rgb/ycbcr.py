@@ -47,12 +47,12 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.models.rgb.transfer_functions import (
     CV_range, eotf_inverse_BT2020, eotf_BT2020)
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
                               domain_range_scale, from_range_1, to_domain_1,
-                              tsplit, tstack)
+                              tsplit, tstack, get_float_precision)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -88,6 +88,129 @@ YCBCR_WEIGHTS : dict
 """
 
 
+def _YCbCr_matrix(K):
+    """
+    Returns the matrix converting normalised *R'G'B'* values to *Y'*, *Cb* and
+    *Cr* values in domains [0, 1], [-0.5, 0.5] and [-0.5, 0.5] respectively.
+
+    Parameters
+    ----------
+    K : array_like
+        Luma weighting coefficients of red and blue.
+
+    Returns
+    -------
+    ndarray
+        *Y'CbCr* matrix.
+
+    Examples
+    --------
+    >>> _YCbCr_matrix(YCBCR_WEIGHTS['ITU-R BT.709'])  # doctest: +ELLIPSIS
+    array([[ 0.2126    ,  0.7152    ,  0.0722    ],
+           [-0.1145721..., -0.3854278...,  0.5       ],
+           [ 0.5       , -0.4541529..., -0.0458470...]])
+    """
+
+    Kr, Kb = K
+
+    Y = np.array([Kr, 1 - Kr - Kb, Kb])
+
+    return np.array([
+        Y,
+        0.5 * (np.array([0, 0, 1]) - Y) / (1 - Kb),
+        0.5 * (np.array([1, 0, 0]) - Y) / (1 - Kr),
+    ])
+
+
+def _is_integer_fast_path(a, in_int):
+    """
+    Returns whether the integer fast path can be used for given input array,
+    i.e. whether it stores integer code values as *uint8* or *uint16* data.
+
+    Parameters
+    ----------
+    a : array_like
+        Input array.
+    in_int : bool
+        Whether the input array values are integer code values.
+
+    Returns
+    -------
+    bool
+        Whether the integer fast path can be used.
+    """
+
+    return in_int and isinstance(a, np.ndarray) and a.dtype in (np.uint8,
+                                                                np.uint16)
+
+
+def _integer_affine_transform(a, M, offset, out_int, out=None):
+    """
+    Applies the affine transformation :math:`M \\cdot a + offset` to given
+    *uint8* or *uint16* code values array without converting it to floating
+    point.
+
+    Integer output values are computed with *int64* fixed-point arithmetic
+    and are rounded half up, the fractional bits count is the largest one,
+    up to 40, such as the computations cannot overflow.
+
+    Parameters
+    ----------
+    a : ndarray
+        *uint8* or *uint16* code values array.
+    M : array_like
+        Affine transformation matrix.
+    offset : array_like
+        Affine transformation offset.
+    out_int : bool
+        Whether to return integer values.
+    out : ndarray, optional
+        Array the values are written into.
+
+    Returns
+    -------
+    ndarray
+        Transformed array.
+
+    Examples
+    --------
+    >>> a = np.array([[0, 128, 255]], dtype=np.uint8)
+    >>> M = np.identity(3) * 0.5
+    >>> _integer_affine_transform(a, M, np.array([0, 0, 0.25]), True)
+    array([[  0,  64, 128]])
+    """
+
+    if out_int:
+        bound = (np.max(np.sum(np.abs(M), axis=-1)) * np.iinfo(a.dtype).max +
+                 np.max(np.abs(offset)) + 1)
+        shift = int(min(np.floor(np.log2(2 ** 62 / bound)), 40))
+
+        M = np.rint(M * 2 ** shift).astype(np.int64)
+        offset = np.rint(offset * 2 ** shift).astype(np.int64)
+        offset += 2 ** (shift - 1)
+        dtype = np.int64
+
+        if out is None:
+            out = np.empty(a.shape, DEFAULT_INT_DTYPE)
+    else:
+        dtype = get_float_precision()
+
+        if out is None:
+            out = np.empty(a.shape, dtype)
+
+    for i in range(3):
+        b = np.multiply(a[..., 0], M[i, 0], dtype=dtype)
+        b += np.multiply(a[..., 1], M[i, 1], dtype=dtype)
+        b += np.multiply(a[..., 2], M[i, 2], dtype=dtype)
+        b += offset[i]
+        if out_int:
+            b >>= shift
+
+        out[..., i] = b
+
+    return out
+
+
 def YCbCr_ranges(bits, is_legal, is_int):
     """"
     Returns the *Y'CbCr* colour encoding ranges array for given bit depth,
@@ -125,7 +248,7 @@ def YCbCr_ranges(bits, is_legal, is_int):
         ranges = np.array([0, 2 ** bits - 1, 0, 2 ** bits - 1])
 
     if not is_int:
-        ranges = ranges.astype(DEFAULT_FLOAT_DTYPE) / (2 ** bits - 1)
+        ranges = ranges.astype(get_float_precision()) / (2 ** bits - 1)
 
     if is_int and not is_legal:
         ranges[3] = 2 ** bits
@@ -145,6 +268,7 @@ def RGB_to_YCbCr(RGB,
                  out_bits=8,
                  out_legal=True,
                  out_int=False,
+                 out=None,
                  **kwargs):
     """
     Converts an array of *R'G'B'* values to the corresponding *Y'CbCr* colour
@@ -177,6 +301,9 @@ def RGB_to_YCbCr(RGB,
     out_int : bool, optional
         Whether to return values as ``out_bits`` integer code values. Default
         is *False*.
+    out : ndarray, optional
+        Array the *Y'CbCr* colour encoding values are written into, its type
+        must be an integer type if ``out_int`` is *True*.
 
     Other Parameters
     ----------------
@@ -287,18 +414,30 @@ def RGB_to_YCbCr(RGB,
     array([ 36, 136, 175]...)
     """
 
-    if in_int:
-        RGB = as_float_array(RGB)
-    else:
-        RGB = to_domain_1(RGB)
-
     Kr, Kb = K
     RGB_min, RGB_max = kwargs.get('in_range',
                                   CV_range(in_bits, in_legal, in_int))
     Y_min, Y_max, C_min, C_max = kwargs.get(
         'out_range', YCbCr_ranges(out_bits, out_legal, out_int))
 
-    RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
+    if _is_integer_fast_path(RGB, in_int):
+        M = (np.array([
+            Y_max - Y_min, C_max - C_min, C_max - C_min
+        ])[..., np.newaxis] * _YCbCr_matrix(K) / (RGB_max - RGB_min))
+        offset = (
+            np.array([Y_min, (C_max + C_min) / 2,
+                      (C_max + C_min) / 2]) - np.sum(M, axis=-1) * RGB_min)
+
+        YCbCr = _integer_affine_transform(RGB, M, offset, out_int, out)
+
+        return YCbCr if out_int else from_range_1(YCbCr)
+
+    if in_int:
+        RGB = as_float_array(RGB)
+    else:
+        RGB = to_domain_1(RGB)
+
+    RGB_float = RGB.astype(get_float_precision()) - RGB_min
     RGB_float *= 1 / (RGB_max - RGB_min)
     R, G, B = tsplit(RGB_float)
 
@@ -312,9 +451,14 @@ def RGB_to_YCbCr(RGB,
     Cb += (C_max + C_min) / 2
     Cr += (C_max + C_min) / 2
 
-    YCbCr = tstack([Y, Cb, Cr])
-    YCbCr = np.round(YCbCr).astype(
-        DEFAULT_INT_DTYPE) if out_int else from_range_1(YCbCr)
+    YCbCr = tstack([Y, Cb, Cr], out=None if out_int else out)
+    if out_int:
+        if out is None:
+            out = np.empty(YCbCr.shape, DEFAULT_INT_DTYPE)
+
+        YCbCr = np.rint(YCbCr, out=out, casting='unsafe')
+    else:
+        YCbCr = from_range_1(YCbCr)
 
     return YCbCr
 
@@ -327,6 +471,7 @@ def YCbCr_to_RGB(YCbCr,
                  out_bits=10,
                  out_legal=False,
                  out_int=False,
+                 out=None,
                  **kwargs):
     """
     Converts an array of *Y'CbCr* colour encoding values to the corresponding
@@ -359,6 +504,9 @@ def YCbCr_to_RGB(YCbCr,
     out_int : bool, optional
         Whether to return values as ``out_bits`` integer code values. Default
         is *False*.
+    out : ndarray, optional
+        Array the *R'G'B'* values are written into, its type must be an
+        integer type if ``out_int`` is *True*.
 
     Other Parameters
     ----------------
@@ -417,18 +565,29 @@ def YCbCr_to_RGB(YCbCr,
     array([ 0.5,  0.5,  0.5])
     """
 
-    if in_int:
-        YCbCr = as_float_array(YCbCr)
-    else:
-        YCbCr = to_domain_1(YCbCr)
-
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
     Kr, Kb = K
     Y_min, Y_max, C_min, C_max = kwargs.get(
         'in_range', YCbCr_ranges(in_bits, in_legal, in_int))
     RGB_min, RGB_max = kwargs.get('out_range',
                                   CV_range(out_bits, out_legal, out_int))
 
+    if _is_integer_fast_path(YCbCr, in_int):
+        M = ((RGB_max - RGB_min) * np.linalg.inv(_YCbCr_matrix(K)) / np.array(
+            [Y_max - Y_min, C_max - C_min, C_max - C_min]))
+        offset = RGB_min - np.dot(
+            M, [Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+
+        RGB = _integer_affine_transform(YCbCr, M, offset, out_int, out)
+
+        return RGB if out_int else from_range_1(RGB)
+
+    if in_int:
+        YCbCr = as_float_array(YCbCr)
+    else:
+        YCbCr = to_domain_1(YCbCr)
+
+    Y, Cb, Cr = tsplit(YCbCr.astype(get_float_precision()))
+
     Y -= Y_min
     Cb -= (C_max + C_min) / 2
     Cr -= (C_max + C_min) / 2
@@ -439,11 +598,16 @@ def YCbCr_to_RGB(YCbCr,
     B = Y + (2 - 2 * Kb) * Cb
     G = (Y - Kr * R - Kb * B) / (1 - Kr - Kb)
 
-    RGB = tstack([R, G, B])
+    RGB = tstack([R, G, B], out=None if out_int else out)
     RGB *= RGB_max - RGB_min
     RGB += RGB_min
-    RGB = np.round(RGB).astype(DEFAULT_INT_DTYPE) if out_int else from_range_1(
-        RGB)
+    if out_int:
+        if out is None:
+            out = np.empty(RGB.shape, DEFAULT_INT_DTYPE)
+
+        RGB = np.rint(RGB, out=out, casting='unsafe')
+    else:
+        RGB = from_range_1(RGB)
 
     return RGB
 
@@ -636,7 +800,7 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     else:
         YcCbcCrc = to_domain_1(YcCbcCrc)
 
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
+    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(get_float_precision()))
     Y_min, Y_max, C_min, C_max = kwargs.get(
         'in_range', YCbCr_ranges(in_bits, in_legal, in_int))
 
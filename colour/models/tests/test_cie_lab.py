@@ -114,6 +114,24 @@ class TestXYZ_to_Lab(unittest.TestCase):
                     Lab * factor_b,
                     decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition
+        *out* argument support.
+        """
+
+        XYZ = np.tile(np.array([0.20654008, 0.12197225, 0.05136952]), (6, 1))
+        out = np.zeros(XYZ.shape)
+        Lab = XYZ_to_Lab(XYZ, out=out)
+        self.assertIs(Lab, out)
+        np.testing.assert_almost_equal(Lab, XYZ_to_Lab(XYZ), decimal=7)
+
+        with domain_range_scale(1):
+            np.testing.assert_almost_equal(
+                XYZ_to_Lab(XYZ, out=np.zeros(XYZ.shape)),
+                Lab * 0.01,
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -218,6 +236,19 @@ class TestLab_to_XYZ(unittest.TestCase):
                     XYZ * factor_b,
                     decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition
+        *out* argument support.
+        """
+
+        Lab = np.tile(
+            np.array([41.52787529, 52.63858304, 26.92317922]), (6, 1))
+        out = np.zeros(Lab.shape)
+        XYZ = Lab_to_XYZ(Lab, out=out)
+        self.assertIs(XYZ, out)
+        np.testing.assert_almost_equal(XYZ, Lab_to_XYZ(Lab), decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_XYZ(self):
         """
@@ -117,6 +117,28 @@ class TestXYZ_to_xyY(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     XYZ_to_xyY(XYZ * factor_a), xyY * factor_b, decimal=7)
 
+    def test_out_XYZ_to_xyY(self):
+        """
+        Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition
+        *out* argument support.
+        """
+
+        XYZ = np.array([
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.00000000, 0.00000000, 0.00000000],
+        ])
+        out = np.zeros(XYZ.shape)
+        xyY = XYZ_to_xyY(XYZ, out=out)
+        self.assertIs(xyY, out)
+        np.testing.assert_almost_equal(xyY, XYZ_to_xyY(XYZ), decimal=7)
+        np.testing.assert_almost_equal(
+            xyY,
+            np.array([
+                [0.54369557, 0.32107944, 0.12197225],
+                [0.31270000, 0.32900000, 0.00000000],
+            ]),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_xyY(self):
         """
@@ -214,6 +236,28 @@ class TestxyY_to_XYZ(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     xyY_to_XYZ(xyY * factor_a), XYZ * factor_b, decimal=7)
 
+    def test_out_xyY_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_xyy.xyY_to_XYZ` definition
+        *out* argument support.
+        """
+
+        xyY = np.array([
+            [0.54369557, 0.32107944, 0.12197225],
+            [0.31270000, 0.00000000, 0.00000000],
+        ])
+        out = np.ones(xyY.shape)
+        XYZ = xyY_to_XYZ(xyY, out=out)
+        self.assertIs(XYZ, out)
+        np.testing.assert_almost_equal(XYZ, xyY_to_XYZ(xyY), decimal=7)
+        np.testing.assert_almost_equal(
+            XYZ,
+            np.array([
+                [0.20654008, 0.12197225, 0.05136952],
+                [0.00000000, 0.00000000, 0.00000000],
+            ]),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_xyY_to_XYZ(self):
         """
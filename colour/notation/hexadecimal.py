@@ -14,7 +14,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.models import eotf_inverse_sRGB, eotf_sRGB
-from colour.utilities import (as_float_array, from_range_1, normalise_maximum,
+from colour.utilities import (as_float_array, as_float_scalars, from_range_1,
+                              get_domain_range_scale, normalise_maximum,
                               to_domain_1, usage_warning)
 
 __author__ = 'Colour Developers'
@@ -27,6 +28,39 @@ __status__ = 'Production'
 __all__ = ['RGB_to_HEX', 'HEX_to_RGB']
 
 
+def _RGB_to_HEX_scalar(RGB):
+    """
+    Converts from single colour *RGB* colourspace to hexadecimal
+    representation using *float* scalars arithmetic.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    unicode or None
+        Hexadecimal representation or *None* if the given values are not a
+        single colour in domain [0, 1].
+    """
+
+    RGB = as_float_scalars(RGB)
+
+    if RGB is None:
+        return None
+
+    if get_domain_range_scale() == '100':
+        RGB = [C / 100 for C in RGB]
+
+    # The negative, over 1 and *nan* values are handled by the *ndarray* code
+    # path.
+    if not all(0 <= C <= 1 for C in RGB):
+        return None
+
+    return '#' + ''.join('{0:02x}'.format(int(C * 255)) for C in RGB)
+
+
 def RGB_to_HEX(RGB):
     """
     Converts from *RGB* colourspace to hexadecimal representation.
@@ -58,6 +92,10 @@ def RGB_to_HEX(RGB):
     '#aaddff'
     """
 
+    HEX = _RGB_to_HEX_scalar(RGB)
+    if HEX is not None:
+        return HEX
+
     RGB = to_domain_1(RGB)
 
     if np.any(RGB < 0):
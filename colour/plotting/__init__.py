@@ -58,6 +58,7 @@ from .temperature import (
     plot_planckian_locus_in_chromaticity_diagram_CIE1931,
     plot_planckian_locus_in_chromaticity_diagram_CIE1960UCS)
 from .volume import plot_RGB_colourspaces_gamuts, plot_RGB_scatter
+from .batch import PlotSpecification, plot_batch
 
 __all__ = []
 __all__ += datasets.__all__
@@ -118,6 +119,7 @@ __all__ += [
     'plot_planckian_locus_in_chromaticity_diagram_CIE1960UCS'
 ]
 __all__ += ['plot_RGB_colourspaces_gamuts', 'plot_RGB_scatter']
+__all__ += ['PlotSpecification', 'plot_batch']
 
 
 # ----------------------------------------------------------------------------#
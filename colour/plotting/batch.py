@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Plotting
+==============
+
+Defines the batch plotting objects:
+
+-   :class:`colour.plotting.PlotSpecification`
+-   :func:`colour.plotting.plot_batch`
+"""
+
+from __future__ import division
+
+import matplotlib.pyplot as plt
+import multiprocessing
+from collections import namedtuple
+from functools import partial
+from io import BytesIO
+
+from colour.plotting.common import (_enable_figures_reuse,
+                                    _disable_figures_reuse, _is_reused_figure)
+from colour.utilities import is_string, multiprocessing_pool
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['PlotSpecification', 'plot_batch']
+
+
+class PlotSpecification(
+        namedtuple('PlotSpecification', ('function', 'args', 'kwargs'))):
+    """
+    Defines a data structure for a plot specification rendered by the
+    :func:`colour.plotting.plot_batch` definition.
+
+    Parameters
+    ----------
+    function : callable or unicode
+        Plotting definition or name of a definition from the
+        :mod:`colour.plotting` sub-package, e.g.
+        *'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1931'*.
+    args : tuple, optional
+        Plotting definition arguments.
+    kwargs : dict, optional
+        Plotting definition keywords arguments.
+    """
+
+    def __new__(cls, function, args=None, kwargs=None):
+        """
+        Returns a new instance of the
+        :class:`colour.plotting.PlotSpecification` class.
+        """
+
+        return super(PlotSpecification, cls).__new__(
+            cls, function,
+            tuple(args) if args is not None else tuple(),
+            dict(kwargs) if kwargs is not None else dict())
+
+
+def _render_plot_specification(specification, image_format='png', **kwargs):
+    """
+    Renders given plot specification and returns the image bytes.
+
+    The definition is executed by the batch plotting worker processes which
+    are using the *Agg* backend and reuse their figures and canvas between
+    successive plot specifications.
+
+    Parameters
+    ----------
+    specification : PlotSpecification or tuple
+        Plot specification to render.
+    image_format : unicode, optional
+        Image format, e.g. *'png'* or *'svg'*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the :meth:`Figure.savefig` method.
+
+    Returns
+    -------
+    bytes
+        Rendered image bytes.
+    """
+
+    # NOTE: No coverage information is available when this code is executed
+    # in sub-processes.
+    if (multiprocessing.current_process().name != 'MainProcess' and
+            plt.get_backend().lower() != 'agg'):  # pragma: no cover
+        plt.switch_backend('agg')
+
+    _enable_figures_reuse()
+
+    if not isinstance(specification, PlotSpecification):
+        specification = PlotSpecification(*specification)
+
+    function = specification.function
+    if is_string(function):
+        import colour.plotting
+
+        function = getattr(colour.plotting, function)
+
+    settings = dict(specification.kwargs)
+    settings['standalone'] = False
+
+    figure, _axes = function(*specification.args, **settings)
+
+    buffer = BytesIO()
+    try:
+        figure.savefig(buffer, format=image_format, **kwargs)
+    finally:
+        if not _is_reused_figure(figure):
+            plt.close(figure)
+
+    return buffer.getvalue()
+
+
+def plot_batch(specifications,
+               image_format='png',
+               processes=None,
+               chunksize=1,
+               **kwargs):
+    """
+    Renders given plot specifications across a pool of worker processes and
+    yields the rendered image bytes, in the plot specifications order, as soon
+    as they are available.
+
+    Parameters
+    ----------
+    specifications : array_like
+        :class:`colour.plotting.PlotSpecification` class instances or
+        *(function, args, kwargs)* tuples to render.
+    image_format : unicode, optional
+        **{'png', 'svg', 'pdf', 'jpg', ...}**,
+        Image format, any format supported by the *Agg* backend
+        :meth:`Figure.savefig` method.
+    processes : int, optional
+        Worker processes count, default to the CPU count.
+    chunksize : int, optional
+        Plot specifications count sent at once to each worker process.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the :meth:`Figure.savefig` method, e.g.
+        ``dpi`` or ``transparent``.
+
+    Yields
+    ------
+    bytes
+        Rendered image bytes.
+
+    Notes
+    -----
+    -   The worker processes are using the *Agg* backend and reuse their
+        figures, canvas and precomputed diagram backgrounds between
+        successive plot specifications. When multiprocessing is disabled with
+        :class:`colour.utilities.disable_multiprocessing`, the plot
+        specifications are rendered serially in the current process with its
+        current backend.
+    -   The plotting definitions and their arguments must be picklable, the
+        plotting definitions can be given by name to that effect.
+
+    Examples
+    --------
+    >>> specifications = [
+    ...     PlotSpecification('plot_single_cmfs'),
+    ...     PlotSpecification(
+    ...         'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1931',
+    ...         (['ACEScg', 'sRGB'], )),
+    ... ]
+    >>> images = list(plot_batch(specifications))  # doctest: +SKIP
+    >>> images[0][:8]  # doctest: +SKIP
+    b'\\x89PNG\\r\\n\\x1a\\n'
+    """
+
+    try:
+        with multiprocessing_pool(processes) as pool:
+            for image in pool.imap(
+                    partial(
+                        _render_plot_specification,
+                        image_format=image_format,
+                        **kwargs),
+                    specifications,
+                    chunksize=chunksize):
+                yield image
+    finally:
+        _disable_figures_reuse()
@@ -367,6 +367,62 @@ class ColourSwatch(namedtuple('ColourSwatch', ('name', 'RGB'))):
         return super(ColourSwatch, cls).__new__(cls, name, RGB)
 
 
+_FIGURES_CACHE = None
+"""
+Reusable figures keyed by their size, populated by the :func:`artist`
+definition when figures reuse is enabled, e.g. by the batch plotting worker
+processes.
+
+_FIGURES_CACHE : dict
+"""
+
+
+def _enable_figures_reuse():
+    """
+    Enables figures reuse: the :func:`artist` definition will recycle
+    previously created figures, and their canvas, of the same size instead of
+    creating new ones.
+    """
+
+    global _FIGURES_CACHE
+
+    if _FIGURES_CACHE is None:
+        _FIGURES_CACHE = {}
+
+
+def _disable_figures_reuse():
+    """
+    Disables figures reuse and closes the cached figures.
+    """
+
+    global _FIGURES_CACHE
+
+    if _FIGURES_CACHE is not None:
+        for figure in _FIGURES_CACHE.values():
+            plt.close(figure)
+
+    _FIGURES_CACHE = None
+
+
+def _is_reused_figure(figure):
+    """
+    Returns whether given figure is a reused figure from the figures cache.
+
+    Parameters
+    ----------
+    figure : Figure
+        Figure to check.
+
+    Returns
+    -------
+    bool
+        Whether given figure is a reused figure.
+    """
+
+    return (_FIGURES_CACHE is not None and
+            any(figure is cached for cached in _FIGURES_CACHE.values()))
+
+
 def colour_cycle(**kwargs):
     """
     Returns a colour cycle iterator using given colour map.
@@ -423,7 +479,26 @@ def artist(**kwargs):
 
     axes = kwargs.get('axes')
     if axes is None:
-        figure = plt.figure(figsize=figure_size)
+        if _FIGURES_CACHE is None:
+            figure = plt.figure(figsize=figure_size)
+        else:
+            figure = _FIGURES_CACHE.get(figure_size)
+            if figure is None or not plt.fignum_exists(figure.number):
+                figure = _FIGURES_CACHE[figure_size] = plt.figure(
+                    figsize=figure_size)
+            else:
+                figure.clf()
+                # Resetting the state not covered by "Figure.clf" so that
+                # the reused figure renders identically to a new one.
+                figure.patch.set_alpha(None)
+                figure.subplots_adjust(
+                    **{
+                        parameter: plt.rcParams['figure.subplot.{0}'.format(
+                            parameter)]
+                        for parameter in ('left', 'bottom', 'right', 'top',
+                                          'wspace', 'hspace')
+                    })
+                plt.figure(figure.number)
 
         return figure, figure.gca()
     else:
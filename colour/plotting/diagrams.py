@@ -27,8 +27,9 @@ from colour.models import (Luv_to_uv, Luv_uv_to_xy, UCS_to_uv, UCS_uv_to_xy,
 from colour.plotting import (COLOUR_STYLE_CONSTANTS, COLOUR_ARROW_STYLE,
                              XYZ_to_plotting_colourspace, artist, filter_cmfs,
                              override_style, render)
-from colour.utilities import (domain_range_scale, first_item, is_string,
-                              normalise_maximum, tstack, suppress_warnings)
+from colour.utilities import (LRUCache, domain_range_scale, first_item,
+                              is_string, normalise_maximum, tstack,
+                              suppress_warnings)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 __author__ = 'Colour Developers'
@@ -48,6 +49,15 @@ __all__ = [
     'plot_sds_in_chromaticity_diagram_CIE1976UCS'
 ]
 
+_CHROMATICITY_DIAGRAM_COLOURS_CACHE = LRUCache(8)
+"""
+Cache of the chromatic diagram colours and spectral locus, keyed by the
+samples count, the method, the colour matching functions name and the
+plotting colourspace name and whitepoint.
+
+_CHROMATICITY_DIAGRAM_COLOURS_CACHE : LRUCache
+"""
+
 
 @override_style()
 def plot_spectral_locus(cmfs='CIE 1931 2 Degree Standard Observer',
@@ -250,6 +260,16 @@ def plot_chromaticity_diagram_colours(
     tuple
         Current figure and axes.
 
+    Warning
+    -------
+    -   The *Chromaticity Diagram* colours are cached in
+        :attr:`colour.plotting.diagrams._CHROMATICITY_DIAGRAM_COLOURS_CACHE`
+        attribute. Their identifier key is defined by the samples count, the
+        method, the colour matching functions name and the plotting
+        colourspace name and whitepoint. Using similar colour matching
+        functions names but with different spectral data will lead to
+        unexpected behaviour.
+
     Examples
     --------
     >>> plot_chromaticity_diagram_colours()  # doctest: +ELLIPSIS
@@ -271,32 +291,40 @@ def plot_chromaticity_diagram_colours(
 
     illuminant = COLOUR_STYLE_CONSTANTS.colour.colourspace.whitepoint
 
-    ii, jj = np.meshgrid(
-        np.linspace(0, 1, samples), np.linspace(1, 0, samples))
-    ij = tstack([ii, jj])
+    name_cdc = ', '.join((str(samples), method, cmfs.name,
+                          COLOUR_STYLE_CONSTANTS.colour.colourspace.name,
+                          str(illuminant))).lower()
+    if name_cdc in _CHROMATICITY_DIAGRAM_COLOURS_CACHE:
+        RGB, spectral_locus = _CHROMATICITY_DIAGRAM_COLOURS_CACHE[name_cdc]
+    else:
+        ii, jj = np.meshgrid(
+            np.linspace(0, 1, samples), np.linspace(1, 0, samples))
+        ij = tstack([ii, jj])
+
+        # NOTE: Various values in the grid have potential to generate
+        # zero-divisions, they could be avoided by perturbing the grid, e.g.
+        # adding a small epsilon. It was decided instead to disable warnings.
+        with suppress_warnings(python_warnings=True):
+            if method == 'CIE 1931':
+                XYZ = xy_to_XYZ(ij)
+                spectral_locus = XYZ_to_xy(cmfs.values, illuminant)
+            elif method == 'CIE 1960 UCS':
+                XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
+                spectral_locus = UCS_to_uv(XYZ_to_UCS(cmfs.values))
+            elif method == 'CIE 1976 UCS':
+                XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
+                spectral_locus = Luv_to_uv(
+                    XYZ_to_Luv(cmfs.values, illuminant), illuminant)
+            else:
+                raise ValueError(
+                    'Invalid method: "{0}", must be one of '
+                    '[\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\']'.
+                    format(method))
 
-    # NOTE: Various values in the grid have potential to generate
-    # zero-divisions, they could be avoided by perturbing the grid, e.g. adding
-    # a small epsilon. It was decided instead to disable warnings.
-    with suppress_warnings(python_warnings=True):
-        if method == 'CIE 1931':
-            XYZ = xy_to_XYZ(ij)
-            spectral_locus = XYZ_to_xy(cmfs.values, illuminant)
-        elif method == 'CIE 1960 UCS':
-            XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
-            spectral_locus = UCS_to_uv(XYZ_to_UCS(cmfs.values))
-        elif method == 'CIE 1976 UCS':
-            XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
-            spectral_locus = Luv_to_uv(
-                XYZ_to_Luv(cmfs.values, illuminant), illuminant)
-        else:
-            raise ValueError(
-                'Invalid method: "{0}", must be one of '
-                '[\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\']'.format(
-                    method))
-
-    RGB = normalise_maximum(
-        XYZ_to_plotting_colourspace(XYZ, illuminant), axis=-1)
+        RGB = normalise_maximum(
+            XYZ_to_plotting_colourspace(XYZ, illuminant), axis=-1)
+
+        _CHROMATICITY_DIAGRAM_COLOURS_CACHE[name_cdc] = RGB, spectral_locus
 
     polygon = Polygon(
         spectral_locus
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.plotting.batch` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from colour.plotting import (PlotSpecification, plot_batch, plot_single_cmfs,
+                             plot_RGB_colourspaces_gamuts)
+from colour.utilities import disable_multiprocessing
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestPlotSpecification', 'TestPlotBatch']
+
+
+class TestPlotSpecification(unittest.TestCase):
+    """
+    Defines :class:`colour.plotting.batch.PlotSpecification` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'args', 'kwargs')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlotSpecification))
+
+    def test__new__(self):
+        """
+        Tests :meth:`colour.plotting.batch.PlotSpecification.__new__` method.
+        """
+
+        specification = PlotSpecification('plot_single_cmfs')
+        self.assertTupleEqual(specification.args, tuple())
+        self.assertDictEqual(specification.kwargs, dict())
+
+        specification = PlotSpecification(plot_single_cmfs, ['CIE 2012'],
+                                          {'title': 'CMFS'})
+        self.assertTupleEqual(specification.args, ('CIE 2012', ))
+        self.assertDictEqual(specification.kwargs, {'title': 'CMFS'})
+
+
+class TestPlotBatch(unittest.TestCase):
+    """
+    Defines :func:`colour.plotting.batch.plot_batch` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._specifications = [
+            PlotSpecification('plot_single_cmfs'),
+            PlotSpecification(
+                'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1931',
+                (['ACEScg', 'sRGB'], ), {'title': 'Batch'}),
+            ('plot_chromaticity_diagram_CIE1931', (), {}),
+            PlotSpecification(plot_RGB_colourspaces_gamuts, (['sRGB'], )),
+        ]
+
+    def test_plot_batch(self):
+        """
+        Tests :func:`colour.plotting.batch.plot_batch` definition.
+        """
+
+        images = list(plot_batch(self._specifications, processes=2))
+        self.assertEqual(len(images), len(self._specifications))
+        for image in images:
+            self.assertTrue(image.startswith(b'\x89PNG'))
+
+        images = list(plot_batch(self._specifications[:1], 'svg', processes=1))
+        self.assertIn(b'<svg', images[0])
+
+    @disable_multiprocessing()
+    def test_plot_batch_serial(self):
+        """
+        Tests :func:`colour.plotting.batch.plot_batch` definition with
+        multiprocessing disabled.
+        """
+
+        images = list(plot_batch(self._specifications, dpi=50))
+        self.assertEqual(len(images), len(self._specifications))
+        for image in images:
+            self.assertTrue(image.startswith(b'\x89PNG'))
+
+        # Re-rendering a specification into a reused figure must be
+        # deterministic.
+        images = list(plot_batch(self._specifications[1:3] * 2))
+        self.assertEqual(images[0], images[2])
+        self.assertEqual(images[1], images[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
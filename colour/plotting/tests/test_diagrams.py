@@ -17,8 +17,9 @@ from colour.plotting import (plot_chromaticity_diagram_CIE1931,
                              plot_sds_in_chromaticity_diagram_CIE1960UCS,
                              plot_sds_in_chromaticity_diagram_CIE1976UCS)
 from colour.plotting.diagrams import (
-    plot_spectral_locus, plot_chromaticity_diagram_colours,
-    plot_chromaticity_diagram, plot_sds_in_chromaticity_diagram)
+    _CHROMATICITY_DIAGRAM_COLOURS_CACHE, plot_spectral_locus,
+    plot_chromaticity_diagram_colours, plot_chromaticity_diagram,
+    plot_sds_in_chromaticity_diagram)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -104,6 +105,14 @@ plot_chromaticity_diagram_colours` definition.
             ValueError,
             lambda: plot_chromaticity_diagram_colours(method='Undefined'))
 
+        for samples in range(
+                8, 8 + _CHROMATICITY_DIAGRAM_COLOURS_CACHE.maximum_size + 4):
+            plot_chromaticity_diagram_colours(samples, standalone=False)
+
+        self.assertEqual(
+            len(_CHROMATICITY_DIAGRAM_COLOURS_CACHE),
+            _CHROMATICITY_DIAGRAM_COLOURS_CACHE.maximum_size)
+
 
 class TestPlotChromaticityDiagram(unittest.TestCase):
     """
@@ -12,6 +12,8 @@ References
 
 from __future__ import absolute_import
 
+from functools import partial
+
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
                               filter_kwargs)
 
@@ -41,6 +43,41 @@ XYZ_TO_SD_METHODS : CaseInsensitiveMapping
 """
 
 
+def _XYZ_to_sd(function, XYZ, **kwargs):
+    """
+    Recovers the spectral distribution of given *CIE XYZ* tristimulus
+    values using given spectral distribution recovery definition.
+
+    Parameters
+    ----------
+    function : callable
+        Spectral distribution recovery definition from the
+        :attr:`colour.XYZ_TO_SD_METHODS` attribute.
+    XYZ : array_like
+        *CIE XYZ* tristimulus values to recover the spectral distribution
+        from.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the spectral distribution recovery definition.
+
+    Returns
+    -------
+    SpectralDistribution
+        Recovered spectral distribution.
+    """
+
+    a = as_float_array(XYZ)
+
+    if function is RGB_to_sd_Smits1999:
+        from colour.recovery.smits1999 import XYZ_to_RGB_Smits1999
+
+        a = XYZ_to_RGB_Smits1999(XYZ)
+
+    return function(a, **filter_kwargs(function, **kwargs))
+
+
 def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
     """
     Recovers the spectral distribution of given *CIE XYZ* tristimulus
@@ -181,16 +218,48 @@ def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
     array([ 0.1996032...,  0.1155770...,  0.0427866...])
     """
 
-    a = as_float_array(XYZ)
+    return _XYZ_to_sd(XYZ_TO_SD_METHODS[method], XYZ, **kwargs)
 
-    function = XYZ_TO_SD_METHODS[method]
 
-    if function is RGB_to_sd_Smits1999:
-        from colour.recovery.smits1999 import XYZ_to_RGB_Smits1999
+def get_XYZ_to_sd_function(method='Meng 2015', **kwargs):
+    """
+    Returns the spectral distribution recovery definition for given method,
+    with its supported keyword arguments bound, for repeated evaluations
+    without resolving the method and filtering the keyword arguments on each
+    call.
 
-        a = XYZ_to_RGB_Smits1999(XYZ)
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Meng 2015', 'Smits 1999'}**,
+        Computation method.
 
-    return function(a, **filter_kwargs(function, **kwargs))
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the spectral distribution recovery definition,
+        see :func:`colour.XYZ_to_sd` definition.
+
+    Returns
+    -------
+    callable
+        Spectral distribution recovery definition taking the *CIE XYZ*
+        tristimulus values as positional argument.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from colour.colorimetry import sd_to_XYZ_integration
+    >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+    >>> XYZ_to_sd_ = get_XYZ_to_sd_function('Smits 1999')
+    >>> sd = XYZ_to_sd_(XYZ)
+    >>> sd_to_XYZ_integration(sd) / 100  # doctest: +ELLIPSIS
+    array([ 0.1898927...,  0.1129773...,  0.0474656...])
+    """
+
+    function = XYZ_TO_SD_METHODS[method]
+
+    return partial(_XYZ_to_sd, function, **filter_kwargs(function, **kwargs))
 
 
-__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd']
+__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd', 'get_XYZ_to_sd_function']
@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import
 
+from functools import partial
+
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .cie_d import xy_to_CCT_CIE_D, CCT_to_xy_CIE_D
@@ -105,6 +107,46 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     return function(uv, **filter_kwargs(function, **kwargs))
 
 
+def get_uv_to_CCT_function(method='Ohno 2013', **kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` computation definition for given method, with its
+    supported keyword arguments bound, for repeated evaluations without
+    resolving the method and filtering the keyword arguments on each call.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Ohno 2013', 'Krystek 1985, 'Robertson 1968'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the correlated colour temperature
+        :math:`T_{cp}` and :math:`\\Delta_{uv}` computation definition, see
+        :func:`colour.uv_to_CCT` definition.
+
+    Returns
+    -------
+    callable
+        Definition taking the *CIE UCS* colourspace *uv* chromaticity
+        coordinates as positional argument.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> uv_to_CCT_ = get_uv_to_CCT_function('Robertson 1968')
+    >>> uv_to_CCT_(uv)  # doctest: +ELLIPSIS
+    array([  6.5068782...e+03,   3.2722434...e-03])
+    """
+
+    function = UV_TO_CCT_METHODS[method]
+
+    return partial(function, **filter_kwargs(function, **kwargs))
+
+
 CCT_TO_UV_METHODS = CaseInsensitiveMapping({
     'Krystek 1985': CCT_to_uv_Krystek1985,
     'Ohno 2013': CCT_to_uv_Ohno2013,
@@ -196,8 +238,48 @@ def CCT_to_uv(CCT_D_uv, method='Ohno 2013', **kwargs):
     return function(CCT_D_uv, **filter_kwargs(function, **kwargs))
 
 
-__all__ += ['UV_TO_CCT_METHODS', 'uv_to_CCT']
-__all__ += ['CCT_TO_UV_METHODS', 'CCT_to_uv']
+def get_CCT_to_uv_function(method='Ohno 2013', **kwargs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates computation
+    definition for given method, with its supported keyword arguments bound,
+    for repeated evaluations without resolving the method and filtering the
+    keyword arguments on each call.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Ohno 2013', 'Robertson 1968', 'Krystek 1985}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the *CIE UCS* colourspace *uv* chromaticity
+        coordinates computation definition, see :func:`colour.CCT_to_uv`
+        definition.
+
+    Returns
+    -------
+    callable
+        Definition taking the correlated colour temperature
+        :math:`T_{cp}`, :math:`\\Delta_{uv}` as positional argument.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> CCT_D_uv = np.array([6507.47380460, 0.00322335])
+    >>> CCT_to_uv_ = get_CCT_to_uv_function('Robertson 1968')
+    >>> CCT_to_uv_(CCT_D_uv)  # doctest: +ELLIPSIS
+    array([ 0.1978362...,  0.3121670...])
+    """
+
+    function = CCT_TO_UV_METHODS[method]
+
+    return partial(function, **filter_kwargs(function, **kwargs))
+
+
+__all__ += ['UV_TO_CCT_METHODS', 'uv_to_CCT', 'get_uv_to_CCT_function']
+__all__ += ['CCT_TO_UV_METHODS', 'CCT_to_uv', 'get_CCT_to_uv_function']
 
 XY_TO_CCT_METHODS = CaseInsensitiveMapping({
     'CIE Illuminant D Series': xy_to_CCT_CIE_D,
@@ -3,7 +3,7 @@
 from __future__ import absolute_import
 
 from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
-                              LazyCaseInsensitiveMapping)
+                              LazyCaseInsensitiveMapping, LRUCache)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
@@ -16,7 +16,8 @@ from .common import (
     from_range_100, from_range_degrees, from_range_int)
 from .array import (
     as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    set_float_precision, set_int_precision, as_namedtuple, closest_indexes,
+    as_float_scalars, get_float_precision, set_float_precision,
+    float_precision, set_int_precision, as_namedtuple, closest_indexes,
     closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
     row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
     linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full)
@@ -30,7 +31,7 @@ from .verbose import (
 
 __all__ = [
     'Lookup', 'Structure', 'CaseInsensitiveMapping',
-    'LazyCaseInsensitiveMapping'
+    'LazyCaseInsensitiveMapping', 'LRUCache'
 ]
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
@@ -47,11 +48,13 @@ __all__ += [
 ]
 __all__ += [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
-    'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones', 'full'
+    'as_float', 'as_float_scalars', 'get_float_precision',
+    'set_float_precision', 'float_precision', 'set_int_precision',
+    'as_namedtuple', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient', 'centroid',
+    'linear_conversion', 'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones',
+    'full'
 ]
 __all__ += ['metric_mse', 'metric_psnr']
 __all__ += [
@@ -19,6 +19,7 @@ numpy-fastest-way-of-computing-diagonal-for-each-row-of-a-2d-array/\
 
 from __future__ import division, unicode_literals
 
+import numbers
 import numpy as np
 import sys
 try:  # pragma: no cover
@@ -26,8 +27,10 @@ try:  # pragma: no cover
 except ImportError:  # pragma: no cover
     from collections.abc import Mapping
 
+import functools
 from contextlib import contextmanager
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE, EPSILON
+from colour.utilities.data_structures import ContextVar
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -38,11 +41,13 @@ __status__ = 'Production'
 
 __all__ = [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
-    'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones', 'full'
+    'as_float', 'as_float_scalars', 'get_float_precision',
+    'set_float_precision', 'float_precision', 'set_int_precision',
+    'as_namedtuple', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient', 'centroid',
+    'linear_conversion', 'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones',
+    'full'
 ]
 
 
@@ -55,8 +60,9 @@ def as_array(a, dtype=None):
     a : object
         Variable to convert.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
 
     Returns
     -------
@@ -72,7 +78,7 @@ def as_array(a, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     return np.asarray(a, dtype)
 
@@ -119,8 +125,9 @@ def as_float_array(a, dtype=None):
     a : object
         Variable to convert.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
 
     Returns
     -------
@@ -134,7 +141,7 @@ def as_float_array(a, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     assert dtype in np.sctypes['float'], (
         '"dtype" must be one of the following types: {0}'.format(
@@ -153,8 +160,9 @@ def as_numeric(a, dtype=None):
     a : object
         Variable to convert.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
 
     Returns
     -------
@@ -170,7 +178,7 @@ def as_numeric(a, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     try:
         return dtype(a)
@@ -263,7 +271,7 @@ def as_float(a, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     assert dtype in np.sctypes['float'], (
         '"dtype" must be one of the following types: {0}'.format(
@@ -272,6 +280,108 @@ def as_float(a, dtype=None):
     return dtype(a)
 
 
+def as_float_scalars(a, size=3):
+    """
+    Converts given single colour :math:`a` variable to a tuple of *float*
+    scalars.
+
+    The definition is used by the single colour fast paths of the most
+    frequently called conversion definitions: their *ndarray* overhead
+    exceeds by far the cost of the arithmetic on a single colour.
+
+    Parameters
+    ----------
+    a : object
+        Variable to convert.
+    size : int, optional
+        Expected components count.
+
+    Returns
+    -------
+    tuple or None
+        *float* scalars or *None* if :math:`a` is not a sequence or *ndarray*
+        of real numbers with given components count, or if the current
+        *Colour* float precision is not *np.float64*.
+
+    Examples
+    --------
+    >>> as_float_scalars(np.array([0.25, 0.5, 1]))
+    (0.25, 0.5, 1.0)
+    >>> as_float_scalars([0.25, 0.5], 2)
+    (0.25, 0.5)
+    >>> as_float_scalars(np.array([[0.25, 0.5, 1]])) is None
+    True
+    """
+
+    if get_float_precision() != np.float64:
+        return None
+
+    if isinstance(a, np.ndarray):
+        if a.shape != (size, ) or a.dtype.kind not in 'fiu':
+            return None
+
+        a = a.tolist()
+    elif not isinstance(a, (list, tuple)) or len(a) != size:
+        return None
+    elif not all(isinstance(x, numbers.Real) for x in a):
+        return None
+
+    return tuple(map(float, a))
+
+
+_FLOAT_PRECISION = ContextVar('_FLOAT_PRECISION', default=None)
+"""
+Context-local variable storing the *Colour* float precision set with the
+:class:`colour.utilities.float_precision` class, *None* if the
+:attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute type is used.
+
+_FLOAT_PRECISION : ContextVar
+"""
+
+_FLOAT_PRECISION_TOKENS = ContextVar('_FLOAT_PRECISION_TOKENS', default=())
+"""
+Context-local stack of the tokens returned when the
+:class:`colour.utilities.float_precision` class sets the float precision, used
+to restore the previous float precision of the same thread and *asyncio* task
+upon exit.
+
+_FLOAT_PRECISION_TOKENS : ContextVar
+"""
+
+
+def get_float_precision():
+    """
+    Returns the current *Colour* float precision, i.e. the type used by
+    :func:`colour.utilities.as_float_array` definition and related
+    definitions when no type is given.
+
+    Returns
+    -------
+    type
+        *Colour* float precision.
+
+    Notes
+    -----
+    -   The float precision set with the
+        :class:`colour.utilities.float_precision` class is local to the current
+        thread and *asyncio* task, it takes precedence over the
+        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute type set with
+        :func:`colour.utilities.set_float_precision` definition.
+
+    Examples
+    --------
+    >>> get_float_precision()
+    <class 'numpy.float64'>
+    >>> with float_precision(np.float32):
+    ...     get_float_precision()
+    <class 'numpy.float32'>
+    """
+
+    dtype = _FLOAT_PRECISION.get()
+
+    return DEFAULT_FLOAT_DTYPE if dtype is None else dtype
+
+
 def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
     """
     Sets *Colour* float precision by setting
@@ -309,8 +419,8 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
     dtype('float64')
     """
 
-    for name, module in sys.modules.items():
-        if not name.startswith(name):
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('colour'):
             continue
 
         if not hasattr(module, 'DEFAULT_FLOAT_DTYPE'):
@@ -319,6 +429,101 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
         setattr(module, 'DEFAULT_FLOAT_DTYPE', dtype)
 
 
+class float_precision(object):
+    """
+    A context manager and decorator temporarily setting *Colour* float
+    precision in the current thread and *asyncio* task.
+
+    Parameters
+    ----------
+    dtype : object
+        **{np.float16, np.float32, np.float64}**,
+        Float type to use, e.g. the type of the processed image.
+
+    Notes
+    -----
+    -   Under *np.float32* precision, the input arrays, the constant matrices
+        and the computations of the colour models conversions, the transfer
+        functions, the interpolators and the *LUT* classes are using
+        *np.float32*, halving the memory bandwidth compared to *np.float64*.
+        The *scipy* based :class:`colour.CubicSplineInterpolator` and
+        :class:`colour.PchipInterpolator` classes are computing with
+        *np.float64*.
+    -   *np.float32* has a machine epsilon of :math:`1.19 \\times 10^{-7}`.
+        The error relative to the values range of the colour models
+        conversions and transfer functions is typically lower than
+        :math:`10^{-5}`, e.g. :math:`5 \\times 10^{-7}` for
+        :func:`colour.XYZ_to_Lab` definition and :math:`3 \\times 10^{-6}`
+        for :func:`colour.XYZ_to_sRGB` definition. The definitions based on
+        *SMPTE ST 2084:2014* transfer function, e.g.
+        :func:`colour.RGB_to_ICTCP` and :func:`colour.XYZ_to_JzAzBz`
+        definitions, reach :math:`10^{-4}` because of its large exponents.
+        Quantities computed from the difference of close values, e.g. the hue
+        angle of near neutral colours, can exhibit larger errors.
+    -   *np.float16* has a machine epsilon of :math:`9.77 \\times 10^{-4}`
+        and is only suitable for storage: computations might overflow or lose
+        most of their precision.
+
+    Examples
+    --------
+    >>> with float_precision(np.float32):
+    ...     as_float_array([0.5, 0.25]).dtype
+    dtype('float32')
+    >>> as_float_array([0.5, 0.25]).dtype
+    dtype('float64')
+    >>> @float_precision(np.float16)
+    ... def fn(a):
+    ...     return as_float_array(a).dtype
+    >>> fn([0.5, 0.25])
+    dtype('float16')
+    """
+
+    def __init__(self, dtype):
+        dtype = np.dtype(dtype).type
+
+        assert dtype in np.sctypes['float'], (
+            '"dtype" must be one of the following types: {0}'.format(
+                np.sctypes['float']))
+
+        self._dtype = dtype
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        # NOTE: The tokens are stored in a context-local stack rather than on
+        # the instance so that it can be entered concurrently and
+        # recursively.
+        token = _FLOAT_PRECISION.set(self._dtype)
+        _FLOAT_PRECISION_TOKENS.set(_FLOAT_PRECISION_TOKENS.get() + (token, ))
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        tokens = _FLOAT_PRECISION_TOKENS.get()
+        _FLOAT_PRECISION_TOKENS.set(tokens[:-1])
+        _FLOAT_PRECISION.reset(tokens[-1])
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # NOTE: A new context manager is used for each call so that the
+            # decorator can be called concurrently and recursively.
+            with float_precision(self._dtype):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
 def set_int_precision(dtype=DEFAULT_INT_DTYPE):
     """
     Sets *Colour* integer precision by setting
@@ -356,8 +561,8 @@ def set_int_precision(dtype=DEFAULT_INT_DTYPE):
     """
 
     # TODO: Investigate behaviour on Windows.
-    for name, module in sys.modules.items():
-        if not name.startswith(name):
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('colour'):
             continue
 
         if not hasattr(module, 'DEFAULT_INT_DTYPE'):
@@ -634,7 +839,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a, dtype=None):
+def tstack(a, dtype=None, out=None, copy=True):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -647,6 +852,15 @@ def tstack(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    out : ndarray, optional
+        Array the stacked arrays are written into, its last axis must match
+        the count of arrays to stack. The arrays are written without any
+        intermediate allocation and ``out`` is returned.
+    copy : bool, optional
+        Whether to return a new array. If *False* and ``a`` is an *ndarray*
+        of the given type, e.g. an array returned by
+        :func:`colour.utilities.tsplit` definition, a strided view on ``a`` is
+        returned instead.
 
     Returns
     -------
@@ -681,17 +895,33 @@ def tstack(a, dtype=None):
              [ 3.,  3.,  3.],
              [ 4.,  4.,  4.],
              [ 5.,  5.,  5.]]]])
+    >>> a = np.arange(0, 3)
+    >>> b = np.empty((3, 3))
+    >>> tstack([a, a, a], out=b) is b
+    True
+    >>> a = np.reshape(np.arange(0, 6.0), (3, 2))
+    >>> np.may_share_memory(tstack(a, copy=False), a)
+    True
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
-    a = as_array(a, dtype)
+    if out is None:
+        if not copy and isinstance(a, np.ndarray):
+            a = as_array(a, dtype)
+
+            return a.transpose(tuple(range(1, a.ndim)) + (0, ))
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+        out = np.empty(np.shape(a[0]) + (len(a), ), dtype)
 
+    for i, x in enumerate(a):
+        out[..., i] = x
 
-def tsplit(a, dtype=None):
+    return out
+
+
+def tsplit(a, dtype=None, copy=True):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -702,6 +932,10 @@ def tsplit(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    copy : bool, optional
+        Whether to return a new array. If *False*, a strided view on ``a``
+        is returned whenever it does not require a type conversion, writing
+        into the view writes into ``a``.
 
     Returns
     -------
@@ -738,13 +972,19 @@ def tsplit(a, dtype=None):
            [[ 0.,  1.,  2.,  3.,  4.,  5.]],
     <BLANKLINE>
            [[ 0.,  1.,  2.,  3.,  4.,  5.]]])
+    >>> a = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    >>> np.may_share_memory(tsplit(a, copy=False), a)
+    True
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = as_array(a, dtype)
 
+    if not copy:
+        return a.transpose((a.ndim - 1, ) + tuple(range(a.ndim - 1)))
+
     return np.array([a[..., x] for x in range(a.shape[-1])])
 
 
@@ -801,7 +1041,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -809,12 +1049,18 @@ def dot_vector(m, v):
     It performs the dot product of two arrays where *m* parameter is expected
     to be an array of 3x3 matrices and parameter *v* an array of vectors.
 
+    A single matrix *m*, the most common case, is applied with
+    :func:`np.matmul` which is significantly faster than :func:`np.einsum`
+    on large arrays of vectors.
+
     Parameters
     ----------
     m : array_like
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array the dot product is written into, it may be *v* itself.
 
     Returns
     -------
@@ -842,7 +1088,22 @@ def dot_vector(m, v):
     m = as_float_array(m)
     v = as_float_array(v)
 
-    return np.einsum('...ij,...j->...i', m, v)
+    # NOTE: :func:`np.einsum` does not buffer its operands, an output array
+    # sharing memory with *v* would be read after being partially written.
+    if out is not None and np.may_share_memory(out, v):
+        out[...] = dot_vector(m, v)
+
+        return out
+
+    if m.ndim == 2:
+        return np.matmul(v, m.T, out=out)
+
+    if out is None:
+        return np.einsum('...ij,...j->...i', m, v)
+
+    np.einsum('...ij,...j->...i', m, v, out=out, casting='same_kind')
+
+    return out
 
 
 def dot_matrix(a, b):
@@ -861,8 +1122,9 @@ def dot_matrix(a, b):
     b : array_like
         Array of 3x3 matrices.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
 
     Returns
     -------
@@ -1163,8 +1425,9 @@ def zeros(shape, dtype=None, order='C'):
     shape : int or array_like
         Shape of the new array, e.g., ``(2, 3)`` or ``2``.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
     order : unicode, optional
         {'C', 'F'},
         Whether to store multi-dimensional data in row-major
@@ -1183,7 +1446,7 @@ def zeros(shape, dtype=None, order='C'):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     return np.zeros(shape, dtype, order)
 
@@ -1199,8 +1462,9 @@ def ones(shape, dtype=None, order='C'):
     shape : int or array_like
         Shape of the new array, e.g., ``(2, 3)`` or ``2``.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
     order : unicode, optional
         {'C', 'F'},
         Whether to store multi-dimensional data in row-major
@@ -1219,7 +1483,7 @@ def ones(shape, dtype=None, order='C'):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     return np.ones(shape, dtype, order)
 
@@ -1237,8 +1501,9 @@ def full(shape, fill_value, dtype=None, order='C'):
     fill_value : numeric
         Fill value.
     dtype : object
-        Type to use for conversion, default to the type defined by the
-        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+        Type to use for conversion, default to the current *Colour* float
+        precision, see :func:`colour.utilities.get_float_precision`
+        definition.
     order : unicode, optional
         {'C', 'F'},
         Whether to store multi-dimensional data in row-major
@@ -1257,6 +1522,6 @@ def full(shape, fill_value, dtype=None, order='C'):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     return np.full(shape, fill_value, dtype, order)
@@ -24,13 +24,15 @@ import numpy as np
 import re
 import six
 import warnings
+import weakref
 from contextlib import contextmanager
 from collections import OrderedDict
-from copy import copy
 from six import integer_types, string_types
 
-from colour.constants import INTEGER_THRESHOLD, DEFAULT_FLOAT_DTYPE
+from colour.constants import INTEGER_THRESHOLD
 from colour.utilities import Lookup
+from colour.utilities.array import _FLOAT_PRECISION, get_float_precision
+from colour.utilities.data_structures import ContextVar
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -219,7 +221,7 @@ def _initializer(kwargs):
     """
     Initializer for the multiprocessing pool. It is mainly use to ensure that
     processes on *Windows* correctly inherit from the current domain-range
-    scale.
+    scale and float precision.
 
     Parameters
     ----------
@@ -227,11 +229,13 @@ def _initializer(kwargs):
         Initialisation arguments.
     """
 
-    global _DOMAIN_RANGE_SCALE
-
     # NOTE: No coverage information is available as this code is executed in
     # sub-processes.
-    _DOMAIN_RANGE_SCALE = kwargs.get('scale', 'reference')  # pragma: no cover
+    scale = kwargs.get('scale', 'reference')  # pragma: no cover
+    _DOMAIN_RANGE_SCALE.set(scale)  # pragma: no cover
+
+    precision = kwargs.get('precision')  # pragma: no cover
+    _FLOAT_PRECISION.set(precision)  # pragma: no cover
 
 
 @contextmanager
@@ -272,6 +276,13 @@ def multiprocessing_pool(*args, **kwargs):
         def __init__(self, *args, **kwargs):
             pass
 
+        def apply(self, func, args=(), kwds=None):
+            """
+            Calls given function with given arguments.
+            """
+
+            return func(*args, **({} if kwds is None else kwds))
+
         def map(self, func, iterable, chunksize=None):
             """
             Applies given function to each element of given iterable.
@@ -279,6 +290,13 @@ def multiprocessing_pool(*args, **kwargs):
 
             return [func(a) for a in iterable]
 
+        def imap(self, func, iterable, chunksize=1):
+            """
+            Lazily applies given function to each element of given iterable.
+            """
+
+            return (func(a) for a in iterable)
+
         def terminate(self):
             """
             Terminate the process.
@@ -287,7 +305,10 @@ def multiprocessing_pool(*args, **kwargs):
             pass
 
     kwargs['initializer'] = _initializer
-    kwargs['initargs'] = ({'scale': get_domain_range_scale()}, )
+    kwargs['initargs'] = ({
+        'scale': get_domain_range_scale(),
+        'precision': get_float_precision()
+    }, )
 
     if _MULTIPROCESSING_ENABLED:
         pool_factory = multiprocessing.Pool
@@ -557,6 +578,18 @@ def is_sibling(element, mapping):
         element, tuple(set(type(element) for element in mapping.values())))
 
 
+_FILTER_KWARGS_CACHE = weakref.WeakKeyDictionary()
+"""
+Cache of the keyword arguments names accepted by the functions given to the
+:func:`colour.utilities.filter_kwargs` definition, weakly keyed by the
+function, or the underlying function of bound methods, so that the cache does
+not keep them alive, then by whether the function is bound and the keyword
+arguments names.
+
+_FILTER_KWARGS_CACHE : WeakKeyDictionary
+"""
+
+
 def filter_kwargs(function, **kwargs):
     """
     Filters keyword arguments incompatible with the given function signature.
@@ -598,25 +631,41 @@ def filter_kwargs(function, **kwargs):
     (1, 2, 3)
     """
 
-    kwargs = copy(kwargs)
+    if not kwargs:
+        return kwargs
 
-    # TODO: Remove when dropping Python 2.7.
-    if six.PY2:  # pragma: no cover
-        try:
-            args, _varargs, _keywords, _defaults = inspect.getargspec(function)
-        except (TypeError, ValueError):
-            return {}
-    else:  # pragma: no cover
+    # NOTE: The *partial* functions are not cached as they are typically
+    # created for each call and would never be hit.
+    cache = args = None
+    key = (hasattr(function, '__func__'), frozenset(kwargs.keys()))
+    if not isinstance(function, functools.partial):
         try:
-            args = list(inspect.signature(function).parameters.keys())
-        except ValueError:
-            return {}
+            cache = _FILTER_KWARGS_CACHE.setdefault(
+                getattr(function, '__func__', function), {})
+            args = cache.get(key)
+        except TypeError:
+            pass
 
-    args = set(kwargs.keys()) - set(args)
-    for key in args:
-        kwargs.pop(key)
+    if args is None:
+        # TODO: Remove when dropping Python 2.7.
+        if six.PY2:  # pragma: no cover
+            try:
+                args, _varargs, _keywords, _defaults = inspect.getargspec(
+                    function)
+            except (TypeError, ValueError):
+                args = []
+        else:  # pragma: no cover
+            try:
+                args = list(inspect.signature(function).parameters.keys())
+            except ValueError:
+                args = []
 
-    return kwargs
+        args = frozenset(kwargs.keys()).intersection(args)
+
+        if cache is not None:
+            cache[key] = args
+
+    return dict((key, value) for key, value in kwargs.items() if key in args)
 
 
 def filter_mapping(mapping, filterers, anchors=True, flags=re.IGNORECASE):
@@ -739,11 +788,23 @@ def first_item(a):
     return next(iter(a))
 
 
-_DOMAIN_RANGE_SCALE = 'reference'
+_DOMAIN_RANGE_SCALE = ContextVar('_DOMAIN_RANGE_SCALE', default='reference')
 """
-Global variable storing the current *Colour* domain-range scale.
+Context-local variable storing the current *Colour* domain-range scale, each
+thread and *asyncio* task has its own domain-range scale.
 
-_DOMAIN_RANGE_SCALE : unicode
+_DOMAIN_RANGE_SCALE : ContextVar
+"""
+
+_DOMAIN_RANGE_SCALE_TOKENS = ContextVar(
+    '_DOMAIN_RANGE_SCALE_TOKENS', default=())
+"""
+Context-local stack of the tokens returned when the
+:class:`colour.utilities.domain_range_scale` class sets the domain-range scale,
+used to restore the previous domain-range scale of the same thread and
+*asyncio* task upon exit.
+
+_DOMAIN_RANGE_SCALE_TOKENS : ContextVar
 """
 
 
@@ -764,9 +825,14 @@ def get_domain_range_scale():
     -------
     unicode
         *Colour* domain-range scale.
+
+    Notes
+    -----
+    -   The domain-range scale is local to the current thread and *asyncio*
+        task, new threads start with the **'Reference'** domain-range scale.
     """
 
-    return _DOMAIN_RANGE_SCALE
+    return _DOMAIN_RANGE_SCALE.get()
 
 
 def set_domain_range_scale(scale='Reference'):
@@ -787,15 +853,38 @@ def set_domain_range_scale(scale='Reference'):
     scale : unicode or int
         **{'Reference', '1'}**,
         *Colour* domain-range scale to set.
+
+    Notes
+    -----
+    -   The domain-range scale is only set for the current thread and
+        *asyncio* task.
     """
 
-    global _DOMAIN_RANGE_SCALE
+    _set_domain_range_scale(scale)
+
+
+def _set_domain_range_scale(scale):
+    """
+    Sets the current *Colour* domain-range scale and returns the token
+    allowing to restore the previous one.
+
+    Parameters
+    ----------
+    scale : unicode or int
+        **{'Reference', '1'}**,
+        *Colour* domain-range scale to set.
+
+    Returns
+    -------
+    Token
+        Token restoring the previous domain-range scale.
+    """
 
     scale = str(scale).lower()
     valid = ('1', '100', 'reference', 'ignore')
     assert scale in valid, 'Scale must be one of "{0}".'.format(valid)
 
-    _DOMAIN_RANGE_SCALE = scale
+    return _DOMAIN_RANGE_SCALE.set(scale)
 
 
 class domain_range_scale(object):
@@ -820,14 +909,18 @@ class domain_range_scale(object):
 
     def __init__(self, scale):
         self._scale = scale
-        self._previous_scale = get_domain_range_scale()
 
     def __enter__(self):
         """
         Called upon entering the context manager and decorator.
         """
 
-        set_domain_range_scale(self._scale)
+        # NOTE: The tokens are stored in a context-local stack rather than on
+        # the instance so that it can be entered concurrently and
+        # recursively.
+        token = _set_domain_range_scale(self._scale)
+        _DOMAIN_RANGE_SCALE_TOKENS.set(_DOMAIN_RANGE_SCALE_TOKENS.get() +
+                                       (token, ))
 
         return self
 
@@ -836,7 +929,9 @@ class domain_range_scale(object):
         Called upon exiting the context manager and decorator.
         """
 
-        set_domain_range_scale(self._previous_scale)
+        tokens = _DOMAIN_RANGE_SCALE_TOKENS.get()
+        _DOMAIN_RANGE_SCALE_TOKENS.set(tokens[:-1])
+        _DOMAIN_RANGE_SCALE.reset(tokens[-1])
 
     def __call__(self, function):
         """
@@ -845,7 +940,9 @@ class domain_range_scale(object):
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            with self:
+            # NOTE: A new context manager is used for each call so that the
+            # decorator can be called concurrently and recursively.
+            with domain_range_scale(self._scale):
                 return function(*args, **kwargs)
 
         return wrapper
@@ -900,11 +997,11 @@ def to_domain_1(a, scale_factor=100, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor
 
     return a
@@ -961,14 +1058,14 @@ def to_domain_10(a, scale_factor=10, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor
 
     return a
@@ -1023,11 +1120,11 @@ def to_domain_100(a, scale_factor=100, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
     return a
@@ -1084,14 +1181,14 @@ def to_domain_degrees(a, scale_factor=360, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor / 100
 
     return a
@@ -1152,15 +1249,15 @@ def to_domain_int(a, bit_depth=8, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     a = np.asarray(a, dtype).copy()
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= maximum_code_value / 100
 
     return a
@@ -1211,7 +1308,7 @@ def from_range_1(a, scale_factor=100):
     100
     """
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor
 
     return a
@@ -1264,10 +1361,10 @@ def from_range_10(a, scale_factor=10):
     10
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor
 
     return a
@@ -1318,7 +1415,7 @@ def from_range_100(a, scale_factor=100):
     1
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
     return a
@@ -1371,10 +1468,10 @@ def from_range_degrees(a, scale_factor=360):
     0.2777777...
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor / 100
 
     return a
@@ -1434,14 +1531,14 @@ def from_range_int(a, bit_depth=8, dtype=None):
     """
 
     if dtype is None:
-        dtype = DEFAULT_FLOAT_DTYPE
+        dtype = get_float_precision()
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a = np.asarray(a, dtype)
         a /= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a = np.asarray(a, dtype)
         a /= maximum_code_value / 100
 
@@ -14,6 +14,8 @@ Defines various data structures classes:
 -   :class:`colour.utilities.LazyCaseInsensitiveMapping`: Another case
     insensitive mapping allowing lazy values retrieving from keys while
     ignoring the key case.
+-   :class:`colour.utilities.LRUCache`: A mapping bounded in size discarding
+    its least recently used items.
 
 References
 ----------
@@ -30,6 +32,9 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
+import threading
+from collections import OrderedDict
+
 try:  # pragma: no cover
     from collections import Mapping, MutableMapping
 except ImportError:  # pragma: no cover
@@ -44,7 +49,7 @@ __status__ = 'Production'
 
 __all__ = [
     'Structure', 'Lookup', 'CaseInsensitiveMapping',
-    'LazyCaseInsensitiveMapping'
+    'LazyCaseInsensitiveMapping', 'LRUCache'
 ]
 
 
@@ -467,3 +472,358 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
             super(LazyCaseInsensitiveMapping, self).__setitem__(item, value)
 
         return value
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a thread-safe mutable mapping / *dict* object bounded in size
+    and discarding its least recently used items when full.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum items count stored into the mapping.
+
+    Attributes
+    ----------
+    maximum_size
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __contains__
+    __iter__
+    __len__
+    __repr__
+    get
+    clear
+
+    Examples
+    --------
+    >>> cache = LRUCache(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a']
+    1
+    >>> cache['c'] = 3
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    """
+
+    def __init__(self, maximum_size=128):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._maximum_size = None
+        self.maximum_size = maximum_size
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum items count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum items count with.
+
+        Returns
+        -------
+        int
+            Maximum items count.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self.maximum_size** property.
+        """
+
+        assert value > 0, '"maximum_size" must be greater than 0!'
+
+        with self._lock:
+            self._maximum_size = int(value)
+
+            while len(self._data) > self._maximum_size:
+                self._data.popitem(last=False)
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value, the least recently used item is
+        discarded if the mapping is full.
+
+        Parameters
+        ----------
+        item : object
+            Attribute.
+        value : object
+            Value.
+        """
+
+        with self._lock:
+            self._data.pop(item, None)
+            self._data[item] = value
+
+            while len(self._data) > self._maximum_size:
+                self._data.popitem(last=False)
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item and marks it as the most recently used
+        item.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        with self._lock:
+            value = self._data.pop(item)
+            self._data[item] = value
+
+            return value
+
+    def __delitem__(self, item):
+        """
+        Deletes given item.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+        """
+
+        with self._lock:
+            del self._data[item]
+
+    def __contains__(self, item):
+        """
+        Returns if the mapping contains given item.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        bool
+            Is item in mapping.
+        """
+
+        return item in self._data
+
+    def __iter__(self):
+        """
+        Iterates over the items names, from the least to the most recently
+        used.
+
+        Returns
+        -------
+        generator
+            Item names.
+        """
+
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def __len__(self):
+        """
+        Returns the items count.
+
+        Returns
+        -------
+        int
+            Items count.
+        """
+
+        return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns the mapping representation.
+
+        Returns
+        -------
+        unicode
+            Mapping representation.
+        """
+
+        return '{0}({1}, {2})'.format(self.__class__.__name__,
+                                      self._maximum_size, dict(self._data))
+
+    def get(self, item, default=None):
+        """
+        Returns the value of given item if it exists, otherwise given default
+        value.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+        default : object, optional
+            Default value.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        with self._lock:
+            try:
+                return self[item]
+            except KeyError:
+                return default
+
+    def clear(self):
+        """
+        Removes all the items.
+        """
+
+        with self._lock:
+            self._data.clear()
+
+
+_THREAD_LOCAL_VARIABLES = set()
+"""
+Thread-local variables captured by the :func:`copy_context` definition when
+the :mod:`contextvars` module is not available.
+
+_THREAD_LOCAL_VARIABLES : set
+"""
+
+
+class _ThreadLocalVariable(threading.local):
+    """
+    A thread-local variable exposing a subset of the
+    :class:`contextvars.ContextVar` class interface, used when the
+    :mod:`contextvars` module is not available.
+
+    Parameters
+    ----------
+    name : unicode
+        Variable name.
+    default : object
+        Variable default value in each thread.
+    """
+
+    def __init__(self, name, default=None):
+        self.name = name
+        self._value = default
+
+        _THREAD_LOCAL_VARIABLES.add(self)
+
+    def get(self):
+        """
+        Returns the variable value in the current thread.
+
+        Returns
+        -------
+        object
+            Variable value.
+        """
+
+        return self._value
+
+    def set(self, value):
+        """
+        Sets the variable value in the current thread.
+
+        Parameters
+        ----------
+        value : object
+            Variable value.
+
+        Returns
+        -------
+        tuple
+            Token storing the previous variable value, to be given to the
+            :meth:`_ThreadLocalVariable.reset` method.
+        """
+
+        token = (self, self._value)
+        self._value = value
+
+        return token
+
+    def reset(self, token):
+        """
+        Resets the variable value in the current thread to the value it had
+        before the :meth:`_ThreadLocalVariable.set` method call that returned
+        given token.
+
+        Parameters
+        ----------
+        token : tuple
+            Token returned by the :meth:`_ThreadLocalVariable.set` method.
+        """
+
+        variable, value = token
+
+        assert variable is self, ('Token was created by a different variable!')
+
+        self._value = value
+
+
+class _ThreadLocalContext(object):
+    """
+    A snapshot of the thread-local variables values exposing a subset of the
+    :class:`contextvars.Context` class interface, used when the
+    :mod:`contextvars` module is not available.
+    """
+
+    def __init__(self):
+        self._values = [(variable, variable.get())
+                        for variable in _THREAD_LOCAL_VARIABLES]
+
+    def run(self, callable_, *args, **kwargs):
+        """
+        Calls given callable with the thread-local variables set to the
+        snapshot values in the current thread, the previous values are
+        restored afterwards.
+
+        Parameters
+        ----------
+        callable_ : callable
+            Callable to call.
+
+        Other Parameters
+        ----------------
+        \\*args : list, optional
+            Arguments.
+        \\**kwargs : dict, optional
+            Keywords arguments.
+
+        Returns
+        -------
+        object
+            Callable return value.
+        """
+
+        previous_values = [(variable, variable.get())
+                           for variable, _value in self._values]
+        try:
+            for variable, value in self._values:
+                variable.set(value)
+
+            return callable_(*args, **kwargs)
+        finally:
+            for variable, value in previous_values:
+                variable.set(value)
+
+
+try:  # pragma: no cover
+    from contextvars import ContextVar, copy_context
+except ImportError:  # pragma: no cover
+    ContextVar = _ThreadLocalVariable
+    copy_context = _ThreadLocalContext
@@ -508,6 +508,9 @@ def handle_arguments_deprecation(changes, **kwargs):
 'argument_2_new_name': True}
     """
 
+    if not kwargs:
+        return kwargs
+
     changes = build_API_changes(changes)
 
     for kwarg in kwargs.copy():
@@ -6,13 +6,15 @@ Defines unit tests for :mod:`colour.utilities.array` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import threading
 import unittest
 from collections import namedtuple
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (
     as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    set_float_precision, set_int_precision, as_namedtuple, closest_indexes,
+    as_float_scalars, get_float_precision, set_float_precision,
+    float_precision, set_int_precision, as_namedtuple, closest_indexes,
     closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
     row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
     linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full)
@@ -27,7 +29,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestAsArray', 'TestAsIntArray', 'TestAsFloatArray', 'TestAsNumeric',
-    'TestAsInt', 'TestAsFloat', 'TestSetFloatPrecision', 'TestSetIntPrecision',
+    'TestAsInt', 'TestAsFloat', 'TestAsFloatScalars', 'TestGetFloatPrecision',
+    'TestSetFloatPrecision', 'TestFloatPrecision', 'TestSetIntPrecision',
     'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
     'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
     'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
@@ -166,6 +169,65 @@ class TestAsFloat(unittest.TestCase):
         self.assertIsInstance(as_float(1), DEFAULT_FLOAT_DTYPE)
 
 
+class TestAsFloatScalars(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_float_scalars` definition unit
+    tests methods.
+    """
+
+    def test_as_float_scalars(self):
+        """
+        Tests :func:`colour.utilities.array.as_float_scalars` definition.
+        """
+
+        self.assertTupleEqual(
+            as_float_scalars(np.array([0.25, 0.5, 1])), (0.25, 0.5, 1.0))
+
+        self.assertTupleEqual(as_float_scalars([1, 2, 3]), (1.0, 2.0, 3.0))
+
+        self.assertTupleEqual(as_float_scalars((0.25, 0.5), 2), (0.25, 0.5))
+
+        for scalars in as_float_scalars(np.array([1, 2, 3])):
+            self.assertIs(type(scalars), float)
+
+        self.assertIsNone(as_float_scalars(np.array([0.25, 0.5])))
+
+        self.assertIsNone(as_float_scalars(np.array([[0.25, 0.5, 1]])))
+
+        self.assertIsNone(as_float_scalars(['0.25', 0.5, 1]))
+
+        self.assertIsNone(as_float_scalars(0.25))
+
+        with float_precision(np.float32):
+            self.assertIsNone(as_float_scalars(np.array([0.25, 0.5, 1])))
+
+
+class TestGetFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.get_float_precision` definition units
+    tests methods.
+    """
+
+    def test_get_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.get_float_precision` definition.
+        """
+
+        self.assertEqual(get_float_precision(), np.float64)
+
+        with float_precision(np.float32):
+            self.assertEqual(get_float_precision(), np.float32)
+
+        try:
+            set_float_precision(np.float16)
+            self.assertEqual(get_float_precision(), np.float16)
+
+            with float_precision(np.float32):
+                self.assertEqual(get_float_precision(), np.float32)
+        finally:
+            set_float_precision(np.float64)
+
+
 class TestSetFloatPrecision(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.set_float_precision` definition units
@@ -260,6 +322,159 @@ class TestSetFloatPrecision(unittest.TestCase):
         set_float_precision(np.float64)
 
 
+class TestFloatPrecision(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.array.float_precision` class units tests
+    methods.
+    """
+
+    def test_float_precision(self):
+        """
+        Tests :class:`colour.utilities.array.float_precision` class.
+        """
+
+        with float_precision(np.float32):
+            self.assertEqual(as_float_array(np.ones(3)).dtype, np.float32)
+            self.assertEqual(tstack([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(zeros(3).dtype, np.float32)
+
+            with float_precision(np.dtype('float16')):
+                self.assertEqual(as_float_array(np.ones(3)).dtype, np.float16)
+
+            self.assertEqual(as_float_array(np.ones(3)).dtype, np.float32)
+
+        self.assertEqual(as_float_array(np.ones(3)).dtype, np.float64)
+
+        @float_precision(np.float32)
+        def fn_a(a):
+            """
+            Helper definition returning given variable type.
+            """
+
+            return as_float_array(a).dtype
+
+        self.assertEqual(fn_a(np.ones(3)), np.float32)
+
+        with float_precision(np.float16):
+            self.assertEqual(fn_a(np.ones(3)), np.float32)
+            self.assertEqual(as_float_array(np.ones(3)).dtype, np.float16)
+
+        self.assertRaises(AssertionError, lambda: float_precision(np.int32))
+
+    def test_float_precision_threads(self):
+        """
+        Tests :class:`colour.utilities.array.float_precision` class isolation
+        between threads.
+        """
+
+        dtypes = {}
+        entered = threading.Event()
+        checked = threading.Event()
+
+        def worker():
+            """
+            Helper definition setting the float precision in a thread.
+            """
+
+            dtypes['initial'] = as_float_array(np.ones(3)).dtype
+            with float_precision(np.float32):
+                entered.set()
+                checked.wait(10)
+                dtypes['worker'] = as_float_array(np.ones(3)).dtype
+
+        thread = threading.Thread(target=worker)
+        with float_precision(np.float16):
+            thread.start()
+            entered.wait(10)
+            dtypes['main'] = as_float_array(np.ones(3)).dtype
+            checked.set()
+            thread.join()
+
+        self.assertEqual(dtypes['initial'], np.float64)
+        self.assertEqual(dtypes['worker'], np.float32)
+        self.assertEqual(dtypes['main'], np.float16)
+
+    def test_float_precision_shared(self):
+        """
+        Tests :class:`colour.utilities.array.float_precision` class instance
+        re-entered and shared between threads.
+        """
+
+        precision = float_precision(np.float32)
+        with float_precision(np.float16):
+            with precision:
+                with precision:
+                    self.assertEqual(get_float_precision(), np.float32)
+                self.assertEqual(get_float_precision(), np.float32)
+            self.assertEqual(get_float_precision(), np.float16)
+
+        dtypes = {}
+        entered = threading.Event()
+        exited = threading.Event()
+
+        def worker():
+            """
+            Helper definition entering the shared instance in a thread.
+            """
+
+            with precision:
+                entered.set()
+                exited.wait(10)
+            dtypes['worker'] = get_float_precision()
+
+        thread = threading.Thread(target=worker)
+        with float_precision(np.float16):
+            with precision:
+                thread.start()
+                entered.wait(10)
+            dtypes['main'] = get_float_precision()
+            exited.set()
+            thread.join()
+
+        self.assertEqual(dtypes['worker'], np.float64)
+        self.assertEqual(dtypes['main'], np.float16)
+        self.assertEqual(get_float_precision(), np.float64)
+
+    def test_float_precision_enforcement(self):
+        """
+        Tests whether :class:`colour.utilities.array.float_precision` effect is
+        applied through the colour models, transfer functions, interpolators
+        and *LUT* classes.
+        """
+
+        from colour import (LUT3D, RGB_COLOURSPACES, RGB_to_RGB,
+                            SpragueInterpolator, XYZ_to_Lab, XYZ_to_sRGB,
+                            delta_E, eotf_inverse, RGB_to_YCbCr)
+
+        RGB = np.array([[0.25, 0.50, 0.75], [0.75, 0.50, 0.25]])
+        LUT = LUT3D(LUT3D.linear_table(5) ** 2)
+        interpolator = SpragueInterpolator(
+            np.arange(7),
+            np.array([5.92, 9.37, 10.81, 4.51, 69.59, 27.80, 86.05]))
+
+        with float_precision(np.float32):
+            RGB = RGB.astype(np.float32)
+            for a in (
+                    XYZ_to_Lab(RGB),
+                    XYZ_to_sRGB(RGB),
+                    RGB_to_RGB(
+                        RGB,
+                        RGB_COLOURSPACES['sRGB'],
+                        RGB_COLOURSPACES['ACEScg'],
+                        apply_cctf_decoding=True),
+                    eotf_inverse(RGB, 'ITU-R BT.2100 PQ'),
+                    RGB_to_YCbCr(RGB),
+                    delta_E(RGB * 100, RGB[::-1] * 100),
+                    LUT.apply(RGB),
+                    SpragueInterpolator(interpolator.x,
+                                        interpolator.y)(RGB[..., 0]),
+            ):
+                self.assertEqual(a.dtype, np.float32)
+
+        np.testing.assert_allclose(
+            LUT.apply(RGB.astype(np.float64)), LUT.apply(RGB), rtol=0.000001)
+
+
 class TestSetIntPrecision(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.set_int_precision` definition units
@@ -590,6 +805,20 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+        a = np.arange(0, 6)
+        out = np.zeros((6, 3), np.float32)
+        self.assertIs(tstack([a, a, a], out=out), out)
+        np.testing.assert_almost_equal(out, tstack([a, a, a]))
+
+        a = np.reshape(np.arange(0, 18.0), (3, 6))
+        b = tstack(a, copy=False)
+        np.testing.assert_equal(b, tstack(a))
+        self.assertTrue(np.may_share_memory(b, a))
+
+        b = tstack(list(a), copy=False)
+        np.testing.assert_equal(b, tstack(a))
+        self.assertFalse(np.may_share_memory(b, a))
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -643,6 +872,25 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_tsplit_view(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition strided views
+        support.
+        """
+
+        a = np.reshape(np.arange(0, 18.0), (6, 3))
+        b = tsplit(a, copy=False)
+        np.testing.assert_equal(b, tsplit(a))
+        self.assertTrue(np.may_share_memory(b, a))
+
+        c = tstack(b, copy=False)
+        np.testing.assert_equal(c, a)
+        self.assertTrue(np.may_share_memory(c, a))
+
+        b = tsplit(a.astype(np.int_), copy=False)
+        np.testing.assert_equal(b, tsplit(a))
+        self.assertEqual(b.dtype, DEFAULT_FLOAT_DTYPE)
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -716,6 +964,37 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_out_dot_vector(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` definition *out*
+        argument support.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+
+        v = np.array([0.20654008, 0.12197225, 0.05136952])
+        v = np.tile(v, (6, 1))
+
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out=out), out)
+        np.testing.assert_almost_equal(
+            out, np.tile([0.19540944, 0.06203965, 0.05279523], (6, 1)))
+
+        out = np.zeros(v.shape, np.float32)
+        self.assertIs(dot_vector(m, v, out=out), out)
+        np.testing.assert_almost_equal(
+            out, np.tile([0.19540944, 0.06203965, 0.05279523], (6, 1)))
+
+        self.assertIs(dot_vector(m, v, out=v), v)
+        np.testing.assert_almost_equal(
+            v,
+            np.tile([0.19540944, 0.06203965, 0.05279523], (6, 1)),
+            decimal=7)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
@@ -5,9 +5,12 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 
 from __future__ import division, unicode_literals
 
+import gc
 import numpy as np
+import threading
 import unittest
 import six
+import weakref
 from collections import OrderedDict
 from functools import partial
 
@@ -18,6 +21,7 @@ from colour.utilities import (
     to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
     from_range_1, from_range_10, from_range_100, from_range_int,
     from_range_degrees)
+from colour.utilities.common import _FILTER_KWARGS_CACHE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -281,6 +285,67 @@ class TestFilterKwargs(unittest.TestCase):
             self.assertDictEqual(
                 filter_kwargs(partial(fn_c, b=1), b=1), {'b': 1})
 
+        # Repeated calls are using the cached signature.
+        self.assertDictEqual(filter_kwargs(fn_b, b=4, c=3), {'b': 4})
+        self.assertDictEqual(filter_kwargs(fn_b, c=3, b=5), {'b': 5})
+        self.assertDictEqual(filter_kwargs(fn_b, c=3), {})
+
+        class Callable(object):
+            """
+            :func:`filter_kwargs` unit tests unhashable callable.
+            """
+
+            __hash__ = None
+
+            def __call__(self, a, b=0):
+                return a, b
+
+        self.assertDictEqual(filter_kwargs(Callable(), b=2, c=3), {'b': 2})
+
+    def test_filter_kwargs_cache(self):
+        """
+        Tests :func:`colour.utilities.common.filter_kwargs` definition cache.
+        """
+
+        class Owner(object):
+            """
+            :func:`filter_kwargs` unit tests bound methods owner.
+            """
+
+            def method(self, a, b=0):
+                """
+                :func:`filter_kwargs` unit tests bound method.
+                """
+
+                return a, b
+
+        owner = Owner()
+        owner_reference = weakref.ref(owner)
+        self.assertDictEqual(filter_kwargs(owner.method, b=2, c=3), {'b': 2})
+        self.assertIn(Owner.method, _FILTER_KWARGS_CACHE)
+        self.assertDictEqual(
+            filter_kwargs(Owner.method, self=1, b=2), {
+                'self': 1,
+                'b': 2
+            })
+        self.assertDictEqual(
+            filter_kwargs(owner.method, self=1, b=2), {'b': 2})
+
+        del owner
+        gc.collect()
+        self.assertIsNone(owner_reference())
+
+        def fn_a(a, b=0):
+            """
+            :func:`filter_kwargs` unit tests :func:`fn_a` definition.
+            """
+
+            return a, b
+
+        count = len(_FILTER_KWARGS_CACHE)
+        filter_kwargs(partial(fn_a, 1), b=2)
+        self.assertEqual(len(_FILTER_KWARGS_CACHE), count)
+
 
 class TestFilterMapping(unittest.TestCase):
     """
@@ -487,6 +552,87 @@ class TestDomainRangeScale(unittest.TestCase):
 
         self.assertEqual(fn_b(10), 2.0)
 
+        with domain_range_scale('100'):
+            self.assertEqual(fn_b(10), 2.0)
+            self.assertEqual(get_domain_range_scale(), '100')
+
+    def test_domain_range_scale_threads(self):
+        """
+        Tests :func:`colour.utilities.common.domain_range_scale` definition
+        isolation between threads.
+        """
+
+        scales = {}
+        entered = threading.Event()
+        checked = threading.Event()
+
+        def worker():
+            """
+            Helper definition setting the domain-range scale in a thread.
+            """
+
+            scales['initial'] = get_domain_range_scale()
+            with domain_range_scale('1'):
+                entered.set()
+                checked.wait(10)
+                scales['worker'] = get_domain_range_scale()
+                scales['value'] = to_domain_100(1)
+
+        thread = threading.Thread(target=worker)
+        with domain_range_scale('100'):
+            thread.start()
+            entered.wait(10)
+            scales['main'] = get_domain_range_scale()
+            checked.set()
+            thread.join()
+
+        self.assertEqual(scales['initial'], 'reference')
+        self.assertEqual(scales['worker'], '1')
+        self.assertEqual(scales['value'], 100)
+        self.assertEqual(scales['main'], '100')
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
+    def test_domain_range_scale_shared(self):
+        """
+        Tests :func:`colour.utilities.common.domain_range_scale` definition
+        instance re-entered and shared between threads.
+        """
+
+        scale = domain_range_scale('1')
+        with domain_range_scale('100'):
+            with scale:
+                with scale:
+                    self.assertEqual(get_domain_range_scale(), '1')
+                self.assertEqual(get_domain_range_scale(), '1')
+            self.assertEqual(get_domain_range_scale(), '100')
+
+        scales = {}
+        entered = threading.Event()
+        exited = threading.Event()
+
+        def worker():
+            """
+            Helper definition entering the shared instance in a thread.
+            """
+
+            with scale:
+                entered.set()
+                exited.wait(10)
+            scales['worker'] = get_domain_range_scale()
+
+        thread = threading.Thread(target=worker)
+        with domain_range_scale('100'):
+            with scale:
+                thread.start()
+                entered.wait(10)
+            scales['main'] = get_domain_range_scale()
+            exited.set()
+            thread.join()
+
+        self.assertEqual(scales['worker'], 'reference')
+        self.assertEqual(scales['main'], '100')
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
 
 class TestToDomain1(unittest.TestCase):
     """
@@ -8,10 +8,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 import operator
 import pickle
+import threading
 import unittest
 
 from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
-                              LazyCaseInsensitiveMapping)
+                              LazyCaseInsensitiveMapping, LRUCache)
+from colour.utilities.data_structures import (_ThreadLocalContext,
+                                              _ThreadLocalVariable)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -22,7 +25,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping',
-    'TestLazyCaseInsensitiveMapping'
+    'TestLazyCaseInsensitiveMapping', 'TestLRUCache', 'TestThreadLocalContext'
 ]
 
 
@@ -381,5 +384,169 @@ LazyCaseInsensitiveMapping.__getitem__` method.
         self.assertEqual(mapping['jane'], 'Doe')
 
 
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.LRUCache` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__setitem__', '__getitem__', '__delitem__',
+                            '__contains__', '__iter__', '__len__', '__repr__',
+                            'get', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.maximum_size`
+        property.
+        """
+
+        cache = LRUCache(3)
+        for i in range(3):
+            cache[i] = i
+
+        cache.maximum_size = 2
+        self.assertListEqual(list(cache), [1, 2])
+
+        self.assertRaises(AssertionError, setattr, cache, 'maximum_size', 0)
+
+    def test__setitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__setitem__`
+        method.
+        """
+
+        cache = LRUCache(2)
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        cache['Luke'] = 'Skywalker'
+
+        self.assertNotIn('John', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__getitem__`
+        method.
+        """
+
+        cache = LRUCache(2)
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+
+        self.assertEqual(cache['John'], 'Doe')
+
+        cache['Luke'] = 'Skywalker'
+
+        self.assertIn('John', cache)
+        self.assertNotIn('Jane', cache)
+
+        self.assertRaises(KeyError, operator.getitem, cache, 'Jane')
+
+    def test__delitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__delitem__`
+        method.
+        """
+
+        cache = LRUCache()
+        cache['John'] = 'Doe'
+        del cache['John']
+
+        self.assertNotIn('John', cache)
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.get` method.
+        """
+
+        cache = LRUCache()
+        cache['John'] = 'Doe'
+
+        self.assertEqual(cache.get('John'), 'Doe')
+        self.assertIsNone(cache.get('Jane'))
+        self.assertEqual(cache.get('Jane', 'Doe'), 'Doe')
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.clear` method.
+        """
+
+        cache = LRUCache()
+        cache['John'] = 'Doe'
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestThreadLocalContext(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures._ThreadLocalContext`
+    class unit tests methods.
+    """
+
+    def test_run(self):
+        """
+        Tests :meth:`colour.utilities.data_structures._ThreadLocalContext.run`
+        method.
+        """
+
+        variable = _ThreadLocalVariable('variable', default='reference')
+        variable.set('1')
+        context = _ThreadLocalContext()
+
+        values = []
+
+        def _worker():
+            """
+            Records the variable value in and out of the context.
+            """
+
+            values.append(variable.get())
+            values.append(context.run(variable.get))
+            values.append(variable.get())
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        thread.join()
+
+        self.assertListEqual(values, ['reference', '1', 'reference'])
+        self.assertEqual(variable.get(), '1')
+
+    def test_reset(self):
+        """
+        Tests :meth:`colour.utilities.data_structures._ThreadLocalVariable.\
+reset` method.
+        """
+
+        variable = _ThreadLocalVariable('variable', default='reference')
+        token_a = variable.set('1')
+        token_b = variable.set('100')
+        variable.reset(token_b)
+        self.assertEqual(variable.get(), '1')
+        variable.reset(token_a)
+        self.assertEqual(variable.get(), 'reference')
+
+        self.assertRaises(AssertionError,
+                          lambda: _ThreadLocalVariable('other').reset(token_a))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,11 +8,9 @@ Defines objects related to *Optimal Colour Stimuli* computations.
 
 from __future__ import division, unicode_literals
 
-import numpy as np
-from scipy.spatial import Delaunay
-
 from colour.models import xyY_to_XYZ
-from colour.volume import ILLUMINANT_OPTIMAL_COLOUR_STIMULI
+from colour.volume import (ILLUMINANT_OPTIMAL_COLOUR_STIMULI,
+                           is_within_mesh_volume)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -24,7 +22,6 @@ __status__ = 'Production'
 __all__ = ['is_within_macadam_limits']
 
 _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = {}
-_XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE = {}
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -69,7 +66,7 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     illuminant : unicode
         Illuminant.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-volume check.
 
     Returns
     -------
@@ -87,6 +84,7 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
@@ -96,13 +94,6 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     """
 
     optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
-        illuminant)
-    if triangulation is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
-
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
 
-    return simplex
+    return is_within_mesh_volume(
+        xyY_to_XYZ(xyY), optimal_colour_stimuli, tolerance)
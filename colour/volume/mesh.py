@@ -8,8 +8,12 @@ Defines helpers objects related to volume computations.
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull
+
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.utilities import LRUCache, as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -18,28 +22,97 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = ['mesh_half_spaces', 'is_within_mesh_volume']
+
+_MESH_HALF_SPACES_CACHE = LRUCache(32)
+"""
+Cache of the mesh convex hull half-spaces equations, keyed by the mesh
+content.
+
+_MESH_HALF_SPACES_CACHE : LRUCache
+"""
+
+_MESH_VOLUME_CHUNK_SIZE = 2 ** 22
+"""
+Maximum element count of the points / half-spaces distances array computed at
+once by the :func:`colour.volume.is_within_mesh_volume` definition.
+
+_MESH_VOLUME_CHUNK_SIZE : int
+"""
+
+
+def mesh_half_spaces(mesh):
+    """
+    Returns the half-spaces equations of the convex hull of given mesh
+    points.
+
+    The equations are cached, their identifier key is the digest of the mesh
+    points content, thus subsequent calls with the same mesh points do not
+    recompute the convex hull.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+
+    Returns
+    -------
+    ndarray
+        Half-spaces equations :math:`[n_x, n_y, n_z, o]` of the convex hull
+        facets with :math:`n` the outward pointing unit normal and :math:`o`
+        the offset such as a point :math:`p` within the convex hull verifies
+        :math:`n \\cdot p + o \\leq 0`.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> mesh_half_spaces(mesh).shape
+    (6, 4)
+    """
+
+    mesh = np.ascontiguousarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+
+    key = '{0}, {1}'.format(mesh.shape,
+                            hashlib.sha1(mesh.tobytes()).hexdigest())
+    equations = _MESH_HALF_SPACES_CACHE.get(key)
+    if equations is None:
+        _MESH_HALF_SPACES_CACHE[key] = equations = ConvexHull(mesh).equations
+
+    return equations
 
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
     """
-    Returns if given points are within given mesh volume using Delaunay
-    triangulation.
+    Returns if given points are within given mesh volume convex hull.
 
     Parameters
     ----------
     points : array_like
         Points to check if they are within ``mesh`` volume.
     mesh : array_like
-        Points of the volume used to generate the Delaunay triangulation.
+        Points of the volume used to generate the convex hull.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-volume check, i.e. the maximum
+        distance outside of the convex hull facets a point can be while being
+        considered within the volume.
 
     Returns
     -------
     bool
         Is within mesh volume.
 
+    Notes
+    -----
+    -   The convex hull half-spaces equations are cached by the
+        :func:`colour.volume.mesh_half_spaces` definition so that a batch of
+        points only costs a matrix product with the equations.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -57,9 +130,22 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    if tolerance is None:
+        tolerance = 100 * EPSILON
+
+    points = as_float_array(points)
+    equations = mesh_half_spaces(mesh)
+
+    normals, offsets = equations[..., :-1], equations[..., -1]
+
+    shape = points.shape[:-1]
+    points = np.reshape(points, (-1, points.shape[-1]))
 
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    within = np.empty(points.shape[0], dtype=np.bool_)
+    chunk_size = max(_MESH_VOLUME_CHUNK_SIZE // len(equations), 1)
+    for i in range(0, points.shape[0], chunk_size):
+        distances = np.dot(points[i:i + chunk_size], normals.T)
+        distances += offsets
+        within[i:i + chunk_size] = np.all(distances <= tolerance, axis=-1)
 
-    return simplex
+    return np.reshape(within, shape)
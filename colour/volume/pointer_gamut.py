@@ -32,7 +32,7 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
     XYZ : array_like
         *CIE XYZ* tristimulus values.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-volume check.
 
     Returns
     -------
@@ -7,9 +7,15 @@ Defines various RGB colourspace volume computation objects:
 
 -   :func:`colour.RGB_colourspace_limits`
 -   :func:`colour.RGB_colourspace_volume_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_MonteCarlo_estimates`
+-   :func:`colour.RGB_colourspace_volume_MonteCarlo_estimate`
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_Mesh`
+-   :func:`colour.RGB_colourspace_volume_coverage_Mesh`
+-   :func:`colour.RGB_colourspace_pointer_gamut_coverage_Mesh`
+-   :func:`colour.RGB_colourspace_visible_spectrum_coverage_Mesh`
 """
 
 from __future__ import division, unicode_literals
@@ -17,13 +23,22 @@ from __future__ import division, unicode_literals
 import itertools
 import multiprocessing
 import numpy as np
+from collections import namedtuple
+from scipy.spatial import ConvexHull
+from scipy.special import ndtri
 
 from colour.algebra import random_triplet_generator
-from colour.colorimetry import ILLUMINANTS
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
-from colour.utilities import as_float_array, multiprocessing_pool
+from colour.colorimetry import ILLUMINANTS, STANDARD_OBSERVER_CMFS, sd_ones
+from colour.constants import DEFAULT_INT_DTYPE, EPSILON
+from colour.geometry import primitive_cube
+from colour.models import (Lab_to_XYZ, LCHab_to_Lab, POINTER_GAMUT_DATA,
+                           POINTER_GAMUT_ILLUMINANT, RGB_to_XYZ, XYZ_to_Lab,
+                           XYZ_to_RGB)
+from colour.volume import (XYZ_outer_surface, is_within_pointer_gamut,
+                           is_within_visible_spectrum)
+from colour.volume.spectrum import DEFAULT_SPECTRAL_SHAPE_XYZ_OUTER_SURFACE
+from colour.utilities import (as_float_array, domain_range_scale,
+                              multiprocessing_pool)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -34,10 +49,15 @@ __status__ = 'Production'
 
 __all__ = [
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_MonteCarlo', 'MonteCarloEstimate',
+    'RGB_colourspace_volume_MonteCarlo_estimates',
+    'RGB_colourspace_volume_MonteCarlo_estimate',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_coverage_Mesh',
+    'RGB_colourspace_pointer_gamut_coverage_Mesh',
+    'RGB_colourspace_visible_spectrum_coverage_Mesh'
 ]
 
 
@@ -257,6 +277,264 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     return Lab_volume * np.sum(results) / (process_samples * processes)
 
 
+class MonteCarloEstimate(
+        namedtuple(
+            'MonteCarloEstimate',
+            ('value', 'standard_error', 'confidence_interval', 'samples'))):
+    """
+    Defines a *Monte Carlo* estimate.
+
+    Parameters
+    ----------
+    value : numeric
+        Estimated value.
+    standard_error : numeric
+        Standard error of the estimated value.
+    confidence_interval : tuple
+        Lower and upper bounds of the confidence interval of the estimated
+        value.
+    samples : int
+        Samples count used for the estimate.
+    """
+
+
+def _sample_RGB_colourspace_volume_MonteCarlo_chunk(arguments):
+    """
+    Randomly samples the *CIE L\\*a\\*b\\** colourspace volume with a
+    dedicated seeded random stream and returns the count of samples within the
+    given *RGB* colourspace volume.
+
+    Parameters
+    ----------
+    arguments : array_like
+        Arguments: *RGB* colourspace, :class:`np.random.SeedSequence` class
+        instance, samples count, *CIE L\\*a\\*b\\** colourspace volume,
+        *illuminant* chromaticity coordinates and *chromatic adaptation*
+        method.
+
+    Returns
+    -------
+    integer
+        Within *RGB* colourspace volume samples count.
+    """
+
+    (colourspace, seed_sequence, samples, limits, illuminant_Lab,
+     chromatic_adaptation_method) = arguments
+
+    limits = as_float_array(limits)
+
+    random_generator = np.random.default_rng(seed_sequence)
+    Lab = random_generator.uniform(
+        limits[..., 0], limits[..., 1], size=(samples, 3))
+
+    RGB = XYZ_to_RGB(
+        Lab_to_XYZ(Lab, illuminant_Lab),
+        illuminant_Lab,
+        colourspace.whitepoint,
+        colourspace.XYZ_to_RGB_matrix,
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    return np.count_nonzero(
+        np.logical_and(np.min(RGB, axis=-1) >= 0,
+                       np.max(RGB, axis=-1) <= 1))
+
+
+def RGB_colourspace_volume_MonteCarlo_estimates(
+        colourspace,
+        samples=10e6,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        seed=None,
+        chunk_size=10e4,
+        target_standard_error=None,
+        confidence=0.95,
+        processes=None):
+    """
+    Performs given *RGB* colourspace volume computation using a reproducible
+    *Monte Carlo* method and multiprocessing, and yields the running estimate
+    after each processed chunk of samples.
+
+    The samples are generated in fixed-size vectorised chunks, each chunk
+    using an independent random stream spawned from given seed with
+    :meth:`np.random.SeedSequence.spawn` method: the estimates only depend on
+    the seed and the chunk size, not on the processes count.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    samples : numeric, optional
+        Maximum samples count.
+    limits : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace volume.
+    illuminant_Lab : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    seed : int or array_like or SeedSequence, optional
+        Seed of the root :class:`np.random.SeedSequence` class instance, if
+        *None*, fresh entropy is used and the estimates are not reproducible.
+    chunk_size : numeric, optional
+        Samples count of each chunk.
+    target_standard_error : numeric, optional
+        Standard error at which the sampling stops early, the sampling is
+        performed until ``samples`` count is reached if *None*.
+    confidence : numeric, optional
+        Confidence level of the confidence interval.
+    processes : int, optional
+        Processes count, default to the CPU count.
+
+    Yields
+    ------
+    MonteCarloEstimate
+        Running *RGB* colourspace volume estimate.
+
+    Notes
+    -----
+    -   The standard error is computed from the binomial distribution of the
+        within *RGB* colourspace volume samples count and the confidence
+        interval uses the normal approximation.
+    -   Early stopping is only performed once some, but not all, the samples
+        are within the *RGB* colourspace volume, as the standard error is
+        otherwise null.
+    -   :class:`np.random.SeedSequence` class requires *Numpy* 1.17 or above.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> from colour.utilities import disable_multiprocessing
+    >>> with disable_multiprocessing():
+    ...     for estimate in RGB_colourspace_volume_MonteCarlo_estimates(
+    ...             sRGB, 10e4, seed=4, chunk_size=5e4):
+    ...         print(estimate.samples)
+    50000
+    100000
+    """
+
+    samples = DEFAULT_INT_DTYPE(samples)
+    chunk_size = DEFAULT_INT_DTYPE(chunk_size)
+
+    chunks_samples = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        chunks_samples.append(samples % chunk_size)
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    arguments = [(colourspace, seed_sequence, chunk_samples, limits,
+                  illuminant_Lab, chromatic_adaptation_method)
+                 for seed_sequence, chunk_samples in zip(
+                     seed.spawn(len(chunks_samples)), chunks_samples)]
+
+    limits = as_float_array(limits)
+    Lab_volume = np.product(np.abs(limits[..., 1] - limits[..., 0]))
+
+    z = ndtri(0.5 + confidence / 2)
+
+    within, total = 0, 0
+    with multiprocessing_pool(processes) as pool:
+        for chunk_samples, chunk_within in zip(
+                chunks_samples,
+                pool.imap(_sample_RGB_colourspace_volume_MonteCarlo_chunk,
+                          arguments)):
+            within += chunk_within
+            total += chunk_samples
+
+            p = within / total
+            volume = Lab_volume * p
+            standard_error = Lab_volume * np.sqrt(p * (1 - p) / total)
+
+            yield MonteCarloEstimate(
+                volume, standard_error,
+                (volume - z * standard_error, volume + z * standard_error),
+                total)
+
+            if (target_standard_error is not None and 0 < within < total and
+                    standard_error <= target_standard_error):
+                break
+
+
+def RGB_colourspace_volume_MonteCarlo_estimate(
+        colourspace,
+        samples=10e6,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        seed=None,
+        chunk_size=10e4,
+        target_standard_error=None,
+        confidence=0.95,
+        processes=None):
+    """
+    Performs given *RGB* colourspace volume computation using a reproducible
+    *Monte Carlo* method and multiprocessing, and returns the final estimate.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    samples : numeric, optional
+        Maximum samples count.
+    limits : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace volume.
+    illuminant_Lab : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    seed : int or array_like or SeedSequence, optional
+        Seed of the root :class:`np.random.SeedSequence` class instance, if
+        *None*, fresh entropy is used and the estimate is not reproducible.
+    chunk_size : numeric, optional
+        Samples count of each chunk.
+    target_standard_error : numeric, optional
+        Standard error at which the sampling stops early, the sampling is
+        performed until ``samples`` count is reached if *None*.
+    confidence : numeric, optional
+        Confidence level of the confidence interval.
+    processes : int, optional
+        Processes count, default to the CPU count.
+
+    Returns
+    -------
+    MonteCarloEstimate
+        *RGB* colourspace volume estimate.
+
+    Notes
+    -----
+    -   Please refer to the
+        :func:`colour.RGB_colourspace_volume_MonteCarlo_estimates` definition
+        for the sampling details.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> from colour.utilities import disable_multiprocessing
+    >>> with disable_multiprocessing():
+    ...     estimate = RGB_colourspace_volume_MonteCarlo_estimate(
+    ...         sRGB, 10e4, seed=4, chunk_size=5e4)
+    >>> estimate.value
+    819810.0
+    """
+
+    estimate = None
+    for estimate in RGB_colourspace_volume_MonteCarlo_estimates(
+            colourspace, samples, limits, illuminant_Lab,
+            chromatic_adaptation_method, seed, chunk_size,
+            target_standard_error, confidence, processes):
+        pass
+
+    return estimate
+
+
 def RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace,
         coverage_sampler,
@@ -391,3 +669,314 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_visible_spectrum, samples, random_generator,
         random_state)
+
+
+def RGB_colourspace_volume_Mesh(
+        colourspace,
+        subdivisions=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Computes given *RGB* colourspace volume in the *CIE L\\*a\\*b\\**
+    colourspace by integration over the tessellated boundary of its gamut.
+
+    The *RGB* colourspace unit cube faces are subdivided, converted to
+    *CIE L\\*a\\*b\\** colourspace and the volume enclosed by the resulting
+    closed triangular mesh is computed with the divergence theorem, i.e. as
+    the sum of the signed volumes of the tetrahedra formed by the origin and
+    each triangle.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    subdivisions : int, optional
+        Subdivisions count of each *RGB* colourspace unit cube edge, the
+        *CIE L\\*a\\*b\\** colourspace transformation being non-linear, the
+        computed volume converges toward the exact volume as the subdivisions
+        count increases.
+    illuminant_Lab : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   The computation is deterministic and its cost is proportional to the
+        square of the subdivisions count.
+    -   The volume is expressed in the reference *CIE L\\*a\\*b\\**
+        colourspace scale so that it is directly comparable with the volume
+        returned by the :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_Mesh(sRGB)  # doctest: +ELLIPSIS
+    8...
+    """
+
+    vertices, faces, _outline = primitive_cube(
+        width_segments=subdivisions,
+        height_segments=subdivisions,
+        depth_segments=subdivisions)
+
+    RGB = vertices['position'] + 0.5
+
+    with domain_range_scale('ignore'):
+        Lab = XYZ_to_Lab(
+            RGB_to_XYZ(RGB, colourspace.whitepoint, illuminant_Lab,
+                       colourspace.RGB_to_XYZ_matrix,
+                       chromatic_adaptation_method), illuminant_Lab)
+
+    triangles = Lab[faces]
+
+    return np.abs(
+        np.sum(
+            np.einsum('...i,...i->...', triangles[:, 0, :],
+                      np.cross(triangles[:, 1, :], triangles[:, 2, :]))) / 6)
+
+
+def _is_non_degenerate_polytope(vertices):
+    """
+    Returns whether given vertices span a 3-dimensional convex polytope.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Convex polytope vertices.
+
+    Returns
+    -------
+    bool
+        Whether given vertices span a 3-dimensional convex polytope.
+    """
+
+    return (len(vertices) >= 4 and
+            np.linalg.matrix_rank(vertices - vertices[0], tol=EPSILON) == 3)
+
+
+def _clip_convex_polytope(vertices, halfspaces):
+    """
+    Clips the convex polytope with given vertices by given half-spaces and
+    returns the vertices of the resulting convex polytope.
+
+    The polytope is clipped successively by each half-space: the vertices
+    within the half-space are kept and the intersections of the polytope
+    edges crossing the half-space boundary plane are added.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Convex polytope vertices.
+    halfspaces : array_like
+        Half-spaces in :math:`Ax + b \\leq 0` form, i.e. stacked
+        :math:`[A; b]` rows.
+
+    Returns
+    -------
+    ndarray
+        Clipped convex polytope vertices, possibly empty or degenerate.
+    """
+
+    vertices = as_float_array(vertices)
+
+    for halfspace in as_float_array(halfspaces):
+        if not _is_non_degenerate_polytope(vertices):
+            return np.zeros([0, 3])
+
+        distances = np.dot(vertices, halfspace[:-1]) + halfspace[-1]
+
+        if np.all(distances <= 0):
+            continue
+
+        edges = ConvexHull(vertices).simplices
+        edges = np.vstack(
+            [edges[:, [0, 1]], edges[:, [1, 2]], edges[:, [2, 0]]])
+        edges = edges[distances[edges[:, 0]] * distances[edges[:, 1]] < 0]
+
+        d_s, d_e = distances[edges[:, 0]], distances[edges[:, 1]]
+        t = (d_s / (d_s - d_e))[:, np.newaxis]
+        intersections = (vertices[edges[:, 0]] +
+                         t * (vertices[edges[:, 1]] - vertices[edges[:, 0]]))
+
+        vertices = np.vstack([vertices[distances <= 0], intersections])
+
+    return vertices
+
+
+def _convex_polytope_volume(vertices):
+    """
+    Returns the volume of the convex polytope with given vertices.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Convex polytope vertices.
+
+    Returns
+    -------
+    float
+        Convex polytope volume, 0 if the polytope is empty or degenerate.
+    """
+
+    if not _is_non_degenerate_polytope(vertices):
+        return 0
+
+    return ConvexHull(vertices).volume
+
+
+def RGB_colourspace_volume_coverage_Mesh(colourspace, mesh):
+    """
+    Returns given *RGB* colourspace exact percentage coverage of the convex
+    volume bounded by given mesh.
+
+    The *RGB* colourspace gamut being a parallelepiped in the *CIE XYZ*
+    colourspace, the coverage is computed as the ratio of the volume of the
+    intersection of the gamut with the mesh convex hull, over the volume of
+    the mesh convex hull, both being clipped to the *CIE XYZ* colourspace unit
+    cube as the :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
+    definition samples.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    mesh : array_like
+        *CIE XYZ* tristimulus values of the points whose convex hull bounds
+        the volume.
+
+    Returns
+    -------
+    float
+        Percentage coverage of volume.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``mesh``   | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> mesh = np.array([
+    ...     [0.0, 0.0, 0.0],
+    ...     [1.0, 0.0, 0.0],
+    ...     [0.0, 1.0, 0.0],
+    ...     [0.0, 0.0, 1.0],
+    ...     [1.0, 1.0, 0.0],
+    ...     [1.0, 0.0, 1.0],
+    ...     [0.0, 1.0, 1.0],
+    ...     [1.0, 1.0, 1.0],
+    ... ])
+    >>> RGB_colourspace_volume_coverage_Mesh(sRGB, mesh)  # doctest: +ELLIPSIS
+    20.1...
+    """
+
+    mesh = as_float_array(mesh)
+    XYZ_to_RGB_matrix = as_float_array(colourspace.XYZ_to_RGB_matrix)
+
+    halfspaces_unit_cube = np.vstack([
+        np.hstack([-np.identity(3), np.zeros([3, 1])]),
+        np.hstack([np.identity(3), -np.ones([3, 1])]),
+    ])
+    halfspaces_RGB = np.vstack([
+        np.hstack([-XYZ_to_RGB_matrix, np.zeros([3, 1])]),
+        np.hstack([XYZ_to_RGB_matrix, -np.ones([3, 1])]),
+    ])
+
+    if not _is_non_degenerate_polytope(mesh):
+        return 0
+
+    vertices = _clip_convex_polytope(mesh[ConvexHull(mesh).vertices],
+                                     halfspaces_unit_cube)
+    volume = _convex_polytope_volume(vertices)
+
+    if volume == 0:
+        return 0
+
+    return 100 * _convex_polytope_volume(
+        _clip_convex_polytope(vertices, halfspaces_RGB)) / volume
+
+
+def RGB_colourspace_pointer_gamut_coverage_Mesh(colourspace):
+    """
+    Returns given *RGB* colourspace exact percentage coverage of Pointer's
+    Gamut volume.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the *Pointer's Gamut* coverage percentage.
+
+    Returns
+    -------
+    float
+        Percentage coverage of *Pointer's Gamut* volume.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_pointer_gamut_coverage_Mesh(sRGB)  # doctest: +ELLIPSIS
+    8...
+    """
+
+    XYZ_p = Lab_to_XYZ(
+        LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT)
+
+    return RGB_colourspace_volume_coverage_Mesh(colourspace, XYZ_p)
+
+
+def RGB_colourspace_visible_spectrum_coverage_Mesh(
+        colourspace,
+        cmfs=STANDARD_OBSERVER_CMFS['CIE 1931 2 Degree Standard Observer']
+        .copy().align(DEFAULT_SPECTRAL_SHAPE_XYZ_OUTER_SURFACE),
+        illuminant=sd_ones(DEFAULT_SPECTRAL_SHAPE_XYZ_OUTER_SURFACE),
+        **kwargs):
+    """
+    Returns given *RGB* colourspace exact percentage coverage of visible
+    spectrum volume.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the visible spectrum coverage percentage.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.multi_sds_to_XYZ`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    float
+        Percentage coverage of visible spectrum volume.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_visible_spectrum_coverage_Mesh(sRGB)
+    ... # doctest: +ELLIPSIS
+    4...
+    """
+
+    return RGB_colourspace_volume_coverage_Mesh(
+        colourspace, XYZ_outer_surface(cmfs, illuminant, **kwargs))
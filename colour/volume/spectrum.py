@@ -24,7 +24,8 @@ from colour.colorimetry import (STANDARD_OBSERVER_CMFS, multi_sds_to_XYZ,
                                 SpectralShape, sd_ones)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros
+from colour.utilities import (LRUCache, from_range_100, runtime_warning, zeros,
+                              get_float_precision)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -46,8 +47,7 @@ interval of 5.
 DEFAULT_SPECTRAL_SHAPE_XYZ_OUTER_SURFACE : SpectralShape
 """
 
-_XYZ_OUTER_SURFACE_CACHE = {}
-_XYZ_OUTER_SURFACE_POINTS_CACHE = {}
+_XYZ_OUTER_SURFACE_CACHE = LRUCache(16)
 
 
 def generate_pulse_waves(bins):
@@ -122,20 +122,82 @@ def generate_pulse_waves(bins):
            [ 1.,  1.,  1.,  1.,  1.]])
     """
 
-    square_waves = []
-    square_waves_basis = np.tril(
-        np.ones((bins, bins), dtype=DEFAULT_FLOAT_DTYPE))[0:-1, :]
-    for square_wave_basis in square_waves_basis:
-        for i in range(bins):
-            square_waves.append(np.roll(square_wave_basis, i))
+    indices = np.arange(bins)
+    widths, starts = np.meshgrid(np.arange(1, bins), indices, indexing='ij')
+
+    # Circulant construction of the pulse waves: each pulse wave of given
+    # width is rolled over all the possible starting bins.
+    square_waves = (np.mod(indices - starts[..., np.newaxis], bins) <
+                    widths[..., np.newaxis]).astype(get_float_precision())
 
     return np.vstack([
         zeros(bins),
-        np.vstack(square_waves),
+        np.reshape(square_waves, (-1, bins)),
         np.ones(bins, dtype=DEFAULT_FLOAT_DTYPE)
     ])
 
 
+def _pulse_waves_to_XYZ_integration(cmfs, illuminant, shape, k=None):
+    """
+    Converts the pulse waves generated by the
+    :func:`colour.volume.generate_pulse_waves` definition for given spectral
+    shape to *CIE XYZ* tristimulus values using given colour matching
+    functions and illuminant.
+
+    The definition yields the same *CIE XYZ* tristimulus values than the
+    :func:`colour.colorimetry.multi_sds_to_XYZ_integration` definition but
+    does not generate the pulse waves: the tristimulus values of each pulse
+    wave are the difference of the cumulative sums of the weighted colour
+    matching functions at its ends, reducing the computation from
+    :math:`O(n^3)` to :math:`O(n^2)` with :math:`n` the bins count.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    shape : SpectralShape
+        Spectral shape the pulse waves, colour matching functions and
+        illuminant are computed at.
+    k : numeric, optional
+        Normalisation constant :math:`k`.
+
+    Returns
+    -------
+    ndarray
+        Pulse waves *CIE XYZ* tristimulus values.
+    """
+
+    if cmfs.shape != shape:
+        runtime_warning('Aligning "{0}" cmfs shape to "{1}".'.format(
+            cmfs.name, shape))
+        cmfs = cmfs.copy().align(shape)
+
+    if illuminant.shape != shape:
+        runtime_warning('Aligning "{0}" illuminant shape to "{1}".'.format(
+            illuminant.name, shape))
+        illuminant = illuminant.copy().align(shape)
+
+    W = cmfs.values * illuminant.values[..., np.newaxis] * shape.interval
+    bins = W.shape[0]
+
+    k = 100 / np.sum(W[..., 1]) if k is None else k
+
+    W_c = np.vstack([zeros([1, 3]), np.cumsum(np.vstack([W, W]), axis=0)])
+
+    widths, starts = np.meshgrid(
+        np.arange(1, bins), np.arange(bins), indexing='ij')
+
+    XYZ = np.vstack([
+        zeros([1, 3]),
+        np.reshape(W_c[starts + widths] - W_c[starts], (-1, 3)),
+        W_c[bins],
+    ])
+
+    return from_range_100(k * XYZ)
+
+
 def XYZ_outer_surface(
         cmfs=STANDARD_OBSERVER_CMFS['CIE 1931 2 Degree Standard Observer']
         .copy().align(DEFAULT_SPECTRAL_SHAPE_XYZ_OUTER_SURFACE),
@@ -164,6 +226,17 @@ def XYZ_outer_surface(
     ndarray
         Outer surface *CIE XYZ* tristimulus values.
 
+    Notes
+    -----
+    -   With the *Integration* method, the pulse waves are not generated: their
+        *CIE XYZ* tristimulus values are computed from the cumulative sums of
+        the weighted colour matching functions at the spectral shape given by
+        the ``shape`` keyword argument, default to the colour matching
+        functions spectral shape. Computing the outer surface at 1nm bins is
+        thus practicable.
+    -   The *CIE XYZ* tristimulus values are cached in a bounded
+        *Least Recently Used* cache.
+
     References
     ----------
     :cite:`Lindbloom2015`, :cite:`Mansencal2018`
@@ -216,8 +289,13 @@ def XYZ_outer_surface(
     XYZ = _XYZ_OUTER_SURFACE_CACHE.get(key)
 
     if XYZ is None:
-        pulse_waves = generate_pulse_waves(len(cmfs.wavelengths))
-        XYZ = multi_sds_to_XYZ(pulse_waves, cmfs, illuminant, **settings) / 100
+        if settings['method'].lower() == 'integration':
+            XYZ = _pulse_waves_to_XYZ_integration(
+                cmfs, illuminant, settings['shape'], settings.get('k')) / 100
+        else:
+            pulse_waves = generate_pulse_waves(len(cmfs.wavelengths))
+            XYZ = multi_sds_to_XYZ(pulse_waves, cmfs, illuminant, **
+                                   settings) / 100
 
         _XYZ_OUTER_SURFACE_CACHE[key] = XYZ
 
@@ -244,7 +322,7 @@ def is_within_visible_spectrum(
     illuminant : SpectralDistribution, optional
         Illuminant spectral distribution.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-volume check.
 
     Other Parameters
     ----------------
@@ -277,11 +355,6 @@ def is_within_visible_spectrum(
     array([ True, False], dtype=bool)
     """
 
-    key = (hash(cmfs), hash(illuminant), six.text_type(kwargs))
-    vertices = _XYZ_OUTER_SURFACE_POINTS_CACHE.get(key)
-
-    if vertices is None:
-        _XYZ_OUTER_SURFACE_POINTS_CACHE[key] = vertices = (XYZ_outer_surface(
-            cmfs, illuminant, **kwargs))
+    vertices = XYZ_outer_surface(cmfs, illuminant, **kwargs)
 
     return is_within_mesh_volume(XYZ, vertices, tolerance)
@@ -9,7 +9,7 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_mesh_volume
+from colour.volume import mesh_half_spaces, is_within_mesh_volume
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +19,41 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = ['TestMeshHalfSpaces', 'TestIsWithinMeshVolume']
+
+
+class TestMeshHalfSpaces(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_half_spaces` definition unit tests
+    methods.
+    """
+
+    def test_mesh_half_spaces(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_half_spaces` definition.
+        """
+
+        mesh = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+
+        equations = mesh_half_spaces(mesh)
+        self.assertTupleEqual(equations.shape, (4, 4))
+
+        np.testing.assert_almost_equal(
+            np.linalg.norm(equations[..., :3], axis=-1), np.ones(4), decimal=7)
+
+        # Vertices are lying on the half-spaces planes.
+        self.assertTrue(
+            np.all(
+                np.abs(np.dot(mesh, equations[..., :3].T) + equations[..., 3])
+                .min(axis=-1) < 1e-7))
+
+        self.assertIs(mesh_half_spaces(mesh.copy()), equations)
+        self.assertIsNot(mesh_half_spaces(mesh * 2), equations)
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
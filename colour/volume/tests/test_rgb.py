@@ -28,10 +28,14 @@ from colour.models import (ACES_2065_1_COLOURSPACE, BT2020_COLOURSPACE,
                            BT709_COLOURSPACE)
 from colour.volume import (
     RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+    RGB_colourspace_volume_MonteCarlo_estimates,
+    RGB_colourspace_volume_MonteCarlo_estimate,
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    is_within_pointer_gamut)
+    RGB_colourspace_volume_Mesh, RGB_colourspace_volume_coverage_Mesh,
+    RGB_colourspace_pointer_gamut_coverage_Mesh,
+    RGB_colourspace_visible_spectrum_coverage_Mesh, is_within_pointer_gamut)
 from colour.utilities import disable_multiprocessing
 
 __author__ = 'Colour Developers'
@@ -43,9 +47,14 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestRGB_colourspaceVolumeMonteCarloEstimates',
+    'TestRGB_colourspaceVolumeMonteCarloEstimate',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
-    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
+    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh', 'TestRGB_colourspaceVolumeCoverageMesh',
+    'TestRGB_colourspacePointerGamutCoverageMesh',
+    'TestRGB_colourspaceVisibleSpectrumCoverageMesh'
 ]
 
 
@@ -113,6 +122,97 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
             places=1)
 
 
+class TestRGB_colourspaceVolumeMonteCarloEstimates(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_MonteCarlo_estimates(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition.
+        """
+
+        estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE, 10e4, seed=4, chunk_size=3e4, processes=2))
+
+        self.assertListEqual([estimate.samples for estimate in estimates],
+                             [30000, 60000, 90000, 100000])
+
+        for estimate in estimates:
+            self.assertGreater(estimate.standard_error, 0)
+            self.assertLess(estimate.confidence_interval[0], estimate.value)
+            self.assertGreater(estimate.confidence_interval[1], estimate.value)
+
+        self.assertLess(estimates[-1].standard_error,
+                        estimates[0].standard_error)
+
+        self.assertAlmostEqual(
+            estimates[-1].value * 1e-6, 821700.0 * 1e-6, places=1)
+
+    def test_reproducibility(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition reproducibility
+        whatever the processes count.
+        """
+
+        estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE, 10e4, seed=4, chunk_size=25e3, processes=3))
+
+        with disable_multiprocessing():
+            self.assertListEqual(
+                list(
+                    RGB_colourspace_volume_MonteCarlo_estimates(
+                        BT709_COLOURSPACE, 10e4, seed=4, chunk_size=25e3)),
+                estimates)
+
+    @disable_multiprocessing()
+    def test_early_stopping(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition early stopping.
+        """
+
+        estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE,
+                10e6,
+                seed=4,
+                chunk_size=1e4,
+                target_standard_error=5000))
+
+        self.assertLess(estimates[-1].samples, 10e6)
+        self.assertLessEqual(estimates[-1].standard_error, 5000)
+        self.assertGreater(estimates[-2].standard_error, 5000)
+
+
+class TestRGB_colourspaceVolumeMonteCarloEstimate(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimate` definition unit tests methods.
+    """
+
+    @disable_multiprocessing()
+    def test_RGB_colourspace_volume_MonteCarlo_estimate(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimate` definition.
+        """
+
+        estimate = RGB_colourspace_volume_MonteCarlo_estimate(
+            BT709_COLOURSPACE, 10e4, seed=4, chunk_size=3e4)
+
+        self.assertEqual(
+            estimate,
+            list(
+                RGB_colourspace_volume_MonteCarlo_estimates(
+                    BT709_COLOURSPACE, 10e4, seed=4, chunk_size=3e4))[-1])
+
+
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.\
@@ -189,5 +289,119 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             decimal=7)
 
 
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            819554.61782972328,
+            places=3)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT2020_COLOURSPACE, 16),
+            1838811.4869741471,
+            places=3)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            RGB_colourspace_volume_MonteCarlo_estimate(
+                BT709_COLOURSPACE, 10e5, seed=4).value,
+            delta=5000)
+
+
+class TestRGB_colourspaceVolumeCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_coverage_Mesh`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_coverage_Mesh`
+        definition.
+        """
+
+        mesh = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [1.0, 1.0, 0.0],
+            [1.0, 0.0, 1.0],
+            [0.0, 1.0, 1.0],
+            [1.0, 1.0, 1.0],
+        ])
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE, mesh),
+            20.130503481446425,
+            places=7)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE,
+                                                 mesh * 0.1 + 0.4),
+            100,
+            places=7)
+
+        self.assertEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE, mesh + 2),
+            0)
+
+        self.assertEqual(
+            RGB_colourspace_volume_coverage_Mesh(BT709_COLOURSPACE,
+                                                 mesh[:4] * [1, 1, 0]), 0)
+
+
+class TestRGB_colourspacePointerGamutCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_pointer_gamut_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage_Mesh` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_pointer_gamut_coverage_Mesh(BT709_COLOURSPACE),
+            81.18209160703546,
+            places=7)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_pointer_gamut_coverage_Mesh(
+                ACES_2065_1_COLOURSPACE),
+            100,
+            places=7)
+
+
+class TestRGB_colourspaceVisibleSpectrumCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_visible_spectrum_coverage_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage_Mesh` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_visible_spectrum_coverage_Mesh(BT709_COLOURSPACE),
+            48.18690046942381,
+            places=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,8 +9,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
-                                STANDARD_OBSERVER_CMFS)
+from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, ILLUMINANT_SDS,
+                                SpectralShape, STANDARD_OBSERVER_CMFS,
+                                multi_sds_to_XYZ)
 from colour.volume import (generate_pulse_waves, XYZ_outer_surface,
                            is_within_visible_spectrum)
 from colour.utilities import ignore_numpy_errors
@@ -122,6 +123,38 @@ class TestXYZOuterSurface(unittest.TestCase):
             ]),
             decimal=7)
 
+        shape = SpectralShape(380, 780, 10)
+        cmfs = STANDARD_OBSERVER_CMFS[
+            'CIE 1964 10 Degree Standard Observer'].copy().align(shape)
+        illuminant = ILLUMINANT_SDS['D65'].copy().align(shape)
+
+        np.testing.assert_almost_equal(
+            XYZ_outer_surface(cmfs, illuminant),
+            multi_sds_to_XYZ(
+                generate_pulse_waves(len(shape.range())),
+                cmfs,
+                illuminant,
+                method='Integration',
+                shape=shape) / 100,
+            decimal=7)
+
+    def test_XYZ_outer_surface_shape(self):
+        """
+        Tests :func:`colour.volume.spectrum.XYZ_outer_surface` definition
+        with a spectral shape different from the colour matching functions
+        one.
+        """
+
+        shape = SpectralShape(360, 780, 1)
+        cmfs = STANDARD_OBSERVER_CMFS['CIE 1931 2 Degree Standard Observer']
+
+        XYZ = XYZ_outer_surface(cmfs, shape=shape)
+
+        self.assertTupleEqual(XYZ.shape, (421 * 420 + 2, 3))
+
+        np.testing.assert_almost_equal(
+            XYZ[-1], np.array([1.00007670, 1.00000000, 1.00033250]), decimal=7)
+
 
 class TestIsWithinVisibleSpectrum(unittest.TestCase):
     """
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark
+=========
+
+Measures the per-call time of *Colour* primitives for single colour, small
+and image sized inputs.
+
+Usage::
+
+    python utilities/benchmark.py
+    python utilities/benchmark.py --filter "tsplit|tstack" --sizes Single
+    python utilities/benchmark.py --sizes Single --output timings.json
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import codecs
+import json
+import numpy as np
+import re
+import timeit
+from collections import OrderedDict
+
+from colour.difference import delta_E
+from colour.models import (RGB_COLOURSPACES, RGB_to_HSV, RGB_to_RGB,
+                           RGB_to_RGB_transform, Lab_to_LCHab, XYZ_to_Lab,
+                           XYZ_to_RGB, XYZ_to_xy)
+from colour.notation import RGB_to_HEX
+from colour.utilities import dot_vector, tsplit, tstack
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['SIZES', 'M', 'COLOURSPACE', 'BENCHMARKS', 'time_call', 'benchmark']
+
+SIZES = OrderedDict([
+    ('Single', (3, )),
+    ('Small', (64, 3)),
+    ('Image', (1080, 1920, 3)),
+])
+"""
+Input array shapes the benchmarks are run with.
+
+SIZES : OrderedDict
+"""
+
+M = np.array([
+    [0.41240000, 0.35760000, 0.18050000],
+    [0.21260000, 0.71520000, 0.07220000],
+    [0.01930000, 0.11920000, 0.95050000],
+])
+"""
+Matrix used by the dot product benchmarks.
+
+M : ndarray
+"""
+
+COLOURSPACE = RGB_COLOURSPACES['sRGB']
+"""
+*RGB* colourspace used by the colour conversions benchmarks.
+
+COLOURSPACE : RGB_Colourspace
+"""
+
+
+def _XYZ_to_RGB_arguments(XYZ):
+    """
+    Returns the :func:`colour.XYZ_to_RGB` definition positional arguments for
+    given *CIE XYZ* tristimulus values array.
+    """
+
+    return (XYZ, COLOURSPACE.whitepoint, COLOURSPACE.whitepoint,
+            COLOURSPACE.XYZ_to_RGB_matrix)
+
+
+BENCHMARKS = OrderedDict([
+    ('tsplit', (lambda a: (a, ), tsplit, {})),
+    ('tsplit - View', (lambda a: (a, ), tsplit, {
+        'copy': False
+    })),
+    ('tstack', (lambda a: (list(tsplit(a)), ), tstack, {})),
+    ('tstack - Out', (lambda a: (list(tsplit(a)), ), tstack, {
+        'out': None
+    })),
+    ('tstack - View', (lambda a: (tsplit(a, copy=False), ), tstack, {
+        'copy': False
+    })),
+    ('dot_vector', (lambda a: (M, a), dot_vector, {})),
+    ('dot_vector - Out', (lambda a: (M, a), dot_vector, {
+        'out': None
+    })),
+    ('dot_vector - Matrices', (lambda a: (np.reshape(M, (1, 3, 3)), a),
+                               dot_vector, {})),
+    ('XYZ_to_Lab', (lambda a: (a, ), XYZ_to_Lab, {})),
+    ('Lab_to_LCHab', (lambda a: (XYZ_to_Lab(a), ), Lab_to_LCHab, {})),
+    ('XYZ_to_xy', (lambda a: (a, ), XYZ_to_xy, {})),
+    ('XYZ_to_RGB', (_XYZ_to_RGB_arguments, XYZ_to_RGB, {
+        'cctf_encoding': COLOURSPACE.cctf_encoding
+    })),
+    ('RGB_to_RGB', (lambda a: (a, COLOURSPACE, RGB_COLOURSPACES['ACEScg']),
+                    RGB_to_RGB, {
+                        'apply_cctf_decoding': True
+                    })),
+    ('RGB_to_RGB - Baked', (lambda a: (a, ),
+                            RGB_to_RGB_transform(
+                                COLOURSPACE,
+                                RGB_COLOURSPACES['ACEScg'],
+                                apply_cctf_decoding=True,
+                                baked=True).apply, {})),
+    ('RGB_to_HSV', (lambda a: (a, ), RGB_to_HSV, {})),
+    ('RGB_to_HEX', (lambda a: (a, ), RGB_to_HEX, {})),
+    ('delta_E - CIE 1976', (lambda a: (XYZ_to_Lab(a), XYZ_to_Lab(a[::-1])),
+                            delta_E, {
+                                'method': 'CIE 1976'
+                            })),
+    ('delta_E - CIE 2000', (lambda a: (XYZ_to_Lab(a), XYZ_to_Lab(a[::-1])),
+                            delta_E, {
+                                'method': 'CIE 2000'
+                            })),
+])
+"""
+Benchmarks as *(setup, function, keywords arguments)* tuples: *setup* returns
+the function positional arguments for given input array and an *out* keyword
+argument set to *None* is replaced with an empty array shaped like the input
+array.
+
+BENCHMARKS : OrderedDict
+"""
+
+
+def time_call(function, args=(), kwargs=None, repeat=5, duration=0.2):
+    """
+    Returns the best per-call time of given function.
+
+    Parameters
+    ----------
+    function : callable
+        Function to time.
+    args : tuple, optional
+        Function positional arguments.
+    kwargs : dict, optional
+        Function keywords arguments.
+    repeat : int, optional
+        Timing repetitions count, the best one is retained.
+    duration : numeric, optional
+        Minimum duration in seconds of a timing repetition, used to calibrate
+        the calls count per repetition.
+
+    Returns
+    -------
+    numeric
+        Best per-call time in seconds.
+    """
+
+    if kwargs is None:
+        kwargs = {}
+
+    timer = timeit.Timer(lambda: function(*args, **kwargs))
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= duration:
+            break
+
+        number *= 10 if elapsed < duration / 10 else 2
+
+    return min([elapsed] + timer.repeat(repeat - 1, number)) / number
+
+
+def benchmark(pattern='.*', sizes=None, repeat=5, duration=0.2):
+    """
+    Runs the benchmarks matching given pattern and prints their per-call
+    times.
+
+    Parameters
+    ----------
+    pattern : unicode, optional
+        Regular expression the benchmarks names are matched against.
+    sizes : array_like, optional
+        Names of the :attr:`SIZES` attribute input array shapes to use.
+    repeat : int, optional
+        Timing repetitions count, the best one is retained.
+    duration : numeric, optional
+        Minimum duration in seconds of a timing repetition.
+
+    Returns
+    -------
+    OrderedDict
+        Per-call times in seconds for each benchmark and input array shape.
+    """
+
+    if sizes is None:
+        sizes = list(SIZES.keys())
+
+    np.random.seed(4)
+    arrays = OrderedDict(
+        (size, np.random.random(SIZES[size])) for size in sizes)
+
+    print('{0:<32}'.format('Benchmark') + ''.join('{0:>16}'.format(size)
+                                                  for size in sizes))
+
+    timings = OrderedDict()
+    for name, (setup, function, kwargs) in BENCHMARKS.items():
+        if not re.search(pattern, name):
+            continue
+
+        timings[name] = OrderedDict()
+        for size, a in arrays.items():
+            call_kwargs = dict(kwargs)
+            if 'out' in call_kwargs:
+                call_kwargs['out'] = np.empty(a.shape)
+
+            timings[name][size] = time_call(function, setup(a), call_kwargs,
+                                            repeat, duration)
+
+        print('{0:<32}'.format(name) + ''.join(
+            '{0:>14.3f}us'.format(timing * 1e6)
+            for timing in timings[name].values()))
+
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measures the per-call time of Colour primitives.')
+    parser.add_argument(
+        '--filter',
+        default='.*',
+        help='Regular expression the benchmarks names are matched against.')
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        choices=list(SIZES.keys()),
+        help='Input array shapes to use.')
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Timing repetitions count.')
+    parser.add_argument(
+        '--output',
+        help='JSON file the per-call times in seconds are written to, '
+        'allowing to track them across revisions.')
+
+    arguments = parser.parse_args()
+
+    timings = benchmark(arguments.filter, arguments.sizes, arguments.repeat)
+
+    if arguments.output is not None:
+        with codecs.open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump(timings, file, indent=4)